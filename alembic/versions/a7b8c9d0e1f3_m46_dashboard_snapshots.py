@@ -0,0 +1,39 @@
+"""m46_dashboard_snapshots
+
+Revision ID: a7b8c9d0e1f3
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "a7b8c9d0e1f3"
+down_revision: str | None = "d6e7f8a9b0c1"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_snapshots",
+        sa.Column("dashboard", sa.String(length=32), nullable=False),
+        sa.Column("window_hours", sa.SmallInteger(), nullable=False),
+        sa.Column("schema_version", sa.SmallInteger(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("compute_ms", sa.Integer(), nullable=False),
+        sa.CheckConstraint("window_hours >= 1", name="ck_dashboard_snapshots_window_positive"),
+        sa.CheckConstraint(
+            "compute_ms >= 0",
+            name="ck_dashboard_snapshots_compute_ms_non_negative",
+        ),
+        sa.PrimaryKeyConstraint("dashboard", "window_hours"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_snapshots")
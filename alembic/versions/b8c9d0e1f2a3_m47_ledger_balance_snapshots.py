@@ -0,0 +1,60 @@
+"""m47_ledger_balance_snapshots
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f3
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | None = "a7b8c9d0e1f3"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ledger_balance_snapshots",
+        sa.Column("entry_type", sa.String(length=32), nullable=False),
+        sa.Column("asset", sa.String(length=32), nullable=False),
+        sa.Column("direction", sa.String(length=8), nullable=False),
+        sa.Column("product_code", sa.String(length=32), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.Column("entries_count", sa.BigInteger(), nullable=False),
+        sa.Column("amount_total", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("entries_count >= 0", name="ck_ledger_balance_snapshots_count"),
+        sa.CheckConstraint("amount_total >= 0", name="ck_ledger_balance_snapshots_amount"),
+        sa.PrimaryKeyConstraint("entry_type", "asset", "direction", "product_code", "shard"),
+    )
+    # Backfill under a lock on ledger_entries so no entry lands between the aggregate and the
+    # first incremental update.
+    op.execute("LOCK TABLE ledger_entries IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO ledger_balance_snapshots (
+            entry_type, asset, direction, product_code, shard,
+            entries_count, amount_total, updated_at
+        )
+        SELECT
+            entry_type,
+            asset,
+            direction,
+            COALESCE(metadata ->> 'product_code', ''),
+            user_id % 16,
+            COUNT(id),
+            SUM(amount),
+            MAX(created_at)
+        FROM ledger_entries
+        GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ledger_balance_snapshots")
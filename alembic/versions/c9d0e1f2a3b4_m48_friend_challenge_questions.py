@@ -0,0 +1,68 @@
+"""m48_friend_challenge_questions
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: str | None = "b8c9d0e1f2a3"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "friend_challenge_questions",
+        sa.Column("challenge_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("round_no", sa.Integer(), nullable=False),
+        sa.Column("question_id", sa.String(length=64), nullable=False),
+        sa.CheckConstraint("round_no >= 1", name="ck_friend_challenge_questions_round_positive"),
+        sa.ForeignKeyConstraint(["challenge_id"], ["friend_challenges.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "challenge_id",
+            "round_no",
+            name="pk_friend_challenge_questions",
+            postgresql_include=["question_id"],
+        ),
+    )
+    # Hold off writers until the column is gone, so no plan lands after the backfill.
+    op.execute("LOCK TABLE friend_challenges IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO friend_challenge_questions (challenge_id, round_no, question_id)
+        SELECT fc.id, plan.round_no, plan.question_id
+        FROM friend_challenges AS fc
+        CROSS JOIN LATERAL jsonb_array_elements_text(fc.question_ids)
+            WITH ORDINALITY AS plan(question_id, round_no)
+        WHERE jsonb_typeof(fc.question_ids) = 'array'
+        """
+    )
+    op.drop_column("friend_challenges", "question_ids")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "friend_challenges",
+        sa.Column("question_ids", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE friend_challenges AS fc
+        SET question_ids = plan.question_ids
+        FROM (
+            SELECT challenge_id, jsonb_agg(question_id ORDER BY round_no) AS question_ids
+            FROM friend_challenge_questions
+            GROUP BY challenge_id
+        ) AS plan
+        WHERE plan.challenge_id = fc.id
+        """
+    )
+    op.drop_table("friend_challenge_questions")
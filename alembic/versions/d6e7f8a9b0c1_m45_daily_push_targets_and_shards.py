@@ -0,0 +1,54 @@
+"""m45_daily_push_targets_and_shards
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: str | None = "c5d6e7f8a9b0"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_push_targets",
+        sa.Column("berlin_date", sa.Date(), nullable=False),
+        sa.Column("push_kind", sa.String(length=32), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("telegram_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("current_streak", sa.Integer(), nullable=False),
+        sa.Column("staged_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("berlin_date", "push_kind", "user_id"),
+    )
+    op.create_table(
+        "daily_push_shards",
+        sa.Column("berlin_date", sa.Date(), nullable=False),
+        sa.Column("push_kind", sa.String(length=32), nullable=False),
+        sa.Column("shard_index", sa.SmallInteger(), nullable=False),
+        sa.Column("user_id_from", sa.BigInteger(), nullable=False),
+        sa.Column("user_id_to", sa.BigInteger(), nullable=False),
+        sa.Column("targets_total", sa.Integer(), nullable=False),
+        sa.Column("last_user_id", sa.BigInteger(), nullable=True),
+        sa.Column("sent_total", sa.Integer(), nullable=False),
+        sa.Column("skipped_total", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "user_id_from <= user_id_to",
+            name="ck_daily_push_shards_user_id_range",
+        ),
+        sa.PrimaryKeyConstraint("berlin_date", "push_kind", "shard_index"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_push_shards")
+    op.drop_table("daily_push_targets")
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import importlib
+import re
+from types import ModuleType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+brotli: ModuleType | None
+try:
+    brotli = importlib.import_module("brotli")
+except ImportError:  # pinned in the lock files; without it responses fall back to gzip
+    brotli = None
+
+COMPRESSED_PATH_PREFIXES = ("/admin", "/internal")
+COMPRESSION_MINIMUM_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+_ENCODED_ETAG = re.compile(r'-(?:gzip|br)"$')
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Per-encoding variant of a strong ETag, so each representation keeps its own validator."""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def strip_etag_encoding(etag: str) -> str:
+    return _ENCODED_ETAG.sub('"', etag)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip()] = quality
+    if brotli is not None and accepted.get("br", 0.0) > 0:
+        return "br"
+    if accepted.get("gzip", 0.0) > 0:
+        return "gzip"
+    return None
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = BROTLI_QUALITY) -> None:
+        super().__init__(app, minimum_size)
+        assert brotli is not None
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        chunk = self._compressor.process(body)
+        return chunk + (self._compressor.flush() if more_body else self._compressor.finish())
+
+
+class ScopedCompressionMiddleware:
+    """Compresses responses under the admin and internal routers only.
+
+    Public and webhook routes keep their plain responses; an ETag on a compressed body gets an
+    encoding suffix (``"<tag>-gzip"``) that ``strip_etag_encoding`` removes again on revalidation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        path_prefixes: tuple[str, ...] = COMPRESSED_PATH_PREFIXES,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+    ) -> None:
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not str(scope["path"]).startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder: IdentityResponder
+        if encoding == "br":
+            responder = BrotliResponder(self.app, self.minimum_size)
+        else:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=GZIP_LEVEL)
+
+        async def send_with_encoded_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and not responder.content_encoding_set:
+                headers = MutableHeaders(scope=message)
+                etag = headers.get("etag")
+                if etag and headers.get("content-encoding") == encoding:
+                    headers["etag"] = encoded_etag(etag, encoding)
+            await send(message)
+
+        await responder(scope, receive, send_with_encoded_etag)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import importlib
+
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+
+API_ROUTER_MODULES: tuple[str, ...] = (
+    "app.api.routes.health",
+    "app.api.routes.metrics",
+    "app.api.routes.telegram_webhook",
+    "app.api.routes.internal_promo",
+    "app.api.routes.internal_offers",
+    "app.api.routes.internal_referrals",
+    "app.api.routes.internal_analytics",
+    "app.api.routes.public_site",
+    "app.api.routes.public_contact",
+    "app.api.routes.ops_ui",
+    "app.api.routes.admin",
+)
+# A webhook-only process only acknowledges Telegram updates; it never imports the admin,
+# internal or ops UI routers (and the services behind them).
+API_ROUTER_PROFILES: dict[str, tuple[str, ...]] = {
+    "full": API_ROUTER_MODULES,
+    "webhook": (
+        "app.api.routes.health",
+        "app.api.routes.metrics",
+        "app.api.routes.telegram_webhook",
+    ),
+}
+_OPS_UI_MODULE = "app.api.routes.ops_ui"
+
+
+def router_modules_for_profile(profile: str) -> tuple[str, ...]:
+    normalized = profile.strip().lower() or "full"
+    try:
+        return API_ROUTER_PROFILES[normalized]
+    except KeyError:
+        raise ValueError(f"unknown API process profile: {profile!r}") from None
+
+
+def include_profile_routers(app: FastAPI, *, profile: str) -> None:
+    """Imports and mounts only the routers the process profile serves."""
+    module_paths = router_modules_for_profile(profile)
+    for module_path in module_paths:
+        app.include_router(importlib.import_module(module_path).router)
+    if _OPS_UI_MODULE in module_paths:
+        static_dir = importlib.import_module(_OPS_UI_MODULE).OPS_UI_STATIC_DIR
+        app.mount("/ops/static", StaticFiles(directory=str(static_dir)), name="ops-static")
@@ -37,7 +37,7 @@ async def login_admin(
 ) -> Response:
     bucket = rate_limit_bucket(request=request, settings=settings)
     window_seconds = settings.admin_login_rate_limit_window_minutes * 60
-    if is_rate_limited(
+    if await is_rate_limited(
         bucket=bucket,
         limit=settings.admin_login_rate_limit_attempts,
         window_seconds=window_seconds,
@@ -47,10 +47,10 @@ async def login_admin(
     if not verify_login_credentials(
         settings=settings, email=payload.email, password=payload.password
     ):
-        record_failure(bucket=bucket, window_seconds=window_seconds)
+        await record_failure(bucket=bucket, window_seconds=window_seconds)
         raise HTTPException(status_code=401, detail={"code": "E_INVALID_CREDENTIALS"})
 
-    clear_failures(bucket=bucket)
+    await clear_failures(bucket=bucket)
     if not settings.admin_2fa_required:
         full_access_token = build_access_token(
             settings=settings,
@@ -96,7 +96,7 @@ async def verify_2fa(
     add_admin_noindex_header(response)
     bucket = rate_limit_bucket(request=request, settings=settings)
     window_seconds = settings.admin_login_rate_limit_window_minutes * 60
-    if is_rate_limited(
+    if await is_rate_limited(
         bucket=bucket,
         limit=settings.admin_login_rate_limit_attempts,
         window_seconds=window_seconds,
@@ -107,10 +107,10 @@ async def verify_2fa(
         settings=settings,
         code=payload.code,
     ):
-        record_failure(bucket=bucket, window_seconds=window_seconds)
+        await record_failure(bucket=bucket, window_seconds=window_seconds)
         raise HTTPException(status_code=401, detail={"code": "E_INVALID_TOTP"})
 
-    clear_failures(bucket=bucket)
+    await clear_failures(bucket=bucket)
     access_token = build_access_token(
         settings=settings,
         email=principal.email,
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from fastapi import Request, Response
+
+from app.api.compression import strip_etag_encoding
+from app.services.admin.cache import CachedJson
+
+# The admin UI may keep a copy but must revalidate it; unchanged payloads come back as 304.
+ADMIN_CACHE_CONTROL = "private, no-cache"
+
+
+def _matching_validator(request: Request, etag: str) -> str | None:
+    """Returns the If-None-Match entry that matches ``etag``, encoding suffix included."""
+    header = request.headers.get("if-none-match", "").strip()
+    if header == "*":
+        return etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate and strip_etag_encoding(candidate.removeprefix("W/")) == etag:
+            return candidate
+    return None
+
+
+def not_modified_response(
+    request: Request, response: Response, cached: CachedJson
+) -> Response | None:
+    """Tags ``response`` with the cached payload's ETag; a 304 when the client already has it.
+
+    The 304 echoes the validator the client sent, so a ``"<tag>-gzip"`` copy stays current.
+    """
+    response.headers["ETag"] = cached.etag
+    response.headers["Cache-Control"] = ADMIN_CACHE_CONTROL
+    validator = _matching_validator(request, cached.etag)
+    if validator is None:
+        return None
+    response.headers["ETag"] = validator
+    return Response(status_code=304, headers=dict(response.headers))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from app.api.routes.admin.audit import write_admin_audit
+from app.db.read_session import ReadSessionLocal
 from app.db.session import SessionLocal
 
 from .routes import approve_flagged_question, get_content_health, reject_flagged_question, router
@@ -8,6 +9,7 @@ from .sorting import LEVEL_SORT_ORDER, _level_sort_key
 
 __all__ = [
     "LEVEL_SORT_ORDER",
+    "ReadSessionLocal",
     "SessionLocal",
     "_level_sort_key",
     "approve_flagged_question",
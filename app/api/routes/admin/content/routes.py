@@ -5,31 +5,48 @@ from datetime import datetime, timezone
 from types import ModuleType
 from typing import cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 
+from app.api.routes.admin.conditional import not_modified_response
 from app.api.routes.admin.deps import AdminPrincipal, add_admin_noindex_header, get_current_admin
+from app.core.config import Settings, get_settings
 from app.db.models.user_events import UserEvent
+from app.services.admin.cache import get_or_refresh_json_cache, invalidate_json_cache
 
 from .queries import fetch_content_health_rows
 from .serializers import build_content_health_payload
 
 router = APIRouter(prefix="/admin/content", tags=["admin-content"])
+CONTENT_HEALTH_CACHE_KEY = "admin:content:health"
 
 
 def _content_module() -> ModuleType:
     return cast(ModuleType, sys.modules[__package__])
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_content_health(
+    request: Request,
     response: Response,
     _admin: AdminPrincipal = Depends(get_current_admin),
-) -> dict[str, object]:
+    settings: Settings = Depends(get_settings),
+) -> dict[str, object] | Response:
     add_admin_noindex_header(response)
     module = _content_module()
-    async with module.SessionLocal.begin() as session:
-        rows = await fetch_content_health_rows(session)
-    return build_content_health_payload(rows)
+
+    async def _build() -> dict[str, object]:
+        async with module.ReadSessionLocal.begin() as session:
+            rows = await fetch_content_health_rows(session)
+        return jsonable_encoder(build_content_health_payload(rows))
+
+    cached = await get_or_refresh_json_cache(
+        settings=settings,
+        key=CONTENT_HEALTH_CACHE_KEY,
+        ttl_seconds=120,
+        build=_build,
+    )
+    return not_modified_response(request, response, cached) or cached.value
 
 
 @router.post("/flagged/{event_id}/approve")
@@ -37,6 +54,7 @@ async def approve_flagged_question(
     event_id: int,
     response: Response,
     admin: AdminPrincipal = Depends(get_current_admin),
+    settings: Settings = Depends(get_settings),
 ) -> dict[str, object]:
     add_admin_noindex_header(response)
     module = _content_module()
@@ -55,6 +73,7 @@ async def approve_flagged_question(
             payload={},
             ip=admin.client_ip,
         )
+    await invalidate_json_cache(settings=settings, key=CONTENT_HEALTH_CACHE_KEY)
     return {"ok": True, "id": event_id, "review": "approved"}
 
 
@@ -64,6 +83,7 @@ async def reject_flagged_question(
     response: Response,
     reason: str = Query(default="not_reproducible"),
     admin: AdminPrincipal = Depends(get_current_admin),
+    settings: Settings = Depends(get_settings),
 ) -> dict[str, object]:
     add_admin_noindex_header(response)
     module = _content_module()
@@ -87,4 +107,5 @@ async def reject_flagged_question(
             payload={"reason": reason},
             ip=admin.client_ip,
         )
+    await invalidate_json_cache(settings=settings, key=CONTENT_HEALTH_CACHE_KEY)
     return {"ok": True, "id": event_id, "review": "rejected", "reason": reason}
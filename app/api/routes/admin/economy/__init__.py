@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.api.routes.admin.economy_ltv import build_ltv_30d_by_cohort
-from app.db.session import SessionLocal
+from app.db.read_session import ReadSessionLocal
 
 from .helpers import STAR_TO_EUR_RATE, _parse_datetime
 from .models import CohortsResponse, PurchasesResponse, SubscriptionsResponse
@@ -11,7 +11,7 @@ __all__ = [
     "CohortsResponse",
     "PurchasesResponse",
     "STAR_TO_EUR_RATE",
-    "SessionLocal",
+    "ReadSessionLocal",
     "SubscriptionsResponse",
     "_parse_datetime",
     "build_ltv_30d_by_cohort",
@@ -5,11 +5,15 @@ from datetime import datetime, timedelta, timezone
 from types import ModuleType
 from typing import cast
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.sql.elements import ColumnElement
 
+from app.api.routes.admin.conditional import not_modified_response
 from app.api.routes.admin.deps import AdminPrincipal, add_admin_noindex_header, get_current_admin
+from app.core.config import Settings, get_settings
 from app.db.models.purchases import Purchase
+from app.services.admin.cache import get_or_refresh_json_cache
 
 from .models import CohortsResponse, PurchasesResponse, SubscriptionsResponse
 from .queries import fetch_cohort_rows, fetch_purchase_rows, fetch_subscription_rows
@@ -53,7 +57,7 @@ async def list_purchases(
     if to_dt is not None:
         filters.append(Purchase.paid_at < to_dt)
 
-    async with module.SessionLocal.begin() as session:
+    async with module.ReadSessionLocal.begin() as session:
         rows = await fetch_purchase_rows(session, filters=filters, page=page, limit=limit)
         ltv_30d_by_cohort = await module.build_ltv_30d_by_cohort(
             session,
@@ -77,22 +81,34 @@ async def list_subscriptions(
 ) -> SubscriptionsResponse:
     add_admin_noindex_header(response)
     module = _economy_module()
-    async with module.SessionLocal.begin() as session:
+    async with module.ReadSessionLocal.begin() as session:
         rows = await fetch_subscription_rows(session, status=status)
     return build_subscriptions_response(rows)
 
 
 @router.get("/cohorts", response_model=CohortsResponse)
 async def get_cohorts(
+    request: Request,
     response: Response,
     _admin: AdminPrincipal = Depends(get_current_admin),
-) -> CohortsResponse:
+    settings: Settings = Depends(get_settings),
+) -> CohortsResponse | Response:
     add_admin_noindex_header(response)
     module = _economy_module()
-    now_utc = datetime.now(timezone.utc)
-    from_utc = now_utc - timedelta(weeks=12)
-
-    async with module.SessionLocal.begin() as session:
-        rows = await fetch_cohort_rows(session, from_utc=from_utc)
 
-    return build_cohorts_response(rows)
+    async def _build() -> dict[str, object]:
+        from_utc = datetime.now(timezone.utc) - timedelta(weeks=12)
+        async with module.ReadSessionLocal.begin() as session:
+            rows = await fetch_cohort_rows(session, from_utc=from_utc)
+        return jsonable_encoder(build_cohorts_response(rows))
+
+    cached = await get_or_refresh_json_cache(
+        settings=settings,
+        key="admin:economy:cohorts",
+        ttl_seconds=300,
+        build=_build,
+    )
+    not_modified = not_modified_response(request, response, cached)
+    if not_modified is not None:
+        return not_modified
+    return CohortsResponse.model_validate(cached.value)
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
 
+from app.api.routes.admin.conditional import not_modified_response
 from app.api.routes.admin.deps import AdminPrincipal, add_admin_noindex_header, get_current_admin
 from app.api.routes.admin.overview_queries import build_overview_payload
 from app.core.config import Settings, get_settings
-from app.db.session import SessionLocal
-from app.services.admin.cache import get_json_cache, set_json_cache
+from app.db.read_session import ReadSessionLocal
+from app.services.admin.cache import get_or_refresh_json_cache
 
 router = APIRouter(prefix="/admin", tags=["admin-overview"])
 VALID_PERIODS = {"7d": 7, "30d": 30, "90d": 90}
@@ -36,31 +37,31 @@ class OverviewResponse(BaseModel):
 
 @router.get("/overview", response_model=OverviewResponse)
 async def get_overview(
+    request: Request,
     response: Response,
     period: str = Query(default="7d"),
     _admin: AdminPrincipal = Depends(get_current_admin),
     settings: Settings = Depends(get_settings),
-) -> OverviewResponse:
+) -> OverviewResponse | Response:
     add_admin_noindex_header(response)
     days = VALID_PERIODS.get(period, 7)
-    cache_key = f"admin:overview:{days}"
 
-    cached = await get_json_cache(settings=settings, key=cache_key)
-    if cached:
-        return OverviewResponse.model_validate(cached)
+    async def _build() -> dict[str, object]:
+        async with ReadSessionLocal.begin() as session:
+            payload = await build_overview_payload(
+                session,
+                now_utc=datetime.now(timezone.utc),
+                days=days,
+            )
+        return jsonable_encoder(OverviewResponse.model_validate(payload))
 
-    async with SessionLocal.begin() as session:
-        payload = await build_overview_payload(
-            session,
-            now_utc=datetime.now(timezone.utc),
-            days=days,
-        )
-
-    model = OverviewResponse.model_validate(payload)
-    await set_json_cache(
+    cached = await get_or_refresh_json_cache(
         settings=settings,
-        key=cache_key,
-        value=jsonable_encoder(model),
+        key=f"admin:overview:{days}",
         ttl_seconds=300,
+        build=_build,
     )
-    return model
+    not_modified = not_modified_response(request, response, cached)
+    if not_modified is not None:
+        return not_modified
+    return OverviewResponse.model_validate(cached.value)
@@ -168,12 +168,14 @@ async def reset_user_state(
             streak.current_streak = 0
             streak.today_status = "NO_ACTIVITY"
             streak.updated_at = now_utc
+            streak.version += 1
 
         energy = await session.get(EnergyState, user_id)
         if energy is not None:
             energy.free_energy = min(energy.free_cap, 20)
             energy.paid_energy = 0
             energy.updated_at = now_utc
+            energy.version += 1
 
         await session.execute(
             update(ModeProgress)
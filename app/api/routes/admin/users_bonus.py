@@ -38,6 +38,7 @@ async def apply_bonus(
             session.add(energy)
         energy.paid_energy += amount
         energy.updated_at = now_utc
+        energy.version += 1
     elif bonus_type == "streak_token":
         streak = await session.get(StreakState, user_id)
         if streak is None:
@@ -54,6 +55,7 @@ async def apply_bonus(
             session.add(streak)
         streak.streak_saver_tokens += amount
         streak.updated_at = now_utc
+        streak.version += 1
     elif bonus_type == "premium_days":
         entitlement = Entitlement(
             user_id=user_id,
@@ -3,21 +3,18 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 import structlog
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from app.core.config import get_settings
-from app.db.session import SessionLocal
+from app.db.read_session import ReadSessionLocal
+from app.services.dashboard_snapshots import OFFERS_DASHBOARD, read_dashboard
 from app.services.internal_auth import (
     extract_client_ip,
     is_client_ip_allowed,
     is_internal_request_authenticated,
 )
-from app.services.offers_observability import (
-    build_offer_funnel_snapshot,
-    evaluate_offer_alert_state,
-    get_offer_alert_thresholds,
-)
+from app.services.offers_observability import evaluate_offer_alert_state, get_offer_alert_thresholds
 
 router = APIRouter(tags=["internal", "offers"])
 logger = structlog.get_logger(__name__)
@@ -82,20 +79,26 @@ def _assert_internal_access(request: Request) -> None:
 @router.get("/internal/offers/dashboard", response_model=OfferDashboardResponse)
 async def get_offers_dashboard(
     request: Request,
+    response: Response,
     window_hours: int = Query(default=24, ge=1, le=168),
+    fresh: bool = Query(default=False),
 ) -> OfferDashboardResponse:
     _assert_internal_access(request)
-    now_utc = datetime.now(timezone.utc)
     settings = get_settings()
     thresholds = get_offer_alert_thresholds(settings)
 
-    async with SessionLocal.begin() as session:
-        snapshot = await build_offer_funnel_snapshot(
+    async with ReadSessionLocal.begin() as session:
+        read = await read_dashboard(
             session,
-            now_utc=now_utc,
+            OFFERS_DASHBOARD,
+            now_utc=datetime.now(timezone.utc),
             window_hours=window_hours,
+            fresh=fresh,
+            max_age_seconds=settings.internal_dashboard_snapshot_max_age_seconds,
         )
 
+    response.headers["X-Dashboard-Source"] = read.source
+    snapshot = read.snapshot
     alert_state = evaluate_offer_alert_state(snapshot=snapshot, thresholds=thresholds)
     return OfferDashboardResponse(
         generated_at=snapshot.generated_at,
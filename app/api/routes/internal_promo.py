@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
 
 from app.core.config import get_settings as _get_settings
 
@@ -34,9 +34,13 @@ async def redeem_promo(payload: PromoRedeemRequest, request: Request) -> PromoRe
 @router.get("/internal/promo/dashboard", response_model=PromoDashboardResponse)
 async def get_promo_dashboard(
     request: Request,
+    response: Response,
     window_hours: int = Query(default=24, ge=1, le=168),
+    fresh: bool = Query(default=False),
 ) -> PromoDashboardResponse:
-    return await _get_promo_dashboard(request=request, window_hours=window_hours)
+    return await _get_promo_dashboard(
+        request=request, response=response, window_hours=window_hours, fresh=fresh
+    )
 
 
 @router.get("/internal/promo/campaigns", response_model=PromoCampaignListResponse)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
 
 from app.core.config import get_settings as _get_settings
 
@@ -29,9 +29,13 @@ __all__ = ["get_settings", "router"]
 @router.get("/internal/referrals/dashboard", response_model=ReferralDashboardResponse)
 async def get_referrals_dashboard(
     request: Request,
+    response: Response,
     window_hours: int = Query(default=24, ge=1, le=168),
+    fresh: bool = Query(default=False),
 ) -> ReferralDashboardResponse:
-    return await _get_referrals_dashboard(request=request, window_hours=window_hours)
+    return await _get_referrals_dashboard(
+        request=request, response=response, window_hours=window_hours, fresh=fresh
+    )
 
 
 @router.get("/internal/referrals/review-queue", response_model=ReferralReviewQueueResponse)
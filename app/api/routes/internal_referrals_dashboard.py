@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import Request
+from fastapi import Request, Response
 
-from app.db.session import SessionLocal
+from app.db.read_session import ReadSessionLocal
+from app.services.dashboard_snapshots import REFERRALS_DASHBOARD, read_dashboard
 from app.services.referrals_observability import (
-    build_referrals_dashboard_snapshot,
     evaluate_referrals_alert_state,
     get_referrals_alert_thresholds,
 )
@@ -34,20 +34,26 @@ def _get_settings():
 async def get_referrals_dashboard(
     *,
     request: Request,
+    response: Response,
     window_hours: int,
+    fresh: bool = False,
 ) -> ReferralDashboardResponse:
     _assert_internal_access(request)
-    now_utc = datetime.now(timezone.utc)
     settings = _get_settings()
     thresholds = get_referrals_alert_thresholds(settings)
 
-    async with SessionLocal.begin() as session:
-        snapshot = await build_referrals_dashboard_snapshot(
+    async with ReadSessionLocal.begin() as session:
+        read = await read_dashboard(
             session,
-            now_utc=now_utc,
+            REFERRALS_DASHBOARD,
+            now_utc=datetime.now(timezone.utc),
             window_hours=window_hours,
+            fresh=fresh,
+            max_age_seconds=settings.internal_dashboard_snapshot_max_age_seconds,
         )
 
+    response.headers["X-Dashboard-Source"] = read.source
+    snapshot = read.snapshot
     alert_state = evaluate_referrals_alert_state(snapshot=snapshot, thresholds=thresholds)
     top_referrers = [
         ReferralTopReferrerStatsResponse(**row)  # type: ignore[arg-type]
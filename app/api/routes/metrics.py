@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import structlog
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.core.config import get_settings
+from app.core.metrics_exposition import CONTENT_TYPE_LATEST, render_metrics
+from app.services.internal_auth import extract_client_ip, is_client_ip_allowed
+
+router = APIRouter(tags=["metrics"])
+logger = structlog.get_logger(__name__)
+
+
+def _assert_scrape_access(request: Request) -> None:
+    settings = get_settings()
+    client_ip = extract_client_ip(
+        request,
+        trusted_proxies=getattr(settings, "internal_api_trusted_proxies", ""),
+    )
+    if not is_client_ip_allowed(client_ip=client_ip, allowlist=settings.internal_api_allowlist):
+        logger.warning("metrics_scrape_forbidden", client_ip=client_ip)
+        raise HTTPException(status_code=403, detail={"code": "E_FORBIDDEN"})
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request) -> Response:
+    _assert_scrape_access(request)
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
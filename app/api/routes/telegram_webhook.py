@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+from time import perf_counter
 
 import structlog
 from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings
+from app.core.metrics import WEBHOOK_ENQUEUE_SECONDS
 from app.services.telegram_updates import extract_update_id, is_valid_webhook_secret
-from app.workers.tasks.telegram_updates import process_telegram_update
+from app.workers.celery_app import celery_app
+from app.workers.tasks.telegram_updates_config import PROCESS_TELEGRAM_UPDATE_TASK_NAME
 
 router = APIRouter(tags=["telegram"])
 logger = structlog.get_logger(__name__)
+# Enqueued by name: importing the task module would pull the whole bot (handlers, game and
+# economy services) into every API process just to publish a message.
+process_telegram_update = celery_app.signature(PROCESS_TELEGRAM_UPDATE_TASK_NAME)
 
 
 def _is_celery_task(task_obj: object) -> bool:
@@ -30,6 +36,8 @@ async def _enqueue_update(
             update_id=update_id,
         )
 
+    started_at = perf_counter()
+    outcome = "queued"
     try:
         if _is_celery_task(process_telegram_update):
             await asyncio.wait_for(
@@ -40,6 +48,7 @@ async def _enqueue_update(
             enqueue_call()
         return True
     except asyncio.TimeoutError:
+        outcome = "timeout"
         logger.warning(
             "telegram_webhook_enqueue_timeout",
             update_id=update_id,
@@ -47,12 +56,15 @@ async def _enqueue_update(
         )
         return False
     except Exception as exc:
+        outcome = "failed"
         logger.warning(
             "telegram_webhook_enqueue_failed",
             update_id=update_id,
             error_type=type(exc).__name__,
         )
         return False
+    finally:
+        WEBHOOK_ENQUEUE_SECONDS.labels(outcome=outcome).observe(perf_counter() - started_at)
 
 
 @router.post("/webhook/telegram")
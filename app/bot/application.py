@@ -1,5 +1,7 @@
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 
 from app.bot.handlers.channel_bonus import router as channel_bonus_router
 from app.bot.handlers.gameplay import router as gameplay_router
@@ -9,14 +11,26 @@ from app.bot.handlers.payments import router as payments_router
 from app.bot.handlers.promo import router as promo_router
 from app.bot.handlers.referral import router as referral_router
 from app.bot.handlers.start import router as start_router
+from app.bot.query_profile_middleware import QueryProfileMiddleware
 from app.core.config import get_settings
+from app.db import session as db_session
+from app.db.query_profiler import install_query_profiler
+from app.services.telegram_api_metrics import TelegramApiMetricsMiddleware
 
 _dispatcher: Dispatcher | None = None
 
 
 def build_bot() -> Bot:
     settings = get_settings()
-    return Bot(token=settings.telegram_bot_token, default=DefaultBotProperties())
+    api_base_url = settings.telegram_bot_api_base_url.strip()
+    session = (
+        AiohttpSession(api=TelegramAPIServer.from_base(api_base_url.rstrip("/")))
+        if api_base_url
+        else None
+    )
+    bot = Bot(token=settings.telegram_bot_token, session=session, default=DefaultBotProperties())
+    bot.session.middleware(TelegramApiMetricsMiddleware())
+    return bot
 
 
 def build_dispatcher() -> Dispatcher:
@@ -25,6 +39,9 @@ def build_dispatcher() -> Dispatcher:
         return _dispatcher
 
     dispatcher = Dispatcher()
+    if get_settings().query_profiler_enabled:
+        install_query_profiler(db_session.engine)
+        dispatcher.update.outer_middleware(QueryProfileMiddleware())
     dispatcher.include_router(start_router)
     dispatcher.include_router(channel_bonus_router)
     dispatcher.include_router(gameplay_inline_share_router)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+from app.db.query_profiler import profile_queries
+
+_CALLBACK_ACTION_RE = re.compile(r"^[a-z_]+$")
+
+
+def resolve_update_profile_label(update: Update) -> str:
+    """Builds `<update kind>:<callback prefix|command>` without user-specific ids."""
+    update_kind = update.event_type
+    callback_query = update.callback_query
+    if callback_query is not None and callback_query.data:
+        segments = callback_query.data.split(":")
+        prefix = segments[0]
+        if len(segments) > 1 and _CALLBACK_ACTION_RE.match(segments[1]):
+            prefix = f"{prefix}:{segments[1]}"
+        return f"{update_kind}:{prefix}"
+    message = update.message
+    if message is not None and message.text and message.text.startswith("/"):
+        command = message.text.split(maxsplit=1)[0].split("@", maxsplit=1)[0]
+        return f"{update_kind}:{command}"
+    return update_kind
+
+
+class QueryProfileMiddleware(BaseMiddleware):
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Update):
+            return await handler(event, data)
+        with profile_queries(resolve_update_profile_label(event)):
+            return await handler(event, data)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -34,3 +35,30 @@ async def emit_analytics_event(
         payload=payload or {},
         happened_at=happened_at,
     )
+
+
+async def emit_analytics_events(
+    session: AsyncSession,
+    *,
+    event_type: str,
+    source: str,
+    happened_at: datetime,
+    payloads: Sequence[dict[str, object]],
+    user_id: int | None = None,
+    user_ids: Sequence[int | None] | None = None,
+) -> int:
+    """Inserts one event per payload in a single multi-row statement.
+
+    ``user_ids``, when given, assigns a user per payload instead of the shared ``user_id``.
+    """
+    local_date_berlin = happened_at.astimezone(ZoneInfo(BERLIN_TIMEZONE)).date()
+    return await AnalyticsRepo.create_events(
+        session,
+        event_type=event_type,
+        source=source,
+        user_id=user_id,
+        local_date_berlin=local_date_berlin,
+        payloads=payloads,
+        happened_at=happened_at,
+        user_ids=user_ids,
+    )
@@ -47,6 +47,12 @@ class AdminSettingsMixin:
         default="",
         alias="OPS_ALERT_ESCALATION_POLICY_JSON",
     )
+    ops_alert_timeout_seconds: float = Field(default=5.0, alias="OPS_ALERT_TIMEOUT_SECONDS")
+    ops_alert_max_attempts: int = Field(default=3, alias="OPS_ALERT_MAX_ATTEMPTS")
+    ops_alert_dedupe_window_seconds: int = Field(
+        default=300,
+        alias="OPS_ALERT_DEDUPE_WINDOW_SECONDS",
+    )
     offers_alert_window_hours: int = Field(default=24, alias="OFFERS_ALERT_WINDOW_HOURS")
     offers_alert_min_impressions: int = Field(default=50, alias="OFFERS_ALERT_MIN_IMPRESSIONS")
     offers_alert_min_conversion_rate: float = Field(
@@ -75,3 +81,15 @@ class AdminSettingsMixin:
         default=3,
         alias="REFERRALS_ALERT_MAX_REFERRER_REJECTED_FRAUD",
     )
+    internal_dashboard_snapshot_windows: str = Field(
+        default="24,168",
+        alias="INTERNAL_DASHBOARD_SNAPSHOT_WINDOWS",
+    )
+    internal_dashboard_snapshot_interval_seconds: int = Field(
+        default=300,
+        alias="INTERNAL_DASHBOARD_SNAPSHOT_INTERVAL_SECONDS",
+    )
+    internal_dashboard_snapshot_max_age_seconds: int = Field(
+        default=900,
+        alias="INTERNAL_DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS",
+    )
@@ -6,6 +6,8 @@ from pydantic import Field
 class MessagingSettingsMixin:
     telegram_bot_token: str = Field(alias="TELEGRAM_BOT_TOKEN")
     telegram_webhook_secret: str = Field(alias="TELEGRAM_WEBHOOK_SECRET")
+    # Empty means api.telegram.org; load tests point this at scripts/telegram_bot_api_stub.py.
+    telegram_bot_api_base_url: str = Field(default="", alias="TELEGRAM_BOT_API_BASE_URL")
     telegram_public_bot_username: str = Field(
         default="Deine_Deutsch_Quiz_bot",
         alias="TELEGRAM_PUBLIC_BOT_USERNAME",
@@ -30,6 +32,13 @@ class MessagingSettingsMixin:
         default=300,
         alias="TELEGRAM_UPDATE_TASK_RETRY_BACKOFF_MAX_SECONDS",
     )
+    # Run updates on one long-lived per-process loop that orders them per chat. Only for a
+    # dedicated updates worker (WORKER_PROCESS_PROFILE=updates, threads pool).
+    telegram_updates_executor_enabled: bool = Field(
+        default=False,
+        alias="TELEGRAM_UPDATES_EXECUTOR_ENABLED",
+    )
+    telegram_updates_queue: str = Field(default="q_normal", alias="TELEGRAM_UPDATES_QUEUE")
     friend_challenge_ttl_seconds: int = Field(default=86_400, alias="FRIEND_CHALLENGE_TTL_SECONDS")
     friend_challenge_last_chance_seconds: int = Field(
         default=7_200,
@@ -43,6 +52,18 @@ class MessagingSettingsMixin:
         default=300,
         alias="FRIEND_CHALLENGE_DEADLINE_SCAN_INTERVAL_SECONDS",
     )
+    friend_challenge_deadline_max_batches: int = Field(
+        default=20,
+        alias="FRIEND_CHALLENGE_DEADLINE_MAX_BATCHES",
+    )
+    friend_challenge_deadline_partitions: int = Field(
+        default=1,
+        alias="FRIEND_CHALLENGE_DEADLINE_PARTITIONS",
+    )
+    friend_challenge_notify_concurrency: int = Field(
+        default=8,
+        alias="FRIEND_CHALLENGE_NOTIFY_CONCURRENCY",
+    )
     duel_pending_ttl_hours: int = Field(default=6, alias="DUEL_PENDING_TTL_HOURS")
     duel_accepted_ttl_hours: int = Field(default=48, alias="DUEL_ACCEPTED_TTL_HOURS")
     duel_max_active_per_user: int = Field(default=10, alias="DUEL_MAX_ACTIVE_PER_USER")
@@ -57,6 +78,14 @@ class MessagingSettingsMixin:
     daily_cup_registration_close: str = Field(default="18:00", alias="DAILY_CUP_REGISTRATION_CLOSE")
     daily_cup_min_participants: int = Field(default=4, alias="DAILY_CUP_MIN_PARTICIPANTS")
     daily_cup_timezone: str = Field(default="Europe/Berlin", alias="DAILY_CUP_TIMEZONE")
+    daily_cup_status_cache_ttl_seconds: int = Field(
+        default=2,
+        alias="DAILY_CUP_STATUS_CACHE_TTL_SECONDS",
+    )
+    daily_cup_status_cache_redis_ttl_seconds: int = Field(
+        default=60,
+        alias="DAILY_CUP_STATUS_CACHE_REDIS_TTL_SECONDS",
+    )
     daily_challenge_precompute_hour_berlin: int = Field(
         default=0,
         alias="DAILY_CHALLENGE_PRECOMPUTE_HOUR_BERLIN",
@@ -77,3 +106,7 @@ class MessagingSettingsMixin:
         default=200,
         alias="DAILY_CHALLENGE_PUSH_BATCH_SIZE",
     )
+    daily_challenge_push_shard_count: int = Field(
+        default=4,
+        alias="DAILY_CHALLENGE_PUSH_SHARD_COUNT",
+    )
@@ -15,10 +15,21 @@ class RuntimeSettingsMixin:
     app_host: str = Field(default="0.0.0.0", alias="APP_HOST")
     app_port: int = Field(default=8000, alias="APP_PORT")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    metrics_worker_port: int = Field(default=9808, alias="METRICS_WORKER_PORT")
+    query_profiler_enabled: bool = Field(default=False, alias="QUERY_PROFILER_ENABLED")
+    # Role profiles: which routers an API process mounts and which task modules a worker loads.
+    api_process_profile: str = Field(default="full", alias="API_PROCESS_PROFILE")
+    worker_process_profile: str = Field(default="all", alias="WORKER_PROCESS_PROFILE")
     quiz_question_pool_cache_ttl_seconds: int = Field(
         default=300,
         alias="QUIZ_QUESTION_POOL_CACHE_TTL_SECONDS",
     )
+    # Reproduces pre-rank selection (SHA-256 seed, linear probe) so existing seeds keep
+    # resolving to the same questions while clients migrate.
+    quiz_selection_legacy_seed_mode: bool = Field(
+        default=False,
+        alias="QUIZ_SELECTION_LEGACY_SEED_MODE",
+    )
     telegram_updates_alert_window_minutes: int = Field(
         default=15,
         alias="TELEGRAM_UPDATES_ALERT_WINDOW_MINUTES",
@@ -97,6 +108,12 @@ class RuntimeSettingsMixin:
         alias="PROMO_ENCRYPTION_KEY",
     )
     database_url: str = Field(alias="DATABASE_URL")
+    # Optional streaming replica for admin, analytics and dashboard reads (app/db/read_session.py).
+    database_replica_url: str = Field(default="", alias="DATABASE_REPLICA_URL")
+    database_replica_max_lag_seconds: float = Field(
+        default=30.0,
+        alias="DATABASE_REPLICA_MAX_LAG_SECONDS",
+    )
     redis_url: str = Field(alias="REDIS_URL")
     celery_broker_url: str = Field(alias="CELERY_BROKER_URL")
     celery_result_backend: str = Field(alias="CELERY_RESULT_BACKEND")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import ParamSpec, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+METRICS_NAMESPACE = "quiz_arena"
+
+_FAST_PATH_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_QUEUE_LAG_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+_TASK_RUNTIME_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+GAMEPLAY_OPERATION_SECONDS = Histogram(
+    "gameplay_operation_seconds",
+    "Latency of gameplay service operations.",
+    labelnames=("operation", "outcome"),
+    namespace=METRICS_NAMESPACE,
+    buckets=_FAST_PATH_BUCKETS,
+)
+QUESTION_POOL_CACHE_LOOKUPS = Counter(
+    "question_pool_cache_lookups",
+    "Question pool cache lookups by result (hit, incremental, full).",
+    labelnames=("result",),
+    namespace=METRICS_NAMESPACE,
+)
+DAILY_CUP_STATUS_CACHE_LOOKUPS = Counter(
+    "daily_cup_status_cache_lookups",
+    "Daily Cup status snapshot lookups by result (local, redis, rebuild).",
+    labelnames=("result",),
+    namespace=METRICS_NAMESPACE,
+)
+WEBHOOK_ENQUEUE_SECONDS = Histogram(
+    "webhook_enqueue_seconds",
+    "Latency of enqueueing Telegram webhook updates to Celery.",
+    labelnames=("outcome",),
+    namespace=METRICS_NAMESPACE,
+    buckets=_FAST_PATH_BUCKETS,
+)
+TELEGRAM_UPDATES_PROCESSED = Counter(
+    "telegram_updates_processed",
+    "Telegram updates handled by workers by outcome.",
+    labelnames=("outcome",),
+    namespace=METRICS_NAMESPACE,
+)
+TELEGRAM_API_REQUEST_SECONDS = Histogram(
+    "telegram_api_request_seconds",
+    "Latency of outgoing Telegram Bot API calls.",
+    labelnames=("method", "outcome"),
+    namespace=METRICS_NAMESPACE,
+    buckets=_FAST_PATH_BUCKETS,
+)
+CELERY_TASK_SECONDS = Histogram(
+    "celery_task_seconds",
+    "Celery task runtime by task name and final state.",
+    labelnames=("task", "state"),
+    namespace=METRICS_NAMESPACE,
+    buckets=_TASK_RUNTIME_BUCKETS,
+)
+CELERY_TASK_QUEUE_LAG_SECONDS = Histogram(
+    "celery_task_queue_lag_seconds",
+    "Delay between publishing a Celery task and a worker starting it.",
+    labelnames=("task",),
+    namespace=METRICS_NAMESPACE,
+    buckets=_QUEUE_LAG_BUCKETS,
+)
+OPS_ALERT_DELIVERY_SECONDS = Histogram(
+    "ops_alert_delivery_seconds",
+    "Latency of delivering an ops alert to one target, including retries.",
+    labelnames=("channel", "outcome"),
+    namespace=METRICS_NAMESPACE,
+    buckets=_FAST_PATH_BUCKETS,
+)
+DB_READ_ROUTE_TOTAL = Counter(
+    "db_read_route_total",
+    "Read-only sessions by target (replica, primary) and reason.",
+    labelnames=("target", "reason"),
+    namespace=METRICS_NAMESPACE,
+)
+DB_POOL_CHECKED_OUT_CONNECTIONS = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool.",
+    labelnames=("pool",),
+    namespace=METRICS_NAMESPACE,
+    multiprocess_mode="livesum",
+)
+DB_POOL_OPEN_CONNECTIONS = Gauge(
+    "db_pool_open_connections",
+    "Database connections currently opened by the pool.",
+    labelnames=("pool",),
+    namespace=METRICS_NAMESPACE,
+    multiprocess_mode="livesum",
+)
+
+
+@contextmanager
+def observe_latency(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """Observes block duration, labelling it with outcome=ok|error."""
+    started_at = perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        histogram.labels(outcome=outcome, **labels).observe(perf_counter() - started_at)
+
+
+def timed_operation(
+    operation: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with observe_latency(GAMEPLAY_OPERATION_SECONDS, operation=operation):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
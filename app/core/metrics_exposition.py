@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "build_metrics_registry",
+    "is_multiprocess_mode",
+    "mark_metrics_process_dead",
+    "render_metrics",
+    "reset_multiprocess_dir",
+    "start_metrics_sidecar",
+]
+
+
+def is_multiprocess_mode() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV, "").strip())
+
+
+def build_metrics_registry() -> CollectorRegistry:
+    if not is_multiprocess_mode():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> bytes:
+    return generate_latest(build_metrics_registry())
+
+
+def reset_multiprocess_dir() -> None:
+    # Must run in the parent process before forking children, otherwise values of
+    # dead processes from a previous run leak into the aggregate.
+    if not is_multiprocess_mode():
+        return
+    directory = Path(os.environ[MULTIPROC_DIR_ENV])
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+
+def mark_metrics_process_dead(pid: int) -> None:
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(pid)
+
+
+def start_metrics_sidecar(*, port: int, addr: str = "0.0.0.0") -> bool:
+    if port <= 0:
+        return False
+    start_http_server(port, addr=addr, registry=build_metrics_registry())
+    return True
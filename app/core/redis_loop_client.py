@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from time import monotonic
+
+import redis.asyncio as redis
+import structlog
+
+from app.core.config import get_settings
+
+REDIS_RECONNECT_COOLDOWN_SECONDS = 30.0
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.5
+
+logger = structlog.get_logger(__name__)
+
+# redis.asyncio connections are bound to the loop that opened them; Celery jobs use a loop per job.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis] = (
+    weakref.WeakKeyDictionary()
+)
+_redis_retry_at = 0.0
+
+
+async def close_loop_redis_client() -> None:
+    """Closes the running loop's client; Celery jobs call this before their loop goes away."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is None:
+        return
+    try:
+        await client.aclose()
+    except Exception as exc:
+        logger.warning("redis_loop_client_close_failed", error_type=type(exc).__name__)
+
+
+async def mark_loop_redis_unavailable(exc: Exception, *, component: str) -> None:
+    """Drops every loop's client and skips Redis for the reconnect cooldown."""
+    global _redis_retry_at
+    _redis_retry_at = monotonic() + REDIS_RECONNECT_COOLDOWN_SECONDS
+    await close_loop_redis_client()
+    _CLIENTS.clear()
+    logger.warning(
+        "redis_loop_client_unavailable", component=component, error_type=type(exc).__name__
+    )
+
+
+async def get_loop_redis_client(*, component: str) -> redis.Redis | None:
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is not None or monotonic() < _redis_retry_at:
+        return client
+    # No PING: the pool connects lazily and a dead server surfaces on the first command.
+    try:
+        client = redis.from_url(
+            get_settings().redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+    except Exception as exc:
+        await mark_loop_redis_unavailable(exc, component=component)
+        return None
+    _CLIENTS[loop] = client
+    return client
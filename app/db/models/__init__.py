@@ -5,11 +5,16 @@ from app.db.models.analytics_events import AnalyticsEvent
 from app.db.models.contact_requests import ContactRequest
 from app.db.models.daily_metrics import DailyMetrics
 from app.db.models.daily_push_logs import DailyPushLog
+from app.db.models.daily_push_shards import DailyPushShard
+from app.db.models.daily_push_targets import DailyPushTarget
 from app.db.models.daily_question_sets import DailyQuestionSet
 from app.db.models.daily_runs import DailyRun
+from app.db.models.dashboard_snapshots import DashboardSnapshot
 from app.db.models.energy_state import EnergyState
 from app.db.models.entitlements import Entitlement
+from app.db.models.friend_challenge_questions import FriendChallengeQuestion
 from app.db.models.friend_challenges import FriendChallenge
+from app.db.models.ledger_balance_snapshots import LedgerBalanceSnapshot
 from app.db.models.ledger_entries import LedgerEntry
 from app.db.models.mode_progress import ModeProgress
 from app.db.models.offers_impressions import OfferImpression
@@ -41,12 +46,17 @@ __all__ = [
     "AnalyticsEvent",
     "ContactRequest",
     "DailyPushLog",
+    "DailyPushShard",
+    "DailyPushTarget",
     "DailyQuestionSet",
     "DailyRun",
     "DailyMetrics",
+    "DashboardSnapshot",
     "EnergyState",
     "FriendChallenge",
+    "FriendChallengeQuestion",
     "Entitlement",
+    "LedgerBalanceSnapshot",
     "LedgerEntry",
     "ModeProgress",
     "OfferImpression",
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, Date, DateTime, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class DailyPushShard(Base):
+    __tablename__ = "daily_push_shards"
+    __table_args__ = (
+        CheckConstraint(
+            "user_id_from <= user_id_to",
+            name="ck_daily_push_shards_user_id_range",
+        ),
+    )
+
+    berlin_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    push_kind: Mapped[str] = mapped_column(String(32), primary_key=True)
+    shard_index: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    user_id_from: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    user_id_to: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    targets_total: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    sent_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
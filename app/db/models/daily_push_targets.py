@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class DailyPushTarget(Base):
+    __tablename__ = "daily_push_targets"
+
+    berlin_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    push_kind: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    telegram_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    current_streak: Mapped[int] = mapped_column(Integer, nullable=False)
+    staged_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, CheckConstraint, DateTime, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class DashboardSnapshot(Base):
+    __tablename__ = "dashboard_snapshots"
+    __table_args__ = (
+        CheckConstraint("window_hours >= 1", name="ck_dashboard_snapshots_window_positive"),
+        CheckConstraint("compute_ms >= 0", name="ck_dashboard_snapshots_compute_ms_non_negative"),
+    )
+
+    dashboard: Mapped[str] = mapped_column(String(32), primary_key=True)
+    window_hours: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    schema_version: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    # Plain JSON rather than JSONB: ranked maps such as top offer codes must keep their order.
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    compute_ms: Mapped[int] = mapped_column(Integer, nullable=False)
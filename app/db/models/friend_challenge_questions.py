@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import CheckConstraint, ForeignKey, Integer, PrimaryKeyConstraint, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class FriendChallengeQuestion(Base):
+    __tablename__ = "friend_challenge_questions"
+    __table_args__ = (
+        CheckConstraint("round_no >= 1", name="ck_friend_challenge_questions_round_positive"),
+        # INCLUDE makes the round lookup an index-only read of the primary key.
+        PrimaryKeyConstraint(
+            "challenge_id",
+            "round_no",
+            name="pk_friend_challenge_questions",
+            postgresql_include=["question_id"],
+        ),
+    )
+
+    challenge_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), ForeignKey("friend_challenges.id", ondelete="CASCADE")
+    )
+    round_no: Mapped[int] = mapped_column(Integer)
+    question_id: Mapped[str] = mapped_column(String(64), nullable=False)
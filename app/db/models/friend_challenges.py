@@ -4,7 +4,6 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Index, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -69,7 +68,6 @@ class FriendChallenge(Base):
     challenge_type: Mapped[str] = mapped_column(String(16), nullable=False)
     mode_code: Mapped[str] = mapped_column(String(32), nullable=False)
     access_type: Mapped[str] = mapped_column(String(16), nullable=False)
-    question_ids: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     tournament_match_id: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
     status: Mapped[str] = mapped_column(String(16), nullable=False)
     current_round: Mapped[int] = mapped_column(Integer, nullable=False)
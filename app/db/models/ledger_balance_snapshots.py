@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class LedgerBalanceSnapshot(Base):
+    """Running totals of ``ledger_entries``, maintained in the transaction that writes each entry.
+
+    Rows are split into ``shard = user_id % LEDGER_SNAPSHOT_SHARDS`` so concurrent writers of the
+    same entry type do not queue on one row lock; readers sum the shards.
+    """
+
+    __tablename__ = "ledger_balance_snapshots"
+    __table_args__ = (
+        CheckConstraint("entries_count >= 0", name="ck_ledger_balance_snapshots_count"),
+        CheckConstraint("amount_total >= 0", name="ck_ledger_balance_snapshots_amount"),
+    )
+
+    entry_type: Mapped[str] = mapped_column(String(32), primary_key=True)
+    asset: Mapped[str] = mapped_column(String(32), primary_key=True)
+    direction: Mapped[str] = mapped_column(String(8), primary_key=True)
+    # Empty for entries that are not tied to a product (energy debits, referral rewards, ...).
+    product_code: Mapped[str] = mapped_column(String(32), primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    entries_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    amount_total: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import DB_POOL_CHECKED_OUT_CONNECTIONS, DB_POOL_OPEN_CONNECTIONS
+
+
+def instrument_pool_metrics(engine: AsyncEngine, *, pool_name: str) -> None:
+    # Pool events are attached to the engine so they survive dispose(), which
+    # recreates the pool with the same dispatch.
+    checked_out = DB_POOL_CHECKED_OUT_CONNECTIONS.labels(pool=pool_name)
+    opened = DB_POOL_OPEN_CONNECTIONS.labels(pool=pool_name)
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        opened.inc()
+
+    @event.listens_for(sync_engine, "close")
+    def _on_close(dbapi_connection: Any, connection_record: Any) -> None:
+        opened.dec()
+
+    @event.listens_for(sync_engine, "close_detached")
+    def _on_close_detached(dbapi_connection: Any) -> None:
+        opened.dec()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        checked_out.inc()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        checked_out.dec()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+SLOWEST_STATEMENTS_LIMIT = 3
+STATEMENT_PREVIEW_CHARS = 160
+
+logger = structlog.get_logger(__name__)
+
+_ACTIVE_PROFILES: ContextVar[tuple[QueryProfile, ...]] = ContextVar(
+    "query_profiler_active_profiles",
+    default=(),
+)
+_STARTED_AT_KEY = "query_profiler_started_at"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+ProfileSink = Callable[["QueryProfile"], None]
+_PROFILE_SINKS: list[ProfileSink] = []
+_INSTRUMENTED_ENGINES: set[int] = set()
+
+
+@dataclass(slots=True)
+class SlowStatement:
+    duration_ms: float
+    statement: str
+
+
+@dataclass(slots=True)
+class QueryProfile:
+    label: str
+    statement_count: int = 0
+    total_db_ms: float = 0.0
+    slowest: list[SlowStatement] = field(default_factory=list)
+
+    def record(self, *, statement: str, duration_ms: float) -> None:
+        self.statement_count += 1
+        self.total_db_ms += duration_ms
+        if (
+            len(self.slowest) < SLOWEST_STATEMENTS_LIMIT
+            or duration_ms > self.slowest[-1].duration_ms
+        ):
+            self.slowest.append(SlowStatement(duration_ms=duration_ms, statement=statement))
+            self.slowest.sort(key=lambda item: item.duration_ms, reverse=True)
+            del self.slowest[SLOWEST_STATEMENTS_LIMIT:]
+
+    def as_log_fields(self) -> dict[str, object]:
+        return {
+            "label": self.label,
+            "statements": self.statement_count,
+            "db_time_ms": round(self.total_db_ms, 2),
+            "slowest": [
+                {"ms": round(item.duration_ms, 2), "sql": item.statement} for item in self.slowest
+            ],
+        }
+
+
+def _preview_statement(statement: str) -> str:
+    return _WHITESPACE_RE.sub(" ", statement).strip()[:STATEMENT_PREVIEW_CHARS]
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if _ACTIVE_PROFILES.get():
+        conn.info.setdefault(_STARTED_AT_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    profiles = _ACTIVE_PROFILES.get()
+    started_stack = conn.info.get(_STARTED_AT_KEY)
+    if not profiles or not started_stack:
+        return
+    duration_ms = (perf_counter() - started_stack.pop()) * 1000
+    preview = _preview_statement(statement)
+    for profile in profiles:
+        profile.record(statement=preview, duration_ms=duration_ms)
+
+
+def _handle_error(exception_context: Any) -> None:
+    conn = exception_context.connection
+    started_stack = conn.info.get(_STARTED_AT_KEY) if conn is not None else None
+    if started_stack:
+        started_stack.pop()
+
+
+def install_query_profiler(engine: AsyncEngine | Engine) -> None:
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if id(sync_engine) in _INSTRUMENTED_ENGINES:
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    _INSTRUMENTED_ENGINES.add(id(sync_engine))
+
+
+def add_profile_sink(sink: ProfileSink) -> None:
+    _PROFILE_SINKS.append(sink)
+
+
+def remove_profile_sink(sink: ProfileSink) -> None:
+    if sink in _PROFILE_SINKS:
+        _PROFILE_SINKS.remove(sink)
+
+
+@contextmanager
+def profile_queries(label: str, *, emit_log: bool = True) -> Iterator[QueryProfile]:
+    """Attributes every statement executed in this context to a named profile."""
+    profile = QueryProfile(label=label)
+    token = _ACTIVE_PROFILES.set((*_ACTIVE_PROFILES.get(), profile))
+    try:
+        yield profile
+    finally:
+        _ACTIVE_PROFILES.reset(token)
+        if emit_log:
+            logger.info("query_profile", **profile.as_log_fields())
+        for sink in tuple(_PROFILE_SINKS):
+            sink(profile)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from time import monotonic
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.core.metrics import DB_READ_ROUTE_TOTAL
+from app.db import session as db_session
+
+logger = structlog.get_logger(__name__)
+
+REPLICA_LAG_CHECK_INTERVAL_SECONDS = 5.0
+# Zero when the replica has replayed everything it received (or the target is not in recovery,
+# e.g. a second local database in dev), otherwise the age of the last replayed transaction.
+REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() IS NULL "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+_SET_READ_ONLY_SQL = text("SET TRANSACTION READ ONLY")
+_SET_REPEATABLE_READ_SQL = text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+
+
+class ReadSessionRouter:
+    """``async with ReadSessionLocal.begin() as session`` for admin, analytics and dashboard reads.
+
+    Sessions go to the replica while its lag stays under ``max_lag_seconds``; when there is no
+    replica, it lags or it is unreachable they fall back to the primary. Either way the
+    transaction is read only, so a write on a read path fails instead of landing anywhere.
+    ``repeatable_read=True`` gives every statement of the transaction the same snapshot.
+    """
+
+    def __init__(
+        self,
+        *,
+        primary: Callable[[], async_sessionmaker[AsyncSession]],
+        replica: Callable[[], async_sessionmaker[AsyncSession] | None],
+        max_lag_seconds: float,
+        check_interval_seconds: float = REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._checked_at: float | None = None
+        self._replica_reason = "no_replica"
+
+    def reset(self) -> None:
+        self._checked_at = None
+
+    async def _replica_lag_seconds(self, replica: async_sessionmaker[AsyncSession]) -> float:
+        async with replica() as session:
+            return float(await session.scalar(REPLICA_LAG_SQL) or 0.0)
+
+    async def _route_reason(self, replica: async_sessionmaker[AsyncSession]) -> str:
+        now = monotonic()
+        if self._checked_at is not None and now - self._checked_at < self._check_interval_seconds:
+            return self._replica_reason
+        try:
+            lag_seconds = await self._replica_lag_seconds(replica)
+        except Exception as exc:
+            logger.warning("db_replica_unavailable", error_type=type(exc).__name__)
+            reason = "replica_error"
+        else:
+            reason = "ok" if lag_seconds <= self._max_lag_seconds else "replica_lag"
+            if reason == "replica_lag":
+                logger.warning(
+                    "db_replica_lagging",
+                    lag_seconds=round(lag_seconds, 3),
+                    max_lag_seconds=self._max_lag_seconds,
+                )
+        self._checked_at = now
+        self._replica_reason = reason
+        return reason
+
+    def begin(self, *, repeatable_read: bool = False) -> AbstractAsyncContextManager[AsyncSession]:
+        return self._begin(repeatable_read=repeatable_read)
+
+    @asynccontextmanager
+    async def _begin(self, *, repeatable_read: bool) -> AsyncIterator[AsyncSession]:
+        replica = self._replica()
+        reason = "no_replica" if replica is None else await self._route_reason(replica)
+        if replica is not None and reason == "ok":
+            DB_READ_ROUTE_TOTAL.labels(target="replica", reason=reason).inc()
+            async with replica.begin() as session:
+                if repeatable_read:
+                    await session.execute(_SET_REPEATABLE_READ_SQL)
+                yield session
+            return
+
+        DB_READ_ROUTE_TOTAL.labels(target="primary", reason=reason).inc()
+        async with self._primary().begin() as session:
+            await session.execute(_SET_READ_ONLY_SQL)
+            if repeatable_read:
+                await session.execute(_SET_REPEATABLE_READ_SQL)
+            yield session
+
+
+ReadSessionLocal = ReadSessionRouter(
+    primary=lambda: db_session.SessionLocal,
+    replica=lambda: db_session.ReplicaSessionLocal,
+    max_lag_seconds=get_settings().database_replica_max_lag_seconds,
+)
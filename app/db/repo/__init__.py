@@ -1,6 +1,9 @@
 from app.db.repo.daily_push_logs_repo import DailyPushLogsRepo
+from app.db.repo.daily_push_shards_repo import DailyPushShardsRepo
+from app.db.repo.daily_push_targets_repo import DailyPushTargetsRepo
 from app.db.repo.daily_question_sets_repo import DailyQuestionSetsRepo
 from app.db.repo.daily_runs_repo import DailyRunsRepo
+from app.db.repo.dashboard_snapshots_repo import DashboardSnapshotsRepo
 from app.db.repo.energy_repo import EnergyRepo
 from app.db.repo.entitlements_repo import EntitlementsRepo
 from app.db.repo.friend_challenges_repo import FriendChallengesRepo
@@ -25,7 +28,10 @@ __all__ = [
     "EnergyRepo",
     "DailyQuestionSetsRepo",
     "DailyPushLogsRepo",
+    "DailyPushShardsRepo",
+    "DailyPushTargetsRepo",
     "DailyRunsRepo",
+    "DashboardSnapshotsRepo",
     "EntitlementsRepo",
     "FriendChallengesRepo",
     "LedgerRepo",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import asdict
 from datetime import date, datetime
 
@@ -41,6 +42,39 @@ async def create_event(
     return event
 
 
+async def create_events(
+    session: AsyncSession,
+    *,
+    event_type: str,
+    source: str,
+    local_date_berlin: date,
+    happened_at: datetime,
+    payloads: Sequence[dict[str, object]],
+    user_id: int | None = None,
+    user_ids: Sequence[int | None] | None = None,
+) -> int:
+    if not payloads:
+        return 0
+    if user_ids is not None and len(user_ids) != len(payloads):
+        raise ValueError("user_ids must line up with payloads")
+    row_user_ids = user_ids if user_ids is not None else [user_id] * len(payloads)
+    await session.execute(
+        insert(AnalyticsEvent),
+        [
+            {
+                "event_type": event_type,
+                "source": source,
+                "user_id": row_user_id,
+                "local_date_berlin": local_date_berlin,
+                "payload": payload,
+                "happened_at": happened_at,
+            }
+            for payload, row_user_id in zip(payloads, row_user_ids, strict=True)
+        ],
+    )
+    return len(payloads)
+
+
 async def create_daily_cup_push_event_once(
     session: AsyncSession,
     *,
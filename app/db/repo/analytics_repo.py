@@ -15,6 +15,7 @@ from app.db.repo.analytics_models import AnalyticsDailyUpsert  # noqa: F401
 from app.db.repo.analytics_mutations import (  # noqa: F401
     create_daily_cup_push_event_once,
     create_event,
+    create_events,
     delete_events_created_before,
     upsert_daily,
 )
@@ -26,6 +27,7 @@ from app.db.repo.analytics_queries import (  # noqa: F401
 
 class AnalyticsRepo:
     create_event = staticmethod(create_event)
+    create_events = staticmethod(create_events)
     create_daily_cup_push_event_once = staticmethod(create_daily_cup_push_event_once)
     count_distinct_active_users_between = staticmethod(count_distinct_active_users_between)
     count_credited_purchases_between = staticmethod(count_credited_purchases_between)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date, datetime
 
 from sqlalchemy.dialects.postgresql import insert
@@ -37,3 +38,39 @@ class DailyPushLogsRepo:
         )
         result = await session.execute(stmt)
         return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def create_many_once(
+        session: AsyncSession,
+        *,
+        user_ids: Sequence[int],
+        berlin_date: date,
+        push_kind: str,
+        push_sent_at: datetime,
+    ) -> set[int]:
+        if not user_ids:
+            return set()
+        stmt = (
+            insert(DailyPushLog)
+            .values(
+                [
+                    {
+                        "user_id": int(user_id),
+                        "berlin_date": berlin_date,
+                        "push_kind": push_kind,
+                        "push_sent_at": push_sent_at,
+                    }
+                    for user_id in user_ids
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    DailyPushLog.user_id,
+                    DailyPushLog.berlin_date,
+                    DailyPushLog.push_kind,
+                ]
+            )
+            .returning(DailyPushLog.user_id)
+        )
+        result = await session.execute(stmt)
+        return {int(user_id) for user_id in result.scalars().all()}
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import ColumnElement, Date, DateTime, String, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.daily_push_shards import DailyPushShard
+from app.db.models.daily_push_targets import DailyPushTarget
+
+
+def _shard_key(
+    *, berlin_date: date, push_kind: str, shard_index: int
+) -> tuple[ColumnElement[bool], ...]:
+    return (
+        DailyPushShard.berlin_date == berlin_date,
+        DailyPushShard.push_kind == push_kind,
+        DailyPushShard.shard_index == shard_index,
+    )
+
+
+class DailyPushShardsRepo:
+    @staticmethod
+    async def list_for_day(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+    ) -> list[DailyPushShard]:
+        stmt = (
+            select(DailyPushShard)
+            .where(DailyPushShard.berlin_date == berlin_date, DailyPushShard.push_kind == push_kind)
+            .order_by(DailyPushShard.shard_index.asc())
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def create_from_targets(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        shard_count: int,
+        now_utc: datetime,
+    ) -> None:
+        # NTILE over staged ids gives contiguous user-id ranges with balanced target counts.
+        ranked = (
+            select(
+                DailyPushTarget.user_id,
+                func.ntile(max(1, int(shard_count)))
+                .over(order_by=DailyPushTarget.user_id)
+                .label("bucket"),
+            )
+            .where(
+                DailyPushTarget.berlin_date == berlin_date,
+                DailyPushTarget.push_kind == push_kind,
+            )
+            .subquery()
+        )
+        ranges = select(
+            literal(berlin_date, Date),
+            literal(push_kind, String(32)),
+            ranked.c.bucket - 1,
+            func.min(ranked.c.user_id),
+            func.max(ranked.c.user_id),
+            func.count(),
+            literal(0),
+            literal(0),
+            literal(now_utc, DateTime(timezone=True)),
+        ).group_by(ranked.c.bucket)
+        stmt = (
+            insert(DailyPushShard)
+            .from_select(
+                [
+                    DailyPushShard.berlin_date,
+                    DailyPushShard.push_kind,
+                    DailyPushShard.shard_index,
+                    DailyPushShard.user_id_from,
+                    DailyPushShard.user_id_to,
+                    DailyPushShard.targets_total,
+                    DailyPushShard.sent_total,
+                    DailyPushShard.skipped_total,
+                    DailyPushShard.updated_at,
+                ],
+                ranges,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    DailyPushShard.berlin_date,
+                    DailyPushShard.push_kind,
+                    DailyPushShard.shard_index,
+                ]
+            )
+        )
+        await session.execute(stmt)
+
+    @staticmethod
+    async def get_by_key(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        shard_index: int,
+    ) -> DailyPushShard | None:
+        stmt = select(DailyPushShard).where(
+            *_shard_key(berlin_date=berlin_date, push_kind=push_kind, shard_index=shard_index)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def record_batch(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        shard_index: int,
+        last_user_id: int,
+        sent: int,
+        skipped: int,
+        now_utc: datetime,
+    ) -> None:
+        stmt = (
+            update(DailyPushShard)
+            .where(
+                *_shard_key(berlin_date=berlin_date, push_kind=push_kind, shard_index=shard_index)
+            )
+            .values(
+                last_user_id=func.greatest(
+                    func.coalesce(DailyPushShard.last_user_id, last_user_id),
+                    last_user_id,
+                ),
+                sent_total=DailyPushShard.sent_total + sent,
+                skipped_total=DailyPushShard.skipped_total + skipped,
+                updated_at=now_utc,
+            )
+        )
+        await session.execute(stmt)
+
+    @staticmethod
+    async def mark_completed(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        shard_index: int,
+        now_utc: datetime,
+    ) -> None:
+        stmt = (
+            update(DailyPushShard)
+            .where(
+                *_shard_key(berlin_date=berlin_date, push_kind=push_kind, shard_index=shard_index),
+                DailyPushShard.completed_at.is_(None),
+            )
+            .values(completed_at=now_utc, updated_at=now_utc)
+        )
+        await session.execute(stmt)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, String, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.daily_push_logs import DailyPushLog
+from app.db.models.daily_push_targets import DailyPushTarget
+from app.db.models.daily_runs import DailyRun
+from app.db.models.streak_state import StreakState
+from app.db.models.users import User
+
+
+class DailyPushTargetsRepo:
+    @staticmethod
+    async def stage_targets(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        staged_at: datetime,
+    ) -> None:
+        completed_daily_exists = (
+            select(DailyRun.id)
+            .where(
+                DailyRun.user_id == User.id,
+                DailyRun.berlin_date == berlin_date,
+                DailyRun.status == "COMPLETED",
+            )
+            .exists()
+        )
+        push_logged_exists = (
+            select(DailyPushLog.user_id)
+            .where(
+                DailyPushLog.user_id == User.id,
+                DailyPushLog.berlin_date == berlin_date,
+                DailyPushLog.push_kind == push_kind,
+            )
+            .exists()
+        )
+        targets = (
+            select(
+                literal(berlin_date, Date),
+                literal(push_kind, String(32)),
+                User.id,
+                User.telegram_user_id,
+                func.coalesce(StreakState.current_streak, 0),
+                literal(staged_at, DateTime(timezone=True)),
+            )
+            .outerjoin(StreakState, StreakState.user_id == User.id)
+            .where(User.status == "ACTIVE", ~completed_daily_exists, ~push_logged_exists)
+        )
+        stmt = (
+            insert(DailyPushTarget)
+            .from_select(
+                [
+                    DailyPushTarget.berlin_date,
+                    DailyPushTarget.push_kind,
+                    DailyPushTarget.user_id,
+                    DailyPushTarget.telegram_user_id,
+                    DailyPushTarget.current_streak,
+                    DailyPushTarget.staged_at,
+                ],
+                targets,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    DailyPushTarget.berlin_date,
+                    DailyPushTarget.push_kind,
+                    DailyPushTarget.user_id,
+                ]
+            )
+        )
+        await session.execute(stmt)
+
+    @staticmethod
+    async def list_range_batch(
+        session: AsyncSession,
+        *,
+        berlin_date: date,
+        push_kind: str,
+        after_user_id: int,
+        to_user_id: int,
+        limit: int,
+    ) -> list[tuple[int, int, int]]:
+        stmt = (
+            select(
+                DailyPushTarget.user_id,
+                DailyPushTarget.telegram_user_id,
+                DailyPushTarget.current_streak,
+            )
+            .where(
+                DailyPushTarget.berlin_date == berlin_date,
+                DailyPushTarget.push_kind == push_kind,
+                DailyPushTarget.user_id > after_user_id,
+                DailyPushTarget.user_id <= to_user_id,
+            )
+            .order_by(DailyPushTarget.user_id.asc())
+            .limit(max(1, min(1000, int(limit))))
+        )
+        result = await session.execute(stmt)
+        return [
+            (int(user_id), int(telegram_user_id), int(current_streak))
+            for user_id, telegram_user_id, current_streak in result.all()
+        ]
+
+    @staticmethod
+    async def delete_before(session: AsyncSession, *, berlin_date: date) -> None:
+        await session.execute(
+            delete(DailyPushTarget).where(DailyPushTarget.berlin_date < berlin_date)
+        )
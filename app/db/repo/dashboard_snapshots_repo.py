@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.dashboard_snapshots import DashboardSnapshot
+
+
+class DashboardSnapshotsRepo:
+    @staticmethod
+    async def get(
+        session: AsyncSession,
+        *,
+        dashboard: str,
+        window_hours: int,
+    ) -> DashboardSnapshot | None:
+        stmt = select(DashboardSnapshot).where(
+            DashboardSnapshot.dashboard == dashboard,
+            DashboardSnapshot.window_hours == window_hours,
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def upsert(
+        session: AsyncSession,
+        *,
+        dashboard: str,
+        window_hours: int,
+        schema_version: int,
+        payload: dict[str, Any],
+        generated_at: datetime,
+        compute_ms: int,
+    ) -> None:
+        values = {
+            "dashboard": dashboard,
+            "window_hours": window_hours,
+            "schema_version": schema_version,
+            "payload": payload,
+            "generated_at": generated_at,
+            "compute_ms": max(0, int(compute_ms)),
+        }
+        stmt = insert(DashboardSnapshot).values(**values)
+        # An older refresh finishing late must not overwrite a newer snapshot.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DashboardSnapshot.dashboard, DashboardSnapshot.window_hours],
+            set_={
+                key: stmt.excluded[key]
+                for key in values
+                if key not in {"dashboard", "window_hours"}
+            },
+            where=DashboardSnapshot.generated_at <= stmt.excluded.generated_at,
+        )
+        await session.execute(stmt)
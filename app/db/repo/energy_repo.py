@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.energy_state import EnergyState
@@ -19,6 +19,35 @@ class EnergyRepo:
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def update_state_if_version(
+        session: AsyncSession,
+        *,
+        user_id: int,
+        expected_version: int,
+        free_energy: int,
+        paid_energy: int,
+        last_regen_at: datetime,
+        last_daily_topup_local_date: date,
+        now_utc: datetime,
+    ) -> bool:
+        stmt = (
+            update(EnergyState)
+            .where(EnergyState.user_id == user_id, EnergyState.version == expected_version)
+            .values(
+                free_energy=free_energy,
+                paid_energy=paid_energy,
+                last_regen_at=last_regen_at,
+                last_daily_topup_local_date=last_daily_topup_local_date,
+                updated_at=now_utc,
+                version=expected_version + 1,
+            )
+            .returning(EnergyState.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     @staticmethod
     async def create_default_state(
         session: AsyncSession,
@@ -7,6 +7,7 @@ from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.entitlements import Entitlement
+from app.db.session_memo import PremiumLookup, PremiumWindow, get_session_memo
 
 
 class EntitlementsRepo:
@@ -32,11 +33,38 @@ class EntitlementsRepo:
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def has_active_premium(session: AsyncSession, user_id: int, now_utc: datetime) -> bool:
-        entitlement = await EntitlementsRepo._get_active_premium_entitlement(
-            session, user_id, now_utc
+    async def _get_active_premium_window(
+        session: AsyncSession,
+        user_id: int,
+        now_utc: datetime,
+    ) -> PremiumWindow | None:
+        memo = get_session_memo(session)
+        cached = memo.premium_by_user_id.get(user_id) if memo is not None else None
+        if cached is not None and cached.checked_at <= now_utc:
+            return cached.active_at(now_utc)
+
+        # Not filtering on starts_at keeps the memo exact for any later now_utc in the transaction.
+        stmt = select(Entitlement.scope, Entitlement.starts_at, Entitlement.ends_at).where(
+            Entitlement.user_id == user_id,
+            Entitlement.entitlement_type == "PREMIUM",
+            Entitlement.status == "ACTIVE",
+            or_(Entitlement.ends_at.is_(None), Entitlement.ends_at > now_utc),
+        )
+        row = (await session.execute(stmt)).one_or_none()
+        window = (
+            PremiumWindow(scope=row.scope, starts_at=row.starts_at, ends_at=row.ends_at)
+            if row is not None
+            else None
         )
-        return entitlement is not None
+        lookup = PremiumLookup(checked_at=now_utc, window=window)
+        if memo is not None:
+            memo.premium_by_user_id[user_id] = lookup
+        return lookup.active_at(now_utc)
+
+    @staticmethod
+    async def has_active_premium(session: AsyncSession, user_id: int, now_utc: datetime) -> bool:
+        window = await EntitlementsRepo._get_active_premium_window(session, user_id, now_utc)
+        return window is not None
 
     @staticmethod
     async def get_active_premium_scope(
@@ -44,10 +72,8 @@ class EntitlementsRepo:
         user_id: int,
         now_utc: datetime,
     ) -> str | None:
-        entitlement = await EntitlementsRepo._get_active_premium_entitlement(
-            session, user_id, now_utc
-        )
-        return entitlement.scope if entitlement is not None else None
+        window = await EntitlementsRepo._get_active_premium_window(session, user_id, now_utc)
+        return window.scope if window is not None else None
 
     @staticmethod
     async def get_active_premium_for_update(
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.friend_challenge_questions import FriendChallengeQuestion
+from app.db.models.quiz_questions import QuizQuestion
+
+
+class FriendChallengeQuestionsRepo:
+    @staticmethod
+    async def insert_plan(
+        session: AsyncSession,
+        *,
+        challenge_id: UUID,
+        question_ids: Sequence[str],
+    ) -> None:
+        if not question_ids:
+            return
+        values = [
+            {"challenge_id": challenge_id, "round_no": round_no, "question_id": question_id}
+            for round_no, question_id in enumerate(question_ids, start=1)
+        ]
+        await session.execute(insert(FriendChallengeQuestion).values(values))
+
+    @staticmethod
+    async def list_question_ids(
+        session: AsyncSession,
+        *,
+        challenge_id: UUID,
+    ) -> tuple[str, ...]:
+        stmt = (
+            select(FriendChallengeQuestion.question_id)
+            .where(FriendChallengeQuestion.challenge_id == challenge_id)
+            .order_by(FriendChallengeQuestion.round_no.asc())
+        )
+        result = await session.execute(stmt)
+        return tuple(result.scalars().all())
+
+    @staticmethod
+    async def get_round_question(
+        session: AsyncSession,
+        *,
+        challenge_id: UUID,
+        round_no: int,
+    ) -> tuple[str, QuizQuestion | None] | None:
+        """Planned question id for one round plus its bank row (None for static-bank ids)."""
+        stmt = (
+            select(FriendChallengeQuestion.question_id, QuizQuestion)
+            .outerjoin(
+                QuizQuestion, QuizQuestion.question_id == FriendChallengeQuestion.question_id
+            )
+            .where(
+                FriendChallengeQuestion.challenge_id == challenge_id,
+                FriendChallengeQuestion.round_no == round_no,
+            )
+        )
+        row = (await session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return str(row[0]), row[1]
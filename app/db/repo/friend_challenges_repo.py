@@ -7,11 +7,21 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.friend_challenges import FriendChallenge
+from app.db.repo.friend_challenges_sweeps import (
+    expire_pending_due,
+    mark_last_chance_due,
+    walkover_joined_due,
+)
 
 _DUEL_LIVE_STATUSES = ("ACTIVE", "PENDING", "ACCEPTED", "CREATOR_DONE", "OPPONENT_DONE")
 
 
 class FriendChallengesRepo:
+    # Set-based deadline sweeps: one UPDATE ... RETURNING per transition class.
+    expire_pending_due = staticmethod(expire_pending_due)
+    walkover_joined_due = staticmethod(walkover_joined_due)
+    mark_last_chance_due = staticmethod(mark_last_chance_due)
+
     @staticmethod
     async def get_by_id(session: AsyncSession, challenge_id: UUID) -> FriendChallenge | None:
         return await session.get(FriendChallenge, challenge_id)
@@ -137,31 +147,6 @@ class FriendChallengesRepo:
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
-    @staticmethod
-    async def list_active_due_for_last_chance_for_update(
-        session: AsyncSession,
-        *,
-        now_utc: datetime,
-        expires_before_utc: datetime,
-        limit: int,
-    ) -> list[FriendChallenge]:
-        resolved_limit = max(1, int(limit))
-        stmt = (
-            select(FriendChallenge)
-            .where(
-                FriendChallenge.tournament_match_id.is_(None),
-                FriendChallenge.status.in_(("ACCEPTED", "CREATOR_DONE", "OPPONENT_DONE", "ACTIVE")),
-                FriendChallenge.expires_at > now_utc,
-                FriendChallenge.expires_at <= expires_before_utc,
-                FriendChallenge.expires_last_chance_notified_at.is_(None),
-            )
-            .order_by(FriendChallenge.expires_at.asc())
-            .limit(resolved_limit)
-            .with_for_update(skip_locked=True)
-        )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
-
     @staticmethod
     async def list_active_due_for_expire_for_update(
         session: AsyncSession,
@@ -184,51 +169,6 @@ class FriendChallengesRepo:
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
-    @staticmethod
-    async def list_pending_due_for_expire_for_update(
-        session: AsyncSession,
-        *,
-        now_utc: datetime,
-        limit: int,
-    ) -> list[FriendChallenge]:
-        resolved_limit = max(1, int(limit))
-        stmt = (
-            select(FriendChallenge)
-            .where(
-                FriendChallenge.tournament_match_id.is_(None),
-                FriendChallenge.status == "PENDING",
-                FriendChallenge.expires_at <= now_utc,
-            )
-            .order_by(FriendChallenge.expires_at.asc())
-            .limit(resolved_limit)
-            .with_for_update(skip_locked=True)
-        )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
-
-    @staticmethod
-    async def list_joined_due_for_walkover_for_update(
-        session: AsyncSession,
-        *,
-        now_utc: datetime,
-        limit: int,
-    ) -> list[FriendChallenge]:
-        resolved_limit = max(1, int(limit))
-        stmt = (
-            select(FriendChallenge)
-            .where(
-                FriendChallenge.tournament_match_id.is_(None),
-                FriendChallenge.status.in_(("ACCEPTED", "CREATOR_DONE", "OPPONENT_DONE", "ACTIVE")),
-                FriendChallenge.opponent_user_id.is_not(None),
-                FriendChallenge.expires_at <= now_utc,
-            )
-            .order_by(FriendChallenge.expires_at.asc())
-            .limit(resolved_limit)
-            .with_for_update(skip_locked=True)
-        )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
-
     @staticmethod
     async def list_by_series_id_for_update(
         session: AsyncSession,
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, and_, case, null, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.friend_challenges import FriendChallenge
+
+_JOINED_STATUSES = ("ACCEPTED", "CREATOR_DONE", "OPPONENT_DONE", "ACTIVE")
+
+_RETURNED_COLUMNS = (
+    FriendChallenge.id,
+    FriendChallenge.status,
+    FriendChallenge.creator_user_id,
+    FriendChallenge.opponent_user_id,
+    FriendChallenge.creator_score,
+    FriendChallenge.opponent_score,
+    FriendChallenge.total_rounds,
+    FriendChallenge.winner_user_id,
+    FriendChallenge.expires_at,
+)
+
+
+def _claim_due(
+    *conditions: Any, limit: int, partition_index: int, partition_count: int
+) -> Select[Any]:
+    stmt = select(
+        FriendChallenge.id.label("id"),
+        FriendChallenge.status.label("previous_status"),
+    ).where(FriendChallenge.tournament_match_id.is_(None), *conditions)
+    if partition_count > 1:
+        stmt = stmt.where(FriendChallenge.creator_user_id % partition_count == partition_index)
+    return (
+        stmt.order_by(FriendChallenge.expires_at.asc())
+        .limit(max(1, int(limit)))
+        .with_for_update(skip_locked=True)
+    )
+
+
+async def _apply(
+    session: AsyncSession,
+    claim: Select[Any],
+    values: dict[Any, Any],
+    *extra_returning: Any,
+) -> list[dict[str, Any]]:
+    due = claim.cte("due")
+    stmt = (
+        update(FriendChallenge)
+        .where(FriendChallenge.id == due.c.id)
+        .values(values)
+        .returning(*_RETURNED_COLUMNS, due.c.previous_status, *extra_returning)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+async def expire_pending_due(
+    session: AsyncSession,
+    *,
+    now_utc: datetime,
+    limit: int,
+    partition_index: int = 0,
+    partition_count: int = 1,
+) -> list[dict[str, Any]]:
+    claim = _claim_due(
+        FriendChallenge.status == "PENDING",
+        FriendChallenge.expires_at <= now_utc,
+        limit=limit,
+        partition_index=partition_index,
+        partition_count=partition_count,
+    )
+    values = {
+        FriendChallenge.status: "EXPIRED",
+        FriendChallenge.winner_user_id: null(),
+        FriendChallenge.completed_at: now_utc,
+        FriendChallenge.updated_at: now_utc,
+    }
+    return await _apply(session, claim, values)
+
+
+async def walkover_joined_due(
+    session: AsyncSession,
+    *,
+    now_utc: datetime,
+    limit: int,
+    partition_index: int = 0,
+    partition_count: int = 1,
+) -> list[dict[str, Any]]:
+    """Set-based twin of ``_expire_friend_challenge_if_due`` for duels that have an opponent."""
+    claim = _claim_due(
+        FriendChallenge.status.in_(_JOINED_STATUSES),
+        FriendChallenge.opponent_user_id.is_not(None),
+        FriendChallenge.expires_at <= now_utc,
+        limit=limit,
+        partition_index=partition_index,
+        partition_count=partition_count,
+    )
+    creator_done = or_(
+        FriendChallenge.creator_finished_at.is_not(None),
+        FriendChallenge.creator_answered_round >= FriendChallenge.total_rounds,
+    )
+    opponent_done = or_(
+        FriendChallenge.opponent_finished_at.is_not(None),
+        FriendChallenge.opponent_answered_round >= FriendChallenge.total_rounds,
+    )
+    creator_only = and_(creator_done, ~opponent_done)
+    opponent_only = and_(opponent_done, ~creator_done)
+    values = {
+        FriendChallenge.status: "WALKOVER",
+        FriendChallenge.winner_user_id: case(
+            (creator_only, FriendChallenge.creator_user_id),
+            (opponent_only, FriendChallenge.opponent_user_id),
+            else_=null(),
+        ),
+        FriendChallenge.creator_score: case((creator_only, FriendChallenge.creator_score), else_=0),
+        FriendChallenge.opponent_score: case(
+            (opponent_only, FriendChallenge.opponent_score), else_=0
+        ),
+        FriendChallenge.completed_at: now_utc,
+        FriendChallenge.updated_at: now_utc,
+    }
+    return await _apply(session, claim, values)
+
+
+async def mark_last_chance_due(
+    session: AsyncSession,
+    *,
+    now_utc: datetime,
+    expires_before_utc: datetime,
+    max_push_per_user: int,
+    limit: int,
+    partition_index: int = 0,
+    partition_count: int = 1,
+) -> list[dict[str, Any]]:
+    """Claims duels waiting on one player and bumps that player's push counter.
+
+    Each returned row carries ``target_user_id``: the player who still has to play.
+    """
+    creator_waiting = and_(
+        FriendChallenge.status == "CREATOR_DONE",
+        FriendChallenge.opponent_user_id.is_not(None),
+        FriendChallenge.opponent_push_count < max_push_per_user,
+    )
+    opponent_waiting = and_(
+        FriendChallenge.status == "OPPONENT_DONE",
+        FriendChallenge.creator_push_count < max_push_per_user,
+    )
+    claim = _claim_due(
+        or_(creator_waiting, opponent_waiting),
+        FriendChallenge.expires_at > now_utc,
+        FriendChallenge.expires_at <= expires_before_utc,
+        FriendChallenge.expires_last_chance_notified_at.is_(None),
+        limit=limit,
+        partition_index=partition_index,
+        partition_count=partition_count,
+    )
+    waits_for_opponent = FriendChallenge.status == "CREATOR_DONE"
+    values = {
+        FriendChallenge.opponent_push_count: case(
+            (waits_for_opponent, FriendChallenge.opponent_push_count + 1),
+            else_=FriendChallenge.opponent_push_count,
+        ),
+        FriendChallenge.creator_push_count: case(
+            (waits_for_opponent, FriendChallenge.creator_push_count),
+            else_=FriendChallenge.creator_push_count + 1,
+        ),
+        FriendChallenge.expires_last_chance_notified_at: now_utc,
+        FriendChallenge.updated_at: now_utc,
+    }
+    target_user_id = case(
+        (waits_for_opponent, FriendChallenge.opponent_user_id),
+        else_=FriendChallenge.creator_user_id,
+    ).label("target_user_id")
+    return await _apply(session, claim, values, target_user_id)
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import distinct, func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.ledger_entries import LedgerEntry
 from app.db.models.purchases import Purchase
 
+from .ledger_repo_snapshot_audit import diff_balance_snapshots, rebuild_balance_snapshots
+from .ledger_repo_snapshots import (
+    apply_entries_to_balance_snapshots,
+    count_distinct_purchase_credits,
+    sum_distinct_purchase_stars_for_credits,
+    sum_distinct_purchase_stars_for_credits_by_product,
+)
+
 
 class LedgerRepo:
     @staticmethod
@@ -22,8 +32,15 @@ class LedgerRepo:
     async def create(session: AsyncSession, *, entry: LedgerEntry) -> LedgerEntry:
         session.add(entry)
         await session.flush()
+        await apply_entries_to_balance_snapshots(session, entries=[entry])
         return entry
 
+    @staticmethod
+    async def create_many(session: AsyncSession, *, entries: Sequence[LedgerEntry]) -> None:
+        session.add_all(entries)
+        await session.flush()
+        await apply_entries_to_balance_snapshots(session, entries=entries)
+
     @staticmethod
     async def get_purchase_credit_for_update(
         session: AsyncSession,
@@ -48,63 +65,42 @@ class LedgerRepo:
         return entries[0]
 
     @staticmethod
-    async def count_distinct_purchase_credits(session: AsyncSession) -> int:
-        stmt = select(func.count(distinct(LedgerEntry.purchase_id))).where(
-            LedgerEntry.purchase_id.is_not(None),
-            LedgerEntry.entry_type == "PURCHASE_CREDIT",
-            LedgerEntry.direction == "CREDIT",
-        )
-        result = await session.execute(stmt)
-        return int(result.scalar_one() or 0)
-
-    @staticmethod
-    async def sum_distinct_purchase_stars_for_credits(session: AsyncSession) -> int:
-        credited_purchase_ids = (
-            select(distinct(LedgerEntry.purchase_id).label("purchase_id"))
-            .where(
-                LedgerEntry.purchase_id.is_not(None),
-                LedgerEntry.entry_type == "PURCHASE_CREDIT",
-                LedgerEntry.direction == "CREDIT",
-            )
-            .subquery()
-        )
-
+    async def count_recent_purchase_credit_mismatches(
+        session: AsyncSession,
+        *,
+        paid_since_utc: datetime,
+    ) -> int:
+        """Credited purchases paid since the cutoff whose credit entry is missing or disagrees."""
         stmt = (
-            select(func.coalesce(func.sum(Purchase.stars_amount), 0))
+            select(func.count(Purchase.id))
             .select_from(Purchase)
-            .join(
-                credited_purchase_ids,
-                Purchase.id == credited_purchase_ids.c.purchase_id,
+            .outerjoin(
+                LedgerEntry,
+                and_(
+                    LedgerEntry.purchase_id == Purchase.id,
+                    LedgerEntry.entry_type == "PURCHASE_CREDIT",
+                    LedgerEntry.direction == "CREDIT",
+                ),
             )
-        )
-        result = await session.execute(stmt)
-        return int(result.scalar_one() or 0)
-
-    @staticmethod
-    async def sum_distinct_purchase_stars_for_credits_by_product(
-        session: AsyncSession,
-    ) -> dict[str, int]:
-        credited_purchase_ids = (
-            select(distinct(LedgerEntry.purchase_id).label("purchase_id"))
             .where(
-                LedgerEntry.purchase_id.is_not(None),
-                LedgerEntry.entry_type == "PURCHASE_CREDIT",
-                LedgerEntry.direction == "CREDIT",
+                Purchase.paid_at.is_not(None),
+                Purchase.paid_at >= paid_since_utc,
+                Purchase.credited_at.is_not(None),
+                or_(
+                    LedgerEntry.id.is_(None),
+                    LedgerEntry.amount != Purchase.stars_amount,
+                    func.coalesce(LedgerEntry.metadata_["product_code"].astext, "")
+                    != Purchase.product_code,
+                ),
             )
-            .subquery()
-        )
-
-        stmt = (
-            select(
-                Purchase.product_code,
-                func.coalesce(func.sum(Purchase.stars_amount), 0),
-            )
-            .select_from(Purchase)
-            .join(
-                credited_purchase_ids,
-                Purchase.id == credited_purchase_ids.c.purchase_id,
-            )
-            .group_by(Purchase.product_code)
         )
         result = await session.execute(stmt)
-        return {product_code: int(total or 0) for product_code, total in result.all()}
+        return int(result.scalar_one() or 0)
+
+    count_distinct_purchase_credits = staticmethod(count_distinct_purchase_credits)
+    sum_distinct_purchase_stars_for_credits = staticmethod(sum_distinct_purchase_stars_for_credits)
+    sum_distinct_purchase_stars_for_credits_by_product = staticmethod(
+        sum_distinct_purchase_stars_for_credits_by_product
+    )
+    diff_balance_snapshots = staticmethod(diff_balance_snapshots)
+    rebuild_balance_snapshots = staticmethod(rebuild_balance_snapshots)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, func, literal, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.ledger_balance_snapshots import LedgerBalanceSnapshot
+from app.db.models.ledger_entries import LedgerEntry
+
+from .ledger_repo_snapshots import KEY_COLUMNS, LEDGER_SNAPSHOT_SHARDS
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerSnapshotDrift:
+    entry_type: str
+    asset: str
+    direction: str
+    product_code: str
+    shard: int
+    expected_count: int
+    expected_amount: int
+    stored_count: int
+    stored_amount: int
+
+
+def _ledger_totals_from_scratch():
+    product_code = func.coalesce(LedgerEntry.metadata_["product_code"].astext, literal(""))
+    shard = LedgerEntry.user_id % LEDGER_SNAPSHOT_SHARDS
+    return select(
+        LedgerEntry.entry_type.label("entry_type"),
+        LedgerEntry.asset.label("asset"),
+        LedgerEntry.direction.label("direction"),
+        product_code.label("product_code"),
+        shard.label("shard"),
+        func.count(LedgerEntry.id).label("entries_count"),
+        func.sum(LedgerEntry.amount).label("amount_total"),
+        func.max(LedgerEntry.created_at).label("updated_at"),
+    ).group_by(
+        LedgerEntry.entry_type, LedgerEntry.asset, LedgerEntry.direction, product_code, shard
+    )
+
+
+async def diff_balance_snapshots(session: AsyncSession) -> list[LedgerSnapshotDrift]:
+    """Rebuilds the totals from ``ledger_entries`` and returns every row that disagrees.
+
+    One statement, so both sides are read from the same MVCC snapshot even while writers run.
+    """
+    expected = _ledger_totals_from_scratch().subquery()
+    stored = LedgerBalanceSnapshot.__table__.alias("stored")
+    joined = expected.join(
+        stored,
+        and_(*(expected.c[column] == stored.c[column] for column in KEY_COLUMNS)),
+        full=True,
+    )
+    stmt = select(
+        *(func.coalesce(expected.c[column], stored.c[column]) for column in KEY_COLUMNS),
+        func.coalesce(expected.c.entries_count, 0),
+        func.coalesce(expected.c.amount_total, 0),
+        func.coalesce(stored.c.entries_count, 0),
+        func.coalesce(stored.c.amount_total, 0),
+    ).select_from(joined)
+    stmt = stmt.where(
+        or_(
+            func.coalesce(expected.c.entries_count, 0) != func.coalesce(stored.c.entries_count, 0),
+            func.coalesce(expected.c.amount_total, 0) != func.coalesce(stored.c.amount_total, 0),
+        )
+    )
+    result = await session.execute(stmt)
+    return [
+        LedgerSnapshotDrift(
+            entry_type=row[0],
+            asset=row[1],
+            direction=row[2],
+            product_code=row[3],
+            shard=int(row[4]),
+            expected_count=int(row[5]),
+            expected_amount=int(row[6]),
+            stored_count=int(row[7]),
+            stored_amount=int(row[8]),
+        )
+        for row in result.all()
+    ]
+
+
+async def rebuild_balance_snapshots(session: AsyncSession) -> int:
+    """Replaces every snapshot row with totals recomputed from ``ledger_entries``.
+
+    The EXCLUSIVE lock waits for writers that already touched the snapshots and holds back new
+    ones until commit, so no entry is counted twice or missed.
+    """
+    await session.execute(text("LOCK TABLE ledger_balance_snapshots IN EXCLUSIVE MODE"))
+    await session.execute(delete(LedgerBalanceSnapshot))
+    totals = _ledger_totals_from_scratch()
+    result = await session.execute(
+        insert(LedgerBalanceSnapshot).from_select(
+            [*KEY_COLUMNS, "entries_count", "amount_total", "updated_at"], totals
+        )
+    )
+    return int(result.rowcount or 0)  # type: ignore[attr-defined]
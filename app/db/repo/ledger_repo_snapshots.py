@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.ledger_balance_snapshots import LedgerBalanceSnapshot
+from app.db.models.ledger_entries import LedgerEntry
+
+LEDGER_SNAPSHOT_SHARDS = 16
+_SnapshotKey = tuple[str, str, str, str, int]
+KEY_COLUMNS = ("entry_type", "asset", "direction", "product_code", "shard")
+
+
+def ledger_snapshot_key(entry: LedgerEntry) -> _SnapshotKey:
+    product_code = (entry.metadata_ or {}).get("product_code") or ""
+    return (
+        entry.entry_type,
+        entry.asset,
+        entry.direction,
+        str(product_code),
+        int(entry.user_id) % LEDGER_SNAPSHOT_SHARDS,
+    )
+
+
+async def apply_entries_to_balance_snapshots(
+    session: AsyncSession, *, entries: Sequence[LedgerEntry]
+) -> None:
+    """Adds freshly inserted ledger entries to the running totals in the caller's transaction."""
+    if not entries:
+        return
+    deltas: dict[_SnapshotKey, list[int]] = defaultdict(lambda: [0, 0])
+    for entry in entries:
+        delta = deltas[ledger_snapshot_key(entry)]
+        delta[0] += 1
+        delta[1] += int(entry.amount)
+    updated_at = max(entry.created_at for entry in entries)
+    # Sorted keys make every writer lock snapshot rows in the same order.
+    rows = [
+        {
+            **dict(zip(KEY_COLUMNS, key, strict=True)),
+            "entries_count": count,
+            "amount_total": amount,
+            "updated_at": updated_at,
+        }
+        for key, (count, amount) in sorted(deltas.items())
+    ]
+    stmt = insert(LedgerBalanceSnapshot).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={
+            "entries_count": LedgerBalanceSnapshot.entries_count + stmt.excluded.entries_count,
+            "amount_total": LedgerBalanceSnapshot.amount_total + stmt.excluded.amount_total,
+            "updated_at": func.greatest(LedgerBalanceSnapshot.updated_at, stmt.excluded.updated_at),
+        },
+    )
+    await session.execute(stmt)
+
+
+# EnergyService.credit_paid_energy also writes PURCHASE_CREDIT/CREDIT rows, with asset PAID_ENERGY.
+_PURCHASE_CREDIT_SNAPSHOT = (
+    LedgerBalanceSnapshot.entry_type == "PURCHASE_CREDIT",
+    LedgerBalanceSnapshot.asset == "PURCHASE",
+    LedgerBalanceSnapshot.direction == "CREDIT",
+)
+
+
+async def count_distinct_purchase_credits(session: AsyncSession) -> int:
+    # ``credit:purchase:<id>`` is unique, so each credited purchase has exactly one entry.
+    stmt = select(func.coalesce(func.sum(LedgerBalanceSnapshot.entries_count), 0)).where(
+        *_PURCHASE_CREDIT_SNAPSHOT
+    )
+    return int((await session.execute(stmt)).scalar_one() or 0)
+
+
+async def sum_distinct_purchase_stars_for_credits(session: AsyncSession) -> int:
+    stmt = select(func.coalesce(func.sum(LedgerBalanceSnapshot.amount_total), 0)).where(
+        *_PURCHASE_CREDIT_SNAPSHOT
+    )
+    return int((await session.execute(stmt)).scalar_one() or 0)
+
+
+async def sum_distinct_purchase_stars_for_credits_by_product(
+    session: AsyncSession,
+) -> dict[str, int]:
+    stmt = (
+        select(
+            LedgerBalanceSnapshot.product_code,
+            func.coalesce(func.sum(LedgerBalanceSnapshot.amount_total), 0),
+        )
+        .where(*_PURCHASE_CREDIT_SNAPSHOT)
+        .group_by(LedgerBalanceSnapshot.product_code)
+    )
+    result = await session.execute(stmt)
+    return {product_code: int(total or 0) for product_code, total in result.all()}
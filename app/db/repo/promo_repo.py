@@ -39,6 +39,10 @@ from app.db.repo.promo_repo_redemptions_analytics import (
     count_discount_redemptions_by_status,
     count_redemptions_by_status,
 )
+from app.db.repo.promo_repo_refund_rollback import (
+    claim_refunded_purchase_ids_with_pending_revoke,
+    revoke_redemptions_for_refunded_purchases,
+)
 
 
 class PromoRepo:
@@ -57,6 +61,12 @@ class PromoRepo:
     get_refunded_purchase_ids_with_pending_redemption_revoke = staticmethod(
         get_refunded_purchase_ids_with_pending_redemption_revoke
     )
+    claim_refunded_purchase_ids_with_pending_revoke = staticmethod(
+        claim_refunded_purchase_ids_with_pending_revoke
+    )
+    revoke_redemptions_for_refunded_purchases = staticmethod(
+        revoke_redemptions_for_refunded_purchases
+    )
     get_redemption_by_idempotency_key = staticmethod(get_redemption_by_idempotency_key)
     get_redemption_by_idempotency_key_for_update = staticmethod(
         get_redemption_by_idempotency_key_for_update
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.promo_redemptions import PromoRedemption
+from app.db.models.purchases import Purchase
+
+
+async def claim_refunded_purchase_ids_with_pending_revoke(
+    session: AsyncSession,
+    *,
+    limit: int,
+) -> list[UUID]:
+    """Locks refunded purchases whose redemption still counts, skipping rows held elsewhere."""
+    stmt = (
+        select(Purchase.id)
+        .join(PromoRedemption, PromoRedemption.applied_purchase_id == Purchase.id)
+        .where(
+            PromoRedemption.status != "REVOKED",
+            Purchase.status == "REFUNDED",
+            Purchase.applied_promo_code_id.is_not(None),
+        )
+        .order_by(Purchase.refunded_at.asc().nullsfirst(), Purchase.id.asc())
+        .limit(max(1, int(limit)))
+        .with_for_update(of=Purchase, skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def revoke_redemptions_for_refunded_purchases(
+    session: AsyncSession,
+    *,
+    purchase_ids: Sequence[UUID],
+    now_utc: datetime,
+) -> set[UUID]:
+    """Set-based twin of ``revoke_redemption_for_refund``; returns the purchases rolled back."""
+    if not purchase_ids:
+        return set()
+    stmt = (
+        update(PromoRedemption)
+        .where(
+            PromoRedemption.applied_purchase_id.in_(purchase_ids),
+            PromoRedemption.status != "REVOKED",
+        )
+        .values(status="REVOKED", updated_at=now_utc)
+        .returning(PromoRedemption.applied_purchase_id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return {purchase_id for purchase_id in result.scalars().all() if purchase_id is not None}
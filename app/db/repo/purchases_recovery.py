@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.purchases import Purchase
+
+
+async def claim_paid_uncredited_page(
+    session: AsyncSession,
+    *,
+    older_than_utc: datetime,
+    limit: int,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[Purchase]:
+    """Locks a page of stuck purchases, skipping rows another recoverer already holds.
+
+    ``after`` is the ``(paid_at, id)`` of the previous page's last row, so one run visits
+    every purchase at most once even when some of them stay PAID_UNCREDITED.
+    """
+    stmt = select(Purchase).where(
+        Purchase.status == "PAID_UNCREDITED",
+        Purchase.paid_at.is_not(None),
+        Purchase.paid_at <= older_than_utc,
+    )
+    if after is not None:
+        paid_at, purchase_id = after
+        stmt = stmt.where(
+            tuple_(Purchase.paid_at, Purchase.id) > tuple_(literal(paid_at), literal(purchase_id))
+        )
+    stmt = (
+        stmt.order_by(Purchase.paid_at.asc(), Purchase.id.asc())
+        .limit(max(1, int(limit)))
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.purchases import Purchase
 
+from .purchases_recovery import claim_paid_uncredited_page
 from .purchases_repo_metrics import (
     count_paid_purchases,
     sum_paid_stars_amount,
@@ -19,6 +20,7 @@ class PurchasesRepo:
     count_paid_purchases = staticmethod(count_paid_purchases)
     sum_paid_stars_amount = staticmethod(sum_paid_stars_amount)
     sum_paid_stars_amount_by_product = staticmethod(sum_paid_stars_amount_by_product)
+    claim_paid_uncredited_page = staticmethod(claim_paid_uncredited_page)
 
     @staticmethod
     async def get_by_id(session: AsyncSession, purchase_id: UUID) -> Purchase | None:
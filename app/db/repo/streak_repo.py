@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.streak_state import StreakState
@@ -25,6 +25,41 @@ class StreakRepo:
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def update_state_if_version(
+        session: AsyncSession,
+        *,
+        user_id: int,
+        expected_version: int,
+        current_streak: int,
+        best_streak: int,
+        last_activity_local_date: date | None,
+        today_status: str,
+        streak_saver_tokens: int,
+        premium_freezes_used_week: int,
+        premium_freeze_week_start_local_date: date | None,
+        now_utc: datetime,
+    ) -> bool:
+        stmt = (
+            update(StreakState)
+            .where(StreakState.user_id == user_id, StreakState.version == expected_version)
+            .values(
+                current_streak=current_streak,
+                best_streak=best_streak,
+                last_activity_local_date=last_activity_local_date,
+                today_status=today_status,
+                streak_saver_tokens=streak_saver_tokens,
+                premium_freezes_used_week=premium_freezes_used_week,
+                premium_freeze_week_start_local_date=premium_freeze_week_start_local_date,
+                updated_at=now_utc,
+                version=expected_version + 1,
+            )
+            .returning(StreakState.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     @staticmethod
     async def create_default_state(
         session: AsyncSession, *, user_id: int, now_utc: datetime
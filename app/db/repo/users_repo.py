@@ -1,16 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from datetime import date, datetime
+from datetime import datetime
 
 from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.daily_push_logs import DailyPushLog
-from app.db.models.daily_runs import DailyRun
 from app.db.models.streak_state import StreakState
 from app.db.models.tournament_participants import TournamentParticipant
 from app.db.models.users import User
+from app.db.session_memo import get_session_memo
 
 
 class UsersRepo:
@@ -26,9 +25,21 @@ class UsersRepo:
 
     @staticmethod
     async def get_by_telegram_user_id(session: AsyncSession, telegram_user_id: int) -> User | None:
+        memo = get_session_memo(session)
+        cached_user_id = (
+            memo.user_id_by_telegram_id.get(telegram_user_id) if memo is not None else None
+        )
+        if cached_user_id is not None:
+            # session.get resolves from the identity map without a round trip.
+            cached_user = await session.get(User, cached_user_id)
+            if cached_user is not None:
+                return cached_user
         stmt = select(User).where(User.telegram_user_id == telegram_user_id)
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user is not None and memo is not None:
+            memo.user_id_by_telegram_id[telegram_user_id] = user.id
+        return user
 
     @staticmethod
     async def get_by_referral_code(session: AsyncSession, referral_code: str) -> User | None:
@@ -86,60 +97,6 @@ class UsersRepo:
         result = await session.execute(stmt)
         return int(result.scalar_one())
 
-    @staticmethod
-    async def list_daily_push_targets(
-        session: AsyncSession,
-        *,
-        berlin_date: date,
-        push_kind: str,
-        after_user_id: int | None,
-        limit: int,
-    ) -> list[tuple[int, int, int]]:
-        resolved_limit = max(1, min(1000, int(limit)))
-        completed_daily_exists = (
-            select(DailyRun.id)
-            .where(
-                DailyRun.user_id == User.id,
-                DailyRun.berlin_date == berlin_date,
-                DailyRun.status == "COMPLETED",
-            )
-            .exists()
-        )
-        push_logged_exists = (
-            select(DailyPushLog.user_id)
-            .where(
-                DailyPushLog.user_id == User.id,
-                DailyPushLog.berlin_date == berlin_date,
-                DailyPushLog.push_kind == push_kind,
-            )
-            .exists()
-        )
-        stmt = (
-            select(
-                User.id,
-                User.telegram_user_id,
-                func.coalesce(StreakState.current_streak, 0),
-            )
-            .outerjoin(StreakState, StreakState.user_id == User.id)
-            .where(User.status == "ACTIVE", ~completed_daily_exists, ~push_logged_exists)
-            .order_by(User.id.asc())
-            .limit(resolved_limit)
-        )
-        if after_user_id is not None:
-            stmt = stmt.where(User.id > after_user_id)
-
-        result = await session.execute(stmt)
-        rows: list[tuple[int, int, int]] = []
-        for user_id_raw, telegram_user_id_raw, streak_raw in result.all():
-            rows.append(
-                (
-                    int(user_id_raw),
-                    int(telegram_user_id_raw),
-                    int(streak_raw),
-                )
-            )
-        return rows
-
     @staticmethod
     async def list_daily_cup_push_targets(
         session: AsyncSession,
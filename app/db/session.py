@@ -1,8 +1,14 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import get_settings
+from app.db.pool_metrics import instrument_pool_metrics
 
 settings = get_settings()
 
@@ -11,6 +17,7 @@ engine = create_async_engine(
     echo=settings.app_env == "dev",
     pool_pre_ping=True,
 )
+instrument_pool_metrics(engine, pool_name="primary")
 
 SessionLocal = async_sessionmaker(
     bind=engine,
@@ -19,6 +26,27 @@ SessionLocal = async_sessionmaker(
 )
 
 
+def create_read_only_engine(database_url: str) -> AsyncEngine:
+    """Engine whose every transaction is READ ONLY on the server, whatever the caller does."""
+    return create_async_engine(
+        database_url,
+        pool_pre_ping=True,
+        connect_args={"server_settings": {"default_transaction_read_only": "on"}},
+    )
+
+
+replica_engine: AsyncEngine | None = None
+ReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_replica_url.strip():
+    replica_engine = create_read_only_engine(settings.database_replica_url.strip())
+    instrument_pool_metrics(replica_engine, pool_name="replica")
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
@@ -26,3 +54,5 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 async def dispose_engine() -> None:
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
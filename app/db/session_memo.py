@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.models.entitlements import Entitlement
+
+MEMO_INFO_KEY = "quiz_arena_session_memo"
+
+
+@dataclass(frozen=True, slots=True)
+class PremiumWindow:
+    scope: str | None
+    starts_at: datetime
+    ends_at: datetime | None
+
+    def covers(self, now_utc: datetime) -> bool:
+        return self.starts_at <= now_utc and (self.ends_at is None or self.ends_at > now_utc)
+
+
+@dataclass(frozen=True, slots=True)
+class PremiumLookup:
+    checked_at: datetime
+    window: PremiumWindow | None
+
+    def active_at(self, now_utc: datetime) -> PremiumWindow | None:
+        if self.window is None or not self.window.covers(now_utc):
+            return None
+        return self.window
+
+
+@dataclass(slots=True)
+class SessionMemo:
+    premium_by_user_id: dict[int, PremiumLookup] = field(default_factory=dict)
+    user_id_by_telegram_id: dict[int, int] = field(default_factory=dict)
+
+
+def get_session_memo(session: AsyncSession | Session) -> SessionMemo | None:
+    """Returns the memo for the session's current transaction; None for sessions without info."""
+    info = getattr(session, "info", None)
+    if not isinstance(info, dict):
+        return None
+    memo = info.get(MEMO_INFO_KEY)
+    if memo is None:
+        memo = SessionMemo()
+        info[MEMO_INFO_KEY] = memo
+    return memo
+
+
+def _invalidate_premium(session: Session) -> None:
+    memo = session.info.get(MEMO_INFO_KEY)
+    if memo is not None:
+        memo.premium_by_user_id.clear()
+
+
+def _clear_memo(session: Session, *_: Any) -> None:
+    session.info.pop(MEMO_INFO_KEY, None)
+
+
+@event.listens_for(Session, "before_flush")
+def _invalidate_on_entitlement_flush(session: Session, *_: Any) -> None:
+    pending = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, Entitlement) for obj in pending):
+        _invalidate_premium(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_entitlement_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    if any(mapper.class_ is Entitlement for mapper in orm_execute_state.all_mappers):
+        _invalidate_premium(orm_execute_state.session)
+
+
+event.listen(Session, "after_commit", _clear_memo)
+event.listen(Session, "after_rollback", _clear_memo)
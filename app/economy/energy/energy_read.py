@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repo.energy_repo import EnergyRepo
+from app.db.repo.entitlements_repo import EntitlementsRepo
+from app.economy.energy.energy_daily_topup import apply_daily_topup_berlin
+from app.economy.energy.energy_models import snapshot_from_model
+from app.economy.energy.energy_regen import apply_regen_tick
+from app.economy.energy.time import berlin_local_date, regen_ticks
+from app.economy.energy.types import EnergySnapshot
+
+
+def energy_transition_due(snapshot: EnergySnapshot, *, now_utc: datetime) -> bool:
+    if regen_ticks(snapshot.last_regen_at, now_utc, snapshot.regen_interval_sec) > 0:
+        return True
+    return berlin_local_date(now_utc) > snapshot.last_daily_topup_local_date
+
+
+async def read_energy_snapshot(
+    session: AsyncSession, *, user_id: int, now_utc: datetime
+) -> EnergySnapshot | None:
+    """Derives the energy clock without row locks; returns None when the locked path must run."""
+    state = await EnergyRepo.get_by_user_id(session, user_id)
+    if state is None:
+        return None
+    stored = snapshot_from_model(state)
+    if not energy_transition_due(stored, now_utc=now_utc):
+        return stored
+
+    premium_active = await EntitlementsRepo.has_active_premium(session, user_id, now_utc)
+    snapshot, _ = apply_regen_tick(stored, now_utc=now_utc, premium_active=premium_active)
+    snapshot, _ = apply_daily_topup_berlin(snapshot, now_utc=now_utc)
+    applied = await EnergyRepo.update_state_if_version(
+        session,
+        user_id=user_id,
+        expected_version=state.version,
+        free_energy=snapshot.free_energy,
+        paid_energy=snapshot.paid_energy,
+        last_regen_at=snapshot.last_regen_at,
+        last_daily_topup_local_date=snapshot.last_daily_topup_local_date,
+        now_utc=now_utc,
+    )
+    # The UPDATE bypasses the identity map; expire so later locked reads see the stored row.
+    session.expire(state)
+    return snapshot if applied else None
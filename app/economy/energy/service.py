@@ -15,6 +15,7 @@ from app.economy.energy.energy_models import (
     initialize_user_state,
     snapshot_from_model,
 )
+from app.economy.energy.energy_read import read_energy_snapshot
 from app.economy.energy.energy_regen import apply_regen_tick
 from app.economy.energy.types import EnergyConsumeResult, EnergyCreditResult, EnergySnapshot
 
@@ -89,6 +90,15 @@ class EnergyService:
         await session.flush()
         return snapshot
 
+    @staticmethod
+    async def read_energy_clock(
+        session: AsyncSession, *, user_id: int, now_utc: datetime
+    ) -> EnergySnapshot:
+        snapshot = await read_energy_snapshot(session, user_id=user_id, now_utc=now_utc)
+        if snapshot is not None:
+            return snapshot
+        return await EnergyService.sync_energy_clock(session, user_id=user_id, now_utc=now_utc)
+
     @staticmethod
     async def fill_to_free_cap(
         session: AsyncSession, *, user_id: int, now_utc: datetime
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.promo_attempts import PromoAttempt
 from app.db.repo.promo_repo import PromoRepo
 from app.db.session import SessionLocal
+from app.economy.promo.rate_limit import note_failed_attempt
 
 
 async def record_attempt(
@@ -49,3 +50,4 @@ async def record_failed_attempt(
             now_utc=now_utc,
             metadata=metadata,
         )
+    await note_failed_attempt(user_id=user_id, result=result, now_utc=now_utc)
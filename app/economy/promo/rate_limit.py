@@ -1,8 +1,5 @@
 from datetime import datetime
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.db.repo.promo_repo import PromoRepo
 from app.economy.promo.constants import (
     FAILED_PROMO_ATTEMPT_RESULTS,
     PROMO_ATTEMPT_BLOCK_WINDOW,
@@ -10,39 +7,51 @@ from app.economy.promo.constants import (
     PROMO_ATTEMPT_RATE_LIMIT_WINDOW,
 )
 from app.economy.promo.errors import PromoRateLimitedError
+from app.services.rate_limiter import get_window_usage, record_hit
+
+_BLOCK_WINDOW_SECONDS = PROMO_ATTEMPT_BLOCK_WINDOW.total_seconds()
+_RATE_LIMIT_WINDOW_SECONDS = PROMO_ATTEMPT_RATE_LIMIT_WINDOW.total_seconds()
+
+
+def _failures_key(user_id: int) -> str:
+    return f"promo_failures:{user_id}"
+
 
+def _blocked_key(user_id: int) -> str:
+    return f"promo_blocked:{user_id}"
 
-async def enforce_rate_limit(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now_utc: datetime,
-) -> None:
-    block_since = now_utc - PROMO_ATTEMPT_BLOCK_WINDOW
-    recently_rate_limited = await PromoRepo.count_user_attempts(
-        session,
-        user_id=user_id,
-        since_utc=block_since,
-        attempt_results=("RATE_LIMITED",),
+
+async def enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
+    now_ts = now_utc.timestamp()
+    blocked = await get_window_usage(
+        key=_blocked_key(user_id),
+        window_seconds=_BLOCK_WINDOW_SECONDS,
+        now=now_ts,
     )
-    if recently_rate_limited > 0:
+    if blocked.count > 0:
         raise PromoRateLimitedError
 
-    window_start = now_utc - PROMO_ATTEMPT_RATE_LIMIT_WINDOW
-    failed_attempts = await PromoRepo.count_user_attempts(
-        session,
-        user_id=user_id,
-        since_utc=window_start,
-        attempt_results=FAILED_PROMO_ATTEMPT_RESULTS,
+    failures = await get_window_usage(
+        key=_failures_key(user_id),
+        window_seconds=_RATE_LIMIT_WINDOW_SECONDS,
+        now=now_ts,
     )
-    if failed_attempts < PROMO_ATTEMPT_MAX_FAILURES:
+    if failures.count < PROMO_ATTEMPT_MAX_FAILURES or failures.newest_at is None:
         return
-
-    last_failed_at = await PromoRepo.get_last_user_attempt_at(
-        session,
-        user_id=user_id,
-        since_utc=window_start,
-        attempt_results=FAILED_PROMO_ATTEMPT_RESULTS,
-    )
-    if last_failed_at is not None and last_failed_at > block_since:
+    if failures.newest_at > now_ts - _BLOCK_WINDOW_SECONDS:
         raise PromoRateLimitedError
+
+
+async def note_failed_attempt(*, user_id: int, result: str, now_utc: datetime) -> None:
+    if result == "RATE_LIMITED":
+        await record_hit(
+            key=_blocked_key(user_id),
+            window_seconds=_BLOCK_WINDOW_SECONDS,
+            now=now_utc.timestamp(),
+        )
+    elif result in FAILED_PROMO_ATTEMPT_RESULTS:
+        await record_hit(
+            key=_failures_key(user_id),
+            window_seconds=_RATE_LIMIT_WINDOW_SECONDS,
+            now=now_utc.timestamp(),
+        )
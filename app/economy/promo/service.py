@@ -75,7 +75,7 @@ class PromoService:
         )
 
         try:
-            await PromoService._enforce_rate_limit(session, user_id=user_id, now_utc=now_utc)
+            await PromoService._enforce_rate_limit(user_id=user_id, now_utc=now_utc)
         except PromoRateLimitedError:
             await record_failed_attempt(
                 user_id=user_id,
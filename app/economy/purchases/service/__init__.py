@@ -9,6 +9,7 @@ from .entitlements import _apply_premium_entitlement
 from .events import _emit_purchase_event
 from .init import init_purchase
 from .precheckout import mark_invoice_sent, validate_precheckout
+from .recover import PurchaseRecoveryOutcome, recover_claimed_purchases
 from .refund import refund_purchase
 from .utilities import (
     _build_invoice_payload,
@@ -46,11 +47,13 @@ class PurchaseService:
     apply_successful_payment = staticmethod(apply_successful_payment)
     apply_zero_cost_purchase = staticmethod(apply_zero_cost_purchase)
     refund_purchase = staticmethod(refund_purchase)
+    recover_claimed_purchases = staticmethod(recover_claimed_purchases)
 
 
 __all__ = [
     "PREMIUM_PLAN_RANKS",
     "PROMO_RESERVATION_TTL",
+    "PurchaseRecoveryOutcome",
     "STREAK_SAVER_PURCHASE_LOCK_WINDOW",
     "PurchaseService",
 ]
@@ -29,7 +29,15 @@ def build_asset_breakdown(product: ProductSpec) -> dict[str, object]:
     return breakdown
 
 
-async def credit_purchase_assets(
+def _has_item_assets(purchase: Purchase, product: ProductSpec) -> bool:
+    return (
+        product.product_type == "PREMIUM"
+        or product.grants_streak_saver
+        or purchase.applied_promo_code_id is not None
+    )
+
+
+async def _credit_item_assets(
     session: AsyncSession,
     *,
     user_id: int,
@@ -46,16 +54,6 @@ async def credit_purchase_assets(
             now_utc=now_utc,
         )
 
-    if product.energy_credit > 0:
-        await EnergyService.credit_paid_energy(
-            session,
-            user_id=user_id,
-            amount=product.energy_credit,
-            idempotency_key=f"credit:energy:{purchase.id}",
-            now_utc=now_utc,
-            write_ledger_entry=False,
-        )
-
     if product.grants_streak_saver:
         await StreakRepo.add_streak_saver_token(session, user_id=user_id, now_utc=now_utc)
 
@@ -72,24 +70,51 @@ async def credit_purchase_assets(
             promo_code.used_total += 1
             promo_code.updated_at = now_utc
 
-    await LedgerRepo.create(
-        session,
-        entry=LedgerEntry(
+
+def _purchase_credit_entry(
+    purchase: Purchase, product: ProductSpec, *, now_utc: datetime
+) -> LedgerEntry:
+    return LedgerEntry(
+        user_id=purchase.user_id,
+        purchase_id=purchase.id,
+        entry_type="PURCHASE_CREDIT",
+        asset="PURCHASE",
+        direction="CREDIT",
+        amount=purchase.stars_amount,
+        balance_after=None,
+        source="PURCHASE",
+        idempotency_key=f"credit:purchase:{purchase.id}",
+        metadata_={
+            "product_code": product.product_code,
+            "asset_breakdown": build_asset_breakdown(product),
+        },
+        created_at=now_utc,
+    )
+
+
+async def credit_purchase_assets(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    purchase: Purchase,
+    product: ProductSpec,
+    now_utc: datetime,
+) -> None:
+    await _credit_item_assets(
+        session, user_id=user_id, purchase=purchase, product=product, now_utc=now_utc
+    )
+    if product.energy_credit > 0:
+        await EnergyService.credit_paid_energy(
+            session,
             user_id=user_id,
-            purchase_id=purchase.id,
-            entry_type="PURCHASE_CREDIT",
-            asset="PURCHASE",
-            direction="CREDIT",
-            amount=purchase.stars_amount,
-            balance_after=None,
-            source="PURCHASE",
-            idempotency_key=f"credit:purchase:{purchase.id}",
-            metadata_={
-                "product_code": product.product_code,
-                "asset_breakdown": build_asset_breakdown(product),
-            },
-            created_at=now_utc,
-        ),
+            amount=product.energy_credit,
+            idempotency_key=f"credit:energy:{purchase.id}",
+            now_utc=now_utc,
+            write_ledger_entry=False,
+        )
+
+    await LedgerRepo.create(
+        session, entry=_purchase_credit_entry(purchase, product, now_utc=now_utc)
     )
 
     purchase.status = "CREDITED"
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.analytics_events import EVENT_SOURCE_SYSTEM, emit_analytics_events
+from app.db.models.purchases import Purchase
+from app.db.repo.ledger_repo import LedgerRepo
+from app.economy.energy.service import EnergyService
+from app.economy.purchases.catalog import ProductSpec
+from app.economy.purchases.errors import PurchasePrecheckoutValidationError
+
+from .credit_assets import _credit_item_assets, _has_item_assets, _purchase_credit_entry
+from .events import _purchase_event_payload
+
+logger = structlog.get_logger(__name__)
+
+
+async def credit_purchase_assets_batch(
+    session: AsyncSession,
+    *,
+    items: Sequence[tuple[Purchase, ProductSpec]],
+    now_utc: datetime,
+) -> dict[UUID, Exception]:
+    """Set-based twin of ``credit_purchase_assets`` for purchases the caller already locked.
+
+    Energy is credited once per user, ledger rows and events are written in bulk. Only
+    purchases with per-item assets (premium, streak saver, promo) get a savepoint; the ones
+    that fail there, for any reason, are returned and left uncredited.
+    """
+    failures: dict[UUID, Exception] = {}
+    credited: list[tuple[Purchase, ProductSpec]] = []
+    for purchase, product in items:
+        if _has_item_assets(purchase, product):
+            try:
+                async with session.begin_nested():
+                    await _credit_item_assets(
+                        session,
+                        user_id=purchase.user_id,
+                        purchase=purchase,
+                        product=product,
+                        now_utc=now_utc,
+                    )
+            except Exception as exc:
+                if not isinstance(exc, PurchasePrecheckoutValidationError):
+                    logger.exception("purchase_item_credit_failed", purchase_id=str(purchase.id))
+                failures[purchase.id] = exc
+                await session.refresh(purchase)
+                continue
+        credited.append((purchase, product))
+
+    energy_by_user: dict[int, int] = defaultdict(int)
+    for purchase, product in credited:
+        if product.energy_credit > 0:
+            energy_by_user[purchase.user_id] += product.energy_credit
+    # Sorted so concurrent recoverers take energy-state row locks in the same order.
+    for user_id, amount in sorted(energy_by_user.items()):
+        await EnergyService.credit_paid_energy(
+            session,
+            user_id=user_id,
+            amount=amount,
+            idempotency_key=f"credit:energy:batch:{user_id}",
+            now_utc=now_utc,
+            write_ledger_entry=False,
+        )
+
+    for purchase, _ in credited:
+        purchase.status = "CREDITED"
+        purchase.credited_at = now_utc
+    await LedgerRepo.create_many(
+        session,
+        entries=[
+            _purchase_credit_entry(purchase, product, now_utc=now_utc)
+            for purchase, product in credited
+        ],
+    )
+    await emit_analytics_events(
+        session,
+        event_type="purchase_credited",
+        source=EVENT_SOURCE_SYSTEM,
+        happened_at=now_utc,
+        payloads=[_purchase_event_payload(purchase) for purchase, _ in credited],
+        user_ids=[purchase.user_id for purchase, _ in credited],
+    )
+    return failures
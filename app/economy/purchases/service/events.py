@@ -8,14 +8,9 @@ from app.core.analytics_events import EVENT_SOURCE_SYSTEM, emit_analytics_event
 from app.db.models.purchases import Purchase
 
 
-async def _emit_purchase_event(
-    session: AsyncSession,
-    *,
-    event_type: str,
-    purchase: Purchase,
-    happened_at: datetime,
-    extra_payload: dict[str, object] | None = None,
-) -> None:
+def _purchase_event_payload(
+    purchase: Purchase, extra_payload: dict[str, object] | None = None
+) -> dict[str, object]:
     payload: dict[str, object] = {
         "purchase_id": str(purchase.id),
         "product_code": purchase.product_code,
@@ -26,6 +21,18 @@ async def _emit_purchase_event(
     }
     if extra_payload:
         payload.update(extra_payload)
+    return payload
+
+
+async def _emit_purchase_event(
+    session: AsyncSession,
+    *,
+    event_type: str,
+    purchase: Purchase,
+    happened_at: datetime,
+    extra_payload: dict[str, object] | None = None,
+) -> None:
+    payload = _purchase_event_payload(purchase, extra_payload)
     await emit_analytics_event(
         session,
         event_type=event_type,
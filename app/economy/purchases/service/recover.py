@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.purchases import Purchase
+from app.economy.purchases.catalog import ProductSpec, get_product
+from app.economy.purchases.recovery import MAX_CREDIT_RECOVERY_ATTEMPTS, increment_recovery_failures
+
+from .credit_assets_batch import credit_purchase_assets_batch
+
+
+@dataclass(frozen=True, slots=True)
+class PurchaseRecoveryOutcome:
+    purchase_id: UUID
+    outcome: str  # "credited", "review" or "retryable_failure"
+
+
+def _record_failure(purchase: Purchase) -> str:
+    payload, failures = increment_recovery_failures(purchase.raw_successful_payment)
+    purchase.raw_successful_payment = payload
+    if failures >= MAX_CREDIT_RECOVERY_ATTEMPTS:
+        purchase.status = "FAILED_CREDIT_PENDING_REVIEW"
+        return "review"
+    return "retryable_failure"
+
+
+async def recover_claimed_purchases(
+    session: AsyncSession,
+    *,
+    purchases: Sequence[Purchase],
+    now_utc: datetime,
+) -> list[PurchaseRecoveryOutcome]:
+    """Credits PAID_UNCREDITED purchases the caller has locked, reporting one outcome each."""
+    outcomes: dict[UUID, str] = {}
+    creditable: list[tuple[Purchase, ProductSpec]] = []
+    for purchase in purchases:
+        if purchase.telegram_payment_charge_id is None or not isinstance(
+            purchase.raw_successful_payment, dict
+        ):
+            purchase.status = "FAILED_CREDIT_PENDING_REVIEW"
+            outcomes[purchase.id] = "review"
+            continue
+        product = get_product(purchase.product_code)
+        if product is None:
+            outcomes[purchase.id] = _record_failure(purchase)
+            continue
+        creditable.append((purchase, product))
+
+    failures = await credit_purchase_assets_batch(session, items=creditable, now_utc=now_utc)
+    for purchase, _ in creditable:
+        outcomes[purchase.id] = _record_failure(purchase) if purchase.id in failures else "credited"
+    await session.flush()
+    return [
+        PurchaseRecoveryOutcome(purchase_id=purchase.id, outcome=outcomes[purchase.id])
+        for purchase in purchases
+    ]
@@ -9,23 +9,19 @@ from app.db.models.streak_state import StreakState
 from app.db.repo.entitlements_repo import EntitlementsRepo
 from app.db.repo.streak_repo import StreakRepo
 from app.economy.streak.rules import classify_streak_state, record_activity, rollover_to_local_date
+from app.economy.streak.streak_read import (
+    emit_streak_lost_if_needed,
+    read_streak_snapshot,
+    snapshot_from_model,
+)
 from app.economy.streak.time import berlin_local_date
-from app.economy.streak.types import StreakActivityResult, StreakSnapshot, StreakTodayStatus
+from app.economy.streak.types import StreakActivityResult, StreakSnapshot
 
 
 class StreakService:
     @staticmethod
     def _snapshot_from_model(state: StreakState) -> StreakSnapshot:
-        return StreakSnapshot(
-            current_streak=state.current_streak,
-            best_streak=state.best_streak,
-            last_activity_local_date=state.last_activity_local_date,
-            today_status=StreakTodayStatus(state.today_status),
-            streak_saver_tokens=state.streak_saver_tokens,
-            premium_freezes_used_week=state.premium_freezes_used_week,
-            premium_freeze_week_start_local_date=state.premium_freeze_week_start_local_date,
-            updated_at=state.updated_at,
-        )
+        return snapshot_from_model(state)
 
     @staticmethod
     def _apply_snapshot_to_model(
@@ -69,23 +65,31 @@ class StreakService:
             premium_scope=premium_scope,
         )
 
-        if snapshot_before_rollover.current_streak > 0 and snapshot.current_streak == 0:
-            await emit_analytics_event(
-                session,
-                event_type="streak_lost",
-                source=EVENT_SOURCE_SYSTEM,
-                user_id=user_id,
-                payload={
-                    "previous_streak": snapshot_before_rollover.current_streak,
-                    "rollover_local_date": berlin_local_date(now_utc).isoformat(),
-                },
-                happened_at=now_utc,
-            )
+        await emit_streak_lost_if_needed(
+            session,
+            user_id=user_id,
+            before=snapshot_before_rollover,
+            after=snapshot,
+            now_utc=now_utc,
+        )
 
         StreakService._apply_snapshot_to_model(state, snapshot, now_utc)
         await session.flush()
         return snapshot
 
+    @staticmethod
+    async def read_rollover(
+        session: AsyncSession,
+        *,
+        user_id: int,
+        now_utc: datetime,
+    ) -> StreakSnapshot:
+        """Lock-free home read; escalates to `sync_rollover` only if the version check loses."""
+        snapshot = await read_streak_snapshot(session, user_id=user_id, now_utc=now_utc)
+        if snapshot is None:
+            return await StreakService.sync_rollover(session, user_id=user_id, now_utc=now_utc)
+        return snapshot
+
     @staticmethod
     async def record_activity(
         session: AsyncSession,
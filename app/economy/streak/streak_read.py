@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.analytics_events import EVENT_SOURCE_SYSTEM, emit_analytics_event
+from app.db.models.streak_state import StreakState
+from app.db.repo.entitlements_repo import EntitlementsRepo
+from app.db.repo.streak_repo import StreakRepo
+from app.economy.streak.rules import rollover_to_local_date
+from app.economy.streak.time import berlin_local_date
+from app.economy.streak.types import StreakSnapshot, StreakTodayStatus
+
+
+def snapshot_from_model(state: StreakState) -> StreakSnapshot:
+    return StreakSnapshot(
+        current_streak=state.current_streak,
+        best_streak=state.best_streak,
+        last_activity_local_date=state.last_activity_local_date,
+        today_status=StreakTodayStatus(state.today_status),
+        streak_saver_tokens=state.streak_saver_tokens,
+        premium_freezes_used_week=state.premium_freezes_used_week,
+        premium_freeze_week_start_local_date=state.premium_freeze_week_start_local_date,
+        updated_at=state.updated_at,
+    )
+
+
+async def emit_streak_lost_if_needed(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    before: StreakSnapshot,
+    after: StreakSnapshot,
+    now_utc: datetime,
+) -> None:
+    if before.current_streak <= 0 or after.current_streak != 0:
+        return
+    await emit_analytics_event(
+        session,
+        event_type="streak_lost",
+        source=EVENT_SOURCE_SYSTEM,
+        user_id=user_id,
+        payload={
+            "previous_streak": before.current_streak,
+            "rollover_local_date": berlin_local_date(now_utc).isoformat(),
+        },
+        happened_at=now_utc,
+    )
+
+
+async def read_streak_snapshot(
+    session: AsyncSession, *, user_id: int, now_utc: datetime
+) -> StreakSnapshot | None:
+    """Rolls the streak over without row locks; returns None when the locked path must run."""
+    state = await StreakRepo.get_by_user_id(session, user_id)
+    if state is None:
+        return None
+    stored = snapshot_from_model(state)
+    local_date = berlin_local_date(now_utc)
+    if local_date <= berlin_local_date(stored.updated_at):
+        return stored
+
+    premium_scope = await EntitlementsRepo.get_active_premium_scope(session, user_id, now_utc)
+    snapshot = rollover_to_local_date(
+        stored, target_local_date=local_date, premium_scope=premium_scope
+    )
+    applied = await StreakRepo.update_state_if_version(
+        session,
+        user_id=user_id,
+        expected_version=state.version,
+        current_streak=snapshot.current_streak,
+        best_streak=snapshot.best_streak,
+        last_activity_local_date=snapshot.last_activity_local_date,
+        today_status=snapshot.today_status.value,
+        streak_saver_tokens=snapshot.streak_saver_tokens,
+        premium_freezes_used_week=snapshot.premium_freezes_used_week,
+        premium_freeze_week_start_local_date=snapshot.premium_freeze_week_start_local_date,
+        now_utc=now_utc,
+    )
+    # The UPDATE bypasses the identity map; expire so later locked reads see the stored row.
+    session.expire(state)
+    if not applied:
+        return None
+    await emit_streak_lost_if_needed(
+        session, user_id=user_id, before=stored, after=snapshot, now_utc=now_utc
+    )
+    return replace(snapshot, updated_at=now_utc)
@@ -19,7 +19,7 @@ from app.game.questions.runtime_bank_models import (  # noqa: F401
 from app.game.questions.runtime_bank_seed import stable_index as _stable_index  # noqa: F401
 from app.game.questions.runtime_bank_select import (  # noqa: F401
     _clamp_cache_ttl_seconds,
-    _get_pool_ids,
+    _get_selection_pool,
     _list_candidate_ids_for_mode,
     _load_pool_ids,
     _pick_from_mode,
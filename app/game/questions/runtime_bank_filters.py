@@ -4,30 +4,20 @@ from collections import Counter
 from typing import Sequence
 
 from app.db.models.quiz_questions import QuizQuestion as QuizQuestionRecord
-from app.game.questions.runtime_bank_seed import stable_index
+from app.game.questions.runtime_bank_seed import seed_index
+from app.game.questions.runtime_bank_selection import SelectionPool
 
 
 def pick_from_pool(
-    candidate_ids: Sequence[str],
+    candidate_ids: Sequence[str] | SelectionPool,
     *,
     exclude_question_ids: Sequence[str],
     selection_seed: str,
 ) -> str | None:
-    if not candidate_ids:
-        return None
-    if not exclude_question_ids:
-        return candidate_ids[stable_index(selection_seed, len(candidate_ids))]
-
-    excluded = set(exclude_question_ids)
-    if len(excluded) >= len(candidate_ids):
-        return None
-
-    start_index = stable_index(selection_seed, len(candidate_ids))
-    for offset in range(len(candidate_ids)):
-        candidate_id = candidate_ids[(start_index + offset) % len(candidate_ids)]
-        if candidate_id not in excluded:
-            return candidate_id
-    return None
+    return SelectionPool.coerce(candidate_ids).pick(
+        exclude_question_ids=exclude_question_ids,
+        selection_seed=selection_seed,
+    )
 
 
 def filter_active_records(
@@ -62,4 +52,4 @@ def select_least_used_by_category(
         if category_counts.get(record.category, 0) == min_count
     ]
     least_used_candidates.sort(key=lambda record: record.question_id)
-    return least_used_candidates[stable_index(selection_seed, len(least_used_candidates))]
+    return least_used_candidates[seed_index(selection_seed, len(least_used_candidates))]
@@ -5,6 +5,7 @@ from typing import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import timed_operation
 from app.game.questions.catalog import DAILY_CHALLENGE_SOURCE_MODE, mode_requires_quick_mix_eligible
 from app.game.questions.runtime_bank_fallback import (
     fallback_get_question_by_id,
@@ -13,12 +14,17 @@ from app.game.questions.runtime_bank_fallback import (
 )
 from app.game.questions.runtime_bank_filters import pick_from_pool
 from app.game.questions.runtime_bank_models import to_quiz_question
-from app.game.questions.runtime_bank_pool import _get_pool_ids, _repo, clear_question_pool_cache
+from app.game.questions.runtime_bank_pool import (
+    _get_selection_pool,
+    _repo,
+    clear_question_pool_cache,
+)
+from app.game.questions.runtime_bank_selection import SelectionPool
 from app.game.questions.types import QuizQuestion
 
 
 def _pick_from_pool(
-    candidate_ids: Sequence[str],
+    candidate_ids: Sequence[str] | SelectionPool,
     *,
     exclude_question_ids: Sequence[str],
     selection_seed: str,
@@ -71,7 +77,7 @@ async def _pick_from_mode(
         preferred_levels = (
             (preferred_level,) if preferred_level is not None else allowed_levels_tuple
         )
-        candidate_ids = await _get_pool_ids(
+        candidate_ids = await _get_selection_pool(
             session,
             mode_code=mode_code,
             preferred_levels=preferred_levels,
@@ -93,7 +99,7 @@ async def _pick_from_mode(
             and preferred_levels is not None
             and allowed_levels_tuple is not None
         ):
-            fallback_candidate_ids = await _get_pool_ids(
+            fallback_candidate_ids = await _get_selection_pool(
                 session,
                 mode_code=mode_code,
                 preferred_levels=allowed_levels_tuple,
@@ -145,6 +151,7 @@ async def get_question_by_id(
     )
 
 
+@timed_operation("select_question")
 async def select_question_for_mode(
     session: AsyncSession,
     mode_code: str,
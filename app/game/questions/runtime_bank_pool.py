@@ -8,14 +8,16 @@ from time import monotonic
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.core.metrics import QUESTION_POOL_CACHE_LOOKUPS
 from app.game.questions.catalog import mode_requires_quick_mix_eligible
 from app.game.questions.runtime_bank_models import QUICK_MIX_MODE_CODE, QUICK_MIX_SCOPE_CODE
+from app.game.questions.runtime_bank_selection import SelectionPool
 
 
 @dataclass(slots=True)
 class _PoolCacheEntry:
     loaded_at_mono: float
-    question_ids: tuple[str, ...]
+    pool: SelectionPool
     updated_at_watermark: datetime
 
 
@@ -117,7 +119,7 @@ async def _build_full_pool_entry(
     )
     return _PoolCacheEntry(
         loaded_at_mono=monotonic(),
-        question_ids=loaded_ids,
+        pool=SelectionPool(loaded_ids),
         updated_at_watermark=datetime.now(timezone.utc),
     )
 
@@ -136,11 +138,11 @@ async def _build_incremental_pool_entry(
     if not changes:
         return _PoolCacheEntry(
             loaded_at_mono=monotonic(),
-            question_ids=cached.question_ids,
+            pool=cached.pool,
             updated_at_watermark=cached.updated_at_watermark,
         )
 
-    refreshed_ids = set(cached.question_ids)
+    refreshed_ids = set(cached.pool.question_ids)
     max_updated_at = cached.updated_at_watermark
     for change in changes:
         include_question = _pool_includes_question(
@@ -160,28 +162,34 @@ async def _build_incremental_pool_entry(
 
     return _PoolCacheEntry(
         loaded_at_mono=monotonic(),
-        question_ids=tuple(sorted(refreshed_ids)),
+        pool=SelectionPool(tuple(sorted(refreshed_ids))),
         updated_at_watermark=max_updated_at,
     )
 
 
-async def _get_pool_ids(
+async def _get_selection_pool(
     session: AsyncSession,
     *,
     mode_code: str,
     preferred_levels: tuple[str, ...] | None,
-) -> tuple[str, ...]:
+) -> SelectionPool:
     cache_key = (_pool_cache_scope(mode_code), preferred_levels)
     ttl_seconds = _clamp_cache_ttl_seconds(get_settings().quiz_question_pool_cache_ttl_seconds)
     now_mono = monotonic()
     cached = _QUESTION_POOL_CACHE.get(cache_key)
     if cached is not None and (now_mono - cached.loaded_at_mono) <= ttl_seconds:
-        return cached.question_ids
+        QUESTION_POOL_CACHE_LOOKUPS.labels(result="hit").inc()
+        return cached.pool
 
     async with _QUESTION_POOL_CACHE_LOCK:
         cached = _QUESTION_POOL_CACHE.get(cache_key)
         if cached is not None and (now_mono - cached.loaded_at_mono) <= ttl_seconds:
-            return cached.question_ids
+            QUESTION_POOL_CACHE_LOOKUPS.labels(result="hit").inc()
+            return cached.pool
+
+        QUESTION_POOL_CACHE_LOOKUPS.labels(
+            result="incremental" if cached is not None else "full"
+        ).inc()
 
         updated_entry = (
             await _build_incremental_pool_entry(
@@ -198,4 +206,4 @@ async def _get_pool_ids(
             )
         )
         _QUESTION_POOL_CACHE[cache_key] = updated_entry
-        return updated_entry.question_ids
+        return updated_entry.pool
@@ -2,7 +2,30 @@ from __future__ import annotations
 
 import hashlib
 
+from app.core.config import get_settings
+
+_UINT64_RANGE = float(2**64)
+
 
 def stable_index(seed: str, size: int) -> int:
     digest = hashlib.sha256(seed.encode("utf-8")).digest()
     return int.from_bytes(digest[:8], "big") % size
+
+
+def legacy_seed_mode() -> bool:
+    return get_settings().quiz_selection_legacy_seed_mode
+
+
+def seed_hash64(seed: str) -> int:
+    if legacy_seed_mode():
+        return int.from_bytes(hashlib.sha256(seed.encode("utf-8")).digest()[:8], "big")
+    return int.from_bytes(hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def seed_index(seed: str, size: int) -> int:
+    return seed_hash64(seed) % size
+
+
+def seed_fraction(seed: str) -> float:
+    """Uniform value in [0, 1) derived from ``seed``."""
+    return seed_hash64(seed) / _UINT64_RANGE
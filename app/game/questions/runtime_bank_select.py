@@ -12,7 +12,7 @@ from app.game.questions.runtime_bank_mode_select import (  # noqa: F401
 )
 from app.game.questions.runtime_bank_pool import (  # noqa: F401
     _clamp_cache_ttl_seconds,
-    _get_pool_ids,
+    _get_selection_pool,
     _load_pool_ids,
     _pool_cache_scope,
     clear_question_pool_cache,
@@ -20,7 +20,7 @@ from app.game.questions.runtime_bank_pool import (  # noqa: F401
 
 __all__ = [
     "_clamp_cache_ttl_seconds",
-    "_get_pool_ids",
+    "_get_selection_pool",
     "_list_candidate_ids_for_mode",
     "_load_pool_ids",
     "_pick_from_mode",
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from app.game.questions.runtime_bank_seed import legacy_seed_mode, stable_index
+
+_DRAW_BYTES = 8
+_DRAWS_PER_DIGEST = 4
+
+
+def _seed_digest(seed: str) -> bytes:
+    return hashlib.blake2b(
+        seed.encode("utf-8"), digest_size=_DRAW_BYTES * _DRAWS_PER_DIGEST
+    ).digest()
+
+
+def _rank_draw(seed: str) -> int:
+    # Independent of the probe draws: those all landed on excluded ids, so reusing
+    # one would skew the rank pick towards ids near the excluded slots.
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=_DRAW_BYTES, person=b"rank")
+    return int.from_bytes(digest.digest(), "big")
+
+
+@dataclass(frozen=True, slots=True)
+class SelectionPool:
+    """Question ids plus a position index for exclusion-aware seeded picks.
+
+    A pick tries a few seeded draws over the whole pool and keeps the first one
+    that is not excluded. If all of them hit excluded ids, it ranks the remaining
+    ids through the position index (O(m log m) for ``m`` exclusions), using a
+    draw independent of the probes. Either way every non-excluded id is equally
+    likely, unlike probing past excluded neighbours, which favours the id right
+    after an excluded run.
+    """
+
+    question_ids: tuple[str, ...]
+    _positions: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        positions = {question_id: index for index, question_id in enumerate(self.question_ids)}
+        object.__setattr__(self, "_positions", positions)
+
+    @classmethod
+    def coerce(cls, candidate_ids: Sequence[str] | SelectionPool) -> SelectionPool:
+        if isinstance(candidate_ids, SelectionPool):
+            return candidate_ids
+        return cls(tuple(candidate_ids))
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def pick(self, *, exclude_question_ids: Sequence[str], selection_seed: str) -> str | None:
+        question_ids = self.question_ids
+        if not question_ids:
+            return None
+        if legacy_seed_mode():
+            return self._pick_legacy(
+                exclude_question_ids=exclude_question_ids, selection_seed=selection_seed
+            )
+        digest = _seed_digest(selection_seed)
+        first_draw = int.from_bytes(digest[:_DRAW_BYTES], "big")
+        if not exclude_question_ids:
+            return question_ids[first_draw % len(question_ids)]
+        excluded = set(exclude_question_ids)
+        for offset in range(0, len(digest), _DRAW_BYTES):
+            draw = int.from_bytes(digest[offset : offset + _DRAW_BYTES], "big")
+            candidate_id = question_ids[draw % len(question_ids)]
+            if candidate_id not in excluded:
+                return candidate_id
+        return self._pick_by_rank(excluded, draw=_rank_draw(selection_seed))
+
+    def _pick_by_rank(self, excluded: set[str], *, draw: int) -> str | None:
+        excluded_positions = sorted(
+            position for position in map(self._positions.get, excluded) if position is not None
+        )
+        available = len(self.question_ids) - len(excluded_positions)
+        if available <= 0:
+            return None
+        index = draw % available
+        # Turn the rank among remaining ids into a pool position.
+        for position in excluded_positions:
+            if position > index:
+                break
+            index += 1
+        return self.question_ids[index]
+
+    def _pick_legacy(
+        self, *, exclude_question_ids: Sequence[str], selection_seed: str
+    ) -> str | None:
+        candidate_ids = self.question_ids
+        if not exclude_question_ids:
+            return candidate_ids[stable_index(selection_seed, len(candidate_ids))]
+        excluded = set(exclude_question_ids)
+        if len(excluded) >= len(candidate_ids):
+            return None
+        start_index = stable_index(selection_seed, len(candidate_ids))
+        for offset in range(len(candidate_ids)):
+            candidate_id = candidate_ids[(start_index + offset) % len(candidate_ids)]
+            if candidate_id not in excluded:
+                return candidate_id
+        return None
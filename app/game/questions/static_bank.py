@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import hashlib
 from datetime import date
+from functools import lru_cache
 from typing import Sequence
 
-from app.game.questions.static_bank_artikel_pool import build_artikel_sprint_pool
-from app.game.questions.static_bank_quick_mix_pool import build_quick_mix_pool
 from app.game.questions.types import QuizQuestion
 
 
@@ -19,8 +18,20 @@ def _daily_challenge_question(local_date_berlin: date) -> QuizQuestion:
     )
 
 
-_QUICK_MIX_A1A2_POOL: tuple[QuizQuestion, ...] = build_quick_mix_pool()
-_ARTIKEL_SPRINT_POOL: tuple[QuizQuestion, ...] = build_artikel_sprint_pool()
+# The static pools are only a fallback for an empty runtime bank, so their tables are
+# imported and built on the first fallback question rather than at process start.
+@lru_cache(maxsize=1)
+def _quick_mix_a1a2_pool() -> tuple[QuizQuestion, ...]:
+    from app.game.questions.static_bank_quick_mix_pool import build_quick_mix_pool
+
+    return build_quick_mix_pool()
+
+
+@lru_cache(maxsize=1)
+def _artikel_sprint_pool() -> tuple[QuizQuestion, ...]:
+    from app.game.questions.static_bank_artikel_pool import build_artikel_sprint_pool
+
+    return build_artikel_sprint_pool()
 
 
 _GENERIC_POOL: tuple[QuizQuestion, ...] = (
@@ -41,9 +52,9 @@ _GENERIC_POOL: tuple[QuizQuestion, ...] = (
 
 def _question_pool_for_mode(mode_code: str) -> tuple[QuizQuestion, ...]:
     if mode_code == "QUICK_MIX_A1A2":
-        return _QUICK_MIX_A1A2_POOL
+        return _quick_mix_a1a2_pool()
     if mode_code == "ARTIKEL_SPRINT":
-        return _ARTIKEL_SPRINT_POOL
+        return _artikel_sprint_pool()
     return _GENERIC_POOL
 
 
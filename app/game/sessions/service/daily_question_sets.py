@@ -8,6 +8,7 @@ from app.db.repo.daily_question_sets_repo import DailyQuestionSetsRepo
 from app.db.repo.quiz_questions_repo import QuizQuestionsRepo
 from app.game.questions.catalog import DAILY_CHALLENGE_SOURCE_MODE
 from app.game.questions.runtime_bank_filters import pick_from_pool
+from app.game.questions.runtime_bank_selection import SelectionPool
 
 from .constants import DAILY_CHALLENGE_TOTAL_QUESTIONS
 
@@ -47,17 +48,16 @@ async def _build_daily_question_ids(
     *,
     berlin_date: date,
 ) -> tuple[str, ...]:
-    candidate_ids_cache: dict[tuple[str, ...] | None, list[str]] = {}
+    candidate_ids_cache: dict[tuple[str, ...] | None, SelectionPool] = {}
 
-    async def _cached_candidate_ids(preferred_levels: tuple[str, ...] | None) -> list[str]:
+    async def _cached_candidate_ids(preferred_levels: tuple[str, ...] | None) -> SelectionPool:
         if preferred_levels not in candidate_ids_cache:
-            candidate_ids_cache[preferred_levels] = (
-                await QuizQuestionsRepo.list_question_ids_for_mode(
-                    session,
-                    mode_code=DAILY_CHALLENGE_SOURCE_MODE,
-                    preferred_levels=preferred_levels,
-                )
+            candidate_ids = await QuizQuestionsRepo.list_question_ids_for_mode(
+                session,
+                mode_code=DAILY_CHALLENGE_SOURCE_MODE,
+                preferred_levels=preferred_levels,
             )
+            candidate_ids_cache[preferred_levels] = SelectionPool(tuple(candidate_ids))
         return candidate_ids_cache[preferred_levels]
 
     selected_question_ids: list[str] = []
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.analytics_events import EVENT_SOURCE_BOT
+from app.db.repo.friend_challenge_questions_repo import FriendChallengeQuestionsRepo
 from app.db.repo.friend_challenges_repo import FriendChallengesRepo
 from app.game.friend_challenges.constants import (
     DUEL_STATUS_ACCEPTED,
@@ -98,7 +100,9 @@ async def create_friend_challenge(
         access_type=access_type,
         total_rounds=resolved_rounds,
         now_utc=now_utc,
-        question_ids=question_ids,
+    )
+    await FriendChallengeQuestionsRepo.insert_plan(
+        session, challenge_id=challenge.id, question_ids=question_ids
     )
     await emit_standard_duel_created_events(
         session,
@@ -107,7 +111,7 @@ async def create_friend_challenge(
         source=EVENT_SOURCE_BOT,
         creator_user_id=creator_user_id,
     )
-    return _build_friend_challenge_snapshot(challenge)
+    return replace(_build_friend_challenge_snapshot(challenge), question_ids=tuple(question_ids))
 
 
 async def create_friend_challenge_rematch(
@@ -185,12 +189,14 @@ async def create_friend_challenge_rematch(
         access_type=access_type,
         total_rounds=challenge.total_rounds,
         now_utc=now_utc,
-        question_ids=rematch_question_ids,
         series_id=series_id,
         series_game_number=series_game_number,
         series_best_of=series_best_of,
         status=DUEL_STATUS_ACCEPTED,
     )
+    await FriendChallengeQuestionsRepo.insert_plan(
+        session, challenge_id=rematch.id, question_ids=rematch_question_ids
+    )
     await emit_rematch_duel_created_events(
         session,
         rematch=rematch,
@@ -200,4 +206,6 @@ async def create_friend_challenge_rematch(
         source=EVENT_SOURCE_BOT,
         initiator_user_id=initiator_user_id,
     )
-    return _build_friend_challenge_snapshot(rematch)
+    return replace(
+        _build_friend_challenge_snapshot(rematch), question_ids=tuple(rematch_question_ids)
+    )
@@ -147,7 +147,6 @@ async def _create_friend_challenge_row(
     access_type: str,
     total_rounds: int,
     now_utc: datetime,
-    question_ids: list[str] | None = None,
     series_id: UUID | None = None,
     series_game_number: int = 1,
     series_best_of: int = 1,
@@ -168,7 +167,6 @@ async def _create_friend_challenge_row(
             challenge_type=challenge_type,
             mode_code=mode_code,
             access_type=access_type,
-            question_ids=question_ids,
             tournament_match_id=None,
             status=status,
             current_round=1,
@@ -207,7 +205,6 @@ def _build_friend_challenge_snapshot(challenge: FriendChallenge) -> FriendChalle
         status=challenge.status,
         creator_user_id=challenge.creator_user_id,
         opponent_user_id=challenge.opponent_user_id,
-        question_ids=tuple(challenge.question_ids or []),
         current_round=challenge.current_round,
         total_rounds=challenge.total_rounds,
         creator_finished_at=challenge.creator_finished_at,
@@ -6,12 +6,15 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.analytics_events import EVENT_SOURCE_BOT
+from app.db.repo.friend_challenge_questions_repo import FriendChallengeQuestionsRepo
 from app.db.repo.friend_challenges_repo import FriendChallengesRepo
 from app.db.repo.quiz_sessions_repo import QuizSessionsRepo
 from app.db.repo.tournament_matches_repo import TournamentMatchesRepo
 from app.db.repo.tournaments_repo import TournamentsRepo
 from app.economy.streak.time import berlin_local_date
 from app.game.friend_challenges.constants import is_duel_playable_for_user, normalize_duel_status
+from app.game.questions.runtime_bank_models import to_quiz_question
+from app.game.questions.types import QuizQuestion
 from app.game.sessions.errors import (
     FriendChallengeAccessError,
     FriendChallengeCompletedError,
@@ -136,11 +139,15 @@ async def start_friend_challenge_round(
     forced_question_id: str | None = (
         shared_round_session.question_id if shared_round_session else None
     )
-    if forced_question_id is None and challenge.question_ids:
-        try:
-            forced_question_id = str(challenge.question_ids[next_round - 1])
-        except IndexError:
-            forced_question_id = None
+    forced_question: QuizQuestion | None = None
+    if forced_question_id is None:
+        planned = await FriendChallengeQuestionsRepo.get_round_question(
+            session, challenge_id=challenge.id, round_no=next_round
+        )
+        if planned is not None:
+            forced_question_id, record = planned
+            if record is not None and record.status == "ACTIVE":
+                forced_question = to_quiz_question(record)
     if forced_question_id is None:
         previous_round_question_ids = (
             await QuizSessionsRepo.list_friend_challenge_question_ids_before_round(
@@ -171,6 +178,7 @@ async def start_friend_challenge_round(
         selection_seed_override=selection_seed,
         preferred_question_level=preferred_level,
         forced_question_id=forced_question_id,
+        forced_question=forced_question,
         friend_challenge_id=challenge.id,
         friend_challenge_round=next_round,
         friend_challenge_total_rounds=challenge.total_rounds,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from typing import Sequence
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.repo.friend_challenge_questions_repo import FriendChallengeQuestionsRepo
 from app.game.friend_challenges.constants import DUEL_STATUS_ACCEPTED, DUEL_TYPE_DIRECT
 from app.game.sessions.types import FriendChallengeSnapshot
 
@@ -52,11 +54,13 @@ async def create_tournament_match_friend_challenge(
         access_type="FREE",
         total_rounds=resolved_rounds,
         now_utc=now_utc,
-        question_ids=question_ids,
         status=DUEL_STATUS_ACCEPTED,
     )
+    await FriendChallengeQuestionsRepo.insert_plan(
+        session, challenge_id=challenge.id, question_ids=question_ids
+    )
     challenge.tournament_match_id = tournament_match_id
     if expires_at is not None:
         challenge.expires_at = expires_at
     challenge.updated_at = now_utc
-    return _build_friend_challenge_snapshot(challenge)
+    return replace(_build_friend_challenge_snapshot(challenge), question_ids=tuple(question_ids))
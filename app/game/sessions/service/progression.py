@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime, timezone
 
 from sqlalchemy import select
@@ -9,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.quiz_attempts import QuizAttempt
 from app.db.models.quiz_sessions import QuizSession
 from app.db.repo.mode_progress_repo import ModeProgressRepo
+from app.game.questions.runtime_bank_seed import seed_fraction
 
 from .constants import MIX_STEP_WEIGHTS, MODE_PROGRESSION_CONFIGS, PERSISTENT_ADAPTIVE_LEVEL_CHAIN
 from .levels import _clamp_level_for_mode
@@ -172,9 +172,7 @@ def select_level_weighted(
     if next_weight <= 0:
         return normalized
 
-    digest = hashlib.sha256(selection_seed.encode("utf-8")).digest()
-    roll = int.from_bytes(digest[:8], "big") / 2**64
-    return next_level if roll < next_weight else normalized
+    return next_level if seed_fraction(selection_seed) < next_weight else normalized
 
 
 async def resolve_start_progression_state(
@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import timed_operation
 from app.db.models.quiz_sessions import QuizSession
 from app.db.repo.quiz_attempts_repo import QuizAttemptsRepo
 from app.db.repo.quiz_sessions_repo import QuizSessionsRepo
@@ -25,6 +26,7 @@ from .question_loading import _build_start_result_from_existing_session
 from .sessions_start_daily import start_daily_session
 
 
+@timed_operation("start_session")
 async def start_session(
     session: AsyncSession,
     *,
@@ -36,6 +38,7 @@ async def start_session(
     selection_seed_override: str | None = None,
     preferred_question_level: str | None = None,
     forced_question_id: str | None = None,
+    forced_question: QuizQuestion | None = None,
     friend_challenge_id: UUID | None = None,
     friend_challenge_round: int | None = None,
     friend_challenge_total_rounds: int | None = None,
@@ -79,8 +82,8 @@ async def start_session(
         energy_paid = energy_result.paid_energy
         energy_cost_total = 1
 
-    question: QuizQuestion | None = None
-    if forced_question_id is not None:
+    question: QuizQuestion | None = forced_question
+    if question is None and forced_question_id is not None:
         from app.game.sessions import service as service_module
 
         question = await service_module.get_question_by_id(
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import timed_operation
 from app.db.models.quiz_attempts import QuizAttempt
 from app.db.repo.quiz_attempts_repo import QuizAttemptsRepo
 from app.db.repo.quiz_sessions_repo import QuizSessionsRepo
@@ -20,6 +21,7 @@ from .sessions_submit_friend_challenge import _apply_friend_challenge_answer
 from .sessions_submit_replay import build_replay_answer_result
 
 
+@timed_operation("submit_answer")
 async def submit_answer(
     session: AsyncSession,
     *,
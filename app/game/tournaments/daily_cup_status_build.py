@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repo.tournament_matches_repo import TournamentMatchesRepo
+from app.db.repo.tournament_participants_repo import TournamentParticipantsRepo
+from app.db.repo.tournaments_repo import TournamentsRepo
+from app.game.tournaments.constants import TOURNAMENT_MATCH_STATUS_PENDING
+from app.game.tournaments.daily_cup_status_snapshot import (
+    DailyCupStatusSnapshot,
+    DailyCupTournamentRef,
+)
+from app.workers.tasks.daily_cup_config import DAILY_CUP_TOURNAMENT_TYPE
+
+ROUND_STATUSES = frozenset({"ROUND_1", "ROUND_2", "ROUND_3", "ROUND_4", "BRACKET_LIVE"})
+
+
+def _pending_round_match_user_ids(*, matches: list) -> frozenset[int]:
+    user_ids: set[int] = set()
+    for match in matches:
+        if match.status != TOURNAMENT_MATCH_STATUS_PENDING:
+            continue
+        user_ids.add(int(match.user_a))
+        if match.user_b is not None:
+            user_ids.add(int(match.user_b))
+    return frozenset(user_ids)
+
+
+def _daily_cup_type_priority() -> tuple[str]:
+    return (DAILY_CUP_TOURNAMENT_TYPE,)
+
+
+async def build_status_snapshot(
+    session: AsyncSession,
+    *,
+    close_at_utc: datetime,
+) -> DailyCupStatusSnapshot:
+    tournament = None
+    for tournament_type in _daily_cup_type_priority():
+        tournament = await TournamentsRepo.get_by_type_and_registration_deadline(
+            session,
+            tournament_type=tournament_type,
+            registration_deadline=close_at_utc,
+        )
+        if tournament is not None:
+            break
+    if tournament is None:
+        return DailyCupStatusSnapshot(tournament=None)
+
+    participants = await TournamentParticipantsRepo.list_for_tournament(
+        session,
+        tournament_id=tournament.id,
+    )
+    pending_match_user_ids: frozenset[int] = frozenset()
+    if tournament.status in ROUND_STATUSES:
+        round_matches = await TournamentMatchesRepo.list_by_tournament_round(
+            session,
+            tournament_id=tournament.id,
+            round_no=max(1, int(tournament.current_round)),
+        )
+        pending_match_user_ids = _pending_round_match_user_ids(matches=round_matches)
+    return DailyCupStatusSnapshot(
+        tournament=DailyCupTournamentRef(
+            id=tournament.id,
+            type=str(tournament.type),
+            status=str(tournament.status),
+            current_round=int(tournament.current_round),
+            registration_deadline=tournament.registration_deadline,
+        ),
+        participant_user_ids=frozenset(int(item.user_id) for item in participants),
+        pending_match_user_ids=pending_match_user_ids,
+    )
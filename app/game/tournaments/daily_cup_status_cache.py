@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.core.config import get_settings
+from app.core.metrics import DAILY_CUP_STATUS_CACHE_LOOKUPS
+from app.db.models.tournament_matches import TournamentMatch
+from app.db.models.tournament_participants import TournamentParticipant
+from app.db.models.tournaments import Tournament
+from app.game.tournaments.daily_cup_status_redis import (
+    bump_generation,
+    get_redis_client,
+    read_shared_snapshot,
+    write_shared_snapshot,
+)
+from app.game.tournaments.daily_cup_status_snapshot import DailyCupStatusSnapshot
+
+STALE_INFO_KEY = "quiz_arena_daily_cup_status_stale"
+_TRACKED_MODELS = (Tournament, TournamentParticipant, TournamentMatch)
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    checked_at_mono: float
+    snapshot: DailyCupStatusSnapshot
+
+
+_LOCAL_CACHE: dict[str, _LocalEntry] = {}
+# asyncio.Lock binds to the first loop that waits on it; Celery jobs use a loop per job.
+_REBUILD_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def clear_daily_cup_status_cache() -> None:
+    _LOCAL_CACHE.clear()
+
+
+def _rebuild_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _REBUILD_LOCKS.get(loop)
+    if lock is None:
+        lock = _REBUILD_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+def _fresh_local_entry(key: str) -> _LocalEntry | None:
+    entry = _LOCAL_CACHE.get(key)
+    if entry is not None and (
+        monotonic() - entry.checked_at_mono <= get_settings().daily_cup_status_cache_ttl_seconds
+    ):
+        DAILY_CUP_STATUS_CACHE_LOOKUPS.labels(result="local").inc()
+        return entry
+    return None
+
+
+async def load_daily_cup_status_snapshot(
+    *,
+    close_at_utc: datetime,
+    build: Callable[[], Awaitable[DailyCupStatusSnapshot]],
+) -> DailyCupStatusSnapshot:
+    key = close_at_utc.isoformat()
+    entry = _fresh_local_entry(key)
+    if entry is not None:
+        return entry.snapshot
+
+    async with _rebuild_lock():
+        entry = _fresh_local_entry(key)
+        if entry is not None:
+            return entry.snapshot
+        entry = _LOCAL_CACHE.get(key)
+
+        client = await get_redis_client()
+        shared = None if client is None else await read_shared_snapshot(client, key=key)
+        generation = 0
+        if shared is not None:
+            shared_snapshot, generation = shared
+            if entry is not None and entry.snapshot.generation == generation:
+                shared_snapshot = entry.snapshot
+            if shared_snapshot is not None:
+                DAILY_CUP_STATUS_CACHE_LOOKUPS.labels(result="redis").inc()
+                _LOCAL_CACHE[key] = _LocalEntry(monotonic(), shared_snapshot)
+                return shared_snapshot
+
+        DAILY_CUP_STATUS_CACHE_LOOKUPS.labels(result="rebuild").inc()
+        snapshot = replace(await build(), generation=generation)
+        _LOCAL_CACHE[key] = _LocalEntry(monotonic(), snapshot)
+        if client is not None and shared is not None:
+            await write_shared_snapshot(
+                client,
+                key=key,
+                snapshot=snapshot,
+                ttl_seconds=int(get_settings().daily_cup_status_cache_redis_ttl_seconds),
+            )
+        return snapshot
+
+
+def _mark_stale(session: Session) -> None:
+    session.info[STALE_INFO_KEY] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _track_tournament_flush(session: Session, *_: Any) -> None:
+    pending = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, _TRACKED_MODELS) for obj in pending):
+        _mark_stale(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_tournament_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    if any(mapper.class_ in _TRACKED_MODELS for mapper in orm_execute_state.all_mappers):
+        _mark_stale(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if not session.info.pop(STALE_INFO_KEY, False):
+        return
+    _LOCAL_CACHE.clear()
+    # AsyncSession commits run this listener inside SQLAlchemy's greenlet, so the bump is
+    # awaited before the writer's commit returns.
+    if in_greenlet():
+        await_only(bump_generation())
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_stale_mark(session: Session) -> None:
+    session.info.pop(STALE_INFO_KEY, None)
+
+
+__all__ = ["clear_daily_cup_status_cache", "load_daily_cup_status_snapshot"]
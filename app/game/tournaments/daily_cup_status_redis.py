@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import orjson
+import redis.asyncio as redis
+
+from app.core.redis_loop_client import get_loop_redis_client, mark_loop_redis_unavailable
+from app.game.tournaments.daily_cup_status_snapshot import DailyCupStatusSnapshot
+
+KEY_PREFIX = "daily_cup:status:"
+GENERATION_KEY = f"{KEY_PREFIX}generation"
+_COMPONENT = "daily_cup_status_cache"
+
+
+async def get_redis_client() -> redis.Redis | None:
+    return await get_loop_redis_client(component=_COMPONENT)
+
+
+async def _mark_redis_unavailable(exc: Exception) -> None:
+    await mark_loop_redis_unavailable(exc, component=_COMPONENT)
+
+
+async def read_shared_snapshot(
+    client: redis.Redis, *, key: str
+) -> tuple[DailyCupStatusSnapshot | None, int] | None:
+    """Returns the shared snapshot if it matches the current generation; None if Redis failed."""
+    try:
+        payload, raw_generation = await client.mget(f"{KEY_PREFIX}{key}", GENERATION_KEY)
+    except Exception as exc:
+        await _mark_redis_unavailable(exc)
+        return None
+    generation = int(raw_generation or 0)
+    if not payload:
+        return None, generation
+    try:
+        snapshot = DailyCupStatusSnapshot.from_payload(orjson.loads(payload))
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None, generation
+    return (snapshot if snapshot.generation == generation else None), generation
+
+
+async def write_shared_snapshot(
+    client: redis.Redis, *, key: str, snapshot: DailyCupStatusSnapshot, ttl_seconds: int
+) -> None:
+    try:
+        await client.set(
+            f"{KEY_PREFIX}{key}",
+            orjson.dumps(snapshot.to_payload()).decode("utf-8"),
+            ex=max(1, ttl_seconds),
+        )
+    except Exception as exc:
+        await _mark_redis_unavailable(exc)
+
+
+async def bump_generation() -> None:
+    client = await get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.incr(GENERATION_KEY)
+    except Exception as exc:
+        await _mark_redis_unavailable(exc)
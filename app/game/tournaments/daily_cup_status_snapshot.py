@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class DailyCupTournamentRef:
+    id: UUID
+    type: str
+    status: str
+    current_round: int
+    registration_deadline: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class DailyCupStatusSnapshot:
+    tournament: DailyCupTournamentRef | None
+    participant_user_ids: frozenset[int] = frozenset()
+    pending_match_user_ids: frozenset[int] = frozenset()
+    generation: int = 0
+
+    def to_payload(self) -> dict[str, Any]:
+        tournament = self.tournament
+        return {
+            "generation": self.generation,
+            "tournament": (
+                None
+                if tournament is None
+                else {
+                    "id": str(tournament.id),
+                    "type": tournament.type,
+                    "status": tournament.status,
+                    "current_round": tournament.current_round,
+                    "registration_deadline": tournament.registration_deadline.isoformat(),
+                }
+            ),
+            "participant_user_ids": sorted(self.participant_user_ids),
+            "pending_match_user_ids": sorted(self.pending_match_user_ids),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> DailyCupStatusSnapshot:
+        raw_tournament = payload["tournament"]
+        return cls(
+            tournament=(
+                None
+                if raw_tournament is None
+                else DailyCupTournamentRef(
+                    id=UUID(raw_tournament["id"]),
+                    type=str(raw_tournament["type"]),
+                    status=str(raw_tournament["status"]),
+                    current_round=int(raw_tournament["current_round"]),
+                    registration_deadline=datetime.fromisoformat(
+                        raw_tournament["registration_deadline"]
+                    ),
+                )
+            ),
+            participant_user_ids=frozenset(int(v) for v in payload["participant_user_ids"]),
+            pending_match_user_ids=frozenset(int(v) for v in payload["pending_match_user_ids"]),
+            generation=int(payload["generation"]),
+        )
+
+
+__all__ = ["DailyCupStatusSnapshot", "DailyCupTournamentRef"]
@@ -9,19 +9,18 @@ from zoneinfo import ZoneInfo
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.db.models.tournaments import Tournament
-from app.db.repo.tournament_matches_repo import TournamentMatchesRepo
-from app.db.repo.tournament_participants_repo import TournamentParticipantsRepo
-from app.db.repo.tournaments_repo import TournamentsRepo
 from app.game.tournaments.constants import (
-    TOURNAMENT_MATCH_STATUS_PENDING,
     TOURNAMENT_STATUS_COMPLETED,
     TOURNAMENT_STATUS_REGISTRATION,
 )
-from app.workers.tasks.daily_cup_config import DAILY_CUP_TOURNAMENT_TYPE
+from app.game.tournaments.daily_cup_status_build import ROUND_STATUSES, build_status_snapshot
+from app.game.tournaments.daily_cup_status_cache import load_daily_cup_status_snapshot
+from app.game.tournaments.daily_cup_status_snapshot import (
+    DailyCupStatusSnapshot,
+    DailyCupTournamentRef,
+)
 
 settings = get_settings()
-_ROUND_STATUSES = frozenset({"ROUND_1", "ROUND_2", "ROUND_3", "ROUND_4", "BRACKET_LIVE"})
 
 
 class DailyCupUserStatus(str, Enum):
@@ -37,7 +36,7 @@ class DailyCupUserStatus(str, Enum):
 @dataclass(frozen=True, slots=True)
 class DailyCupUserStatusSnapshot:
     status: DailyCupUserStatus
-    tournament: Tournament | None
+    tournament: DailyCupTournamentRef | None
 
 
 def _parse_hhmm(value: str, *, default_hour: int, default_minute: int) -> tuple[int, int]:
@@ -82,18 +81,31 @@ def _close_at_utc(*, now_utc: datetime) -> datetime:
     ).astimezone(timezone.utc)
 
 
-def _has_pending_round_match_for_user(*, user_id: int, matches: list) -> bool:
-    for match in matches:
-        is_user_match = int(match.user_a) == user_id or (
-            match.user_b is not None and int(match.user_b) == user_id
+def _status_for_user(*, snapshot: DailyCupStatusSnapshot, user_id: int) -> DailyCupUserStatus:
+    tournament = snapshot.tournament
+    if tournament is None:
+        return DailyCupUserStatus.NO_TOURNAMENT
+    viewer_joined = user_id in snapshot.participant_user_ids
+    if tournament.status == TOURNAMENT_STATUS_REGISTRATION:
+        return (
+            DailyCupUserStatus.REGISTERED_WAITING
+            if viewer_joined
+            else DailyCupUserStatus.INVITE_OPEN
         )
-        if is_user_match and match.status == TOURNAMENT_MATCH_STATUS_PENDING:
-            return True
-    return False
-
-
-def _daily_cup_type_priority() -> tuple[str]:
-    return (DAILY_CUP_TOURNAMENT_TYPE,)
+    if tournament.status in ROUND_STATUSES:
+        if not viewer_joined:
+            return DailyCupUserStatus.NOT_PARTICIPANT
+        if user_id in snapshot.pending_match_user_ids:
+            return DailyCupUserStatus.ROUND_ACTIVE
+        return DailyCupUserStatus.ROUND_WAITING
+    if tournament.status == TOURNAMENT_STATUS_COMPLETED:
+        # TODO: completed Arena не розрізняє winner від інших учасників
+        # Технічно можливо через daily_cup_standings.py (place == 1)
+        # але потребує додавання WINNER статусу в DailyCupUserStatus enum
+        # і окремого запиту standings — це окрема задача, не cleanup
+        # Зараз: будь-який учасник completed турніру отримує COMPLETED
+        return DailyCupUserStatus.COMPLETED if viewer_joined else DailyCupUserStatus.NOT_PARTICIPANT
+    return DailyCupUserStatus.NO_TOURNAMENT
 
 
 async def get_daily_cup_status_for_user(
@@ -105,71 +117,16 @@ async def get_daily_cup_status_for_user(
     if now_utc < _invite_open_at_utc(now_utc=now_utc):
         return DailyCupUserStatusSnapshot(status=DailyCupUserStatus.NO_TOURNAMENT, tournament=None)
 
-    tournament = None
     close_at_utc = _close_at_utc(now_utc=now_utc)
-    for tournament_type in _daily_cup_type_priority():
-        tournament = await TournamentsRepo.get_by_type_and_registration_deadline(
-            session,
-            tournament_type=tournament_type,
-            registration_deadline=close_at_utc,
-        )
-        if tournament is not None:
-            break
-    if tournament is None:
-        return DailyCupUserStatusSnapshot(status=DailyCupUserStatus.NO_TOURNAMENT, tournament=None)
-
-    participants = await TournamentParticipantsRepo.list_for_tournament(
-        session,
-        tournament_id=tournament.id,
+    snapshot = await load_daily_cup_status_snapshot(
+        close_at_utc=close_at_utc,
+        build=lambda: build_status_snapshot(session, close_at_utc=close_at_utc),
+    )
+    status = _status_for_user(snapshot=snapshot, user_id=user_id)
+    return DailyCupUserStatusSnapshot(
+        status=status,
+        tournament=None if status is DailyCupUserStatus.NO_TOURNAMENT else snapshot.tournament,
     )
-    viewer_joined = user_id in {int(item.user_id) for item in participants}
-
-    if tournament.status == TOURNAMENT_STATUS_REGISTRATION:
-        if viewer_joined:
-            return DailyCupUserStatusSnapshot(
-                status=DailyCupUserStatus.REGISTERED_WAITING,
-                tournament=tournament,
-            )
-        return DailyCupUserStatusSnapshot(
-            status=DailyCupUserStatus.INVITE_OPEN, tournament=tournament
-        )
-
-    if tournament.status in _ROUND_STATUSES:
-        if not viewer_joined:
-            return DailyCupUserStatusSnapshot(
-                status=DailyCupUserStatus.NOT_PARTICIPANT,
-                tournament=tournament,
-            )
-        round_matches = await TournamentMatchesRepo.list_by_tournament_round(
-            session,
-            tournament_id=tournament.id,
-            round_no=max(1, int(tournament.current_round)),
-        )
-        if _has_pending_round_match_for_user(user_id=user_id, matches=round_matches):
-            return DailyCupUserStatusSnapshot(
-                status=DailyCupUserStatus.ROUND_ACTIVE,
-                tournament=tournament,
-            )
-        return DailyCupUserStatusSnapshot(
-            status=DailyCupUserStatus.ROUND_WAITING, tournament=tournament
-        )
-
-    if tournament.status == TOURNAMENT_STATUS_COMPLETED:
-        # TODO: completed Arena не розрізняє winner від інших учасників
-        # Технічно можливо через daily_cup_standings.py (place == 1)
-        # але потребує додавання WINNER статусу в DailyCupUserStatus enum
-        # і окремого запиту standings — це окрема задача, не cleanup
-        # Зараз: будь-який учасник completed турніру отримує COMPLETED
-        return DailyCupUserStatusSnapshot(
-            status=(
-                DailyCupUserStatus.COMPLETED
-                if viewer_joined
-                else DailyCupUserStatus.NOT_PARTICIPANT
-            ),
-            tournament=tournament,
-        )
-
-    return DailyCupUserStatusSnapshot(status=DailyCupUserStatus.NO_TOURNAMENT, tournament=None)
 
 
 __all__ = ["DailyCupUserStatus", "DailyCupUserStatusSnapshot", "get_daily_cup_status_for_user"]
@@ -1,19 +1,9 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
-from app.api.routes.admin import router as admin_router
-from app.api.routes.health import router as health_router
-from app.api.routes.internal_analytics import router as internal_analytics_router
-from app.api.routes.internal_offers import router as internal_offers_router
-from app.api.routes.internal_promo import router as internal_promo_router
-from app.api.routes.internal_referrals import router as internal_referrals_router
-from app.api.routes.ops_ui import OPS_UI_STATIC_DIR
-from app.api.routes.ops_ui import router as ops_ui_router
-from app.api.routes.public_contact import router as public_contact_router
-from app.api.routes.public_site import router as public_site_router
-from app.api.routes.telegram_webhook import router as telegram_webhook_router
+from app.api.compression import ScopedCompressionMiddleware
+from app.api.router_registry import include_profile_routers
 from app.core.config import get_settings
 from app.core.logging import configure_logging
 
@@ -40,6 +30,8 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
+    app.add_middleware(ScopedCompressionMiddleware)
+
     @app.middleware("http")
     async def add_admin_noindex_header(request, call_next):
         response = await call_next(request)
@@ -47,17 +39,9 @@ def create_app() -> FastAPI:
             response.headers["X-Robots-Tag"] = "noindex, nofollow"
         return response
 
-    app.include_router(health_router)
-    app.include_router(telegram_webhook_router)
-    app.include_router(internal_promo_router)
-    app.include_router(internal_offers_router)
-    app.include_router(internal_referrals_router)
-    app.include_router(internal_analytics_router)
-    app.include_router(public_site_router)
-    app.include_router(public_contact_router)
-    app.include_router(ops_ui_router)
-    app.include_router(admin_router)
-    app.mount("/ops/static", StaticFiles(directory=str(OPS_UI_STATIC_DIR)), name="ops-static")
+    include_profile_routers(
+        app, profile=str(getattr(settings, "api_process_profile", "full") or "full")
+    )
     return app
 
 
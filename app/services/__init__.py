@@ -1,3 +1,17 @@
-from app.services.user_onboarding import UserOnboardingService
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.user_onboarding import UserOnboardingService
+
+
+def __getattr__(name: str) -> Any:
+    if name == "UserOnboardingService":
+        from app.services.user_onboarding import UserOnboardingService
+
+        return UserOnboardingService
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 __all__ = ["UserOnboardingService"]
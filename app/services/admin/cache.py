@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import orjson
 import redis.asyncio as redis
 
 from app.core.config import Settings
+from app.services.admin.cache_entries import (
+    SWR_LEASE_SECONDS,
+    CachedJson,
+    acquire_lease,
+    json_etag,
+    read_entry,
+    release_lease,
+    store_entry,
+)
 
 _redis_client: redis.Redis | None = None
 
+_LEASE_POLL_SECONDS = 0.05
+
 
 async def get_redis_client(settings: Settings) -> redis.Redis | None:
     global _redis_client
@@ -49,3 +63,54 @@ async def set_json_cache(
         await client.set(key, orjson.dumps(value).decode("utf-8"), ex=max(1, int(ttl_seconds)))
     except Exception:
         return
+
+
+async def invalidate_json_cache(*, settings: Settings, key: str) -> None:
+    client = await get_redis_client(settings)
+    if client is None:
+        return
+    try:
+        await client.delete(key)
+    except Exception:
+        return
+
+
+async def get_or_refresh_json_cache(
+    *,
+    settings: Settings,
+    key: str,
+    ttl_seconds: int,
+    build: Callable[[], Awaitable[dict[str, Any]]],
+) -> CachedJson:
+    """Stale-while-revalidate read where only the lease holder runs ``build``.
+
+    Once an entry is older than its (jittered) TTL, it keeps being served for another
+    ``SWR_STALE_SECONDS`` while one caller refreshes it. A cold key makes the other
+    callers poll until the lease holder stores a value or the lease runs out. The ETag is
+    stored with the value, so revalidating a cached payload never re-serializes it.
+    """
+    client = await get_redis_client(settings)
+    if client is None:
+        value = await build()
+        return CachedJson(value, json_etag(value))
+
+    deadline = time.monotonic() + SWR_LEASE_SECONDS
+    while True:
+        entry = await read_entry(client, key)
+        if entry is not None and entry[1]:
+            return entry[0]
+        token = await acquire_lease(client, key)
+        if token is not None:
+            try:
+                refreshed = await read_entry(client, key)
+                if refreshed is not None and refreshed[1]:
+                    return refreshed[0]
+                return await store_entry(client, key, await build(), ttl_seconds)
+            finally:
+                await release_lease(client, key, token)
+        if entry is not None:
+            return entry[0]
+        if time.monotonic() >= deadline:
+            value = await build()
+            return CachedJson(value, json_etag(value))
+        await asyncio.sleep(_LEASE_POLL_SECONDS)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+import orjson
+import redis.asyncio as redis
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SWR_STALE_SECONDS = 600
+SWR_LEASE_SECONDS = 30
+SWR_TTL_JITTER_RATIO = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class CachedJson:
+    value: dict[str, Any]
+    etag: str
+
+
+def json_etag(value: dict[str, Any]) -> str:
+    """Strong ETag of a JSON payload; equal content gives an equal tag whatever the key order."""
+    payload = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+async def read_entry(client: redis.Redis, key: str) -> tuple[CachedJson, bool] | None:
+    try:
+        payload = await client.get(key)
+    except redis.RedisError:
+        logger.warning("admin_cache_read_failed", key=key, exc_info=True)
+        return None
+    try:
+        entry = orjson.loads(payload) if payload else None
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("value"), dict):
+        return None
+    etag = entry.get("etag")
+    cached = CachedJson(
+        entry["value"], etag if isinstance(etag, str) else json_etag(entry["value"])
+    )
+    return cached, time.time() < float(entry.get("fresh_until") or 0)
+
+
+async def acquire_lease(client: redis.Redis, key: str) -> str | None:
+    token = uuid4().hex
+    try:
+        acquired = await client.set(f"{key}:lease", token, nx=True, ex=SWR_LEASE_SECONDS)
+    except redis.RedisError:
+        # Without a working lease the caller computes on its own instead of waiting forever.
+        logger.warning("admin_cache_lease_failed", key=key, exc_info=True)
+        return token
+    return token if acquired else None
+
+
+async def release_lease(client: redis.Redis, key: str, token: str) -> None:
+    try:
+        if await client.get(f"{key}:lease") == token:
+            await client.delete(f"{key}:lease")
+    except redis.RedisError:
+        # The lease expires on its own after SWR_LEASE_SECONDS.
+        logger.warning("admin_cache_lease_release_failed", key=key, exc_info=True)
+
+
+async def store_entry(
+    client: redis.Redis, key: str, value: dict[str, Any], ttl_seconds: int
+) -> CachedJson:
+    cached = CachedJson(value, json_etag(value))
+    fresh_for = max(1.0, ttl_seconds * random.uniform(1 - SWR_TTL_JITTER_RATIO, 1.0))
+    entry = {"fresh_until": time.time() + fresh_for, "etag": cached.etag, "value": value}
+    try:
+        await client.set(key, orjson.dumps(entry), ex=int(fresh_for) + SWR_STALE_SECONDS)
+    except redis.RedisError:
+        logger.warning("admin_cache_store_failed", key=key, exc_info=True)
+    return cached
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 from datetime import datetime, timezone
 
-import httpx
 import structlog
 
 from app.core.config import get_settings
 from app.services.alerts_config import DEFAULT_PAGERDUTY_EVENTS_URL, AlertRoute, AlertTarget
+from app.services.alerts_dedupe import ALERT_DEDUPLICATOR
 from app.services.alerts_delivery import post_json
+from app.services.alerts_http import get_alert_http_client
 from app.services.alerts_payloads import build_channel_payload
 from app.services.alerts_routes import resolve_alert_route, resolve_targets
 
@@ -24,34 +28,47 @@ async def send_ops_alert(*, event: str, payload: dict[str, object]) -> bool:
     if not targets:
         return False
 
+    dedupe_key = _dedupe_key(event=event, payload=payload)
+    dedupe_window_seconds = _setting_float(settings, "ops_alert_dedupe_window_seconds", 300.0)
+    suppressed_before = ALERT_DEDUPLICATOR.claim(
+        key=dedupe_key,
+        window_seconds=dedupe_window_seconds,
+    )
+    if suppressed_before is None:
+        logger.info("ops_alert_suppressed_duplicate", alert_event=event)
+        return True
+
     sent_at = datetime.now(timezone.utc)
     app_env = _setting_str(settings, "app_env") or "dev"
     pagerduty_routing_key = _setting_str(settings, "ops_alert_pagerduty_routing_key")
+    timeout_seconds = _setting_float(settings, "ops_alert_timeout_seconds", 5.0)
+    max_attempts = int(_setting_float(settings, "ops_alert_max_attempts", 3))
 
-    delivered_to: list[str] = []
-    failed_to: list[str] = []
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        for target in targets:
-            body = build_channel_payload(
-                channel=target.channel,
-                event=event,
-                payload=payload,
-                sent_at=sent_at,
-                route=route,
-                app_env=app_env,
-                pagerduty_routing_key=pagerduty_routing_key,
-            )
-            delivered = await post_json(
+    client = get_alert_http_client(timeout_seconds=timeout_seconds)
+    results = await asyncio.gather(
+        *(
+            post_json(
                 client=client,
                 url=target.url,
-                body=body,
+                body=build_channel_payload(
+                    channel=target.channel,
+                    event=event,
+                    payload=payload,
+                    sent_at=sent_at,
+                    route=route,
+                    app_env=app_env,
+                    pagerduty_routing_key=pagerduty_routing_key,
+                ),
                 event=event,
                 channel=target.channel,
+                timeout_seconds=timeout_seconds,
+                max_attempts=max_attempts,
             )
-            if delivered:
-                delivered_to.append(target.channel)
-            else:
-                failed_to.append(target.channel)
+            for target in targets
+        )
+    )
+    delivered_to = [target.channel for target, ok in zip(targets, results, strict=True) if ok]
+    failed_to = [target.channel for target, ok in zip(targets, results, strict=True) if not ok]
 
     if not delivered_to:
         logger.error(
@@ -61,6 +78,8 @@ async def send_ops_alert(*, event: str, payload: dict[str, object]) -> bool:
             escalation_tier=route.escalation_tier,
             failed_to=failed_to,
         )
+        # Let the next occurrence go out instead of being collapsed into a failed delivery.
+        ALERT_DEDUPLICATOR.release(key=dedupe_key)
         return False
 
     logger.info(
@@ -70,15 +89,26 @@ async def send_ops_alert(*, event: str, payload: dict[str, object]) -> bool:
         escalation_tier=route.escalation_tier,
         delivered_to=delivered_to,
         failed_to=failed_to,
+        suppressed_duplicates=suppressed_before,
     )
     return True
 
 
+def _dedupe_key(*, event: str, payload: dict[str, object]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return f"{event}:{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+
 def _setting_str(settings: object, attr: str) -> str:
     value = getattr(settings, attr, "")
     return value.strip() if isinstance(value, str) else ""
 
 
+def _setting_float(settings: object, attr: str, default: float) -> float:
+    value = getattr(settings, attr, default)
+    return float(value) if isinstance(value, (int, float)) else default
+
+
 __all__ = [
     "AlertRoute",
     "AlertTarget",
@@ -47,6 +47,11 @@ EVENT_ALERT_ROUTES = {
         severity="error",
         escalation_tier="ops_l1",
     ),
+    "ledger_snapshot_drift_detected": AlertRoute(
+        channels=("slack", "generic"),
+        severity="error",
+        escalation_tier="ops_l1",
+    ),
     "offers_conversion_drop_detected": AlertRoute(
         channels=("slack", "generic"),
         severity="warning",
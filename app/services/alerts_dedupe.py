@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _DedupeEntry:
+    first_sent_at_mono: float
+    suppressed: int = 0
+
+
+class AlertDeduplicator:
+    """Collapses repeated alerts with the same key inside a rolling window per process."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _DedupeEntry] = {}
+        self._lock = Lock()
+
+    def claim(
+        self, *, key: str, window_seconds: float, now_mono: float | None = None
+    ) -> int | None:
+        """Returns suppressed-duplicate count to report when sending, or None to skip."""
+        if window_seconds <= 0:
+            return 0
+        now_value = monotonic() if now_mono is None else now_mono
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now_value - entry.first_sent_at_mono < window_seconds:
+                entry.suppressed += 1
+                return None
+            suppressed_before = entry.suppressed if entry is not None else 0
+            self._entries[key] = _DedupeEntry(first_sent_at_mono=now_value)
+            expired_summaries = self._prune(now_mono=now_value, window_seconds=window_seconds)
+        for expired_key, suppressed in expired_summaries:
+            # The key stopped firing, so no later send will carry its duplicate count.
+            logger.info(
+                "ops_alert_suppressed_duplicates_flushed",
+                dedupe_key=expired_key,
+                suppressed_duplicates=suppressed,
+            )
+        return suppressed_before
+
+    def release(self, *, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self, *, now_mono: float, window_seconds: float) -> list[tuple[str, int]]:
+        """Evicts expired entries; returns the non-zero suppressed counts they still held."""
+        expired_keys = [
+            key
+            for key, entry in self._entries.items()
+            if now_mono - entry.first_sent_at_mono >= window_seconds
+        ]
+        summaries: list[tuple[str, int]] = []
+        for key in expired_keys:
+            entry = self._entries.pop(key)
+            if entry.suppressed:
+                summaries.append((key, entry.suppressed))
+        return summaries
+
+
+ALERT_DEDUPLICATOR = AlertDeduplicator()
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+from time import perf_counter
 from typing import Any
 
 import httpx
 import structlog
 
+from app.core.metrics import OPS_ALERT_DELIVERY_SECONDS
+
 logger = structlog.get_logger("app.services.alerts")
 
+RETRY_BACKOFF_BASE_SECONDS = 0.25
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(exc, (httpx.TransportError, asyncio.TimeoutError))
+
 
 async def post_json(
     *,
@@ -15,15 +28,41 @@ async def post_json(
     body: dict[str, Any],
     event: str,
     channel: str,
+    timeout_seconds: float = 5.0,
+    max_attempts: int = 1,
 ) -> bool:
-    try:
-        response = await client.post(url, json=body)
-        response.raise_for_status()
-        return True
-    except Exception:
-        logger.exception(
-            "ops_alert_delivery_failed",
-            alert_event=event,
-            provider=channel,
+    started_at = perf_counter()
+    attempts = max(1, max_attempts)
+    for attempt in range(1, attempts + 1):
+        try:
+            response = await asyncio.wait_for(
+                client.post(url, json=body),
+                timeout=timeout_seconds,
+            )
+            response.raise_for_status()
+        except Exception as exc:
+            if attempt < attempts and _is_retryable(exc):
+                logger.warning(
+                    "ops_alert_delivery_retry",
+                    alert_event=event,
+                    provider=channel,
+                    attempt=attempt,
+                    error_type=type(exc).__name__,
+                )
+                await asyncio.sleep(RETRY_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+                continue
+            logger.exception(
+                "ops_alert_delivery_failed",
+                alert_event=event,
+                provider=channel,
+                attempts=attempt,
+            )
+            OPS_ALERT_DELIVERY_SECONDS.labels(channel=channel, outcome="failed").observe(
+                perf_counter() - started_at
+            )
+            return False
+        OPS_ALERT_DELIVERY_SECONDS.labels(channel=channel, outcome="ok").observe(
+            perf_counter() - started_at
         )
-        return False
+        return True
+    return False
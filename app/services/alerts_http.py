@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+import httpx
+
+ALERT_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# httpx connection pools are bound to the event loop that opened them; Celery jobs run
+# each task in a fresh loop, so the shared client is kept per running loop.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_alert_http_client(*, timeout_seconds: float) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=timeout_seconds, limits=ALERT_HTTP_LIMITS)
+        _CLIENTS[loop] = client
+    return client
+
+
+async def close_alert_http_client() -> None:
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def reset_alert_http_clients() -> None:
+    _CLIENTS.clear()
@@ -5,13 +5,13 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.db.repo.quiz_sessions_repo import QuizSessionsRepo
 from app.db.repo.users_repo import UsersRepo
 from app.economy.energy.service import EnergyService
+from app.services.channel_membership import is_channel_member
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,6 @@ _CHANNEL_BONUS_STATUS_ALREADY_CLAIMED = "ALREADY_CLAIMED"
 _CHANNEL_BONUS_STATUS_NOT_SUBSCRIBED = "NOT_SUBSCRIBED"
 _CHANNEL_BONUS_STATUS_CHECK_ERROR = "CHECK_ERROR"
 
-_SUBSCRIBED_MEMBER_STATUSES = {"creator", "administrator", "member", "restricted"}
-
 
 @dataclass(frozen=True, slots=True)
 class ChannelBonusClaimResult:
@@ -104,37 +102,6 @@ async def should_show_post_game_prompt(
     return completed_sessions == 1
 
 
-async def _is_user_subscribed_to_bonus_channel(
-    *,
-    bot: Bot,
-    channel_target: int | str,
-    telegram_user_id: int,
-    checker_bot_token: str,
-) -> bool | None:
-    active_bot = bot
-    checker_bot: Bot | None = None
-    normalized_checker_token = checker_bot_token.strip()
-    if normalized_checker_token:
-        try:
-            checker_bot = Bot(token=normalized_checker_token)
-            active_bot = checker_bot
-        except ValueError as exc:
-            logger.warning("channel_bonus_checker_bot_invalid_token", exc_info=exc)
-            return None
-
-    try:
-        member = await active_bot.get_chat_member(chat_id=channel_target, user_id=telegram_user_id)
-    except (TelegramAPIError, TimeoutError, OSError) as exc:
-        logger.warning("channel_bonus_check_failed", exc_info=exc)
-        return None
-    finally:
-        if checker_bot is not None:
-            await checker_bot.session.close()
-
-    member_status = str(getattr(member, "status", "")).lower().strip()
-    return member_status in _SUBSCRIBED_MEMBER_STATUSES
-
-
 async def claim_bonus_if_subscribed(
     session: AsyncSession,
     *,
@@ -149,7 +116,7 @@ async def claim_bonus_if_subscribed(
         logger.warning("channel_bonus_channel_not_configured")
         return ChannelBonusClaimResult(status=_CHANNEL_BONUS_STATUS_CHECK_ERROR)
 
-    subscribed = await _is_user_subscribed_to_bonus_channel(
+    subscribed = await is_channel_member(
         bot=bot,
         channel_target=channel_target,
         telegram_user_id=telegram_user_id,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from time import monotonic
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.exceptions import TelegramAPIError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBED_MEMBER_STATUSES = frozenset({"creator", "administrator", "member", "restricted"})
+# Members rarely leave within minutes; non-members are expected to join and tap again soon.
+POSITIVE_TTL_SECONDS = 300.0
+NEGATIVE_TTL_SECONDS = 5.0
+MAX_CACHED_RESULTS = 50_000
+
+_MemberKey = tuple[int | str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResult:
+    expires_at_mono: float
+    subscribed: bool
+
+
+_RESULTS: dict[_MemberKey, _CachedResult] = {}
+# aiohttp sessions and tasks are bound to the loop that created them; Celery jobs run each
+# update in a fresh loop, so the checker bot and in-flight checks are kept per running loop.
+_CHECKER_BOTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Bot] = (
+    weakref.WeakKeyDictionary()
+)
+_IN_FLIGHT: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[_MemberKey, asyncio.Task[bool | None]]
+] = weakref.WeakKeyDictionary()
+
+
+def clear_membership_cache() -> None:
+    _RESULTS.clear()
+
+
+def _checker_bot(token: str) -> Bot:
+    loop = asyncio.get_running_loop()
+    bot = _CHECKER_BOTS.get(loop)
+    if bot is None:
+        api_base_url = get_settings().telegram_bot_api_base_url.strip()
+        session = (
+            AiohttpSession(api=TelegramAPIServer.from_base(api_base_url.rstrip("/")))
+            if api_base_url
+            else None
+        )
+        bot = Bot(token=token, session=session)
+        _CHECKER_BOTS[loop] = bot
+    return bot
+
+
+async def close_checker_bot() -> None:
+    bot = _CHECKER_BOTS.pop(asyncio.get_running_loop(), None)
+    if bot is not None:
+        await bot.session.close()
+
+
+def _remember(key: _MemberKey, subscribed: bool) -> None:
+    now_mono = monotonic()
+    if len(_RESULTS) >= MAX_CACHED_RESULTS:
+        for stale_key in [k for k, v in _RESULTS.items() if v.expires_at_mono <= now_mono]:
+            del _RESULTS[stale_key]
+        if len(_RESULTS) >= MAX_CACHED_RESULTS:
+            _RESULTS.clear()
+    ttl_seconds = POSITIVE_TTL_SECONDS if subscribed else NEGATIVE_TTL_SECONDS
+    _RESULTS[key] = _CachedResult(expires_at_mono=now_mono + ttl_seconds, subscribed=subscribed)
+
+
+async def _check(bot: Bot, key: _MemberKey) -> bool | None:
+    channel_target, telegram_user_id = key
+    try:
+        member = await bot.get_chat_member(chat_id=channel_target, user_id=telegram_user_id)
+    except (TelegramAPIError, TimeoutError, OSError) as exc:
+        logger.warning("channel_bonus_check_failed", exc_info=exc)
+        return None
+    subscribed = str(getattr(member, "status", "")).lower().strip() in SUBSCRIBED_MEMBER_STATUSES
+    _remember(key, subscribed)
+    return subscribed
+
+
+async def is_channel_member(
+    *,
+    bot: Bot,
+    channel_target: int | str,
+    telegram_user_id: int,
+    checker_bot_token: str,
+) -> bool | None:
+    """Returns membership, or None when it could not be determined (errors are not cached).
+
+    Concurrent checks for the same user share one ``get_chat_member`` call.
+    """
+    key: _MemberKey = (channel_target, telegram_user_id)
+    cached = _RESULTS.get(key)
+    if cached is not None and cached.expires_at_mono > monotonic():
+        return cached.subscribed
+
+    in_flight = _IN_FLIGHT.setdefault(asyncio.get_running_loop(), {})
+    task = in_flight.get(key)
+    if task is None:
+        active_bot = bot
+        normalized_checker_token = checker_bot_token.strip()
+        if normalized_checker_token:
+            try:
+                active_bot = _checker_bot(normalized_checker_token)
+            except ValueError as exc:
+                logger.warning("channel_bonus_checker_bot_invalid_token", exc_info=exc)
+                return None
+        task = asyncio.ensure_future(_check(active_bot, key))
+        in_flight[key] = task
+        task.add_done_callback(lambda _: in_flight.pop(key, None))
+    # Shielded so one caller giving up does not cancel the check the others are waiting on.
+    return await asyncio.shield(task)
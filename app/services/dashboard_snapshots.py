@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Generic, TypeVar
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repo.dashboard_snapshots_repo import DashboardSnapshotsRepo
+from app.services.offers_observability import OfferFunnelSnapshot, build_offer_funnel_snapshot
+from app.services.promo_observability import PromoDashboardSnapshot, build_promo_dashboard_snapshot
+from app.services.referrals_observability import (
+    ReferralsDashboardSnapshot,
+    build_referrals_dashboard_snapshot,
+)
+
+# Bump whenever a snapshot dataclass changes shape; rows written under another version are ignored.
+SNAPSHOT_SCHEMA_VERSION = 1
+
+SnapshotT = TypeVar("SnapshotT")
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardSpec(Generic[SnapshotT]):
+    name: str
+    snapshot_type: type[SnapshotT]
+    build: Callable[..., Awaitable[SnapshotT]]
+
+
+PROMO_DASHBOARD = DashboardSpec("promo", PromoDashboardSnapshot, build_promo_dashboard_snapshot)
+REFERRALS_DASHBOARD = DashboardSpec(
+    "referrals", ReferralsDashboardSnapshot, build_referrals_dashboard_snapshot
+)
+OFFERS_DASHBOARD = DashboardSpec("offers", OfferFunnelSnapshot, build_offer_funnel_snapshot)
+DASHBOARDS: tuple[DashboardSpec[Any], ...] = (
+    PROMO_DASHBOARD,
+    REFERRALS_DASHBOARD,
+    OFFERS_DASHBOARD,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardRead(Generic[SnapshotT]):
+    snapshot: SnapshotT
+    source: str  # "snapshot" or "live"
+
+
+def parse_snapshot_windows(raw: str) -> tuple[int, ...]:
+    windows: set[int] = set()
+    for chunk in str(raw or "").split(","):
+        chunk = chunk.strip()
+        if chunk.isdigit() and 1 <= int(chunk) <= 168:
+            windows.add(int(chunk))
+    return tuple(sorted(windows))
+
+
+def encode_snapshot(snapshot: object) -> dict[str, Any]:
+    payload = orjson.loads(orjson.dumps(snapshot))
+    if not isinstance(payload, dict):
+        raise TypeError("dashboard snapshot must serialize to an object")
+    return payload
+
+
+def decode_snapshot(snapshot_type: type[SnapshotT], payload: dict[str, Any]) -> SnapshotT:
+    return snapshot_type(
+        **{**payload, "generated_at": datetime.fromisoformat(payload["generated_at"])}
+    )
+
+
+async def refresh_dashboard_snapshots(
+    session: AsyncSession,
+    *,
+    now_utc: datetime,
+    windows: Sequence[int],
+    write_session: AsyncSession | None = None,
+) -> dict[str, int]:
+    """Recomputes every dashboard for each window; returns compute time per ``name[window]``.
+
+    Snapshots are built on ``session`` and stored through ``write_session`` (defaults to
+    ``session``), so the builds can run on a read replica.
+    """
+    target_session = session if write_session is None else write_session
+    compute_ms_by_key: dict[str, int] = {}
+    for window_hours in windows:
+        for spec in DASHBOARDS:
+            started_at = perf_counter()
+            snapshot = await spec.build(session, now_utc=now_utc, window_hours=window_hours)
+            compute_ms = int((perf_counter() - started_at) * 1000)
+            await DashboardSnapshotsRepo.upsert(
+                target_session,
+                dashboard=spec.name,
+                window_hours=window_hours,
+                schema_version=SNAPSHOT_SCHEMA_VERSION,
+                payload=encode_snapshot(snapshot),
+                generated_at=now_utc,
+                compute_ms=compute_ms,
+            )
+            compute_ms_by_key[f"{spec.name}[{window_hours}]"] = compute_ms
+    return compute_ms_by_key
+
+
+async def read_dashboard(
+    session: AsyncSession,
+    spec: DashboardSpec[SnapshotT],
+    *,
+    now_utc: datetime,
+    window_hours: int,
+    fresh: bool,
+    max_age_seconds: int,
+) -> DashboardRead[SnapshotT]:
+    """Serves the stored snapshot when it is current enough, otherwise computes live."""
+    if not fresh:
+        row = await DashboardSnapshotsRepo.get(
+            session, dashboard=spec.name, window_hours=window_hours
+        )
+        if (
+            row is not None
+            and row.schema_version == SNAPSHOT_SCHEMA_VERSION
+            and (now_utc - row.generated_at).total_seconds() <= max_age_seconds
+        ):
+            return DashboardRead(decode_snapshot(spec.snapshot_type, row.payload), "snapshot")
+    snapshot = await spec.build(session, now_utc=now_utc, window_hours=window_hours)
+    return DashboardRead(snapshot, "live")
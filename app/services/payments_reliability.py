@@ -9,12 +9,14 @@ def compute_reconciliation_diff(
     paid_stars_total: int,
     credited_stars_total: int,
     product_stars_mismatch_count: int,
+    recent_credit_mismatch_count: int = 0,
 ) -> int:
     return (
         abs(paid_purchases_count - credited_purchases_count)
         + max(0, stale_paid_uncredited_count)
         + (1 if paid_stars_total != credited_stars_total else 0)
         + max(0, product_stars_mismatch_count)
+        + max(0, recent_credit_mismatch_count)
     )
 
 
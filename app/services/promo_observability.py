@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repo.promo_repo import PromoRepo
+
+PROMO_FAILURE_RESULTS = ("INVALID", "EXPIRED", "NOT_APPLICABLE", "RATE_LIMITED")
+PROMO_GUARD_LOOKBACK_MINUTES = 10
+PROMO_GUARD_MIN_FAILED_ATTEMPTS = 100
+PROMO_GUARD_MIN_DISTINCT_USERS = 2
+
+
+def _safe_rate(*, numerator: int, denominator: int) -> float:
+    if denominator <= 0:
+        return 0.0
+    return numerator / denominator
+
+
+@dataclass(frozen=True, slots=True)
+class PromoDashboardSnapshot:
+    generated_at: datetime
+    window_hours: int
+    attempts_total: int
+    attempts_accepted: int
+    attempts_failed: int
+    acceptance_rate: float
+    failure_rate: float
+    attempt_failures_by_result: dict[str, int]
+    redemptions_total: int
+    redemptions_applied: int
+    redemptions_by_status: dict[str, int]
+    discount_redemptions_total: int
+    discount_redemptions_applied: int
+    discount_redemptions_reserved: int
+    discount_redemptions_expired: int
+    discount_conversion_rate: float
+    guard_window_minutes: int
+    guard_trigger_hashes: int
+    active_campaigns_total: int
+    paused_campaigns_total: int
+    paused_campaigns_recent: int
+
+
+async def build_promo_dashboard_snapshot(
+    session: AsyncSession,
+    *,
+    now_utc: datetime,
+    window_hours: int,
+) -> PromoDashboardSnapshot:
+    window_since_utc = now_utc - timedelta(hours=window_hours)
+    guard_since_utc = now_utc - timedelta(minutes=PROMO_GUARD_LOOKBACK_MINUTES)
+
+    attempt_counts = await PromoRepo.count_attempts_by_result(session, since_utc=window_since_utc)
+    redemption_counts = await PromoRepo.count_redemptions_by_status(
+        session, since_utc=window_since_utc
+    )
+    discount_redemption_counts = await PromoRepo.count_discount_redemptions_by_status(
+        session,
+        since_utc=window_since_utc,
+    )
+    campaign_counts = await PromoRepo.count_campaigns_by_status(session)
+    paused_recent = await PromoRepo.count_paused_campaigns_since(
+        session, since_utc=window_since_utc
+    )
+    guard_trigger_hashes = await PromoRepo.count_abusive_code_hashes(
+        session,
+        since_utc=guard_since_utc,
+        min_failed_attempts=PROMO_GUARD_MIN_FAILED_ATTEMPTS,
+        min_distinct_users=PROMO_GUARD_MIN_DISTINCT_USERS,
+    )
+
+    attempts_total = sum(attempt_counts.values())
+    attempts_accepted = attempt_counts.get("ACCEPTED", 0)
+    attempts_failed = max(0, attempts_total - attempts_accepted)
+
+    discount_redemptions_total = sum(discount_redemption_counts.values())
+    discount_redemptions_applied = discount_redemption_counts.get("APPLIED", 0)
+
+    return PromoDashboardSnapshot(
+        generated_at=now_utc,
+        window_hours=window_hours,
+        attempts_total=attempts_total,
+        attempts_accepted=attempts_accepted,
+        attempts_failed=attempts_failed,
+        acceptance_rate=_safe_rate(numerator=attempts_accepted, denominator=attempts_total),
+        failure_rate=_safe_rate(numerator=attempts_failed, denominator=attempts_total),
+        attempt_failures_by_result={
+            result: attempt_counts.get(result, 0) for result in PROMO_FAILURE_RESULTS
+        },
+        redemptions_total=sum(redemption_counts.values()),
+        redemptions_applied=redemption_counts.get("APPLIED", 0),
+        redemptions_by_status=redemption_counts,
+        discount_redemptions_total=discount_redemptions_total,
+        discount_redemptions_applied=discount_redemptions_applied,
+        discount_redemptions_reserved=discount_redemption_counts.get("RESERVED", 0),
+        discount_redemptions_expired=discount_redemption_counts.get("EXPIRED", 0),
+        discount_conversion_rate=_safe_rate(
+            numerator=discount_redemptions_applied,
+            denominator=discount_redemptions_total,
+        ),
+        guard_window_minutes=PROMO_GUARD_LOOKBACK_MINUTES,
+        guard_trigger_hashes=guard_trigger_hashes,
+        active_campaigns_total=campaign_counts.get("ACTIVE", 0),
+        paused_campaigns_total=campaign_counts.get("PAUSED", 0),
+        paused_campaigns_recent=paused_recent,
+    )
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import time
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from app.core.redis_loop_client import get_loop_redis_client, mark_loop_redis_unavailable
+
+KEY_PREFIX = "rate_limit:"
+_COMPONENT = "rate_limiter"
+
+# Sliding-window log: prune expired hits, optionally add one, report count and newest hit.
+_SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now_ms = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local member = ARGV[3]
+redis.call('ZREMRANGEBYSCORE', key, '-inf', '(' .. (now_ms - window_ms))
+if member ~= '' then
+  redis.call('ZADD', key, now_ms, member)
+  redis.call('PEXPIRE', key, window_ms)
+end
+local newest = redis.call('ZRANGE', key, -1, -1, 'WITHSCORES')
+return {redis.call('ZCARD', key), newest[2] or '0'}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class WindowUsage:
+    count: int
+    newest_at: float | None
+
+
+_MEMORY_HITS: dict[str, deque[float]] = {}
+_MEMORY_LOCK = Lock()
+
+
+def _memory_usage(*, key: str, window_seconds: float, now: float, add_hit: bool) -> WindowUsage:
+    cutoff = now - window_seconds
+    with _MEMORY_LOCK:
+        hits = _MEMORY_HITS.get(key)
+        if hits is None:
+            if not add_hit:
+                return WindowUsage(count=0, newest_at=None)
+            hits = _MEMORY_HITS.setdefault(key, deque())
+        while hits and hits[0] < cutoff:
+            hits.popleft()
+        if add_hit:
+            hits.append(now)
+        if not hits:
+            _MEMORY_HITS.pop(key, None)
+            return WindowUsage(count=0, newest_at=None)
+        return WindowUsage(count=len(hits), newest_at=hits[-1])
+
+
+async def _get_redis_client() -> redis.Redis | None:
+    return await get_loop_redis_client(component=_COMPONENT)
+
+
+async def _mark_redis_unavailable(exc: Exception) -> None:
+    await mark_loop_redis_unavailable(exc, component=_COMPONENT)
+
+
+async def _window_usage(
+    *, key: str, window_seconds: float, now: float | None, add_hit: bool
+) -> WindowUsage:
+    resolved_window = max(1.0, float(window_seconds))
+    resolved_now = time() if now is None else now
+    client = await _get_redis_client()
+    if client is not None:
+        try:
+            count, newest_ms = await client.register_script(_SLIDING_WINDOW_SCRIPT)(
+                keys=[f"{KEY_PREFIX}{key}"],
+                args=[
+                    int(resolved_now * 1000),
+                    int(resolved_window * 1000),
+                    f"{int(resolved_now * 1000)}:{uuid4().hex[:12]}" if add_hit else "",
+                ],
+            )
+        except Exception as exc:
+            await _mark_redis_unavailable(exc)
+        else:
+            newest = float(newest_ms) / 1000
+            return WindowUsage(count=int(count), newest_at=newest if int(count) > 0 else None)
+    return _memory_usage(key=key, window_seconds=resolved_window, now=resolved_now, add_hit=add_hit)
+
+
+async def record_hit(*, key: str, window_seconds: float, now: float | None = None) -> WindowUsage:
+    return await _window_usage(key=key, window_seconds=window_seconds, now=now, add_hit=True)
+
+
+async def get_window_usage(
+    *, key: str, window_seconds: float, now: float | None = None
+) -> WindowUsage:
+    return await _window_usage(key=key, window_seconds=window_seconds, now=now, add_hit=False)
+
+
+async def clear_hits(*, key: str) -> None:
+    with _MEMORY_LOCK:
+        _MEMORY_HITS.pop(key, None)
+    client = await _get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.delete(f"{KEY_PREFIX}{key}")
+    except Exception as exc:
+        await _mark_redis_unavailable(exc)
+
+
+async def reset_rate_limits() -> None:
+    with _MEMORY_LOCK:
+        _MEMORY_HITS.clear()
+    client = await _get_redis_client()
+    if client is None:
+        return
+    try:
+        async for redis_key in client.scan_iter(match=f"{KEY_PREFIX}*"):
+            await client.delete(redis_key)
+    except Exception as exc:
+        await _mark_redis_unavailable(exc)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+
+from app.core.metrics import TELEGRAM_API_REQUEST_SECONDS
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+    from aiogram.methods import Response, TelegramMethod
+
+
+def _outcome_for_error(exc: BaseException) -> str:
+    if isinstance(exc, TelegramRetryAfter):
+        return "retry_after"
+    if isinstance(exc, TelegramForbiddenError):
+        return "forbidden"
+    if isinstance(exc, TelegramBadRequest):
+        return "bad_request"
+    return "error"
+
+
+class TelegramApiMetricsMiddleware(BaseRequestMiddleware):
+    """Records Bot API call latency per method and outcome."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[Any],
+        bot: Bot,
+        method: TelegramMethod[Any],
+    ) -> Response[Any]:
+        method_name = str(getattr(method, "__api_method__", type(method).__name__))
+        started_at = perf_counter()
+        outcome = "ok"
+        try:
+            return await make_request(bot, method)
+        except Exception as exc:
+            outcome = _outcome_for_error(exc)
+            raise
+        finally:
+            TELEGRAM_API_REQUEST_SECONDS.labels(method=method_name, outcome=outcome).observe(
+                perf_counter() - started_at
+            )
@@ -83,10 +83,11 @@ class UserOnboardingService:
                 )
 
         await UsersRepo.touch_last_seen(session, user.id, now_utc)
-        energy_snapshot = await EnergyService.sync_energy_clock(
+        # Home renders read without row locks; writes happen only when a transition is due.
+        energy_snapshot = await EnergyService.read_energy_clock(
             session, user_id=user.id, now_utc=now_utc
         )
-        streak_snapshot = await StreakService.sync_rollover(
+        streak_snapshot = await StreakService.read_rollover(
             session, user_id=user.id, now_utc=now_utc
         )
         global_best_streak = await UsersRepo.get_global_best_streak(session)
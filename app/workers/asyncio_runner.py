@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from collections.abc import Awaitable
 from typing import TypeVar
 
+from app.core.redis_loop_client import close_loop_redis_client
 from app.db.session import dispose_engine
+from app.services.alerts_http import close_alert_http_client
 
 T = TypeVar("T")
 
 
+async def _close_checker_bot() -> None:
+    # Only processes that ran a channel-bonus check hold a checker bot; the rest never import
+    # the membership module (and aiogram with it).
+    channel_membership = sys.modules.get("app.services.channel_membership")
+    if channel_membership is not None:
+        await channel_membership.close_checker_bot()
+
+
 async def _run_with_fresh_db_pool(awaitable: Awaitable[T]) -> T:
     await dispose_engine()
     try:
         return await awaitable
     finally:
+        await close_alert_http_client()
+        await close_loop_redis_client()
+        await _close_checker_bot()
         await dispose_engine()
 
 
@@ -1,6 +1,9 @@
 from celery import Celery
 
 from app.core.config import get_settings
+from app.workers import celery_metrics  # noqa: F401
+from app.workers.task_registry import task_modules_for_profile
+from app.workers.tasks.telegram_updates_config import PROCESS_TELEGRAM_UPDATE_TASK_NAME
 
 settings = get_settings()
 
@@ -8,29 +11,12 @@ celery_app = Celery(
     "quiz_arena",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=[
-        "app.workers.tasks.telegram_updates",
-        "app.workers.tasks.payments_reliability",
-        "app.workers.tasks.offers_observability",
-        "app.workers.tasks.analytics_daily",
-        "app.workers.tasks.admin_daily_metrics",
-        "app.workers.tasks.daily_challenge",
-        "app.workers.tasks.promo_maintenance",
-        "app.workers.tasks.retention_cleanup",
-        "app.workers.tasks.referrals",
-        "app.workers.tasks.referrals_observability",
-        "app.workers.tasks.telegram_updates_observability",
-        "app.workers.tasks.friend_challenges",
-        "app.workers.tasks.friend_challenges_proof_cards",
-        "app.workers.tasks.tournaments",
-        "app.workers.tasks.tournaments_messaging",
-        "app.workers.tasks.tournaments_proof_cards",
-        "app.workers.tasks.daily_cup",
-    ],
+    include=list(task_modules_for_profile(settings.worker_process_profile)),
 )
 
 celery_app.conf.update(
     task_default_queue="q_normal",
+    task_routes={PROCESS_TELEGRAM_UPDATE_TASK_NAME: {"queue": settings.telegram_updates_queue}},
     task_acks_late=True,
     worker_prefetch_multiplier=1,
     task_serializer="json",
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime
+from typing import Any
+
+import structlog
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_shutdown,
+)
+
+from app.core.config import get_settings
+from app.core.metrics import CELERY_TASK_QUEUE_LAG_SECONDS, CELERY_TASK_SECONDS
+from app.core.metrics_exposition import (
+    mark_metrics_process_dead,
+    reset_multiprocess_dir,
+    start_metrics_sidecar,
+)
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+logger = structlog.get_logger(__name__)
+
+_TASK_STARTED_AT: dict[str, float] = {}
+
+
+def _eta_timestamp(raw_eta: object) -> float | None:
+    if isinstance(raw_eta, datetime):
+        return raw_eta.timestamp()
+    if isinstance(raw_eta, str) and raw_eta:
+        try:
+            return datetime.fromisoformat(raw_eta).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def compute_queue_lag_seconds(request: Any, *, now_ts: float) -> float | None:
+    enqueued_at = getattr(request, ENQUEUED_AT_HEADER, None)
+    if not isinstance(enqueued_at, (int, float)):
+        return None
+    # Retries and countdown tasks are not lagging before their ETA.
+    ready_at = max(float(enqueued_at), _eta_timestamp(getattr(request, "eta", None)) or 0.0)
+    return max(0.0, now_ts - ready_at)
+
+
+@before_task_publish.connect
+def _stamp_enqueued_at(headers: dict[str, Any] | None = None, **_: Any) -> None:
+    if headers is not None:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def _on_task_prerun(task_id: str | None = None, task: Any = None, **_: Any) -> None:
+    if task_id is None or task is None:
+        return
+    _TASK_STARTED_AT[task_id] = time.perf_counter()
+    lag_seconds = compute_queue_lag_seconds(task.request, now_ts=time.time())
+    if lag_seconds is not None:
+        CELERY_TASK_QUEUE_LAG_SECONDS.labels(task=task.name).observe(lag_seconds)
+
+
+@task_postrun.connect
+def _on_task_postrun(
+    task_id: str | None = None,
+    task: Any = None,
+    state: str | None = None,
+    **_: Any,
+) -> None:
+    if task_id is None or task is None:
+        return
+    started_at = _TASK_STARTED_AT.pop(task_id, None)
+    if started_at is None:
+        return
+    CELERY_TASK_SECONDS.labels(task=task.name, state=state or "UNKNOWN").observe(
+        time.perf_counter() - started_at
+    )
+
+
+@worker_init.connect
+def _on_worker_init(**_: Any) -> None:
+    reset_multiprocess_dir()
+    port = int(get_settings().metrics_worker_port)
+    try:
+        started = start_metrics_sidecar(port=port)
+    except OSError as exc:
+        logger.warning("worker_metrics_sidecar_failed", port=port, error_type=type(exc).__name__)
+        return
+    if started:
+        logger.info("worker_metrics_sidecar_started", port=port)
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(pid: int | None = None, **_: Any) -> None:
+    mark_metrics_process_dead(pid if pid is not None else os.getpid())
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+WORKER_TASK_MODULES: tuple[str, ...] = (
+    "app.workers.tasks.telegram_updates",
+    "app.workers.tasks.payments_reliability",
+    "app.workers.tasks.offers_observability",
+    "app.workers.tasks.internal_dashboards",
+    "app.workers.tasks.analytics_daily",
+    "app.workers.tasks.admin_daily_metrics",
+    "app.workers.tasks.daily_challenge",
+    "app.workers.tasks.promo_maintenance",
+    "app.workers.tasks.retention_cleanup",
+    "app.workers.tasks.referrals",
+    "app.workers.tasks.referrals_observability",
+    "app.workers.tasks.telegram_updates_observability",
+    "app.workers.tasks.friend_challenges",
+    "app.workers.tasks.friend_challenges_proof_cards",
+    "app.workers.tasks.tournaments",
+    "app.workers.tasks.tournaments_messaging",
+    "app.workers.tasks.tournaments_proof_cards",
+    "app.workers.tasks.daily_cup",
+)
+# Beat schedules are registered when task modules are imported, so beat and any worker that
+# consumes q_normal/q_low must keep the "all" profile. A q_high-only worker (payments
+# reliability) skips the gameplay, messaging and proof-card modules entirely. An "updates"
+# worker only consumes TELEGRAM_UPDATES_QUEUE and runs the per-chat ordered executor.
+WORKER_TASK_PROFILES: dict[str, tuple[str, ...]] = {
+    "all": WORKER_TASK_MODULES,
+    "q_high": ("app.workers.tasks.payments_reliability",),
+    "updates": ("app.workers.tasks.telegram_updates",),
+}
+
+
+def task_modules_for_profile(profile: str) -> tuple[str, ...]:
+    normalized = profile.strip().lower() or "all"
+    try:
+        return WORKER_TASK_PROFILES[normalized]
+    except KeyError:
+        raise ValueError(f"unknown worker process profile: {profile!r}") from None
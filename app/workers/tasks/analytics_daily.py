@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 
 import structlog
 
+from app.db.read_session import ReadSessionLocal
 from app.db.repo.analytics_repo import AnalyticsRepo
 from app.db.session import SessionLocal
 from app.economy.energy.constants import BERLIN_TIMEZONE
@@ -24,18 +25,25 @@ async def run_analytics_daily_aggregation_async(*, days_back: int = 2) -> dict[s
     now_utc = datetime.now(timezone.utc)
     berlin_today = now_utc.astimezone(ZoneInfo(BERLIN_TIMEZONE)).date()
     processed_days: list[str] = []
+    snapshots = []
 
-    async with SessionLocal.begin() as session:
+    # The aggregate scans run on the read replica; only the upserts touch the primary.
+    async with ReadSessionLocal.begin() as read_session:
         for offset in range(resolved_days_back):
             local_day_berlin = berlin_today - timedelta(days=offset)
-            snapshot = await build_daily_snapshot(
-                session,
-                local_date_berlin=local_day_berlin,
-                now_utc=now_utc,
+            snapshots.append(
+                await build_daily_snapshot(
+                    read_session,
+                    local_date_berlin=local_day_berlin,
+                    now_utc=now_utc,
+                )
             )
-            await AnalyticsRepo.upsert_daily(session, row=snapshot.row)
             processed_days.append(local_day_berlin.isoformat())
 
+    async with SessionLocal.begin() as session:
+        for snapshot in snapshots:
+            await AnalyticsRepo.upsert_daily(session, row=snapshot.row)
+
     result: dict[str, object] = {
         "generated_at": now_utc.isoformat(),
         "days_processed": resolved_days_back,
@@ -10,13 +10,19 @@ from app.workers.tasks.daily_challenge_async import (
 )
 from app.workers.tasks.daily_challenge_config import DAILY_PUSH_BATCH_SIZE, DAILY_PUSH_KIND_MORNING
 from app.workers.tasks.daily_challenge_schedule import configure_daily_challenge_schedule
+from app.workers.tasks.daily_push_async import (
+    run_daily_push_shard_async as _run_daily_push_shard_async,
+)
 
 run_daily_question_set_precompute_async = _run_daily_question_set_precompute_async
 run_daily_push_notifications_async = _run_daily_push_notifications_async
+run_daily_push_shard_async = _run_daily_push_shard_async
 
 __all__ = [
     "run_daily_push_notifications",
     "run_daily_push_notifications_async",
+    "run_daily_push_shard",
+    "run_daily_push_shard_async",
     "run_daily_question_set_precompute",
     "run_daily_question_set_precompute_async",
 ]
@@ -27,6 +33,24 @@ def run_daily_question_set_precompute() -> dict[str, object]:
     return run_async_job(run_daily_question_set_precompute_async())
 
 
+def _dispatch_daily_push_shard(
+    *,
+    berlin_date: str,
+    push_kind: str,
+    shard_index: int,
+    batch_size: int,
+) -> None:
+    run_daily_push_shard.apply_async(
+        kwargs={
+            "berlin_date": berlin_date,
+            "push_kind": push_kind,
+            "shard_index": shard_index,
+            "batch_size": batch_size,
+        },
+        queue="q_low",
+    )
+
+
 @celery_app.task(name="app.workers.tasks.daily_challenge.run_daily_push_notifications")
 def run_daily_push_notifications(
     batch_size: int = DAILY_PUSH_BATCH_SIZE,
@@ -36,6 +60,24 @@ def run_daily_push_notifications(
         run_daily_push_notifications_async(
             batch_size=batch_size,
             push_kind=push_kind,
+            dispatch_shard=_dispatch_daily_push_shard,
+        )
+    )
+
+
+@celery_app.task(name="app.workers.tasks.daily_challenge.run_daily_push_shard")
+def run_daily_push_shard(
+    berlin_date: str,
+    push_kind: str,
+    shard_index: int,
+    batch_size: int = DAILY_PUSH_BATCH_SIZE,
+) -> dict[str, object]:
+    return run_async_job(
+        run_daily_push_shard_async(
+            berlin_date=berlin_date,
+            push_kind=push_kind,
+            shard_index=shard_index,
+            batch_size=batch_size,
         )
     )
 
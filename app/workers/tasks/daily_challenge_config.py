@@ -26,6 +26,10 @@ def _clamp_batch_size(value: int) -> int:
     return max(1, min(1000, int(value)))
 
 
+def _clamp_shard_count(value: int) -> int:
+    return max(1, min(32, int(value)))
+
+
 DAILY_PRECOMPUTE_HOUR_BERLIN = _clamp_hour(settings.daily_challenge_precompute_hour_berlin)
 DAILY_PRECOMPUTE_MINUTE_BERLIN = _clamp_minute(settings.daily_challenge_precompute_minute_berlin)
 DAILY_PUSH_HOUR_BERLIN = _clamp_hour(settings.daily_challenge_push_hour_berlin)
@@ -33,6 +37,7 @@ DAILY_PUSH_MINUTE_BERLIN = _clamp_minute(settings.daily_challenge_push_minute_be
 DAILY_EVENING_REMINDER_HOUR_BERLIN = _clamp_hour(19)
 DAILY_EVENING_REMINDER_MINUTE_BERLIN = _clamp_minute(0)
 DAILY_PUSH_BATCH_SIZE = _clamp_batch_size(settings.daily_challenge_push_batch_size)
+DAILY_PUSH_SHARD_COUNT = _clamp_shard_count(settings.daily_challenge_push_shard_count)
 
 __all__ = [
     "DAILY_EVENING_REMINDER_HOUR_BERLIN",
@@ -44,5 +49,6 @@ __all__ = [
     "DAILY_PUSH_KIND_MORNING",
     "DAILY_PUSH_MINUTE_BERLIN",
     "DAILY_PUSH_BATCH_SIZE",
+    "DAILY_PUSH_SHARD_COUNT",
     "VALID_DAILY_PUSH_KINDS",
 ]
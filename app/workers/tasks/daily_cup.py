@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+# Imported for its commit listeners that invalidate the shared Daily Cup status snapshot.
+from app.game.tournaments import daily_cup_status_cache  # noqa: F401
 from app.workers.asyncio_runner import run_async_job
 from app.workers.celery_app import celery_app
 from app.workers.tasks.daily_cup_async import (
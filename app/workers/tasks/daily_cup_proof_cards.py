@@ -20,7 +20,7 @@ from app.workers.tasks.daily_cup_config import DAILY_CUP_TIMEZONE
 from app.workers.tasks.daily_cup_proof_cards_delivery import send_daily_cup_proof_card
 from app.workers.tasks.daily_cup_proof_cards_text import format_points, format_user_label
 from app.workers.tasks.daily_cup_task_helpers import is_celery_task, is_today_daily_cup_tournament
-from app.workers.tasks.tournaments_proof_card_render import render_tournament_proof_card_png
+from app.workers.tasks.proof_card_renderers import render_tournament_proof_card_png
 
 logger = structlog.get_logger("app.workers.tasks.daily_cup_proof_cards")
 
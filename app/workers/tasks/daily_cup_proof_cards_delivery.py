@@ -9,7 +9,7 @@ from app.bot.keyboards.daily_cup import build_daily_cup_share_keyboard, build_da
 from app.bot.texts.de import TEXTS_DE
 from app.core.telegram_links import public_bot_link
 from app.workers.tasks.daily_cup_proof_cards_text import build_caption
-from app.workers.tasks.tournaments_proof_card_render import render_tournament_proof_card_png
+from app.workers.tasks.proof_card_renderers import render_tournament_proof_card_png
 
 
 async def send_daily_cup_proof_card(
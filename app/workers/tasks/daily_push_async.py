@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import structlog
+
+from app.bot.application import build_bot
+from app.bot.keyboards.daily import build_daily_push_keyboard
+from app.bot.texts.de import TEXTS_DE
+from app.db.repo.daily_push_logs_repo import DailyPushLogsRepo
+from app.db.repo.daily_push_shards_repo import DailyPushShardsRepo
+from app.db.repo.daily_push_targets_repo import DailyPushTargetsRepo
+from app.db.session import SessionLocal
+from app.workers.tasks.daily_challenge_config import (
+    DAILY_PUSH_BATCH_SIZE,
+    DAILY_PUSH_KIND_EVENING_REMINDER,
+    VALID_DAILY_PUSH_KINDS,
+)
+
+logger = structlog.get_logger("app.workers.tasks.daily_challenge")
+
+
+def resolve_push_kind(push_kind: str) -> str:
+    candidate = str(push_kind).strip().upper()
+    if candidate not in VALID_DAILY_PUSH_KINDS:
+        raise ValueError(f"Unsupported daily push kind: {push_kind}")
+    return candidate
+
+
+def _build_push_text(*, push_kind: str, current_streak: int) -> str:
+    lines = [
+        (
+            TEXTS_DE["msg.daily.push.evening"]
+            if push_kind == DAILY_PUSH_KIND_EVENING_REMINDER
+            else TEXTS_DE["msg.daily.push.base"]
+        )
+    ]
+    if current_streak > 0:
+        lines.append(TEXTS_DE["msg.daily.push.streak"].format(streak=current_streak))
+    return "\n".join(lines)
+
+
+async def prepare_daily_push_shards(
+    *,
+    berlin_date: date,
+    push_kind: str,
+    shard_count: int,
+    now_utc: datetime,
+) -> tuple[int, list[int]]:
+    async with SessionLocal.begin() as session:
+        shards = await DailyPushShardsRepo.list_for_day(
+            session, berlin_date=berlin_date, push_kind=push_kind
+        )
+        if not shards:
+            await DailyPushTargetsRepo.delete_before(session, berlin_date=berlin_date)
+            await DailyPushTargetsRepo.stage_targets(
+                session, berlin_date=berlin_date, push_kind=push_kind, staged_at=now_utc
+            )
+            await DailyPushShardsRepo.create_from_targets(
+                session,
+                berlin_date=berlin_date,
+                push_kind=push_kind,
+                shard_count=shard_count,
+                now_utc=now_utc,
+            )
+            shards = await DailyPushShardsRepo.list_for_day(
+                session, berlin_date=berlin_date, push_kind=push_kind
+            )
+    targets_total = sum(int(shard.targets_total) for shard in shards)
+    pending = [int(shard.shard_index) for shard in shards if shard.completed_at is None]
+    return targets_total, pending
+
+
+async def run_daily_push_shard_async(
+    *,
+    berlin_date: str,
+    push_kind: str,
+    shard_index: int,
+    batch_size: int = DAILY_PUSH_BATCH_SIZE,
+) -> dict[str, object]:
+    resolved_date = date.fromisoformat(berlin_date)
+    resolved_push_kind = resolve_push_kind(push_kind)
+    resolved_batch_size = max(1, int(batch_size))
+
+    scanned_total = 0
+    sent_total = 0
+    skipped_total = 0
+    bot = build_bot()
+    try:
+        while True:
+            now_utc = datetime.now(timezone.utc)
+            async with SessionLocal.begin() as session:
+                shard = await DailyPushShardsRepo.get_by_key(
+                    session,
+                    berlin_date=resolved_date,
+                    push_kind=resolved_push_kind,
+                    shard_index=shard_index,
+                )
+                if shard is None or shard.completed_at is not None:
+                    break
+                # Resume from the persisted cursor so a crashed shard does not rescan its range.
+                cursor = (
+                    int(shard.last_user_id)
+                    if shard.last_user_id is not None
+                    else int(shard.user_id_from) - 1
+                )
+                targets = await DailyPushTargetsRepo.list_range_batch(
+                    session,
+                    berlin_date=resolved_date,
+                    push_kind=resolved_push_kind,
+                    after_user_id=cursor,
+                    to_user_id=int(shard.user_id_to),
+                    limit=resolved_batch_size,
+                )
+                if not targets:
+                    await DailyPushShardsRepo.mark_completed(
+                        session,
+                        berlin_date=resolved_date,
+                        push_kind=resolved_push_kind,
+                        shard_index=shard_index,
+                        now_utc=now_utc,
+                    )
+                    break
+                claimed_user_ids = await DailyPushLogsRepo.create_many_once(
+                    session,
+                    user_ids=[user_id for user_id, _, _ in targets],
+                    berlin_date=resolved_date,
+                    push_kind=resolved_push_kind,
+                    push_sent_at=now_utc,
+                )
+
+            batch_sent = 0
+            for user_id, telegram_user_id, current_streak in targets:
+                if user_id not in claimed_user_ids:
+                    continue
+                try:
+                    await bot.send_message(
+                        chat_id=telegram_user_id,
+                        text=_build_push_text(
+                            push_kind=resolved_push_kind,
+                            current_streak=current_streak,
+                        ),
+                        reply_markup=build_daily_push_keyboard(),
+                    )
+                    batch_sent += 1
+                except Exception:
+                    continue
+            batch_skipped = len(targets) - batch_sent
+
+            async with SessionLocal.begin() as session:
+                await DailyPushShardsRepo.record_batch(
+                    session,
+                    berlin_date=resolved_date,
+                    push_kind=resolved_push_kind,
+                    shard_index=shard_index,
+                    last_user_id=targets[-1][0],
+                    sent=batch_sent,
+                    skipped=batch_skipped,
+                    now_utc=datetime.now(timezone.utc),
+                )
+            scanned_total += len(targets)
+            sent_total += batch_sent
+            skipped_total += batch_skipped
+    finally:
+        await bot.session.close()
+
+    result: dict[str, object] = {
+        "berlin_date": resolved_date.isoformat(),
+        "push_kind": resolved_push_kind,
+        "shard_index": shard_index,
+        "users_scanned_total": scanned_total,
+        "sent_total": sent_total,
+        "skipped_total": skipped_total,
+    }
+    logger.info("daily_push_shard_processed", **result)
+    return result
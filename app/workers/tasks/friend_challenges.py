@@ -5,7 +5,7 @@ from app.workers.celery_app import celery_app
 from app.workers.tasks.friend_challenges_async import (
     run_friend_challenge_deadlines_async as _run_friend_challenge_deadlines_async,
 )
-from app.workers.tasks.friend_challenges_config import DEADLINE_BATCH_SIZE
+from app.workers.tasks.friend_challenges_config import DEADLINE_BATCH_SIZE, DEADLINE_PARTITIONS
 from app.workers.tasks.friend_challenges_schedule import configure_friend_challenges_schedule
 from app.workers.tasks.friend_challenges_utils import (  # noqa: F401
     format_remaining_hhmm as _format_remaining_hhmm,
@@ -16,11 +16,41 @@ run_friend_challenge_deadlines_async = _run_friend_challenge_deadlines_async
 __all__ = ["run_friend_challenge_deadlines", "run_friend_challenge_deadlines_async"]
 
 
+def _dispatch_deadline_partition(
+    *, batch_size: int, partition_index: int, partition_count: int
+) -> None:
+    run_friend_challenge_deadlines.apply_async(
+        kwargs={
+            "batch_size": batch_size,
+            "partition_index": partition_index,
+            "partition_count": partition_count,
+        },
+        queue="q_normal",
+    )
+
+
 @celery_app.task(name="app.workers.tasks.friend_challenges.run_friend_challenge_deadlines")
 def run_friend_challenge_deadlines(
     batch_size: int = DEADLINE_BATCH_SIZE,
+    partition_index: int | None = None,
+    partition_count: int = DEADLINE_PARTITIONS,
 ) -> dict[str, int]:
-    return run_async_job(run_friend_challenge_deadlines_async(batch_size=batch_size))
+    # The beat run owns partition 0 and hands the others to further workers.
+    if partition_index is None:
+        for index in range(1, max(1, partition_count)):
+            _dispatch_deadline_partition(
+                batch_size=batch_size,
+                partition_index=index,
+                partition_count=partition_count,
+            )
+        partition_index = 0
+    return run_async_job(
+        run_friend_challenge_deadlines_async(
+            batch_size=batch_size,
+            partition_index=partition_index,
+            partition_count=partition_count,
+        )
+    )
 
 
 configure_friend_challenges_schedule(celery_app)
@@ -1,179 +1,167 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import structlog
 
-from app.core.analytics_events import EVENT_SOURCE_WORKER, emit_analytics_event
+from app.core.analytics_events import EVENT_SOURCE_WORKER, emit_analytics_events
 from app.db.repo.friend_challenges_repo import FriendChallengesRepo
 from app.db.session import SessionLocal
-from app.game.friend_challenges.constants import DUEL_STATUS_CREATOR_DONE, DUEL_STATUS_OPPONENT_DONE
 from app.game.sessions.service.constants import DUEL_MAX_PUSH_PER_USER
-from app.game.sessions.service.friend_challenges_internal import _expire_friend_challenge_if_due
-from app.workers.tasks.friend_challenges_config import DEADLINE_BATCH_SIZE, LAST_CHANCE_SECONDS
+from app.workers.tasks.friend_challenges_config import (
+    DEADLINE_BATCH_SIZE,
+    DEADLINE_MAX_BATCHES,
+    LAST_CHANCE_SECONDS,
+)
 from app.workers.tasks.friend_challenges_notifications import send_deadline_notifications
 
 logger = structlog.get_logger("app.workers.tasks.friend_challenges")
 
 
-async def run_friend_challenge_deadlines_async(
-    *, batch_size: int = DEADLINE_BATCH_SIZE
-) -> dict[str, int]:
-    now_utc = datetime.now(timezone.utc)
-    expires_before_utc = now_utc + timedelta(seconds=LAST_CHANCE_SECONDS)
-    resolved_batch_size = max(1, int(batch_size))
+def _optional_int(value: Any) -> int | None:
+    return int(value) if value is not None else None
+
+
+def _reminder_item(row: dict[str, Any]) -> dict[str, object]:
+    return {
+        "challenge_id": str(row["id"]),
+        "target_user_id": int(row["target_user_id"]),
+        "creator_user_id": int(row["creator_user_id"]),
+        "opponent_user_id": _optional_int(row["opponent_user_id"]),
+        "status": row["status"],
+        "expires_at": row["expires_at"],
+    }
+
+
+def _expired_item(row: dict[str, Any]) -> dict[str, object]:
+    return {
+        "challenge_id": str(row["id"]),
+        "creator_user_id": int(row["creator_user_id"]),
+        "opponent_user_id": _optional_int(row["opponent_user_id"]),
+        "creator_score": int(row["creator_score"]),
+        "opponent_score": int(row["opponent_score"]),
+        "total_rounds": int(row["total_rounds"]),
+        "winner_user_id": _optional_int(row["winner_user_id"]),
+        "status": row["status"],
+        "previous_status": row["previous_status"],
+        "expires_at": row["expires_at"],
+    }
+
+
+def _expired_event_payload(item: dict[str, object]) -> dict[str, object]:
+    payload = {key: value for key, value in item.items() if key != "expires_at"}
+    expires_at = item["expires_at"]
+    payload["expires_at"] = expires_at.isoformat() if isinstance(expires_at, datetime) else None
+    return payload
 
-    reminder_items: list[dict[str, object]] = []
-    expired_items: list[dict[str, object]] = []
 
+async def _sweep_batch(
+    *, now_utc: datetime, batch_size: int, partition_index: int, partition_count: int
+) -> tuple[list[dict[str, object]], list[dict[str, object]], bool]:
+    """Runs one claim-and-transition round; the flag is True while any class filled its batch."""
+    partition = {"partition_index": partition_index, "partition_count": partition_count}
     async with SessionLocal.begin() as session:
-        due_last_chance = await FriendChallengesRepo.list_active_due_for_last_chance_for_update(
+        reminder_rows = await FriendChallengesRepo.mark_last_chance_due(
             session,
             now_utc=now_utc,
-            expires_before_utc=expires_before_utc,
-            limit=resolved_batch_size,
+            expires_before_utc=now_utc + timedelta(seconds=LAST_CHANCE_SECONDS),
+            max_push_per_user=DUEL_MAX_PUSH_PER_USER,
+            limit=batch_size,
+            **partition,
         )
-        for challenge in due_last_chance:
-            reminder_user_id: int | None = None
-            if (
-                challenge.status == DUEL_STATUS_CREATOR_DONE
-                and challenge.opponent_user_id is not None
-                and challenge.opponent_push_count < DUEL_MAX_PUSH_PER_USER
-            ):
-                challenge.opponent_push_count += 1
-                reminder_user_id = int(challenge.opponent_user_id)
-            elif (
-                challenge.status == DUEL_STATUS_OPPONENT_DONE
-                and challenge.creator_push_count < DUEL_MAX_PUSH_PER_USER
-            ):
-                challenge.creator_push_count += 1
-                reminder_user_id = int(challenge.creator_user_id)
-            if reminder_user_id is None:
-                continue
-            challenge.expires_last_chance_notified_at = now_utc
-            challenge.updated_at = now_utc
-            reminder_items.append(
-                {
-                    "challenge_id": str(challenge.id),
-                    "target_user_id": reminder_user_id,
-                    "creator_user_id": int(challenge.creator_user_id),
-                    "opponent_user_id": (
-                        int(challenge.opponent_user_id)
-                        if challenge.opponent_user_id is not None
-                        else None
-                    ),
-                    "status": challenge.status,
-                    "expires_at": challenge.expires_at,
-                }
-            )
-
-        pending_due = await FriendChallengesRepo.list_pending_due_for_expire_for_update(
+        pending_rows = await FriendChallengesRepo.expire_pending_due(
+            session, now_utc=now_utc, limit=batch_size, **partition
+        )
+        walkover_rows = await FriendChallengesRepo.walkover_joined_due(
+            session, now_utc=now_utc, limit=batch_size, **partition
+        )
+        expired_items = [_expired_item(row) for row in [*pending_rows, *walkover_rows]]
+        await emit_analytics_events(
             session,
+            event_type="duel_expired",
+            source=EVENT_SOURCE_WORKER,
+            happened_at=now_utc,
+            payloads=[_expired_event_payload(item) for item in expired_items],
+        )
+    has_more = any(len(rows) >= batch_size for rows in (reminder_rows, pending_rows, walkover_rows))
+    return [_reminder_item(row) for row in reminder_rows], expired_items, has_more
+
+
+async def run_friend_challenge_deadlines_async(
+    *,
+    batch_size: int = DEADLINE_BATCH_SIZE,
+    partition_index: int = 0,
+    partition_count: int = 1,
+    max_batches: int = DEADLINE_MAX_BATCHES,
+) -> dict[str, int]:
+    now_utc = datetime.now(timezone.utc)
+    resolved_batch_size = max(1, int(batch_size))
+    resolved_partition_count = max(1, int(partition_count))
+    resolved_partition_index = int(partition_index) % resolved_partition_count
+
+    totals = {
+        "last_chance_queued_total": 0,
+        "expired_total": 0,
+        "last_chance_sent_total": 0,
+        "last_chance_failed_total": 0,
+        "expired_notice_sent_total": 0,
+        "expired_notice_failed_total": 0,
+    }
+    batches = 0
+    has_more = True
+    # Each batch commits before its notifications go out, so row locks are held only briefly.
+    while has_more and batches < max(1, int(max_batches)):
+        batches += 1
+        reminder_items, expired_items, has_more = await _sweep_batch(
             now_utc=now_utc,
-            limit=resolved_batch_size,
+            batch_size=resolved_batch_size,
+            partition_index=resolved_partition_index,
+            partition_count=resolved_partition_count,
         )
-        joined_due = await FriendChallengesRepo.list_joined_due_for_walkover_for_update(
-            session,
+        if not reminder_items and not expired_items:
+            break
+        (
+            reminders_sent,
+            reminders_failed,
+            expired_notices_sent,
+            expired_notices_failed,
+            reminder_events,
+            expired_notice_events,
+        ) = await send_deadline_notifications(
             now_utc=now_utc,
-            limit=resolved_batch_size,
+            reminder_items=reminder_items,
+            expired_items=expired_items,
         )
-        for challenge in [*pending_due, *joined_due]:
-            previous_status = str(challenge.status)
-            expired_now = _expire_friend_challenge_if_due(challenge=challenge, now_utc=now_utc)
-            if not expired_now:
-                continue
-            expired_items.append(
-                {
-                    "challenge_id": str(challenge.id),
-                    "creator_user_id": int(challenge.creator_user_id),
-                    "opponent_user_id": (
-                        int(challenge.opponent_user_id)
-                        if challenge.opponent_user_id is not None
-                        else None
-                    ),
-                    "creator_score": int(challenge.creator_score),
-                    "opponent_score": int(challenge.opponent_score),
-                    "total_rounds": int(challenge.total_rounds),
-                    "winner_user_id": (
-                        int(challenge.winner_user_id)
-                        if challenge.winner_user_id is not None
-                        else None
-                    ),
-                    "status": challenge.status,
-                    "previous_status": previous_status,
-                    "expires_at": challenge.expires_at,
-                }
-            )
-            await emit_analytics_event(
-                session,
-                event_type="duel_expired",
-                source=EVENT_SOURCE_WORKER,
-                happened_at=now_utc,
-                user_id=None,
-                payload={
-                    "challenge_id": str(challenge.id),
-                    "creator_user_id": int(challenge.creator_user_id),
-                    "opponent_user_id": (
-                        int(challenge.opponent_user_id)
-                        if challenge.opponent_user_id is not None
-                        else None
-                    ),
-                    "creator_score": int(challenge.creator_score),
-                    "opponent_score": int(challenge.opponent_score),
-                    "winner_user_id": (
-                        int(challenge.winner_user_id)
-                        if challenge.winner_user_id is not None
-                        else None
-                    ),
-                    "status": challenge.status,
-                    "previous_status": previous_status,
-                    "total_rounds": int(challenge.total_rounds),
-                    "expires_at": challenge.expires_at.isoformat(),
-                },
-            )
-
-    (
-        reminders_sent,
-        reminders_failed,
-        expired_notices_sent,
-        expired_notices_failed,
-        reminder_events,
-        expired_notice_events,
-    ) = await send_deadline_notifications(
-        now_utc=now_utc,
-        reminder_items=reminder_items,
-        expired_items=expired_items,
-    )
-
-    if reminder_events or expired_notice_events:
-        async with SessionLocal.begin() as session:
-            for payload in reminder_events:
-                await emit_analytics_event(
+        if reminder_events or expired_notice_events:
+            async with SessionLocal.begin() as session:
+                await emit_analytics_events(
                     session,
                     event_type="friend_challenge_last_chance_sent",
                     source=EVENT_SOURCE_WORKER,
                     happened_at=now_utc,
-                    user_id=None,
-                    payload=payload,
+                    payloads=reminder_events,
                 )
-            for payload in expired_notice_events:
-                await emit_analytics_event(
+                await emit_analytics_events(
                     session,
                     event_type="friend_challenge_expired_notice_sent",
                     source=EVENT_SOURCE_WORKER,
                     happened_at=now_utc,
-                    user_id=None,
-                    payload=payload,
+                    payloads=expired_notice_events,
                 )
+        totals["last_chance_queued_total"] += len(reminder_items)
+        totals["expired_total"] += len(expired_items)
+        totals["last_chance_sent_total"] += reminders_sent
+        totals["last_chance_failed_total"] += reminders_failed
+        totals["expired_notice_sent_total"] += expired_notices_sent
+        totals["expired_notice_failed_total"] += expired_notices_failed
 
     result = {
         "batch_size": resolved_batch_size,
-        "last_chance_queued_total": len(reminder_items),
-        "expired_total": len(expired_items),
-        "last_chance_sent_total": reminders_sent,
-        "last_chance_failed_total": reminders_failed,
-        "expired_notice_sent_total": expired_notices_sent,
-        "expired_notice_failed_total": expired_notices_failed,
+        "batches": batches,
+        "partition_index": resolved_partition_index,
+        "partition_count": resolved_partition_count,
+        **totals,
     }
     logger.info("friend_challenge_deadlines_processed", **result)
     return result
@@ -5,7 +5,17 @@ from app.core.config import get_settings
 settings = get_settings()
 
 DEADLINE_BATCH_SIZE = max(1, int(settings.friend_challenge_deadline_batch_size))
+DEADLINE_MAX_BATCHES = max(1, int(settings.friend_challenge_deadline_max_batches))
+DEADLINE_PARTITIONS = max(1, int(settings.friend_challenge_deadline_partitions))
 LAST_CHANCE_SECONDS = max(60, int(settings.friend_challenge_last_chance_seconds))
+NOTIFY_CONCURRENCY = max(1, int(settings.friend_challenge_notify_concurrency))
 SCAN_INTERVAL_SECONDS = max(30, int(settings.friend_challenge_deadline_scan_interval_seconds))
 
-__all__ = ["DEADLINE_BATCH_SIZE", "LAST_CHANCE_SECONDS", "SCAN_INTERVAL_SECONDS"]
+__all__ = [
+    "DEADLINE_BATCH_SIZE",
+    "DEADLINE_MAX_BATCHES",
+    "DEADLINE_PARTITIONS",
+    "LAST_CHANCE_SECONDS",
+    "NOTIFY_CONCURRENCY",
+    "SCAN_INTERVAL_SECONDS",
+]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from aiogram.exceptions import TelegramRetryAfter
+
+# A flood-control wait longer than this is treated as a failed send instead of stalling the sweep.
+MAX_RETRY_AFTER_SECONDS = 10
+
+
+@dataclass(frozen=True, slots=True)
+class OutgoingMessage:
+    item_index: int
+    chat_id: int | None
+    text: str
+    reply_markup: object
+
+
+async def send_message(*, bot, chat_id: int | None, text: str, reply_markup=None) -> bool:
+    if chat_id is None:
+        return False
+    for attempt in range(2):
+        try:
+            await bot.send_message(
+                chat_id=chat_id,
+                text=text,
+                reply_markup=reply_markup,
+            )
+            return True
+        except TelegramRetryAfter as exc:
+            if attempt > 0 or exc.retry_after > MAX_RETRY_AFTER_SECONDS:
+                return False
+            await asyncio.sleep(exc.retry_after)
+        except Exception:
+            return False
+    return False
+
+
+async def send_concurrently(
+    *, bot, outgoing: list[OutgoingMessage], concurrency: int
+) -> list[bool]:
+    """Returns one outcome per message, in order, with at most ``concurrency`` sends in flight."""
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def _send_one(message: OutgoingMessage) -> bool:
+        async with semaphore:
+            return await send_message(
+                bot=bot,
+                chat_id=message.chat_id,
+                text=message.text,
+                reply_markup=message.reply_markup,
+            )
+
+    return list(await asyncio.gather(*(_send_one(message) for message in outgoing)))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import cast
 
 from app.bot.application import build_bot
 from app.bot.keyboards.friend_challenge import (
@@ -8,24 +9,68 @@ from app.bot.keyboards.friend_challenge import (
     build_friend_challenge_next_keyboard,
     build_friend_pending_expired_keyboard,
 )
+from app.workers.tasks.friend_challenges_config import NOTIFY_CONCURRENCY
+from app.workers.tasks.friend_challenges_delivery import OutgoingMessage, send_concurrently
 from app.workers.tasks.friend_challenges_utils import (
     format_remaining_hhmm,
     resolve_telegram_targets,
 )
 
+# (reminders sent, reminders failed, notices sent, notices failed, reminder events, notice events)
+DeadlineNotificationTotals = tuple[
+    int, int, int, int, list[dict[str, object]], list[dict[str, object]]
+]
 
-async def _send_message(*, bot, chat_id: int | None, text: str, reply_markup=None) -> bool:
-    if chat_id is None:
-        return False
-    try:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=text,
-            reply_markup=reply_markup,
+
+def _expired_messages(
+    *,
+    item_index: int,
+    item: dict[str, object],
+    telegram_targets: dict[int, int],
+) -> list[OutgoingMessage]:
+    challenge_id = str(item["challenge_id"])
+    creator_user_id = item["creator_user_id"]
+    opponent_user_id = item["opponent_user_id"]
+    creator_score = item["creator_score"]
+    opponent_score = item["opponent_score"]
+    creator_chat = (
+        telegram_targets.get(creator_user_id) if isinstance(creator_user_id, int) else None
+    )
+    status = str(item.get("status") or "")
+    if status == "EXPIRED" and str(item.get("previous_status") or "") == "PENDING":
+        return [
+            OutgoingMessage(
+                item_index=item_index,
+                chat_id=creator_chat,
+                text="⏳ Niemand hat angenommen.",
+                reply_markup=build_friend_pending_expired_keyboard(challenge_id=challenge_id),
+            )
+        ]
+
+    headline = (
+        "⌛ Walkover. Duell beendet."
+        if status == "WALKOVER"
+        else "⌛ Dein Duell ist wegen Zeitablauf beendet."
+    )
+    finished_keyboard = build_friend_challenge_finished_keyboard(challenge_id=challenge_id)
+    messages = [
+        OutgoingMessage(
+            item_index=item_index,
+            chat_id=creator_chat,
+            text=f"{headline}\nFinaler Score: Du {creator_score} | Gegner {opponent_score}.",
+            reply_markup=finished_keyboard,
+        )
+    ]
+    if isinstance(opponent_user_id, int):
+        messages.append(
+            OutgoingMessage(
+                item_index=item_index,
+                chat_id=telegram_targets.get(opponent_user_id),
+                text=f"{headline}\nFinaler Score: Du {opponent_score} | Gegner {creator_score}.",
+                reply_markup=finished_keyboard,
+            )
         )
-        return True
-    except Exception:
-        return False
+    return messages
 
 
 async def send_deadline_notifications(
@@ -33,174 +78,101 @@ async def send_deadline_notifications(
     now_utc: datetime,
     reminder_items: list[dict[str, object]],
     expired_items: list[dict[str, object]],
-) -> tuple[
-    int,
-    int,
-    int,
-    int,
-    list[dict[str, object]],
-    list[dict[str, object]],
-]:
+    concurrency: int = NOTIFY_CONCURRENCY,
+) -> DeadlineNotificationTotals:
     user_ids: set[int] = set()
     for item in reminder_items:
         target_user_id = item["target_user_id"]
         if isinstance(target_user_id, int):
             user_ids.add(target_user_id)
     for item in expired_items:
-        creator_user_id = item["creator_user_id"]
-        if isinstance(creator_user_id, int):
-            user_ids.add(creator_user_id)
-        opponent_user_id = item["opponent_user_id"]
-        if isinstance(opponent_user_id, int):
-            user_ids.add(opponent_user_id)
+        for key in ("creator_user_id", "opponent_user_id"):
+            user_id = item[key]
+            if isinstance(user_id, int):
+                user_ids.add(user_id)
     telegram_targets = await resolve_telegram_targets(user_ids)
 
-    reminders_sent = 0
-    reminders_failed = 0
-    expired_notices_sent = 0
-    expired_notices_failed = 0
-    reminder_events: list[dict[str, object]] = []
-    expired_notice_events: list[dict[str, object]] = []
-
-    bot = build_bot()
-    try:
-        for item in reminder_items:
-            expires_at = item["expires_at"]
-            target_user_id = item["target_user_id"]
-            if not isinstance(expires_at, datetime) or not isinstance(target_user_id, int):
-                continue
-            hours, minutes = format_remaining_hhmm(now_utc=now_utc, expires_at=expires_at)
-            sent = await _send_message(
-                bot=bot,
+    reminders: list[OutgoingMessage] = []
+    for index, item in enumerate(reminder_items):
+        expires_at = item["expires_at"]
+        target_user_id = item["target_user_id"]
+        if not isinstance(expires_at, datetime) or not isinstance(target_user_id, int):
+            continue
+        hours, minutes = format_remaining_hhmm(now_utc=now_utc, expires_at=expires_at)
+        reminders.append(
+            OutgoingMessage(
+                item_index=index,
                 chat_id=telegram_targets.get(target_user_id),
                 text=f"⏳ Gegner hat gespielt. Jetzt bist du dran! ({hours:02d}:{minutes:02d}h)",
                 reply_markup=build_friend_challenge_next_keyboard(
                     challenge_id=str(item["challenge_id"])
                 ),
             )
-            reminders_sent += int(sent)
-            reminders_failed += int(not sent)
-            reminder_events.append(
-                {
-                    "challenge_id": str(item["challenge_id"]),
-                    "target_user_id": target_user_id,
-                    "sent_to": int(sent),
-                    "failed_to": int(not sent),
-                    "expires_at": expires_at.isoformat(),
-                }
-            )
-
-        for item in expired_items:
-            challenge_id = str(item["challenge_id"])
-            creator_user_id = item["creator_user_id"]
-            opponent_user_id = item["opponent_user_id"]
-            creator_score_raw = item["creator_score"]
-            opponent_score_raw = item["opponent_score"]
-            if not isinstance(creator_score_raw, int) or not isinstance(opponent_score_raw, int):
-                continue
-            creator_score = creator_score_raw
-            opponent_score = opponent_score_raw
-            status = str(item.get("status") or "")
-            previous_status = str(item.get("previous_status") or "")
-
-            sent_to = 0
-            failed_to = 0
-            creator_chat = (
-                telegram_targets.get(creator_user_id) if isinstance(creator_user_id, int) else None
-            )
-            opponent_chat = (
-                telegram_targets.get(opponent_user_id)
-                if isinstance(opponent_user_id, int)
-                else None
-            )
+        )
+    notices: list[OutgoingMessage] = []
+    notified_expired_indexes: list[int] = []
+    for index, item in enumerate(expired_items):
+        if not isinstance(item["creator_score"], int) or not isinstance(
+            item["opponent_score"], int
+        ):
+            continue
+        notified_expired_indexes.append(index)
+        notices.extend(
+            _expired_messages(item_index=index, item=item, telegram_targets=telegram_targets)
+        )
 
-            if status == "EXPIRED" and previous_status == "PENDING":
-                sent = await _send_message(
-                    bot=bot,
-                    chat_id=creator_chat,
-                    text="⏳ Niemand hat angenommen.",
-                    reply_markup=build_friend_pending_expired_keyboard(challenge_id=challenge_id),
-                )
-                sent_to += int(sent)
-                failed_to += int(not sent)
-            elif status == "WALKOVER":
-                creator_sent = await _send_message(
-                    bot=bot,
-                    chat_id=creator_chat,
-                    text=(
-                        "⌛ Walkover. Duell beendet.\n"
-                        f"Finaler Score: Du {creator_score} | Gegner {opponent_score}."
-                    ),
-                    reply_markup=build_friend_challenge_finished_keyboard(
-                        challenge_id=challenge_id
-                    ),
-                )
-                sent_to += int(creator_sent)
-                failed_to += int(not creator_sent)
-                if isinstance(opponent_user_id, int):
-                    opponent_sent = await _send_message(
-                        bot=bot,
-                        chat_id=opponent_chat,
-                        text=(
-                            "⌛ Walkover. Duell beendet.\n"
-                            f"Finaler Score: Du {opponent_score} | Gegner {creator_score}."
-                        ),
-                        reply_markup=build_friend_challenge_finished_keyboard(
-                            challenge_id=challenge_id
-                        ),
-                    )
-                    sent_to += int(opponent_sent)
-                    failed_to += int(not opponent_sent)
-            else:
-                creator_sent = await _send_message(
-                    bot=bot,
-                    chat_id=creator_chat,
-                    text=(
-                        "⌛ Dein Duell ist wegen Zeitablauf beendet.\n"
-                        f"Finaler Score: Du {creator_score} | Gegner {opponent_score}."
-                    ),
-                    reply_markup=build_friend_challenge_finished_keyboard(
-                        challenge_id=challenge_id
-                    ),
-                )
-                sent_to += int(creator_sent)
-                failed_to += int(not creator_sent)
-                if isinstance(opponent_user_id, int):
-                    opponent_sent = await _send_message(
-                        bot=bot,
-                        chat_id=opponent_chat,
-                        text=(
-                            "⌛ Dein Duell ist wegen Zeitablauf beendet.\n"
-                            f"Finaler Score: Du {opponent_score} | Gegner {creator_score}."
-                        ),
-                        reply_markup=build_friend_challenge_finished_keyboard(
-                            challenge_id=challenge_id
-                        ),
-                    )
-                    sent_to += int(opponent_sent)
-                    failed_to += int(not opponent_sent)
+    if not reminders and not notices:
+        return 0, 0, 0, 0, [], []
 
-            expired_notices_sent += sent_to
-            expired_notices_failed += failed_to
-            expired_notice_events.append(
-                {
-                    "challenge_id": challenge_id,
-                    "status": status,
-                    "previous_status": previous_status,
-                    "sent_to": sent_to,
-                    "failed_to": failed_to,
-                    "creator_score": creator_score,
-                    "opponent_score": opponent_score,
-                }
-            )
+    bot = build_bot()
+    try:
+        outcomes = await send_concurrently(
+            bot=bot, outgoing=[*reminders, *notices], concurrency=concurrency
+        )
     finally:
         await bot.session.close()
+    reminder_outcomes = outcomes[: len(reminders)]
+    notice_outcomes = outcomes[len(reminders) :]
+
+    reminder_events: list[dict[str, object]] = []
+    for message, sent in zip(reminders, reminder_outcomes, strict=True):
+        item = reminder_items[message.item_index]
+        expires_at = cast(datetime, item["expires_at"])
+        reminder_events.append(
+            {
+                "challenge_id": str(item["challenge_id"]),
+                "target_user_id": item["target_user_id"],
+                "sent_to": int(sent),
+                "failed_to": int(not sent),
+                "expires_at": expires_at.isoformat(),
+            }
+        )
+
+    sent_by_item: dict[int, list[bool]] = {index: [] for index in notified_expired_indexes}
+    for message, sent in zip(notices, notice_outcomes, strict=True):
+        sent_by_item[message.item_index].append(sent)
+    expired_notice_events: list[dict[str, object]] = []
+    for index, results in sent_by_item.items():
+        item = expired_items[index]
+        expired_notice_events.append(
+            {
+                "challenge_id": str(item["challenge_id"]),
+                "status": str(item.get("status") or ""),
+                "previous_status": str(item.get("previous_status") or ""),
+                "sent_to": sum(results),
+                "failed_to": len(results) - sum(results),
+                "creator_score": item["creator_score"],
+                "opponent_score": item["opponent_score"],
+            }
+        )
 
+    reminders_sent = sum(reminder_outcomes)
+    expired_notices_sent = sum(notice_outcomes)
     return (
         reminders_sent,
-        reminders_failed,
+        len(reminder_outcomes) - reminders_sent,
         expired_notices_sent,
-        expired_notices_failed,
+        len(notice_outcomes) - expired_notices_sent,
         reminder_events,
         expired_notice_events,
     )
@@ -12,8 +12,8 @@ from app.db.repo.users_repo import UsersRepo
 from app.db.session import SessionLocal
 from app.workers.asyncio_runner import run_async_job
 from app.workers.celery_app import celery_app
-from app.workers.tasks.friend_challenges_proof_card_render import render_duel_proof_card_png
 from app.workers.tasks.friend_challenges_proof_card_text import build_caption, resolve_user_label
+from app.workers.tasks.proof_card_renderers import render_duel_proof_card_png
 
 logger = structlog.get_logger("app.workers.tasks.friend_challenges_proof_cards")
 _DUEL_FINAL_STATUSES = frozenset({"COMPLETED", "EXPIRED", "WALKOVER"})
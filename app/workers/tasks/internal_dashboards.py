@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import structlog
+
+from app.core.config import get_settings
+from app.db.read_session import ReadSessionLocal
+from app.db.session import SessionLocal
+from app.services.dashboard_snapshots import parse_snapshot_windows, refresh_dashboard_snapshots
+from app.workers.asyncio_runner import run_async_job
+from app.workers.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+
+async def run_internal_dashboard_snapshots_async() -> dict[str, object]:
+    settings = get_settings()
+    now_utc = datetime.now(timezone.utc)
+    windows = parse_snapshot_windows(settings.internal_dashboard_snapshot_windows)
+
+    # One REPEATABLE READ transaction per window: under READ COMMITTED each aggregate would see
+    # its own snapshot, so the dashboards of a window could disagree. The builds run on the read
+    # replica and only the snapshot upserts go to the primary.
+    compute_ms: dict[str, int] = {}
+    for window_hours in windows:
+        async with (
+            ReadSessionLocal.begin(repeatable_read=True) as read_session,
+            SessionLocal.begin() as session,
+        ):
+            compute_ms.update(
+                await refresh_dashboard_snapshots(
+                    read_session,
+                    now_utc=now_utc,
+                    windows=(window_hours,),
+                    write_session=session,
+                )
+            )
+
+    result: dict[str, object] = {
+        "generated_at": now_utc.isoformat(),
+        "windows": list(windows),
+        "snapshots_total": len(compute_ms),
+        "compute_ms": compute_ms,
+    }
+    logger.info("internal_dashboard_snapshots_refreshed", **result)
+    return result
+
+
+@celery_app.task(name="app.workers.tasks.internal_dashboards.run_internal_dashboard_snapshots")
+def run_internal_dashboard_snapshots() -> dict[str, object]:
+    return run_async_job(run_internal_dashboard_snapshots_async())
+
+
+celery_app.conf.beat_schedule = celery_app.conf.beat_schedule or {}
+celery_app.conf.beat_schedule.update(
+    {
+        "internal-dashboard-snapshots": {
+            "task": "app.workers.tasks.internal_dashboards.run_internal_dashboard_snapshots",
+            "schedule": float(
+                max(60, int(get_settings().internal_dashboard_snapshot_interval_seconds))
+            ),
+            "options": {"queue": "q_low"},
+        },
+    }
+)
@@ -2,26 +2,32 @@ from __future__ import annotations
 
 from app.workers.asyncio_runner import run_async_job
 from app.workers.celery_app import celery_app
+from app.workers.tasks.payments_reconciliation_async import (
+    check_ledger_snapshots_async as _check_ledger_snapshots_async,
+)
+from app.workers.tasks.payments_reconciliation_async import (
+    run_payments_reconciliation_async as _run_payments_reconciliation_async,
+)
 from app.workers.tasks.payments_reliability_async import (
     expire_stale_unpaid_invoices_async as _expire_stale_unpaid_invoices_async,
 )
 from app.workers.tasks.payments_reliability_async import (
     recover_paid_uncredited_async as _recover_paid_uncredited_async,
 )
-from app.workers.tasks.payments_reliability_async import (
-    run_payments_reconciliation_async as _run_payments_reconciliation_async,
-)
 from app.workers.tasks.payments_reliability_async import (
     run_refund_promo_rollback_async as _run_refund_promo_rollback_async,
 )
 from app.workers.tasks.payments_reliability_schedule import configure_payments_reliability_schedule
 
+check_ledger_snapshots_async = _check_ledger_snapshots_async
 expire_stale_unpaid_invoices_async = _expire_stale_unpaid_invoices_async
 recover_paid_uncredited_async = _recover_paid_uncredited_async
 run_refund_promo_rollback_async = _run_refund_promo_rollback_async
 run_payments_reconciliation_async = _run_payments_reconciliation_async
 
 __all__ = [
+    "check_ledger_snapshots",
+    "check_ledger_snapshots_async",
     "expire_stale_unpaid_invoices",
     "expire_stale_unpaid_invoices_async",
     "recover_paid_uncredited",
@@ -58,4 +64,9 @@ def run_payments_reconciliation(stale_minutes: int = 30) -> dict[str, int | str]
     return run_async_job(run_payments_reconciliation_async(stale_minutes=stale_minutes))
 
 
+@celery_app.task(name="app.workers.tasks.payments_reliability.check_ledger_snapshots")
+def check_ledger_snapshots(repair: bool = False) -> dict[str, int]:
+    return run_async_job(check_ledger_snapshots_async(repair=repair))
+
+
 configure_payments_reliability_schedule(celery_app)
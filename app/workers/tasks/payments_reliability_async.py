@@ -5,24 +5,11 @@ from uuid import UUID
 
 import structlog
 
-from app.db.repo.ledger_repo import LedgerRepo
 from app.db.repo.promo_repo import PromoRepo
 from app.db.repo.purchases_repo import PurchasesRepo
-from app.db.repo.reconciliation_runs_repo import ReconciliationRunsRepo
 from app.db.session import SessionLocal
-from app.economy.purchases.errors import (
-    ProductNotFoundError,
-    PurchaseNotFoundError,
-    PurchasePrecheckoutValidationError,
-)
-from app.economy.purchases.recovery import MAX_CREDIT_RECOVERY_ATTEMPTS, increment_recovery_failures
 from app.economy.purchases.service import PurchaseService
 from app.services.alerts import send_ops_alert
-from app.services.payments_reliability import (
-    compute_product_stars_mismatch_count,
-    compute_reconciliation_diff,
-    reconciliation_status,
-)
 
 logger = structlog.get_logger("app.workers.tasks.payments_reliability")
 
@@ -43,123 +30,111 @@ async def expire_stale_unpaid_invoices_async(*, stale_minutes: int = 30) -> dict
 
 
 async def run_refund_promo_rollback_async(*, batch_size: int = 100) -> dict[str, int]:
-    now_utc = datetime.now(timezone.utc)
-    async with SessionLocal.begin() as session:
-        purchase_ids = await PromoRepo.get_refunded_purchase_ids_with_pending_redemption_revoke(
-            session,
-            limit=batch_size,
-        )
+    """Revokes pending promo redemptions of refunded purchases, one claimed page per transaction.
 
+    Revoked rows drop out of the claim query, so pages are taken until a short one comes back.
+    """
+    now_utc = datetime.now(timezone.utc)
+    page_size = max(1, int(batch_size))
     summary: dict[str, int] = {
-        "examined": len(purchase_ids),
+        "examined": 0,
         "rolled_back": 0,
         "skipped": 0,
         "missing": 0,
         "errors": 0,
     }
 
-    for purchase_id in purchase_ids:
+    while True:
         try:
             async with SessionLocal.begin() as session:
-                purchase = await PurchasesRepo.get_by_id_for_update(session, purchase_id)
-                if purchase is None:
-                    summary["missing"] += 1
-                    continue
-                if purchase.status != "REFUNDED" or purchase.applied_promo_code_id is None:
-                    summary["skipped"] += 1
-                    continue
-
-                _, _, rollback_applied = await PromoRepo.revoke_redemption_for_refund(
+                purchase_ids = await PromoRepo.claim_refunded_purchase_ids_with_pending_revoke(
+                    session,
+                    limit=page_size,
+                )
+                rolled_back = await PromoRepo.revoke_redemptions_for_refunded_purchases(
                     session,
-                    purchase_id=purchase.id,
-                    promo_code_id=purchase.applied_promo_code_id,
+                    purchase_ids=purchase_ids,
                     now_utc=now_utc,
                 )
-                if rollback_applied:
-                    summary["rolled_back"] += 1
-                else:
-                    summary["skipped"] += 1
         except Exception:
             summary["errors"] += 1
-            logger.exception("promo_refund_rollback_error", purchase_id=str(purchase_id))
+            logger.exception("promo_refund_rollback_error")
+            break
+
+        summary["examined"] += len(purchase_ids)
+        summary["rolled_back"] += len(rolled_back)
+        summary["skipped"] += len(purchase_ids) - len(rolled_back)
+        if len(purchase_ids) < page_size:
+            break
 
     logger.info("promo_refund_rollback_finished", **summary)
     return summary
 
 
-async def _recover_single_purchase(purchase_id: UUID, *, now_utc: datetime) -> str:
-    async with SessionLocal.begin() as session:
-        purchase = await PurchasesRepo.get_for_credit_lock(session, purchase_id)
-        if purchase is None:
-            return "missing"
-        if purchase.status != "PAID_UNCREDITED":
-            return "skipped"
-
-        if purchase.telegram_payment_charge_id is None:
-            purchase.status = "FAILED_CREDIT_PENDING_REVIEW"
-            return "review"
-        if not isinstance(purchase.raw_successful_payment, dict):
-            purchase.status = "FAILED_CREDIT_PENDING_REVIEW"
-            return "review"
-
-        try:
-            await PurchaseService.apply_successful_payment(
-                session,
-                user_id=purchase.user_id,
-                invoice_payload=purchase.invoice_payload,
-                telegram_payment_charge_id=purchase.telegram_payment_charge_id,
-                raw_successful_payment=purchase.raw_successful_payment,
-                now_utc=now_utc,
-            )
-        except (
-            ProductNotFoundError,
-            PurchaseNotFoundError,
-            PurchasePrecheckoutValidationError,
-        ):
-            payload, failures = increment_recovery_failures(purchase.raw_successful_payment)
-            purchase.raw_successful_payment = payload
-
-            if failures >= MAX_CREDIT_RECOVERY_ATTEMPTS:
-                purchase.status = "FAILED_CREDIT_PENDING_REVIEW"
-                return "review"
-
-            return "retryable_failure"
-
-    return "credited"
-
-
 async def recover_paid_uncredited_async(
-    *, batch_size: int = 100, stale_minutes: int = 2
+    *, batch_size: int = 100, stale_minutes: int = 2, max_batches: int = 50
 ) -> dict[str, int]:
+    """Credits stuck purchases page by page; each page is claimed and credited in one transaction.
+
+    Pages are claimed with SKIP LOCKED, so concurrent recoverers split the backlog instead of
+    queueing on each other, and a keyset cursor keeps a run from revisiting failed purchases.
+    """
     now_utc = datetime.now(timezone.utc)
     stale_cutoff = now_utc - timedelta(minutes=stale_minutes)
-
-    async with SessionLocal.begin() as session:
-        candidates = await PurchasesRepo.get_paid_uncredited_older_than(
-            session,
-            older_than_utc=stale_cutoff,
-            limit=batch_size,
-        )
-
+    page_size = max(1, int(batch_size))
     summary: dict[str, int] = {
-        "examined": len(candidates),
+        "examined": 0,
         "credited": 0,
         "review": 0,
         "retryable_failure": 0,
         "skipped": 0,
         "missing": 0,
         "errors": 0,
+        "batches": 0,
     }
 
-    for purchase in candidates:
+    cursor: tuple[datetime, UUID] | None = None
+    for _ in range(max(1, int(max_batches))):
+        page_count = 0
         try:
-            outcome = await _recover_single_purchase(purchase.id, now_utc=now_utc)
+            async with SessionLocal.begin() as session:
+                purchases = await PurchasesRepo.claim_paid_uncredited_page(
+                    session,
+                    older_than_utc=stale_cutoff,
+                    limit=page_size,
+                    after=cursor,
+                )
+                page_count = len(purchases)
+                if not purchases:
+                    break
+                last = purchases[-1]
+                if last.paid_at is not None:
+                    cursor = (last.paid_at, last.id)
+                outcomes = await PurchaseService.recover_claimed_purchases(
+                    session,
+                    purchases=purchases,
+                    now_utc=now_utc,
+                )
         except Exception:
-            summary["errors"] += 1
-            logger.exception("paid_uncredited_recovery_error", purchase_id=str(purchase.id))
+            summary["examined"] += page_count
+            summary["errors"] += page_count or 1
+            logger.exception("paid_uncredited_recovery_error", page_size=page_count)
+            if page_count == 0:
+                break
             continue
 
-        summary[outcome] = summary.get(outcome, 0) + 1
+        summary["batches"] += 1
+        summary["examined"] += len(outcomes)
+        for item in outcomes:
+            summary[item.outcome] = summary.get(item.outcome, 0) + 1
+            if item.outcome != "credited":
+                logger.warning(
+                    "paid_uncredited_recovery_outcome",
+                    purchase_id=str(item.purchase_id),
+                    outcome=item.outcome,
+                )
+        if page_count < page_size:
+            break
 
     if summary["review"] > 0 or summary["errors"] > 0:
         payload: dict[str, object] = {key: value for key, value in summary.items()}
@@ -170,64 +145,3 @@ async def recover_paid_uncredited_async(
 
     logger.info("paid_uncredited_recovery_finished", **summary)
     return summary
-
-
-async def run_payments_reconciliation_async(*, stale_minutes: int = 30) -> dict[str, int | str]:
-    started_at = datetime.now(timezone.utc)
-    stale_cutoff = started_at - timedelta(minutes=stale_minutes)
-
-    async with SessionLocal.begin() as session:
-        paid_purchases_count = await PurchasesRepo.count_paid_purchases(session)
-        credited_purchases_count = await LedgerRepo.count_distinct_purchase_credits(session)
-        paid_stars_total = await PurchasesRepo.sum_paid_stars_amount(session)
-        credited_stars_total = await LedgerRepo.sum_distinct_purchase_stars_for_credits(session)
-        paid_stars_by_product = await PurchasesRepo.sum_paid_stars_amount_by_product(session)
-        credited_stars_by_product = (
-            await LedgerRepo.sum_distinct_purchase_stars_for_credits_by_product(session)
-        )
-        product_stars_mismatch_count = compute_product_stars_mismatch_count(
-            paid_stars_by_product=paid_stars_by_product,
-            credited_stars_by_product=credited_stars_by_product,
-        )
-        stale_paid_uncredited_count = await PurchasesRepo.count_paid_uncredited_older_than(
-            session,
-            older_than_utc=stale_cutoff,
-        )
-        diff_count = compute_reconciliation_diff(
-            paid_purchases_count=paid_purchases_count,
-            credited_purchases_count=credited_purchases_count,
-            stale_paid_uncredited_count=stale_paid_uncredited_count,
-            paid_stars_total=paid_stars_total,
-            credited_stars_total=credited_stars_total,
-            product_stars_mismatch_count=product_stars_mismatch_count,
-        )
-        status = reconciliation_status(diff_count)
-
-        await ReconciliationRunsRepo.create(
-            session,
-            started_at=started_at,
-            finished_at=datetime.now(timezone.utc),
-            status=status,
-            diff_count=diff_count,
-        )
-
-    result: dict[str, int | str] = {
-        "paid_purchases_count": paid_purchases_count,
-        "credited_purchases_count": credited_purchases_count,
-        "stale_paid_uncredited_count": stale_paid_uncredited_count,
-        "paid_stars_total": paid_stars_total,
-        "credited_stars_total": credited_stars_total,
-        "product_stars_mismatch_count": product_stars_mismatch_count,
-        "diff_count": diff_count,
-        "status": status,
-    }
-    if diff_count > 0:
-        payload: dict[str, object] = {key: value for key, value in result.items()}
-        await send_ops_alert(
-            event="payments_reconciliation_diff_detected",
-            payload=payload,
-        )
-        logger.warning("payments_reconciliation_diff_detected", **result)
-    else:
-        logger.info("payments_reconciliation_finished", **result)
-    return result
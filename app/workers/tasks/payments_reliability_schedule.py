@@ -32,5 +32,10 @@ def configure_payments_reliability_schedule(celery_app) -> None:
                 "schedule": crontab(hour=3, minute=30),
                 "options": {"queue": "q_normal"},
             },
+            "ledger-snapshots-check-daily-0345-berlin": {
+                "task": "app.workers.tasks.payments_reliability.check_ledger_snapshots",
+                "schedule": crontab(hour=3, minute=45),
+                "options": {"queue": "q_low"},
+            },
         }
     )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+# Pillow and the card styles are only imported on the first render, so worker processes that
+# never draw a proof card (and every API process) do not pay for them at startup.
+
+
+def render_duel_proof_card_png(
+    *,
+    creator_name: str,
+    opponent_name: str,
+    creator_score: int,
+    opponent_score: int,
+    total_rounds: int,
+    completed_at: datetime | None,
+) -> bytes:
+    from app.workers.tasks.friend_challenges_proof_card_render import (
+        render_duel_proof_card_png as _render,
+    )
+
+    return _render(
+        creator_name=creator_name,
+        opponent_name=opponent_name,
+        creator_score=creator_score,
+        opponent_score=opponent_score,
+        total_rounds=total_rounds,
+        completed_at=completed_at,
+    )
+
+
+def render_tournament_proof_card_png(
+    *,
+    player_label: str,
+    place: int,
+    points: str,
+    format_label: str,
+    completed_at: datetime | None,
+    tournament_name: str | None = None,
+    rounds_played: int | None = None,
+    is_daily_arena: bool = False,
+) -> bytes:
+    from app.workers.tasks.tournaments_proof_card_render import (
+        render_tournament_proof_card_png as _render,
+    )
+
+    return _render(
+        player_label=player_label,
+        place=place,
+        points=points,
+        format_label=format_label,
+        completed_at=completed_at,
+        tournament_name=tournament_name,
+        rounds_played=rounds_played,
+        is_daily_arena=is_daily_arena,
+    )
@@ -8,7 +8,6 @@ from app.bot.application import build_bot, build_dispatcher
 from app.db.repo.processed_updates_repo import ProcessedUpdatesRepo
 from app.db.session import SessionLocal
 from app.services.telegram_updates import extract_update_id
-from app.workers.asyncio_runner import run_async_job
 from app.workers.celery_app import celery_app
 from app.workers.tasks.telegram_updates_config import (
     _ACQUIRE_CREATED,
@@ -18,11 +17,13 @@ from app.workers.tasks.telegram_updates_config import (
     EVENT_TELEGRAM_UPDATE_FAILED_FINAL,
     EVENT_TELEGRAM_UPDATE_RECLAIMED,
     EVENT_TELEGRAM_UPDATE_RETRY_SCHEDULED,
+    PROCESS_TELEGRAM_UPDATE_TASK_NAME,
     PROCESSING_TTL_SECONDS,
     RETRY_JITTER_RATIO,
     TASK_MAX_RETRIES,
     TASK_RETRY_BACKOFF_MAX_SECONDS,
 )
+from app.workers.tasks.telegram_updates_executor import run_update_job, submit_ordered_update
 from app.workers.tasks.telegram_updates_processing import (
     process_update_async as _process_update_async,
 )
@@ -100,7 +101,7 @@ async def _acquire_processing_slot(
 
 
 @celery_app.task(
-    name="app.workers.tasks.telegram_updates.process_telegram_update",
+    name=PROCESS_TELEGRAM_UPDATE_TASK_NAME,
     bind=True,
     max_retries=TASK_MAX_RETRIES,
     acks_late=True,
@@ -120,11 +121,14 @@ def process_telegram_update(
 
     task_id = str(self.request.id) if self.request.id is not None else None
     try:
-        return run_async_job(
-            process_update_async(
+        return run_update_job(
+            submit_ordered_update(
                 update_payload,
-                update_id=resolved_update_id,
-                task_id=task_id,
+                lambda: process_update_async(
+                    update_payload,
+                    update_id=resolved_update_id,
+                    task_id=task_id,
+                ),
             )
         )
     except Exception as exc:
@@ -139,7 +143,7 @@ def process_telegram_update(
                 retries=current_retries,
                 max_retries=TASK_MAX_RETRIES,
             )
-            run_async_job(
+            run_update_job(
                 _emit_reliability_event(
                     event_type=EVENT_TELEGRAM_UPDATE_FAILED_FINAL,
                     payload={
@@ -167,7 +171,7 @@ def process_telegram_update(
             retry_in_seconds=retry_in_seconds,
             max_retries=TASK_MAX_RETRIES,
         )
-        run_async_job(
+        run_update_job(
             _emit_reliability_event(
                 event_type=EVENT_TELEGRAM_UPDATE_RETRY_SCHEDULED,
                 payload={
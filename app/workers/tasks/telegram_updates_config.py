@@ -4,6 +4,8 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+PROCESS_TELEGRAM_UPDATE_TASK_NAME = "app.workers.tasks.telegram_updates.process_telegram_update"
+
 PROCESSING_TTL_SECONDS = max(1, int(settings.telegram_update_processing_ttl_seconds))
 TASK_MAX_RETRIES = max(0, int(settings.telegram_update_task_max_retries))
 TASK_RETRY_BACKOFF_MAX_SECONDS = max(
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from typing import Any, TypeVar
+
+from app.core.config import get_settings
+from app.core.metrics import TELEGRAM_UPDATES_PROCESSED
+from app.db.session import dispose_engine
+from app.workers.asyncio_runner import run_async_job
+
+T = TypeVar("T")
+UpdateJob = Callable[[], Awaitable[str]]
+_TapKey = tuple[int, str, str]
+
+OUTCOME_COALESCED = "coalesced"
+MAX_CONCURRENT_CHATS = 64
+_CHAT_UPDATE_KEYS = (
+    "message",
+    "edited_message",
+    "channel_post",
+    "edited_channel_post",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+)
+_SENDER_UPDATE_KEYS = (
+    "callback_query",
+    "inline_query",
+    "chosen_inline_result",
+    "pre_checkout_query",
+)
+
+
+def _mapping(value: object) -> Mapping[str, object]:
+    return value if isinstance(value, Mapping) else {}
+
+
+def update_chat_id(update_payload: Mapping[str, object]) -> int | None:
+    """Chat an update belongs to; updates without a chat fall back to the sender."""
+    callback_message = _mapping(_mapping(update_payload.get("callback_query")).get("message"))
+    for container in (
+        *(_mapping(update_payload.get(key)) for key in _CHAT_UPDATE_KEYS),
+        callback_message,
+    ):
+        chat_id = _mapping(container.get("chat")).get("id")
+        if isinstance(chat_id, int):
+            return chat_id
+    for key in _SENDER_UPDATE_KEYS:
+        sender_id = _mapping(_mapping(update_payload.get(key)).get("from")).get("id")
+        if isinstance(sender_id, int):
+            return sender_id
+    return None
+
+
+def callback_tap_key(update_payload: Mapping[str, object]) -> _TapKey | None:
+    callback = _mapping(update_payload.get("callback_query"))
+    sender_id = _mapping(callback.get("from")).get("id")
+    data = callback.get("data")
+    target = _mapping(callback.get("message")).get("message_id") or callback.get(
+        "inline_message_id"
+    )
+    if not isinstance(sender_id, int) or not isinstance(data, str) or target is None:
+        return None
+    return sender_id, str(target), data
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ChatOrderedExecutor:
+    """Runs updates of one chat one after another and updates of different chats concurrently.
+
+    A callback query for the same button as one that is still queued or running for that chat
+    (a double tap) is dropped before it reaches the database.
+    """
+
+    def __init__(self, *, max_concurrent_chats: int = MAX_CONCURRENT_CHATS) -> None:
+        self._tails: dict[int, asyncio.Future[None]] = {}
+        self._taps: set[_TapKey] = set()
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_chats))
+
+    async def submit(self, update_payload: Mapping[str, object], job: UpdateJob) -> str:
+        chat_id = update_chat_id(update_payload)
+        if chat_id is None:
+            async with self._slots:
+                return await job()
+
+        tap_key = callback_tap_key(update_payload)
+        if tap_key is not None:
+            if tap_key in self._taps:
+                TELEGRAM_UPDATES_PROCESSED.labels(outcome=OUTCOME_COALESCED).inc()
+                return OUTCOME_COALESCED
+            self._taps.add(tap_key)
+
+        previous = self._tails.get(chat_id)
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._tails[chat_id] = done
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+            async with self._slots:
+                return await job()
+        finally:
+            if tap_key is not None:
+                self._taps.discard(tap_key)
+            if previous is None or previous.done():
+                _resolve(done)
+                if self._tails.get(chat_id) is done:
+                    del self._tails[chat_id]
+            else:
+                # Cancelled while queued: the next update must still wait for the running one.
+                previous.add_done_callback(lambda _: _resolve(done))
+
+
+_EXECUTORS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ChatOrderedExecutor] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def submit_ordered_update(update_payload: Mapping[str, object], job: UpdateJob) -> str:
+    loop = asyncio.get_running_loop()
+    executor = _EXECUTORS.get(loop)
+    if executor is None:
+        executor = ChatOrderedExecutor()
+        _EXECUTORS[loop] = executor
+    return await executor.submit(update_payload, job)
+
+
+class _ExecutorLoopThread:
+    """One long-lived loop per worker process that every update task hands its work to."""
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="telegram-updates-executor", daemon=True
+                ).start()
+                # Drop pooled connections opened by other loops before this one owns the pool.
+                asyncio.run_coroutine_threadsafe(dispose_engine(), loop).result()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop()).result()
+
+
+_LOOP_THREAD = _ExecutorLoopThread()
+
+
+def run_update_job(coroutine: Coroutine[Any, Any, T]) -> T:
+    if get_settings().telegram_updates_executor_enabled:
+        return _LOOP_THREAD.run(coroutine)
+    return run_async_job(coroutine)
@@ -4,6 +4,7 @@ import structlog
 from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
 from aiogram.types import Update
 
+from app.core.metrics import TELEGRAM_UPDATES_PROCESSED
 from app.db.repo.processed_updates_repo import ProcessedUpdatesRepo
 from app.db.session import SessionLocal
 from app.workers.tasks.telegram_updates_config import (
@@ -67,6 +68,7 @@ async def process_update_async(
     )
     if acquire_outcome == _ACQUIRE_DUPLICATE:
         logger.info("telegram_update_duplicate", update_id=update_id)
+        TELEGRAM_UPDATES_PROCESSED.labels(outcome="duplicate").inc()
         return "duplicate"
 
     if acquire_outcome == _ACQUIRE_RECLAIMED_STALE:
@@ -109,6 +111,7 @@ async def process_update_async(
             update_id=update_id,
             error=str(exc),
         )
+        TELEGRAM_UPDATES_PROCESSED.labels(outcome="non_retryable").inc()
         return "processed"
     except Exception:
         async with SessionLocal.begin() as session:
@@ -119,6 +122,7 @@ async def process_update_async(
                 processing_task_id=None,
             )
         logger.exception("telegram_update_processing_failed", update_id=update_id)
+        TELEGRAM_UPDATES_PROCESSED.labels(outcome="failed").inc()
         raise
     finally:
         await bot.session.close()
@@ -132,4 +136,5 @@ async def process_update_async(
         )
 
     logger.info("telegram_update_processed", update_id=update_id)
+    TELEGRAM_UPDATES_PROCESSED.labels(outcome="processed").inc()
     return "processed"
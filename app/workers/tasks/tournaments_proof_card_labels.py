@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+
+def format_user_label(*, username: str | None, first_name: str | None) -> str:
+    if username:
+        cleaned = username.strip()
+        if cleaned:
+            return f"@{cleaned}"
+    if first_name:
+        cleaned = first_name.strip()
+        if cleaned:
+            return cleaned
+    return "Spieler"
+
+
+def format_points(value: Decimal) -> str:
+    normalized = value.normalize()
+    if normalized == normalized.to_integral():
+        return str(int(normalized))
+    return format(normalized, "f").rstrip("0").rstrip(".")
+
+
+def format_tournament_format(format_code: str) -> str:
+    return "12 Fragen" if format_code == "QUICK_12" else "5 Fragen"
+
+
+def build_caption(*, place: int, points: str) -> str:
+    return f"🏆 Turnier abgeschlossen\nPlatz #{place}\nPunkte: {points}"
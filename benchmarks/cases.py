@@ -0,0 +1,234 @@
+"""Domain hot-path benchmark cases.
+
+Each case maps a size parameter to a zero-argument callable; the runner times the
+callable, so all input construction happens in ``setup`` and is not measured.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.db.models.quiz_questions import QuizQuestion
+from app.economy.energy.energy_regen import apply_regen_tick
+from app.economy.energy.rules import consume_quiz_energy
+from app.economy.energy.types import EnergySnapshot
+from app.economy.streak.rules import rollover_to_local_date
+from app.economy.streak.types import StreakSnapshot, StreakTodayStatus
+from app.game.questions.runtime_bank_filters import pick_from_pool, select_least_used_by_category
+from app.game.questions.runtime_bank_selection import SelectionPool
+from app.game.tournaments.pairing import build_swiss_pairs, create_elimination_bracket
+from app.game.tournaments.types import SwissParticipant
+from app.workers.tasks.daily_cup_messaging_text import build_round_text, build_standings_lines
+from app.workers.tasks.friend_challenges_proof_card_render import render_duel_proof_card_png
+
+NOW_UTC = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+CATEGORIES = tuple(f"category_{index:02d}" for index in range(24))
+RECENT_QUESTIONS = 12
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    name: str
+    params: tuple[int, ...]
+    setup: Callable[[int], Callable[[], object]]
+
+
+def _pick_from_pool(pool_size: int) -> Callable[[], object]:
+    # Runtime callers pass the SelectionPool cached with the question pool.
+    pool = SelectionPool(tuple(f"q_{index:06d}" for index in range(pool_size)))
+    recent = pool.question_ids[:RECENT_QUESTIONS]
+    seeds = [f"seed-{index}" for index in range(64)]
+
+    def run() -> object:
+        return [
+            pick_from_pool(pool, exclude_question_ids=recent, selection_seed=seed) for seed in seeds
+        ]
+
+    return run
+
+
+def _pick_with_clustered_exclusions(excluded_count: int) -> Callable[[], object]:
+    pool = SelectionPool(tuple(f"q_{index:06d}" for index in range(10_000)))
+    excluded = list(pool.question_ids[:excluded_count])
+    seeds = [f"seed-{index}" for index in range(64)]
+
+    def run() -> object:
+        return [
+            pick_from_pool(pool, exclude_question_ids=excluded, selection_seed=seed)
+            for seed in seeds
+        ]
+
+    return run
+
+
+def _question(index: int) -> QuizQuestion:
+    return QuizQuestion(
+        question_id=f"q_{index:06d}",
+        category=CATEGORIES[index % len(CATEGORIES)],
+        status="ACTIVE",
+    )
+
+
+def _select_least_used(candidate_count: int) -> Callable[[], object]:
+    candidates = [_question(index) for index in range(candidate_count)]
+    previous = candidates[:RECENT_QUESTIONS]
+
+    def run() -> object:
+        return select_least_used_by_category(
+            candidate_records=candidates, previous_records=previous, selection_seed="seed"
+        )
+
+    return run
+
+
+def _swiss_pairs(participant_count: int) -> Callable[[], object]:
+    rng = random.Random(participant_count)
+    participants = [
+        SwissParticipant(
+            user_id=user_id,
+            score=Decimal(rng.randint(0, 3)),
+            tie_break=Decimal(rng.randint(0, 20)),
+            joined_at=NOW_UTC + timedelta(seconds=user_id),
+        )
+        for user_id in range(1, participant_count + 1)
+    ]
+    # Two earlier rounds of adjacent pairings, like a Daily Cup entering round 3.
+    previous_pairs = {
+        frozenset((user_id, user_id + step))
+        for step in (1, 2)
+        for user_id in range(1, participant_count + 1 - step, 2)
+    }
+
+    def run() -> object:
+        return build_swiss_pairs(participants=participants, previous_pairs=previous_pairs)
+
+    return run
+
+
+def _elimination_bracket(participant_count: int) -> Callable[[], object]:
+    participants = list(range(1, participant_count + 1))
+
+    def run() -> object:
+        return create_elimination_bracket(participants, "tournament")
+
+    return run
+
+
+def _energy_snapshot(*, free_energy: int, last_regen_at: datetime) -> EnergySnapshot:
+    return EnergySnapshot(
+        free_energy=free_energy,
+        paid_energy=5,
+        free_cap=20,
+        regen_interval_sec=1800,
+        last_regen_at=last_regen_at,
+        last_daily_topup_local_date=date(2026, 3, 1),
+    )
+
+
+def _regen_tick(users: int) -> Callable[[], object]:
+    snapshots = [
+        _energy_snapshot(free_energy=index % 20, last_regen_at=NOW_UTC - timedelta(minutes=index))
+        for index in range(users)
+    ]
+
+    def run() -> object:
+        return [
+            apply_regen_tick(snapshot, now_utc=NOW_UTC, premium_active=False)
+            for snapshot in snapshots
+        ]
+
+    return run
+
+
+def _consume_energy(quizzes: int) -> Callable[[], object]:
+    start = _energy_snapshot(free_energy=20, last_regen_at=NOW_UTC)
+
+    def run() -> object:
+        snapshot = start
+        for _ in range(quizzes):
+            snapshot, _allowed, _asset = consume_quiz_energy(snapshot, premium_active=False)
+        return snapshot
+
+    return run
+
+
+def _streak_rollover(days_idle: int) -> Callable[[], object]:
+    snapshot = StreakSnapshot(
+        current_streak=40,
+        best_streak=40,
+        last_activity_local_date=date(2026, 1, 1),
+        today_status=StreakTodayStatus.PLAYED,
+        streak_saver_tokens=2,
+        premium_freezes_used_week=0,
+        premium_freeze_week_start_local_date=None,
+        updated_at=NOW_UTC,
+    )
+    target = NOW_UTC.date() + timedelta(days=days_idle)
+
+    def run() -> object:
+        return rollover_to_local_date(snapshot, target_local_date=target, premium_scope="MONTH")
+
+    return run
+
+
+def _standings_text(participant_count: int) -> Callable[[], object]:
+    user_ids = list(range(1, participant_count + 1))
+    labels = {user_id: f"Spieler {user_id}" for user_id in user_ids}
+    points = {user_id: str(participant_count - user_id) for user_id in user_ids}
+
+    # A round broadcast renders the table once per participant (viewer marker differs).
+    def run() -> object:
+        return [
+            build_round_text(
+                round_no=2,
+                rounds_total=3,
+                deadline_text="18:30",
+                opponent_label="Gegner",
+                standings_lines=build_standings_lines(
+                    standings_user_ids=user_ids,
+                    labels=labels,
+                    points_by_user=points,
+                    viewer_user_id=viewer,
+                ),
+            )
+            for viewer in user_ids
+        ]
+
+    return run
+
+
+def _proof_card(name_length: int) -> Callable[[], object]:
+    creator = ("Alexandra" * 8)[:name_length]
+    opponent = ("Maximilian" * 8)[:name_length]
+
+    def run() -> object:
+        return render_duel_proof_card_png(
+            creator_name=creator,
+            opponent_name=opponent,
+            creator_score=4,
+            opponent_score=3,
+            total_rounds=5,
+            completed_at=NOW_UTC,
+        )
+
+    return run
+
+
+CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase("pick_from_pool", (1_000, 10_000, 40_000), _pick_from_pool),
+    BenchmarkCase(
+        "pick_from_pool_clustered_exclusions", (100, 1_000, 5_000), _pick_with_clustered_exclusions
+    ),
+    BenchmarkCase("select_least_used_by_category", (50, 500, 5_000), _select_least_used),
+    BenchmarkCase("build_swiss_pairs", (8, 32, 128), _swiss_pairs),
+    BenchmarkCase("create_elimination_bracket", (8, 64, 512), _elimination_bracket),
+    BenchmarkCase("apply_regen_tick", (100, 1_000, 10_000), _regen_tick),
+    BenchmarkCase("consume_quiz_energy", (1, 20, 200), _consume_energy),
+    BenchmarkCase("rollover_to_local_date", (1, 30, 365), _streak_rollover),
+    BenchmarkCase("daily_cup_standings_text", (8, 32, 128), _standings_text),
+    BenchmarkCase("render_duel_proof_card_png", (8, 32), _proof_card),
+)
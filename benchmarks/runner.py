@@ -0,0 +1,152 @@
+"""Runs the domain hot-path benchmarks and compares them with a saved baseline.
+
+    python -m benchmarks.runner                        # writes reports/benchmarks/domain_hotpaths.json
+    python -m benchmarks.runner --compare benchmarks/baseline.json
+    python -m benchmarks.runner --save-baseline        # refresh benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks.cases import CASES, BenchmarkCase
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT / "reports" / "benchmarks" / "domain_hotpaths.json"
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+DEFAULT_MAX_REGRESSION = 0.25
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def measure(case: BenchmarkCase, param: int, *, repeat: int, max_seconds: float) -> dict[str, Any]:
+    timer = timeit.Timer(case.setup(param))
+    number, first_total = timer.autorange()
+    # Slow cases (image rendering) get fewer repeats so one sweep stays within budget.
+    repeats = max(1, min(repeat, int(max_seconds / max(first_total, 1e-9))))
+    per_call = [total / number for total in timer.repeat(repeat=repeats, number=number)]
+    return {
+        "case": case.name,
+        "param": param,
+        "number": number,
+        "repeat": repeats,
+        "min_ms": round(min(per_call) * 1000, 6),
+        "median_ms": round(statistics.median(per_call) * 1000, 6),
+    }
+
+
+def run_cases(
+    cases: tuple[BenchmarkCase, ...],
+    *,
+    repeat: int,
+    max_seconds: float,
+    only: set[str] | None = None,
+    quick: bool = False,
+) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    for case in cases:
+        if only and case.name not in only:
+            continue
+        params = case.params[:1] if quick else case.params
+        for param in params:
+            results[f"{case.name}[{param}]"] = measure(
+                case, param, repeat=repeat, max_seconds=max_seconds
+            )
+    return results
+
+
+def compare_results(
+    current: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    *,
+    max_regression: float,
+) -> list[dict[str, Any]]:
+    """Returns one row per benchmark present in both runs; ``regressed`` marks slowdowns."""
+    rows: list[dict[str, Any]] = []
+    for key in sorted(current.keys() & baseline.keys()):
+        before = float(baseline[key]["min_ms"])
+        after = float(current[key]["min_ms"])
+        ratio = after / before if before > 0 else 1.0
+        rows.append(
+            {
+                "benchmark": key,
+                "baseline_ms": before,
+                "current_ms": after,
+                "ratio": round(ratio, 3),
+                "regressed": ratio > 1 + max_regression,
+            }
+        )
+    return rows
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark domain hot paths.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="Time budget per size.")
+    parser.add_argument("--case", action="append", help="Run only the named case(s).")
+    parser.add_argument("--quick", action="store_true", help="Smallest size of each case only.")
+    args = parser.parse_args()
+
+    results = run_cases(
+        CASES,
+        repeat=max(1, args.repeat),
+        max_seconds=args.max_seconds,
+        only=set(args.case) if args.case else None,
+        quick=args.quick,
+    )
+    payload = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+    _write_json(args.output, payload)
+    if args.save_baseline:
+        _write_json(DEFAULT_BASELINE, payload)
+    for key, result in results.items():
+        print(f"{key:<45} min={result['min_ms']:.4f}ms median={result['median_ms']:.4f}ms")
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+    rows = compare_results(results, baseline, max_regression=args.max_regression)
+    for row in rows:
+        marker = "REGRESSION" if row["regressed"] else "ok"
+        print(f"{row['benchmark']:<45} x{row['ratio']:.3f} {marker}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,5 @@
 from pytest_env_bootstrap import bootstrap_pytest_env
 
 bootstrap_pytest_env()
+
+pytest_plugins = ("tests.query_budget_plugin", "pytester")
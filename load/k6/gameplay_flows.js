@@ -0,0 +1,227 @@
+import http from "k6/http";
+import { check } from "k6";
+import { Rate, Trend } from "k6/metrics";
+
+const BASE_URL = (__ENV.BASE_URL || "http://127.0.0.1:8000").replace(/\/+$/, "");
+const STUB_URL = (__ENV.TELEGRAM_STUB_URL || "http://127.0.0.1:8081").replace(/\/+$/, "");
+const WEBHOOK_SECRET = __ENV.WEBHOOK_SECRET || "replace_me";
+const TELEGRAM_USER_BASE = Number(__ENV.TELEGRAM_USER_BASE || 91000000000);
+const UPDATE_ID_BASE = Number(__ENV.UPDATE_ID_BASE || 900000000);
+const FLOWS = (__ENV.K6_FLOWS || "mode_play,friend_duel,daily_cup")
+  .split(",")
+  .map((flow) => flow.trim());
+const RATE = Number(__ENV.K6_FLOW_RATE || 2);
+const DURATION = __ENV.K6_DURATION || "5m";
+const ANSWERS_PER_RUN = Number(__ENV.ANSWERS_PER_RUN || 5);
+const REPLY_TIMEOUT_MS = Number(__ENV.REPLY_TIMEOUT_MS || 10000);
+const MODE_CODE = __ENV.MODE_CODE || "";
+
+// Webhook POST -> first stubbed sendMessage/editMessage* for the same chat, per flow step.
+const e2eLatency = new Trend("gameplay_e2e_ms", true);
+const stepFailures = new Rate("gameplay_step_fail_rate");
+
+const FLOW_EXEC = {
+  mode_play: "modePlayFlow",
+  friend_duel: "friendDuelFlow",
+  daily_cup: "dailyCupFlow",
+};
+
+function scenarioFor(flow) {
+  return {
+    executor: "constant-arrival-rate",
+    rate: RATE,
+    timeUnit: "1s",
+    duration: DURATION,
+    preAllocatedVUs: RATE * 20,
+    maxVUs: RATE * 60,
+    exec: FLOW_EXEC[flow],
+    tags: { flow },
+  };
+}
+
+const scenarios = {};
+const thresholds = {};
+for (const flow of FLOWS) {
+  if (!FLOW_EXEC[flow]) {
+    throw new Error(`Unsupported flow ${flow}. Use mode_play|friend_duel|daily_cup.`);
+  }
+  scenarios[flow] = scenarioFor(flow);
+  // Thresholds also make k6 export the per-flow submetrics read by scripts/evaluate_slo_gate.py.
+  thresholds[`gameplay_e2e_ms{flow:${flow}}`] = ["p(95)<5000"];
+  thresholds[`gameplay_step_fail_rate{flow:${flow}}`] = ["rate<0.05"];
+}
+
+export const options = {
+  scenarios,
+  thresholds,
+  summaryTrendStats: ["avg", "min", "med", "p(90)", "p(95)", "p(99)", "max"],
+};
+
+function newUser(slot) {
+  const id = TELEGRAM_USER_BASE + (__VU * 100000 + __ITER) * 2 + slot;
+  return { id, cursor: 0, updates: 0 };
+}
+
+function nextUpdateId(user) {
+  user.updates += 1;
+  return UPDATE_ID_BASE + (user.id - TELEGRAM_USER_BASE) * 100 + user.updates;
+}
+
+function sender(user) {
+  return { id: user.id, is_bot: false, first_name: "Load", language_code: "de" };
+}
+
+function postUpdate(flow, update) {
+  const response = http.post(`${BASE_URL}/webhook/telegram`, JSON.stringify(update), {
+    headers: {
+      "Content-Type": "application/json",
+      "X-Telegram-Bot-Api-Secret-Token": WEBHOOK_SECRET,
+    },
+    tags: { flow },
+  });
+  return check(response, { "webhook accepted": (r) => r.status === 200 });
+}
+
+function pollMessages(user, timeoutMs) {
+  const response = http.get(
+    `${STUB_URL}/__stub__/messages?chat_id=${user.id}&after=${user.cursor}&timeout_ms=${timeoutMs}`,
+    { tags: { flow: "stub_poll" }, timeout: `${timeoutMs + 5000}ms` },
+  );
+  if (response.status !== 200) {
+    return [];
+  }
+  const messages = response.json("messages") || [];
+  if (messages.length > 0) {
+    user.cursor = messages[messages.length - 1].seq;
+  }
+  return messages;
+}
+
+function buttons(message) {
+  const markup = message.reply_markup || {};
+  return (markup.inline_keyboard || []).flat();
+}
+
+// Sends one update and waits until a message offering a button that matches `pattern` arrives.
+function step(flow, user, update, pattern) {
+  const sentAt = Date.now();
+  if (!postUpdate(flow, update)) {
+    stepFailures.add(true, { flow });
+    return null;
+  }
+  const deadline = sentAt + REPLY_TIMEOUT_MS;
+  let latencyRecorded = false;
+  while (Date.now() < deadline) {
+    const messages = pollMessages(user, Math.max(1, deadline - Date.now()));
+    for (const message of messages) {
+      if (!latencyRecorded) {
+        e2eLatency.add(message.received_at_ms - sentAt, { flow });
+        latencyRecorded = true;
+      }
+      const matched = buttons(message).find((b) => pattern.test(b.callback_data || ""));
+      if (matched) {
+        stepFailures.add(false, { flow });
+        return { message, button: matched };
+      }
+    }
+  }
+  stepFailures.add(true, { flow });
+  return null;
+}
+
+function sendStart(flow, user, pattern, payload) {
+  const text = payload ? `/start ${payload}` : "/start";
+  return step(flow, user, {
+    update_id: nextUpdateId(user),
+    message: {
+      message_id: user.updates + 1,
+      date: Math.floor(Date.now() / 1000),
+      chat: { id: user.id, type: "private", first_name: "Load" },
+      from: sender(user),
+      text,
+      entities: [{ offset: 0, length: 6, type: "bot_command" }],
+    },
+  }, pattern);
+}
+
+function press(flow, user, reply, pattern) {
+  return step(flow, user, {
+    update_id: nextUpdateId(user),
+    callback_query: {
+      id: `${user.id}-${user.updates}`,
+      from: sender(user),
+      chat_instance: `load-${user.id}`,
+      message: {
+        message_id: reply.message.message_id,
+        date: Math.floor(Date.now() / 1000),
+        chat: { id: user.id, type: "private", first_name: "Load" },
+        text: reply.message.text || "",
+      },
+      data: reply.button.callback_data,
+    },
+  }, pattern);
+}
+
+const ANSWER = /^answer:/;
+const ANSWER_OR_NEXT = /^(answer:|friend:next:)/;
+const ANY_BUTTON = /./;
+
+function playQuestions(flow, user, reply, answers) {
+  let current = reply;
+  for (let index = 0; current && index < answers; index += 1) {
+    const options = buttons(current.message).filter((b) => ANSWER.test(b.callback_data || ""));
+    if (options.length > 0) {
+      current.button = options[Math.floor(Math.random() * options.length)];
+    }
+    // The last answer only has to produce some reply (result or summary keyboard).
+    current = press(flow, user, current, index + 1 < answers ? ANSWER_OR_NEXT : ANY_BUTTON);
+  }
+}
+
+export function modePlayFlow() {
+  const flow = "mode_play";
+  const user = newUser(0);
+  // Empty MODE_CODE uses the home "play" button (quick mix); otherwise press mode:<MODE_CODE>.
+  const startPattern = MODE_CODE ? new RegExp(`^mode:${MODE_CODE}$`) : /^play$/;
+  const home = sendStart(flow, user, startPattern);
+  if (!home) return;
+  const question = press(flow, user, home, ANSWER);
+  playQuestions(flow, user, question, ANSWERS_PER_RUN);
+}
+
+export function friendDuelFlow() {
+  const flow = "friend_duel";
+  const creator = newUser(0);
+  const opponent = newUser(1);
+  const home = sendStart(flow, creator, /^friend:challenge:create$/);
+  if (!home) return;
+  const types = press(flow, creator, home, /^friend:challenge:type:direct$/);
+  if (!types) return;
+  const formats = press(flow, creator, types, /^friend:challenge:format:direct:5$/);
+  if (!formats) return;
+  const invite = press(flow, creator, formats, /^friend:invite:sent:[0-9a-f-]{36}$/);
+  if (!invite) return;
+  const duelId = invite.button.callback_data.split(":").pop();
+  const opponentQuestion = sendStart(flow, opponent, ANSWER, `duel_${duelId}`);
+  playQuestions(flow, opponent, opponentQuestion, ANSWERS_PER_RUN);
+  const confirmed = press(flow, creator, invite, /^friend:next:/);
+  if (!confirmed) return;
+  playQuestions(flow, creator, press(flow, creator, confirmed, ANSWER), ANSWERS_PER_RUN);
+}
+
+export function dailyCupFlow() {
+  const flow = "daily_cup";
+  const user = newUser(0);
+  const home = sendStart(flow, user, /^friend:challenge:create$/);
+  if (!home) return;
+  const arena = press(flow, user, home, /^daily:cup:menu$/);
+  if (!arena) return;
+  const menu = press(flow, user, arena, /^daily:cup:(join|view):/);
+  if (!menu) return;
+  if (/^daily:cup:join:/.test(menu.button.callback_data)) {
+    const lobby = press(flow, user, menu, /^(daily:cup:view:|friend:next:)/);
+    if (lobby && /^friend:next:/.test(lobby.button.callback_data)) {
+      playQuestions(flow, user, press(flow, user, lobby, ANSWER), ANSWERS_PER_RUN);
+    }
+  }
+}
@@ -6,6 +6,8 @@ const PROFILE = (__ENV.K6_PROFILE || "steady").trim().toLowerCase();
 const BASE_URL = (__ENV.BASE_URL || "http://127.0.0.1:8000").replace(/\/+$/, "");
 const WEBHOOK_SECRET = __ENV.WEBHOOK_SECRET || "replace_me";
 const TELEGRAM_USER_BASE = Number(__ENV.TELEGRAM_USER_BASE || 90000000000);
+// A small pool makes several VUs open /start for the same user concurrently (row-lock contention).
+const TELEGRAM_USER_POOL = Number(__ENV.TELEGRAM_USER_POOL || 0);
 const UPDATE_ID_BASE = Number(__ENV.UPDATE_ID_BASE || 800000000);
 
 const queuedResponses = new Counter("queued_responses_total");
@@ -73,7 +75,8 @@ export const options = {
 
 function updatePayloadForIteration() {
   const n = (__VU * 1000000) + __ITER;
-  const telegramUserId = TELEGRAM_USER_BASE + __VU;
+  const userSlot = TELEGRAM_USER_POOL > 0 ? __VU % TELEGRAM_USER_POOL : __VU;
+  const telegramUserId = TELEGRAM_USER_BASE + userSlot;
   const updateId = UPDATE_ID_BASE + n;
   return {
     update_id: updateId,
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from time import perf_counter
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+
+from app.workers.tasks.daily_cup_core import send_daily_cup_canceled_messages
+from scripts.telegram_bot_api_stub import StubFaults, TelegramBotApiStub, create_app
+
+CHAT_ID_BASE = 70_000_000_000
+
+
+async def _run(args: argparse.Namespace) -> dict[str, object]:
+    targets = [CHAT_ID_BASE + index for index in range(max(1, args.recipients))]
+    blocked = set(targets[:: args.blocked_every]) if args.blocked_every > 0 else set()
+    stub = TelegramBotApiStub(
+        StubFaults(
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            per_chat_per_second=args.per_chat_per_second,
+            global_per_second=args.global_per_second,
+            blocked_chat_ids=set(blocked),
+        )
+    )
+    runner = web.AppRunner(create_app(stub))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    def bot_factory() -> Bot:
+        api = TelegramAPIServer.from_base(f"http://127.0.0.1:{port}")
+        return Bot(token="123456:benchmark", session=AiohttpSession(api=api))
+
+    try:
+        started_at = perf_counter()
+        await send_daily_cup_canceled_messages(telegram_targets=targets, bot_factory=bot_factory)
+        elapsed_s = perf_counter() - started_at
+    finally:
+        await runner.cleanup()
+
+    stats = stub.stats()
+    delivered = int(stats["messages_total"])
+    return {
+        "path": "daily_cup_canceled_broadcast",
+        "recipients": len(targets),
+        "blocked": len(blocked),
+        "latency_ms": args.latency_ms,
+        "elapsed_s": round(elapsed_s, 3),
+        "delivered": delivered,
+        "delivered_per_second": round(delivered / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        "status_counts": stats["status_counts"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure broadcast messages/sec against the local Bot API stub."
+    )
+    parser.add_argument("--recipients", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--per-chat-per-second", type=int, default=0)
+    parser.add_argument("--global-per-second", type=int, default=0)
+    parser.add_argument(
+        "--blocked-every", type=int, default=0, help="Every Nth recipient answers 403."
+    )
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_run(args)), sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -44,7 +44,7 @@ ssh "$REMOTE" "cd ${REMOTE_DIR} && \
   docker compose -f docker-compose.prod.yml up -d postgres redis && \
   docker compose -f docker-compose.prod.yml build api worker beat && \
   docker compose -f docker-compose.prod.yml run --rm api alembic upgrade head && \
-  docker compose -f docker-compose.prod.yml run --rm api sh -lc 'QUIZBANK_REPLACE_ALL_CONFIRM=PROD_REPLACE_ALL_OK QUIZBANK_REPLACE_ALL_CONFIRM_DB=\"\$POSTGRES_DB\" python -m scripts.quizbank_import_tool --replace-all' && \
+  docker compose -f docker-compose.prod.yml run --rm api python -m scripts.quizbank_import_tool --sync && \
   docker compose -f docker-compose.prod.yml run --rm api python -m scripts.quizbank_assert_non_empty && \
   docker compose -f docker-compose.prod.yml up -d --build api worker beat caddy && \
   docker compose -f docker-compose.prod.yml run --rm api python -m scripts.post_deploy_gate && \
@@ -3,9 +3,10 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
+from typing import Any
 
 
-def _read_summary(path: Path) -> dict[str, object]:
+def _read_summary(path: Path) -> dict[str, Any]:
     with path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
@@ -48,58 +49,110 @@ def _metric_values(
     return exact_values
 
 
+def _evaluate_flow(
+    metrics: dict[str, object],
+    *,
+    flow_tag: str,
+    max_p95_ms: float,
+    max_error_rate: float,
+    duration_metric: str = "http_req_duration",
+    error_metric: str = "http_req_failed",
+) -> tuple[dict[str, object], list[str]]:
+    duration_values = _metric_values(metrics, metric_name=duration_metric, flow_tag=flow_tag)
+    failed_values = _metric_values(metrics, metric_name=error_metric, flow_tag=flow_tag)
+    if duration_values is None or failed_values is None:
+        raise SystemExit(f"SLO_FAIL: required metrics not found in k6 summary for {flow_tag}")
+
+    p95_ms = float(duration_values.get("p(95)", duration_values.get("p95", 0.0)))
+    error_rate = float(failed_values.get("rate", failed_values.get("value", 1.0)))
+
+    failures: list[str] = []
+    if p95_ms > max_p95_ms:
+        failures.append(f"p95={p95_ms:.2f}ms > {max_p95_ms:.2f}ms")
+    if error_rate > max_error_rate:
+        failures.append(f"error_rate={error_rate:.6f} > {max_error_rate:.6f}")
+    result: dict[str, object] = {
+        "p95_ms": round(p95_ms, 3),
+        "max_p95_ms": max_p95_ms,
+        "error_rate": round(error_rate, 6),
+        "max_error_rate": max_error_rate,
+    }
+    return result, failures
+
+
+def evaluate_flow_slos(
+    metrics: dict[str, object],
+    flow_slos: dict[str, dict[str, Any]],
+) -> tuple[dict[str, dict[str, object]], list[str]]:
+    """Evaluates per-flow latency/error SLOs; each flow reads its own k6 metrics."""
+    results: dict[str, dict[str, object]] = {}
+    failures: list[str] = []
+    for flow_tag, slo in sorted(flow_slos.items()):
+        results[flow_tag], flow_failures = _evaluate_flow(
+            metrics,
+            flow_tag=flow_tag,
+            max_p95_ms=float(slo["max_p95_ms"]),
+            max_error_rate=float(slo["max_error_rate"]),
+            duration_metric=str(slo.get("duration_metric", "http_req_duration")),
+            error_metric=str(slo.get("error_metric", "http_req_failed")),
+        )
+        failures.extend(f"{flow_tag}: {failure}" for failure in flow_failures)
+    return results, failures
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Evaluate SLO gate from k6 summary + DB lock waits."
     )
     parser.add_argument("--summary-file", required=True)
     parser.add_argument("--flow-tag", default="webhook_start")
-    parser.add_argument("--max-p95-ms", type=float, required=True)
-    parser.add_argument("--max-error-rate", type=float, required=True)
+    parser.add_argument("--max-p95-ms", type=float)
+    parser.add_argument("--max-error-rate", type=float)
+    parser.add_argument(
+        "--slo-file",
+        help="JSON map of flow tag -> {max_p95_ms, max_error_rate, duration_metric, error_metric}",
+    )
     parser.add_argument("--db-lock-waits", type=int, required=True)
     parser.add_argument("--max-db-lock-waits", type=int, required=True)
     parser.add_argument("--deadlocks-delta", type=int, required=True)
     parser.add_argument("--max-deadlocks-delta", type=int, default=0)
     args = parser.parse_args()
+    if args.slo_file is None and (args.max_p95_ms is None or args.max_error_rate is None):
+        parser.error("--max-p95-ms and --max-error-rate are required without --slo-file")
 
     summary = _read_summary(Path(args.summary_file))
     metrics = summary.get("metrics")
     if not isinstance(metrics, dict):
         raise SystemExit("SLO_FAIL: summary file does not contain metrics payload")
 
-    duration_values = _metric_values(
-        metrics, metric_name="http_req_duration", flow_tag=args.flow_tag
-    )
-    failed_values = _metric_values(metrics, metric_name="http_req_failed", flow_tag=args.flow_tag)
-    if duration_values is None or failed_values is None:
-        raise SystemExit("SLO_FAIL: required metrics not found in k6 summary")
-
-    p95_ms = float(duration_values.get("p(95)", duration_values.get("p95", 0.0)))
-    error_rate = float(failed_values.get("rate", failed_values.get("value", 1.0)))
+    result: dict[str, object]
+    if args.slo_file is not None:
+        flow_results, failures = evaluate_flow_slos(metrics, _read_summary(Path(args.slo_file)))
+        result = {"flows": flow_results}
+    else:
+        flow_result, failures = _evaluate_flow(
+            metrics,
+            flow_tag=args.flow_tag,
+            max_p95_ms=args.max_p95_ms,
+            max_error_rate=args.max_error_rate,
+        )
+        result = {"flow_tag": args.flow_tag, **flow_result}
 
-    failures: list[str] = []
-    if p95_ms > args.max_p95_ms:
-        failures.append(f"p95={p95_ms:.2f}ms > {args.max_p95_ms:.2f}ms")
-    if error_rate > args.max_error_rate:
-        failures.append(f"error_rate={error_rate:.6f} > {args.max_error_rate:.6f}")
     if args.db_lock_waits > args.max_db_lock_waits:
         failures.append(f"db_lock_waits={args.db_lock_waits} > {args.max_db_lock_waits}")
     if args.deadlocks_delta > args.max_deadlocks_delta:
         failures.append(f"deadlocks_delta={args.deadlocks_delta} > {args.max_deadlocks_delta}")
 
-    result = {
-        "flow_tag": args.flow_tag,
-        "p95_ms": round(p95_ms, 3),
-        "max_p95_ms": args.max_p95_ms,
-        "error_rate": round(error_rate, 6),
-        "max_error_rate": args.max_error_rate,
-        "db_lock_waits": args.db_lock_waits,
-        "max_db_lock_waits": args.max_db_lock_waits,
-        "deadlocks_delta": args.deadlocks_delta,
-        "max_deadlocks_delta": args.max_deadlocks_delta,
-        "pass": len(failures) == 0,
-        "failures": failures,
-    }
+    result.update(
+        {
+            "db_lock_waits": args.db_lock_waits,
+            "max_db_lock_waits": args.max_db_lock_waits,
+            "deadlocks_delta": args.deadlocks_delta,
+            "max_deadlocks_delta": args.max_deadlocks_delta,
+            "pass": len(failures) == 0,
+            "failures": failures,
+        }
+    )
     print(json.dumps(result, separators=(",", ":"), sort_keys=True))
     if failures:
         raise SystemExit("SLO_FAIL")
@@ -17,17 +17,35 @@ def _to_asyncpg_dsn(database_url: str) -> str:
     return parsed._replace(scheme=scheme).geturl()
 
 
-async def _collect(database_url: str) -> dict[str, int]:
+def summarize_lock_waits(samples: list[int]) -> dict[str, float | int]:
+    if not samples:
+        return {"lock_waits_max": 0, "lock_waits_mean": 0.0, "samples": 0}
+    return {
+        "lock_waits_max": max(samples),
+        "lock_waits_mean": round(sum(samples) / len(samples), 3),
+        "samples": len(samples),
+    }
+
+
+async def _collect(
+    database_url: str, *, samples: int = 1, interval_seconds: float = 1.0
+) -> dict[str, float | int]:
     conn = await asyncpg.connect(_to_asyncpg_dsn(database_url))
+    lock_wait_samples: list[int] = []
     try:
-        lock_waits = await conn.fetchval(
-            """
-            SELECT COUNT(*)::int
-            FROM pg_stat_activity
-            WHERE wait_event_type = 'Lock'
-              AND state = 'active'
-            """
-        )
+        # A single snapshot misses short FOR UPDATE waits; sample through a k6 run instead.
+        for index in range(max(1, samples)):
+            if index:
+                await asyncio.sleep(interval_seconds)
+            lock_waits = await conn.fetchval(
+                """
+                SELECT COUNT(*)::int
+                FROM pg_stat_activity
+                WHERE wait_event_type = 'Lock'
+                  AND state = 'active'
+                """
+            )
+            lock_wait_samples.append(int(lock_waits or 0))
         deadlocks_total = await conn.fetchval(
             """
             SELECT COALESCE(SUM(deadlocks), 0)::bigint
@@ -38,8 +56,9 @@ async def _collect(database_url: str) -> dict[str, int]:
         await conn.close()
 
     return {
-        "lock_waits_active": int(lock_waits or 0),
+        "lock_waits_active": lock_wait_samples[-1],
         "deadlocks_total": int(deadlocks_total or 0),
+        **summarize_lock_waits(lock_wait_samples),
     }
 
 
@@ -48,9 +67,17 @@ def main() -> int:
         description="Snapshot current PostgreSQL lock waits/deadlocks."
     )
     parser.add_argument("--database-url", required=True)
+    parser.add_argument("--samples", type=int, default=1)
+    parser.add_argument("--interval-seconds", type=float, default=1.0)
     args = parser.parse_args()
 
-    payload = asyncio.run(_collect(args.database_url))
+    payload = asyncio.run(
+        _collect(
+            args.database_url,
+            samples=args.samples,
+            interval_seconds=args.interval_seconds,
+        )
+    )
     print(json.dumps(payload, separators=(",", ":"), sort_keys=True))
     return 0
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BUDGET_FILE = Path(__file__).resolve().with_name("startup_budgets.json")
+
+# Each probe runs in a fresh interpreter: the API probe imports app.main (which builds the app),
+# the worker probe imports the task modules the way ``celery worker`` does on boot.
+_PROBES: dict[str, str] = {
+    "api": "import app.main",
+    "worker": (
+        "from app.workers.celery_app import celery_app\n"
+        "celery_app.loader.import_default_modules()"
+    ),
+}
+_PROFILE_ENV = {"api": "API_PROCESS_PROFILE", "worker": "WORKER_PROCESS_PROFILE"}
+_MEASURE = """
+import json, sys, time
+started_at = time.perf_counter()
+{probe}
+elapsed = time.perf_counter() - started_at
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules)}}))
+"""
+
+
+@dataclass(frozen=True)
+class StartupMeasurement:
+    role: str
+    profile: str
+    seconds: float
+    modules: int
+    slowest_imports: tuple[tuple[str, float], ...] = ()
+
+
+def _slowest_imports(importtime_log: str, *, top: int) -> tuple[tuple[str, float], ...]:
+    rows: list[tuple[str, float]] = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = (part.strip() for part in line[12:].split("|", 2))
+        if cumulative_us.isdigit():
+            rows.append((module, int(cumulative_us) / 1_000_000))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return tuple(rows[:top])
+
+
+def measure_profile(role: str, profile: str, *, top: int = 0) -> StartupMeasurement:
+    env = {**os.environ, _PROFILE_ENV[role]: profile}
+    command = [sys.executable]
+    if top > 0:
+        command += ["-X", "importtime"]
+    command += ["-c", _MEASURE.format(probe=_PROBES[role])]
+    completed = subprocess.run(
+        command, cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    payload = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupMeasurement(
+        role=role,
+        profile=profile,
+        seconds=float(payload["seconds"]),
+        modules=int(payload["modules"]),
+        slowest_imports=_slowest_imports(completed.stderr, top=top) if top > 0 else (),
+    )
+
+
+def load_budgets(path: Path = BUDGET_FILE) -> dict[str, dict[str, dict[str, Any]]]:
+    with path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def budget_failures(measurement: StartupMeasurement, budget: dict[str, Any]) -> list[str]:
+    failures: list[str] = []
+    label = f"{measurement.role}:{measurement.profile}"
+    if measurement.seconds > float(budget["max_import_seconds"]):
+        failures.append(
+            f"{label}: import={measurement.seconds:.2f}s > {budget['max_import_seconds']}s"
+        )
+    if measurement.modules > int(budget["max_modules"]):
+        failures.append(f"{label}: modules={measurement.modules} > {budget['max_modules']}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Profile cold-start import time and module count per process profile."
+    )
+    parser.add_argument("--role", choices=sorted(_PROBES), action="append")
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest imports.")
+    parser.add_argument("--check", action="store_true", help="Fail when a budget is exceeded.")
+    args = parser.parse_args()
+
+    budgets = load_budgets()
+    results: list[dict[str, object]] = []
+    failures: list[str] = []
+    for role in args.role or sorted(_PROBES):
+        for profile, budget in budgets[role].items():
+            measurement = measure_profile(role, profile, top=args.top)
+            failures.extend(budget_failures(measurement, budget))
+            results.append(
+                {
+                    "role": role,
+                    "profile": profile,
+                    "seconds": round(measurement.seconds, 3),
+                    "modules": measurement.modules,
+                    "budget": budget,
+                    "slowest_imports": [
+                        {"module": module, "seconds": round(seconds, 3)}
+                        for module, seconds in measurement.slowest_imports
+                    ],
+                }
+            )
+
+    print(json.dumps({"profiles": results, "failures": failures}, indent=2, sort_keys=True))
+    if args.check and failures:
+        raise SystemExit("STARTUP_BUDGET_FAIL")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
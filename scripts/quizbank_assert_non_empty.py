@@ -10,13 +10,15 @@ from app.db.session import SessionLocal
 
 async def _run() -> int:
     async with SessionLocal() as session:
-        total = int(
-            (await session.execute(select(func.count()).select_from(QuizQuestion))).scalar_one()
-        )
+        # `--sync` keeps removed questions as DISABLED rows, so only ACTIVE ones count.
+        stmt = select(func.count()).select_from(QuizQuestion).where(QuizQuestion.status == "ACTIVE")
+        total = int((await session.execute(stmt)).scalar_one())
 
     print(f"quizbank_assert_non_empty total={total}")  # noqa: T201
     if total <= 0:
-        print("quizbank_assert_non_empty failed: quiz_questions table is empty")  # noqa: T201
+        print(  # noqa: T201
+            "quizbank_assert_non_empty failed: quiz_questions has no ACTIVE questions"
+        )
         return 1
     return 0
 
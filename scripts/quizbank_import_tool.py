@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import csv
+import json
 import os
 import re
 from collections import Counter
@@ -19,6 +20,7 @@ from app.core.config import get_settings
 from app.db.models.quiz_questions import QuizQuestion
 from app.db.session import SessionLocal
 from app.game.questions.catalog import QUIZBANK_FILE_TO_MODE_CODE, is_quick_mix_eligible_source_file
+from scripts.quizbank_sync import QuizbankDiff, apply_diff, compute_diff, load_existing_rows
 
 SKIP_FILES = {"logik_luecke_sheet_template.csv"}
 REQUIRED_COLUMNS = {
@@ -50,11 +52,26 @@ class ImportSummary:
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Import QuizBank CSV files into quiz_questions.")
     parser.add_argument("--input-dir", type=Path, default=Path("QuizBank"))
-    parser.add_argument(
+    write_mode = parser.add_mutually_exclusive_group()
+    write_mode.add_argument(
         "--replace-all",
         action="store_true",
         help="Delete existing rows from quiz_questions before import.",
     )
+    write_mode.add_argument(
+        "--sync",
+        action="store_true",
+        help=(
+            "Write only new/changed questions (by content hash) and mark questions missing "
+            "from the CSVs as DISABLED. With --dry-run, only report the diff."
+        ),
+    )
+    parser.add_argument(
+        "--diff-report",
+        type=Path,
+        default=None,
+        help="With --sync, write the full diff (all question ids) as JSON to this path.",
+    )
     parser.add_argument(
         "--allow-unmapped",
         action="store_true",
@@ -281,12 +298,51 @@ async def _persist_records(records: list[dict[str, Any]], *, replace_all: bool)
             await session.execute(stmt)
 
 
+async def _sync_records(records: list[dict[str, Any]], *, dry_run: bool) -> QuizbankDiff:
+    if not records:
+        raise ValueError("no importable rows found")
+
+    async with SessionLocal.begin() as session:
+        diff = compute_diff(records, await load_existing_rows(session))
+        if not dry_run and diff.has_changes:
+            await apply_diff(
+                session,
+                records=records,
+                diff=diff,
+                now_utc=datetime.now(timezone.utc),
+            )
+    return diff
+
+
+def _print_sync_report(diff: QuizbankDiff, *, report_path: Path | None) -> None:
+    report = diff.as_report()
+    print(  # noqa: T201
+        "quizbank_sync "
+        f"inserted={report['inserted']} "
+        f"updated={report['updated']} "
+        f"disabled={report['disabled']} "
+        f"unchanged={report['unchanged']}"
+    )
+    for kind in ("inserted", "updated", "disabled"):
+        sample_ids = report[f"{kind}_ids"]
+        if sample_ids:
+            print(f"quizbank_sync_{kind}_sample {','.join(sample_ids)}")  # noqa: T201
+    if report_path is not None:
+        report_path.write_text(
+            json.dumps(diff.as_report(sample_size=None), indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+
 async def _run() -> int:
     args = _parse_args()
     _assert_replace_all_safety(replace_all=args.replace_all)
     records, summary, by_mode = _build_records(args)
 
-    if not args.dry_run:
+    if args.sync:
+        diff = await _sync_records(records, dry_run=args.dry_run)
+        _print_sync_report(diff, report_path=args.diff_report)
+    elif not args.dry_run:
         await _persist_records(records, replace_all=args.replace_all)
 
     mode_stats = ", ".join(f"{mode}={count}" for mode, count in sorted(by_mode.items()))
@@ -296,6 +352,7 @@ async def _run() -> int:
         f"rows_imported={summary.total_rows_imported} "
         f"skipped_not_ready={summary.skipped_not_ready} "
         f"replace_all={args.replace_all} "
+        f"sync={args.sync} "
         f"dry_run={args.dry_run}"
     )
     print(f"quizbank_import_by_mode {mode_stats}")  # noqa: T201
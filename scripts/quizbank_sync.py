@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.quiz_questions import QuizQuestion
+
+CONTENT_FIELDS = (
+    "mode_code",
+    "source_file",
+    "level",
+    "category",
+    "question_text",
+    "option_1",
+    "option_2",
+    "option_3",
+    "option_4",
+    "correct_option_id",
+    "correct_answer",
+    "explanation",
+    "key",
+    "status",
+    "quick_mix_eligible",
+)
+WRITE_CHUNK_SIZE = 1000
+REPORT_SAMPLE_SIZE = 10
+
+
+@dataclass(slots=True)
+class QuizbankDiff:
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    disabled: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.inserted or self.updated or self.disabled)
+
+    def as_report(self, *, sample_size: int | None = REPORT_SAMPLE_SIZE) -> dict[str, Any]:
+        return {
+            "inserted": len(self.inserted),
+            "updated": len(self.updated),
+            "disabled": len(self.disabled),
+            "unchanged": self.unchanged,
+            "inserted_ids": sorted(self.inserted)[:sample_size],
+            "updated_ids": sorted(self.updated)[:sample_size],
+            "disabled_ids": sorted(self.disabled)[:sample_size],
+        }
+
+
+def content_hash(row: dict[str, Any]) -> str:
+    payload = json.dumps([row[name] for name in CONTENT_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compute_diff(
+    records: list[dict[str, Any]],
+    existing_rows: list[dict[str, Any]],
+) -> QuizbankDiff:
+    """Classifies CSV records against stored rows by content hash; absent ACTIVE rows get disabled."""
+    existing_by_id = {str(row["question_id"]): row for row in existing_rows}
+    diff = QuizbankDiff()
+    for record in records:
+        stored = existing_by_id.pop(str(record["question_id"]), None)
+        if stored is None:
+            diff.inserted.append(str(record["question_id"]))
+        elif content_hash(stored) != content_hash(record):
+            diff.updated.append(str(record["question_id"]))
+        else:
+            diff.unchanged += 1
+    diff.disabled.extend(
+        question_id for question_id, row in existing_by_id.items() if row["status"] != "DISABLED"
+    )
+    return diff
+
+
+async def load_existing_rows(session: AsyncSession) -> list[dict[str, Any]]:
+    columns = [QuizQuestion.question_id, *(getattr(QuizQuestion, name) for name in CONTENT_FIELDS)]
+    result = await session.execute(select(*columns))
+    return [dict(row._mapping) for row in result]
+
+
+def _chunks(values: list[Any], size: int = WRITE_CHUNK_SIZE) -> list[list[Any]]:
+    return [values[index : index + size] for index in range(0, len(values), size)]
+
+
+async def apply_diff(
+    session: AsyncSession,
+    *,
+    records: list[dict[str, Any]],
+    diff: QuizbankDiff,
+    now_utc: datetime,
+) -> None:
+    records_by_id = {str(record["question_id"]): record for record in records}
+
+    inserted_rows = [
+        {**records_by_id[question_id], "created_at": now_utc, "updated_at": now_utc}
+        for question_id in diff.inserted
+    ]
+    for chunk in _chunks(inserted_rows):
+        await session.execute(pg_insert(QuizQuestion).values(chunk))
+
+    updated_rows = [
+        {
+            "question_id": question_id,
+            **{name: records_by_id[question_id][name] for name in CONTENT_FIELDS},
+            "updated_at": now_utc,
+        }
+        for question_id in diff.updated
+    ]
+    for chunk in _chunks(updated_rows):
+        # ORM bulk UPDATE by primary key: one executemany per chunk, created_at untouched.
+        await session.execute(update(QuizQuestion), chunk)
+
+    for chunk in _chunks(diff.disabled):
+        await session.execute(
+            update(QuizQuestion)
+            .where(QuizQuestion.question_id.in_(chunk))
+            .values(status="DISABLED", updated_at=now_utc)
+            .execution_options(synchronize_session=False)
+        )
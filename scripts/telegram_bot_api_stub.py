@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from time import monotonic, time
+from typing import Any
+
+from aiohttp import web
+
+# Methods that put a message into a chat; load scenarios wait on these per chat.
+MESSAGE_METHODS = frozenset(
+    {
+        "sendmessage",
+        "sendphoto",
+        "senddocument",
+        "sendinvoice",
+        "sendanimation",
+        "editmessagetext",
+        "editmessagecaption",
+        "editmessagereplymarkup",
+    }
+)
+MAX_POLL_TIMEOUT_MS = 30_000
+STUB_BOT_USER = {"id": 1, "is_bot": True, "first_name": "Stub", "username": "stub_bot"}
+
+
+@dataclass(slots=True)
+class StubFaults:
+    """Simulated Bot API behaviour; zero values disable a fault."""
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    # Telegram allows roughly 1 message/s per chat and 30 messages/s per bot.
+    per_chat_per_second: int = 0
+    global_per_second: int = 0
+    retry_after_seconds: int = 1
+    blocked_chat_ids: set[int | str] = field(default_factory=set)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedCall:
+    seq: int
+    method: str
+    chat_id: int | str | None
+    status: int
+    received_at_ms: int
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedMessage:
+    seq: int
+    method: str
+    chat_id: int | str
+    message_id: int
+    received_at_ms: int
+    text: str | None
+    reply_markup: dict[str, Any] | None
+
+
+def _decode_json_field(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _chat_id(value: Any) -> int | str:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+async def _read_params(request: web.Request) -> dict[str, Any]:
+    if request.content_type == "application/json":
+        payload = await request.json()
+        return payload if isinstance(payload, dict) else {}
+    form = await request.post()
+    params: dict[str, Any] = {}
+    for key, value in form.items():
+        params[key] = getattr(value, "filename", None) or _decode_json_field(value)
+    return params
+
+
+class TelegramBotApiStub:
+    """In-memory Bot API: answers every method with a well-formed result and logs chat messages."""
+
+    def __init__(self, faults: StubFaults | None = None) -> None:
+        self.faults = faults or StubFaults()
+        self.calls: list[RecordedCall] = []
+        self.messages: list[RecordedMessage] = []
+        self._next_message_id = 1
+        self._changed = asyncio.Condition()
+        self._sent_at: dict[int | str | None, deque[float]] = {}
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.messages.clear()
+        self._sent_at.clear()
+
+    def _over_limit(self, key: int | str | None, limit: int, now: float) -> bool:
+        if limit <= 0:
+            return False
+        window = self._sent_at.setdefault(key, deque())
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        return len(window) >= limit
+
+    def _fault_for(
+        self, method: str, chat_id: int | str | None
+    ) -> tuple[int, dict[str, Any]] | None:
+        if method not in MESSAGE_METHODS or chat_id is None:
+            return None
+        if chat_id in self.faults.blocked_chat_ids:
+            return 403, {"description": "Forbidden: bot was blocked by the user"}
+        now = monotonic()
+        if self._over_limit(chat_id, self.faults.per_chat_per_second, now) or self._over_limit(
+            None, self.faults.global_per_second, now
+        ):
+            retry_after = self.faults.retry_after_seconds
+            return 429, {
+                "description": f"Too Many Requests: retry after {retry_after}",
+                "parameters": {"retry_after": retry_after},
+            }
+        for key in (chat_id, None):
+            self._sent_at.setdefault(key, deque()).append(now)
+        return None
+
+    async def _simulate_latency(self) -> None:
+        delay_ms = self.faults.latency_ms + random.uniform(0.0, self.faults.latency_jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+    def _message_result(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        if method.startswith("edit") and "message_id" in params:
+            message_id = int(params["message_id"])
+        else:
+            message_id = self._next_message_id
+            self._next_message_id += 1
+        result: dict[str, Any] = {
+            "message_id": message_id,
+            "date": int(time()),
+            "chat": {"id": _chat_id(params.get("chat_id")), "type": "private"},
+            "from": STUB_BOT_USER,
+        }
+        if "text" in params:
+            result["text"] = str(params["text"])
+        if "caption" in params:
+            result["caption"] = str(params["caption"])
+        if method == "sendphoto":
+            result["photo"] = [
+                {
+                    "file_id": f"stub-photo-{message_id}",
+                    "file_unique_id": f"p{message_id}",
+                    "width": 1,
+                    "height": 1,
+                }
+            ]
+        if isinstance(params.get("reply_markup"), dict):
+            result["reply_markup"] = params["reply_markup"]
+        return result
+
+    def _result(self, method: str, params: dict[str, Any]) -> Any:
+        if method in MESSAGE_METHODS:
+            return self._message_result(method, params)
+        if method == "getme":
+            return STUB_BOT_USER
+        if method == "getchatmember":
+            user = {"id": int(params.get("user_id", 0)), "is_bot": False, "first_name": "Stub"}
+            return {"status": "member", "user": user}
+        return True
+
+    def _record_call(self, method: str, chat_id: int | str | None, status: int) -> None:
+        self.calls.append(
+            RecordedCall(
+                seq=len(self.calls) + 1,
+                method=method,
+                chat_id=chat_id,
+                status=status,
+                received_at_ms=int(time() * 1000),
+            )
+        )
+
+    async def handle_method(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"].lower()
+        params = await _read_params(request)
+        chat_id = _chat_id(params["chat_id"]) if "chat_id" in params else None
+        await self._simulate_latency()
+        fault = self._fault_for(method, chat_id)
+        if fault is not None:
+            status, error = fault
+            self._record_call(method, chat_id, status)
+            return web.json_response({"ok": False, "error_code": status, **error}, status=status)
+        self._record_call(method, chat_id, 200)
+        result = self._result(method, params)
+        if method in MESSAGE_METHODS and chat_id is not None:
+            async with self._changed:
+                self.messages.append(
+                    RecordedMessage(
+                        seq=len(self.messages) + 1,
+                        method=method,
+                        chat_id=chat_id,
+                        message_id=int(result["message_id"]),
+                        received_at_ms=int(time() * 1000),
+                        text=params.get("text") or params.get("caption"),
+                        reply_markup=result.get("reply_markup"),
+                    )
+                )
+                self._changed.notify_all()
+        return web.json_response({"ok": True, "result": result})
+
+    def stats(self) -> dict[str, Any]:
+        status_counts: dict[str, int] = {}
+        method_counts: dict[str, int] = {}
+        for call in self.calls:
+            status_counts[str(call.status)] = status_counts.get(str(call.status), 0) + 1
+            method_counts[call.method] = method_counts.get(call.method, 0) + 1
+        messages_per_second = 0.0
+        if len(self.messages) > 1:
+            span_ms = self.messages[-1].received_at_ms - self.messages[0].received_at_ms
+            messages_per_second = round(len(self.messages) * 1000 / max(1, span_ms), 2)
+        return {
+            "calls_total": len(self.calls),
+            "messages_total": len(self.messages),
+            "messages_per_second": messages_per_second,
+            "method_counts": method_counts,
+            "status_counts": status_counts,
+        }
+
+    def _messages_for(self, chat_id: int | str, *, after: int) -> list[RecordedMessage]:
+        return [m for m in self.messages[after:] if m.chat_id == chat_id]
+
+    async def handle_poll(self, request: web.Request) -> web.Response:
+        """Long-polls messages sent to ``chat_id`` with ``seq > after``."""
+        chat_id = _chat_id(request.query.get("chat_id"))
+        after = max(0, int(request.query.get("after", "0")))
+        timeout_ms = min(MAX_POLL_TIMEOUT_MS, int(request.query.get("timeout_ms", "5000")))
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: bool(self._messages_for(chat_id, after=after))),
+                    timeout=timeout_ms / 1000,
+                )
+            except TimeoutError:
+                pass
+            found = self._messages_for(chat_id, after=after)
+            last_seq = len(self.messages)
+        return web.json_response(
+            {"messages": [asdict(message) for message in found], "last_seq": last_seq}
+        )
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+    async def handle_calls(self, request: web.Request) -> web.Response:
+        method = request.query.get("method", "").lower()
+        calls = [call for call in self.calls if not method or call.method == method]
+        return web.json_response({"calls": [asdict(call) for call in calls]})
+
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        self.reset()
+        return web.json_response({"ok": True})
+
+    async def handle_blocked(self, request: web.Request) -> web.Response:
+        """Replaces the set of chats that answer 403 (``{"chat_ids": [...]}``)."""
+        payload = await request.json()
+        chat_ids = payload.get("chat_ids", []) if isinstance(payload, dict) else []
+        self.faults.blocked_chat_ids = {_chat_id(chat_id) for chat_id in chat_ids}
+        return web.json_response({"blocked_chat_ids": sorted(map(str, chat_ids))})
+
+
+STUB_KEY = web.AppKey("stub", TelegramBotApiStub)
+
+
+def create_app(stub: TelegramBotApiStub | None = None) -> web.Application:
+    stub = stub or TelegramBotApiStub()
+    app = web.Application()
+    app[STUB_KEY] = stub
+    app.router.add_get("/__stub__/messages", stub.handle_poll)
+    app.router.add_get("/__stub__/stats", stub.handle_stats)
+    app.router.add_get("/__stub__/calls", stub.handle_calls)
+    app.router.add_post("/__stub__/reset", stub.handle_reset)
+    app.router.add_post("/__stub__/blocked", stub.handle_blocked)
+    app.router.add_post("/bot{token}/{method}", stub.handle_method)
+    return app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a local Telegram Bot API stub.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--per-chat-per-second", type=int, default=0)
+    parser.add_argument("--global-per-second", type=int, default=0)
+    parser.add_argument("--retry-after-seconds", type=int, default=1)
+    parser.add_argument("--blocked-chat-id", action="append", default=[])
+    args = parser.parse_args()
+    faults = StubFaults(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        per_chat_per_second=args.per_chat_per_second,
+        global_per_second=args.global_per_second,
+        retry_after_seconds=args.retry_after_seconds,
+        blocked_chat_ids={_chat_id(chat_id) for chat_id in args.blocked_chat_id},
+    )
+    app = create_app(TelegramBotApiStub(faults))
+    web.run_app(app, host=args.host, port=args.port, print=None)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from types import SimpleNamespace
 from uuid import uuid4
 
@@ -23,6 +24,20 @@ def _settings(*, two_fa_required: bool = True) -> SimpleNamespace:
     )
 
 
+def _async_return(value: object) -> Callable[..., Awaitable[object]]:
+    async def _fake(**kwargs: object) -> object:
+        return value
+
+    return _fake
+
+
+def _async_call(func: Callable[..., object]) -> Callable[..., Awaitable[object]]:
+    async def _fake(**kwargs: object) -> object:
+        return func(**kwargs)
+
+    return _fake
+
+
 def _principal(*, two_factor_verified: bool = False) -> admin_deps.AdminPrincipal:
     return admin_deps.AdminPrincipal(
         id=uuid4(),
@@ -47,12 +62,12 @@ def test_admin_login_rejects_invalid_credentials(
     failures: list[tuple[str, int]] = []
     app.dependency_overrides[auth.get_settings] = lambda: _settings(two_fa_required=True)
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
     monkeypatch.setattr(auth, "verify_login_credentials", lambda **kwargs: False)
     monkeypatch.setattr(
         auth,
         "record_failure",
-        lambda *, bucket, window_seconds: failures.append((bucket, window_seconds)),
+        _async_call(lambda *, bucket, window_seconds: failures.append((bucket, window_seconds))),
     )
 
     response = client.post(
@@ -69,7 +84,7 @@ def test_admin_login_rejects_rate_limited_requests(
 ) -> None:
     app.dependency_overrides[auth.get_settings] = lambda: _settings(two_fa_required=True)
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: True)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(True))
 
     response = client.post(
         "/admin/auth/login", json={"email": "admin@example.com", "password": "secret123"}
@@ -85,9 +100,9 @@ def test_admin_login_without_2fa_sets_full_auth_cookies(
     cookie_calls: list[dict[str, str]] = []
     app.dependency_overrides[auth.get_settings] = lambda: _settings(two_fa_required=False)
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
     monkeypatch.setattr(auth, "verify_login_credentials", lambda **kwargs: True)
-    monkeypatch.setattr(auth, "clear_failures", lambda **kwargs: None)
+    monkeypatch.setattr(auth, "clear_failures", _async_return(None))
     monkeypatch.setattr(auth, "build_access_token", lambda **kwargs: "access-token")
     monkeypatch.setattr(auth, "build_refresh_token", lambda **kwargs: "refresh-token")
     monkeypatch.setattr(
@@ -116,9 +131,9 @@ def test_admin_login_with_2fa_sets_partial_cookie(
     partial_cookie_calls: list[str] = []
     app.dependency_overrides[auth.get_settings] = lambda: _settings(two_fa_required=True)
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
     monkeypatch.setattr(auth, "verify_login_credentials", lambda **kwargs: True)
-    monkeypatch.setattr(auth, "clear_failures", lambda **kwargs: None)
+    monkeypatch.setattr(auth, "clear_failures", _async_return(None))
     monkeypatch.setattr(auth, "build_access_token", lambda **kwargs: "partial-access")
     monkeypatch.setattr(
         auth,
@@ -143,7 +158,7 @@ def test_admin_verify_2fa_rejects_rate_limited_requests(
         two_factor_verified=False
     )
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: True)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(True))
 
     response = client.post("/admin/auth/2fa/verify", json={"code": "123456"})
 
@@ -160,11 +175,11 @@ def test_admin_verify_2fa_rejects_invalid_code(
         two_factor_verified=False
     )
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
     monkeypatch.setattr(
         auth,
         "record_failure",
-        lambda *, bucket, window_seconds: failures.append((bucket, window_seconds)),
+        _async_call(lambda *, bucket, window_seconds: failures.append((bucket, window_seconds))),
     )
     monkeypatch.setattr(
         auth, "verify_totp_code", lambda **kwargs: auth.verify_totp_code.__class__(None)
@@ -197,8 +212,8 @@ def test_admin_verify_2fa_success_sets_full_auth_cookies(
         two_factor_verified=False
     )
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
-    monkeypatch.setattr(auth, "clear_failures", lambda **kwargs: None)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
+    monkeypatch.setattr(auth, "clear_failures", _async_return(None))
     monkeypatch.setattr(auth, "verify_totp_code", _true_totp)
     monkeypatch.setattr(auth, "build_access_token", lambda **kwargs: "verified-access")
     monkeypatch.setattr(auth, "build_refresh_token", lambda **kwargs: "verified-refresh")
@@ -242,8 +257,8 @@ def test_admin_verify_2fa_skips_totp_check_when_2fa_disabled(
         two_factor_verified=False
     )
     monkeypatch.setattr(auth, "rate_limit_bucket", lambda **kwargs: "bucket")
-    monkeypatch.setattr(auth, "is_rate_limited", lambda **kwargs: False)
-    monkeypatch.setattr(auth, "clear_failures", lambda **kwargs: None)
+    monkeypatch.setattr(auth, "is_rate_limited", _async_return(False))
+    monkeypatch.setattr(auth, "clear_failures", _async_return(None))
     monkeypatch.setattr(auth, "verify_totp_code", _unexpected_totp)
     monkeypatch.setattr(auth, "build_access_token", lambda **kwargs: "verified-access")
     monkeypatch.setattr(auth, "build_refresh_token", lambda **kwargs: "verified-refresh")
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from types import SimpleNamespace
 
+import orjson
 import pytest
+import redis.asyncio as redis
+from httpx import ASGITransport, AsyncClient
 
+from app.api.routes.admin import deps as admin_deps
+from app.api.routes.admin import overview
+from app.main import app
 from app.services.admin import cache as admin_cache
+from app.services.admin import cache_entries
 
 
 def _settings() -> SimpleNamespace:
@@ -106,3 +115,188 @@ async def test_set_json_cache_handles_missing_client_and_set_failures(
         value={"v": 1},
         ttl_seconds=0,
     )
+
+
+class _LeaseRedis:
+    """Single-process stand-in for the GET/SET NX/DELETE subset the SWR cache relies on."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    async def get(self, key: str) -> object | None:
+        await asyncio.sleep(0)
+        return self.values.get(key)
+
+    async def set(self, key: str, value: object, *, ex: int, nx: bool = False) -> bool:
+        del ex
+        await asyncio.sleep(0)
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+class _CountingBuild:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> dict[str, object]:
+        self.calls += 1
+        version = self.calls
+        await asyncio.sleep(0.05)
+        return {"version": version}
+
+
+def _lease_redis(monkeypatch: pytest.MonkeyPatch) -> _LeaseRedis:
+    client = _LeaseRedis()
+
+    async def _client(settings):
+        del settings
+        return client
+
+    monkeypatch.setattr(admin_cache, "get_redis_client", _client)
+    return client
+
+
+async def _fire(build: _CountingBuild, *, requests: int = 25) -> list[dict[str, object]]:
+    cached = await asyncio.gather(
+        *(
+            admin_cache.get_or_refresh_json_cache(
+                settings=_settings(), key="admin:test", ttl_seconds=300, build=build
+            )
+            for _ in range(requests)
+        )
+    )
+    assert all(item.etag == admin_cache.json_etag(item.value) for item in cached)
+    return [item.value for item in cached]
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_runs_build_once_for_concurrent_cold_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _lease_redis(monkeypatch)
+    build = _CountingBuild()
+
+    results = await _fire(build)
+
+    assert build.calls == 1
+    assert results == [{"version": 1}] * 25
+    assert "admin:test:lease" not in client.values
+    assert await _fire(build) == [{"version": 1}] * 25
+    assert build.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_serves_stale_value_while_single_caller_refreshes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _lease_redis(monkeypatch)
+    client.values["admin:test"] = orjson.dumps(
+        {"fresh_until": time.time() - 1, "value": {"version": 0}}
+    )
+    build = _CountingBuild()
+
+    results = await _fire(build)
+
+    assert build.calls == 1
+    assert results.count({"version": 1}) == 1
+    assert results.count({"version": 0}) == 24
+    assert await _fire(build) == [{"version": 1}] * 25
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_returns_built_value_and_logs_when_redis_writes_fail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _lease_redis(monkeypatch)
+
+    async def _failing_set(key: str, value: object, *, ex: int, nx: bool = False) -> bool:
+        del key, value, ex
+        if nx:
+            return True
+        raise redis.ConnectionError("down")
+
+    async def _failing_get(key: str) -> object | None:
+        if key.endswith(":lease"):
+            raise redis.ConnectionError("down")
+        return None
+
+    monkeypatch.setattr(client, "set", _failing_set)
+    monkeypatch.setattr(client, "get", _failing_get)
+    warnings: list[str] = []
+    monkeypatch.setattr(
+        cache_entries.logger, "warning", lambda event, **kwargs: warnings.append(event)
+    )
+    build = _CountingBuild()
+
+    results = await _fire(build, requests=1)
+
+    assert results == [{"version": 1}]
+    assert warnings == ["admin_cache_store_failed", "admin_cache_lease_release_failed"]
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_builds_directly_without_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _none_client(settings):
+        del settings
+        return None
+
+    monkeypatch.setattr(admin_cache, "get_redis_client", _none_client)
+    build = _CountingBuild()
+
+    results = await _fire(build, requests=3)
+
+    assert build.calls == 3
+    assert sorted(result["version"] for result in results) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_admin_overview_collapses_concurrent_cold_requests_into_one_build(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _lease_redis(monkeypatch)
+    calls: list[int] = []
+
+    class _Begin:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *exc_info: object) -> bool:
+            return False
+
+    async def _build(session, *, now_utc, days):
+        del session
+        calls.append(days)
+        await asyncio.sleep(0.05)
+        return {
+            "period": "30d",
+            "generated_at": now_utc,
+            "kpis": {},
+            "revenue_series": [],
+            "users_series": [],
+            "funnel": [],
+            "top_products": [],
+            "alerts": [],
+        }
+
+    monkeypatch.setattr(overview, "ReadSessionLocal", SimpleNamespace(begin=_Begin))
+    monkeypatch.setattr(overview, "build_overview_payload", _build)
+    app.dependency_overrides[overview.get_settings] = _settings
+    app.dependency_overrides[admin_deps.get_current_admin] = lambda: SimpleNamespace(
+        email="admin@example.com"
+    )
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.get("/admin/overview?period=30d") for _ in range(20))
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [200] * 20
+    assert calls == [30]
+    assert len({response.json()["generated_at"] for response in responses}) == 1
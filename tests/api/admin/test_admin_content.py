@@ -120,7 +120,7 @@ def test_admin_content_health_returns_aggregated_payload(
             _RowsResult([("QUIZ", "A1", 4), ("QUIZ", "B1", 2)]),
         ]
     )
-    monkeypatch.setattr(content, "SessionLocal", _session_local(session))
+    monkeypatch.setattr(content, "ReadSessionLocal", _session_local(session))
 
     response = client.get("/admin/content")
 
@@ -149,7 +149,7 @@ def test_admin_content_helpers_and_empty_branches(
             _RowsResult([]),
         ]
     )
-    monkeypatch.setattr(content, "SessionLocal", _session_local(session))
+    monkeypatch.setattr(content, "ReadSessionLocal", _session_local(session))
 
     response = client.get("/admin/content")
 
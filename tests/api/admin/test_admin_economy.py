@@ -113,7 +113,7 @@ def test_admin_economy_purchases_route_builds_items_and_charts(
     )
     monkeypatch.setattr(
         economy,
-        "SessionLocal",
+        "ReadSessionLocal",
         _session_local(
             _Session(
                 _ScalarResult(2),
@@ -171,7 +171,7 @@ def test_admin_economy_subscriptions_route_serializes_active_entitlements(
     )
     monkeypatch.setattr(
         economy,
-        "SessionLocal",
+        "ReadSessionLocal",
         _session_local(_Session(_RowsResult([(entitlement, "alice")]))),
     )
 
@@ -209,7 +209,7 @@ def test_admin_economy_cohorts_route_groups_users_and_filters_invalid_purchases(
     ]
     monkeypatch.setattr(
         economy,
-        "SessionLocal",
+        "ReadSessionLocal",
         _session_local(_Session(_RowsResult(user_rows), _RowsResult(purchase_rows))),
     )
 
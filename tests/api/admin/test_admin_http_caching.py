@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.api import compression
+from app.api.compression import ScopedCompressionMiddleware, negotiate_encoding
+from app.api.routes.admin import deps as admin_deps
+from app.api.routes.admin.content import routes as content_routes
+from app.main import app
+from app.services.admin import cache as admin_cache
+
+
+def _admin() -> admin_deps.AdminPrincipal:
+    return admin_deps.AdminPrincipal(
+        id=uuid4(),
+        email="admin@example.com",
+        role="admin",
+        two_factor_verified=True,
+        client_ip="127.0.0.1",
+    )
+
+
+def _payload() -> dict[str, object]:
+    flagged = [
+        {"id": index, "question_id": f"q-{index}", "reason": "typo", "review": None}
+        for index in range(200)
+    ]
+    return {"flagged": flagged, "totals": {"flagged": len(flagged)}}
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    payload = _payload()
+
+    async def _fake_cache(**kwargs) -> admin_cache.CachedJson:
+        return admin_cache.CachedJson(value=payload, etag=admin_cache.json_etag(payload))
+
+    monkeypatch.setattr(content_routes, "get_or_refresh_json_cache", _fake_cache)
+    app.dependency_overrides.clear()
+    app.dependency_overrides[admin_deps.get_current_admin] = _admin
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def test_admin_json_is_gzipped_for_clients_that_accept_it(client: TestClient) -> None:
+    plain = client.get("/admin/content", headers={"Accept-Encoding": "identity"})
+    zipped = client.get("/admin/content", headers={"Accept-Encoding": "gzip"})
+
+    assert plain.status_code == zipped.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert int(zipped.headers["content-length"]) * 5 < int(plain.headers["content-length"])
+    assert zipped.json() == plain.json()
+    assert zipped.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert plain.headers["cache-control"] == "private, no-cache"
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+def test_matching_etag_returns_empty_304(client: TestClient, encoding: str) -> None:
+    first = client.get("/admin/content", headers={"Accept-Encoding": encoding})
+
+    revalidated = client.get(
+        "/admin/content",
+        headers={"Accept-Encoding": encoding, "If-None-Match": first.headers["etag"]},
+    )
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert "content-encoding" not in revalidated.headers
+
+
+def test_304_echoes_the_matching_validator_from_a_list(client: TestClient) -> None:
+    gzip_etag = client.get("/admin/content", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+    revalidated = client.get(
+        "/admin/content",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f'"stale", W/{gzip_etag}'},
+    )
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == f"W/{gzip_etag}"
+
+
+def test_stale_etag_gets_the_full_payload(client: TestClient) -> None:
+    response = client.get("/admin/content", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == _payload()
+
+
+def _public_app() -> Starlette:
+    async def _large(request) -> JSONResponse:
+        return JSONResponse(_payload())
+
+    routes = [Route("/public/large", _large), Route("/admin/large", _large)]
+    public_app = Starlette(routes=routes)
+    public_app.add_middleware(ScopedCompressionMiddleware)
+    return public_app
+
+
+def test_compression_is_scoped_to_admin_paths() -> None:
+    with TestClient(_public_app()) as test_client:
+        public = test_client.get("/public/large", headers={"Accept-Encoding": "gzip"})
+        admin = test_client.get("/admin/large", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in public.headers
+    assert admin.headers["content-encoding"] == "gzip"
+
+
+def test_brotli_is_preferred_when_installed() -> None:
+    pytest.importorskip("brotli")
+    with TestClient(_public_app()) as test_client:
+        response = test_client.get("/admin/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", None),
+        ("identity", None),
+        ("", None),
+        ("br;q=0, gzip;q=0.5", "gzip"),
+    ],
+)
+def test_negotiate_encoding(header: str, expected: str | None) -> None:
+    assert negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_ignores_br_without_brotli(monkeypatch) -> None:
+    monkeypatch.setattr(compression, "brotli", None)
+
+    assert negotiate_encoding("br, gzip") == "gzip"
+
+
+def test_json_etag_ignores_key_order() -> None:
+    assert admin_cache.json_etag({"a": 1, "b": [1, 2]}) == admin_cache.json_etag(
+        {"b": [1, 2], "a": 1}
+    )
+    assert admin_cache.json_etag({"a": 1}) != admin_cache.json_etag({"a": 2})
@@ -308,14 +308,14 @@ def test_admin_overview_route_uses_cache_hit(
     app.dependency_overrides[admin_deps.get_current_admin] = _admin
 
     async def _cached(**kwargs):
-        del kwargs
-        return payload
+        assert kwargs["key"] == "admin:overview:30"
+        return admin_cache.CachedJson(payload, admin_cache.json_etag(payload))
 
     async def _unexpected_build(*args, **kwargs):
         del args, kwargs
         raise AssertionError("build_overview_payload should not run on cache hit")
 
-    monkeypatch.setattr(overview, "get_json_cache", _cached)
+    monkeypatch.setattr(overview, "get_or_refresh_json_cache", _cached)
     monkeypatch.setattr(overview, "build_overview_payload", _unexpected_build)
 
     response = client.get("/admin/overview?period=30d")
@@ -332,10 +332,6 @@ def test_admin_overview_route_builds_payload_and_stores_cache(
     app.dependency_overrides[overview.get_settings] = _settings
     app.dependency_overrides[admin_deps.get_current_admin] = _admin
 
-    async def _miss(**kwargs):
-        del kwargs
-        return None
-
     async def _build(*args, **kwargs):
         del args, kwargs
         return {
@@ -350,13 +346,14 @@ def test_admin_overview_route_builds_payload_and_stores_cache(
             "alerts": [],
         }
 
-    async def _store(**kwargs):
+    async def _miss(**kwargs):
         stored.append(kwargs)
+        value = await kwargs["build"]()
+        return admin_cache.CachedJson(value, admin_cache.json_etag(value))
 
-    monkeypatch.setattr(overview, "SessionLocal", _session_local(session))
-    monkeypatch.setattr(overview, "get_json_cache", _miss)
+    monkeypatch.setattr(overview, "ReadSessionLocal", _session_local(session))
     monkeypatch.setattr(overview, "build_overview_payload", _build)
-    monkeypatch.setattr(overview, "set_json_cache", _store)
+    monkeypatch.setattr(overview, "get_or_refresh_json_cache", _miss)
 
     response = client.get("/admin/overview?period=unknown")
 
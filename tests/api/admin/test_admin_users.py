@@ -340,7 +340,7 @@ async def test_apply_bonus_updates_existing_state_without_creating_duplicate_rec
             return datetime(2026, 3, 10, 12, 0, tzinfo=tz)
 
     monkeypatch.setattr(users_helpers, "datetime", _FrozenDatetime)
-    existing_state = SimpleNamespace(updated_at=None, **{field_name: 4})
+    existing_state = SimpleNamespace(updated_at=None, version=5, **{field_name: 4})
     gets = {("User", 101): SimpleNamespace(id=101)}
     if bonus_type == "energy":
         gets[("EnergyState", 101)] = existing_state
@@ -352,4 +352,5 @@ async def test_apply_bonus_updates_existing_state_without_creating_duplicate_rec
 
     assert result["amount"] == 3
     assert getattr(existing_state, field_name) == 7
+    assert existing_state.version == 6
     assert not any(isinstance(item, (EnergyState, StreakState)) for item in session.added)
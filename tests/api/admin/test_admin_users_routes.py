@@ -166,8 +166,8 @@ def test_admin_users_state_routes_cover_mutations_and_not_found(
 ) -> None:
     blocked_user = SimpleNamespace(status="ACTIVE")
     unblocked_user = SimpleNamespace(status="BLOCKED")
-    streak = SimpleNamespace(current_streak=5, today_status="ACTIVE", updated_at=None)
-    energy = SimpleNamespace(free_cap=30, free_energy=7, paid_energy=9, updated_at=None)
+    streak = SimpleNamespace(current_streak=5, today_status="ACTIVE", updated_at=None, version=2)
+    energy = SimpleNamespace(free_cap=30, free_energy=7, paid_energy=9, updated_at=None, version=4)
     reset_user = SimpleNamespace(status="ACTIVE")
     reset_session = _Session(
         gets={
@@ -209,6 +209,7 @@ def test_admin_users_state_routes_cover_mutations_and_not_found(
     assert streak.today_status == "NO_ACTIVITY"
     assert energy.free_energy == 20
     assert energy.paid_energy == 0
+    assert (streak.version, energy.version) == (3, 5)
     assert any(type(item).__name__ == "UserEvent" for item in reset_session.added)
     assert missing.status_code == 404
     assert missing.json() == {"detail": {"code": "E_USER_NOT_FOUND"}}
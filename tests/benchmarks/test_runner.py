@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from benchmarks.cases import CASES, BenchmarkCase
+from benchmarks.runner import compare_results, run_cases
+
+
+def _result(min_ms: float) -> dict[str, object]:
+    return {"min_ms": min_ms, "median_ms": min_ms}
+
+
+def test_compare_results_flags_only_slowdowns_beyond_threshold() -> None:
+    rows = compare_results(
+        {"a[1]": _result(1.2), "b[1]": _result(2.0), "new[1]": _result(1.0)},
+        {"a[1]": _result(1.0), "b[1]": _result(1.0), "gone[1]": _result(1.0)},
+        max_regression=0.25,
+    )
+
+    assert [(row["benchmark"], row["regressed"]) for row in rows] == [
+        ("a[1]", False),
+        ("b[1]", True),
+    ]
+
+
+def test_run_cases_quick_measures_smallest_size_only() -> None:
+    calls: list[int] = []
+
+    def setup(param: int) -> Callable[[], object]:
+        calls.append(param)
+        return lambda: sum(range(param))
+
+    case = BenchmarkCase("sum", (10, 1_000), setup)
+
+    results = run_cases((case,), repeat=2, max_seconds=0.05, quick=True)
+
+    assert list(results) == ["sum[10]"]
+    assert calls == [10]
+    assert results["sum[10]"]["min_ms"] > 0
+
+
+def test_every_case_builds_a_callable_for_its_smallest_size() -> None:
+    for case in CASES:
+        if case.name == "render_duel_proof_card_png":
+            continue
+        assert case.setup(case.params[0])() is not None
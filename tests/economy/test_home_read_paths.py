@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.economy.energy import energy_read
+from app.economy.energy.service import EnergyService
+from app.economy.streak import streak_read
+from app.economy.streak.service import StreakService
+from app.economy.streak.types import StreakSnapshot
+
+UTC = timezone.utc
+NOW_UTC = datetime(2026, 2, 19, 12, 0, tzinfo=UTC)
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.expired: list[object] = []
+
+    def expire(self, obj: object) -> None:
+        self.expired.append(obj)
+
+
+def _energy_state(*, last_regen_at: datetime, topup_date: date) -> SimpleNamespace:
+    return SimpleNamespace(
+        free_energy=5,
+        paid_energy=2,
+        free_cap=20,
+        regen_interval_sec=1800,
+        last_regen_at=last_regen_at,
+        last_daily_topup_local_date=topup_date,
+        version=7,
+    )
+
+
+def _streak_state(*, updated_at: datetime, current_streak: int = 3) -> SimpleNamespace:
+    return SimpleNamespace(
+        current_streak=current_streak,
+        best_streak=5,
+        last_activity_local_date=updated_at.date(),
+        today_status="PLAYED",
+        streak_saver_tokens=0,
+        premium_freezes_used_week=0,
+        premium_freeze_week_start_local_date=None,
+        version=4,
+        updated_at=updated_at,
+    )
+
+
+def _patch_energy(monkeypatch, *, state: object, applied: bool = True) -> list[dict[str, object]]:
+    updates: list[dict[str, object]] = []
+
+    async def _get_by_user_id(session, user_id):  # noqa: ANN001
+        return state
+
+    async def _update_state_if_version(session, **kwargs):  # noqa: ANN001
+        updates.append(kwargs)
+        return applied
+
+    async def _has_active_premium(session, user_id, now_utc):  # noqa: ANN001
+        return False
+
+    monkeypatch.setattr(energy_read.EnergyRepo, "get_by_user_id", _get_by_user_id)
+    monkeypatch.setattr(energy_read.EnergyRepo, "update_state_if_version", _update_state_if_version)
+    monkeypatch.setattr(energy_read.EntitlementsRepo, "has_active_premium", _has_active_premium)
+    return updates
+
+
+@pytest.mark.asyncio
+async def test_energy_read_skips_write_and_premium_lookup_when_nothing_is_due(
+    monkeypatch,
+) -> None:
+    state = _energy_state(last_regen_at=NOW_UTC - timedelta(minutes=10), topup_date=NOW_UTC.date())
+    updates = _patch_energy(monkeypatch, state=state)
+
+    async def _unexpected(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("premium lookup must not run")
+
+    monkeypatch.setattr(energy_read.EntitlementsRepo, "has_active_premium", _unexpected)
+
+    snapshot = await EnergyService.read_energy_clock(_Session(), user_id=1, now_utc=NOW_UTC)
+
+    assert (snapshot.free_energy, snapshot.paid_energy) == (5, 2)
+    assert updates == []
+
+
+@pytest.mark.asyncio
+async def test_energy_read_persists_regen_with_version_check(monkeypatch) -> None:
+    state = _energy_state(last_regen_at=NOW_UTC - timedelta(hours=1), topup_date=NOW_UTC.date())
+    updates = _patch_energy(monkeypatch, state=state)
+    session = _Session()
+
+    snapshot = await EnergyService.read_energy_clock(session, user_id=1, now_utc=NOW_UTC)
+
+    assert snapshot.free_energy == 7
+    assert snapshot.last_regen_at == NOW_UTC
+    assert [(item["expected_version"], item["free_energy"]) for item in updates] == [(7, 7)]
+    assert session.expired == [state]
+
+
+@pytest.mark.asyncio
+async def test_energy_read_escalates_to_locked_sync_on_version_conflict(monkeypatch) -> None:
+    state = _energy_state(
+        last_regen_at=NOW_UTC - timedelta(minutes=5),
+        topup_date=NOW_UTC.date() - timedelta(days=1),
+    )
+    _patch_energy(monkeypatch, state=state, applied=False)
+    locked_calls: list[int] = []
+
+    async def _sync_energy_clock(session, *, user_id, now_utc):  # noqa: ANN001
+        locked_calls.append(user_id)
+        return "locked-snapshot"
+
+    monkeypatch.setattr(EnergyService, "sync_energy_clock", _sync_energy_clock)
+
+    result = await EnergyService.read_energy_clock(_Session(), user_id=9, now_utc=NOW_UTC)
+
+    assert result == "locked-snapshot"
+    assert locked_calls == [9]
+
+
+def _patch_streak(monkeypatch, *, state: object, applied: bool = True) -> list[dict[str, object]]:
+    updates: list[dict[str, object]] = []
+
+    async def _get_by_user_id(session, user_id):  # noqa: ANN001
+        return state
+
+    async def _update_state_if_version(session, **kwargs):  # noqa: ANN001
+        updates.append(kwargs)
+        return applied
+
+    async def _get_active_premium_scope(session, user_id, now_utc):  # noqa: ANN001
+        return None
+
+    monkeypatch.setattr(streak_read.StreakRepo, "get_by_user_id", _get_by_user_id)
+    monkeypatch.setattr(streak_read.StreakRepo, "update_state_if_version", _update_state_if_version)
+    monkeypatch.setattr(
+        streak_read.EntitlementsRepo, "get_active_premium_scope", _get_active_premium_scope
+    )
+    return updates
+
+
+@pytest.mark.asyncio
+async def test_streak_read_returns_stored_snapshot_on_same_berlin_day(monkeypatch) -> None:
+    updates = _patch_streak(monkeypatch, state=_streak_state(updated_at=NOW_UTC))
+
+    snapshot = await StreakService.read_rollover(_Session(), user_id=1, now_utc=NOW_UTC)
+
+    assert snapshot.current_streak == 3
+    assert updates == []
+
+
+@pytest.mark.asyncio
+async def test_streak_read_persists_lost_streak_and_emits_event(monkeypatch) -> None:
+    state = _streak_state(updated_at=NOW_UTC - timedelta(days=3))
+    updates = _patch_streak(monkeypatch, state=state)
+    emitted: list[dict[str, object]] = []
+
+    async def _emit(session, **kwargs):  # noqa: ANN001
+        emitted.append(kwargs)
+
+    monkeypatch.setattr(streak_read, "emit_analytics_event", _emit)
+
+    snapshot = await StreakService.read_rollover(_Session(), user_id=1, now_utc=NOW_UTC)
+
+    assert snapshot.current_streak == 0
+    assert snapshot.updated_at == NOW_UTC
+    assert [(item["expected_version"], item["current_streak"]) for item in updates] == [(4, 0)]
+    assert [item["event_type"] for item in emitted] == ["streak_lost"]
+
+
+@pytest.mark.asyncio
+async def test_streak_read_escalates_without_emitting_on_version_conflict(monkeypatch) -> None:
+    _patch_streak(
+        monkeypatch, state=_streak_state(updated_at=NOW_UTC - timedelta(days=3)), applied=False
+    )
+    locked_state = _streak_state(updated_at=NOW_UTC)
+    locked_snapshot = StreakService._snapshot_from_model(locked_state)  # type: ignore[arg-type]
+    emitted: list[dict[str, object]] = []
+
+    async def _emit(session, **kwargs):  # noqa: ANN001
+        emitted.append(kwargs)
+
+    async def _sync_rollover(session, *, user_id, now_utc) -> StreakSnapshot:  # noqa: ANN001
+        return locked_snapshot
+
+    monkeypatch.setattr(streak_read, "emit_analytics_event", _emit)
+    monkeypatch.setattr(StreakService, "sync_rollover", _sync_rollover)
+
+    snapshot = await StreakService.read_rollover(_Session(), user_id=1, now_utc=NOW_UTC)
+
+    assert snapshot is locked_snapshot
+    assert emitted == []
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models.ledger_entries import LedgerEntry
+from app.db.repo.ledger_repo import LedgerRepo
+from app.db.repo.ledger_repo_snapshots import LEDGER_SNAPSHOT_SHARDS, ledger_snapshot_key
+
+NOW_UTC = datetime(2026, 2, 26, 12, 0, tzinfo=timezone.utc)
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.statements: list[object] = []
+
+    def add(self, entry) -> None:
+        self.calls.append("add")
+
+    def add_all(self, entries) -> None:
+        self.calls.append(f"add_all:{len(entries)}")
+
+    async def flush(self) -> None:
+        self.calls.append("flush")
+
+    async def execute(self, statement) -> SimpleNamespace:
+        self.calls.append("execute")
+        self.statements.append(statement)
+        return SimpleNamespace(scalar_one=lambda: 0)
+
+
+def _entry(user_id: int, *, amount: int, product_code: str | None, minutes: int = 0) -> LedgerEntry:
+    return LedgerEntry(
+        user_id=user_id,
+        entry_type="PURCHASE_CREDIT" if product_code else "ENERGY_DEBIT_QUIZ",
+        asset="PURCHASE" if product_code else "FREE_ENERGY",
+        direction="CREDIT" if product_code else "DEBIT",
+        amount=amount,
+        source="PURCHASE" if product_code else "QUIZ",
+        idempotency_key=f"k:{user_id}:{amount}:{minutes}",
+        metadata_={"product_code": product_code} if product_code else {},
+        created_at=NOW_UTC + timedelta(minutes=minutes),
+    )
+
+
+def _upsert_rows(statement) -> list[dict[str, object]]:
+    params = statement.compile(dialect=postgresql.dialect()).params
+    rows: dict[int, dict[str, object]] = {}
+    for name, value in params.items():
+        column, _, index = name.rpartition("_m")
+        if index.isdigit():
+            rows.setdefault(int(index), {})[column] = value
+    return [rows[index] for index in sorted(rows)]
+
+
+def test_snapshot_key_uses_product_code_and_user_shard() -> None:
+    assert ledger_snapshot_key(_entry(LEDGER_SNAPSHOT_SHARDS + 3, amount=5, product_code="P")) == (
+        "PURCHASE_CREDIT",
+        "PURCHASE",
+        "CREDIT",
+        "P",
+        3,
+    )
+    assert ledger_snapshot_key(_entry(7, amount=1, product_code=None))[3] == ""
+
+
+@pytest.mark.asyncio
+async def test_create_updates_snapshot_after_the_entry_is_flushed() -> None:
+    session = _Session()
+
+    await LedgerRepo.create(session, entry=_entry(1, amount=5, product_code="ENERGY_10"))  # type: ignore[arg-type]
+
+    assert session.calls == ["add", "flush", "execute"]
+    [row] = _upsert_rows(session.statements[0])
+    assert row["entries_count"] == 1
+    assert row["amount_total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_create_many_folds_entries_into_one_sorted_upsert() -> None:
+    session = _Session()
+    entries = [
+        _entry(LEDGER_SNAPSHOT_SHARDS + 2, amount=5, product_code="ENERGY_10"),
+        _entry(2, amount=5, product_code="ENERGY_10", minutes=3),
+        _entry(1, amount=10, product_code="ENERGY_10"),
+        _entry(2, amount=30, product_code="PREMIUM_MONTH", minutes=1),
+    ]
+
+    await LedgerRepo.create_many(session, entries=entries)  # type: ignore[arg-type]
+
+    assert session.calls == ["add_all:4", "flush", "execute"]
+    rows = _upsert_rows(session.statements[0])
+    assert [(row["product_code"], row["shard"]) for row in rows] == [
+        ("ENERGY_10", 1),
+        ("ENERGY_10", 2),
+        ("PREMIUM_MONTH", 2),
+    ]
+    assert [(row["entries_count"], row["amount_total"]) for row in rows] == [
+        (1, 10),
+        (2, 10),
+        (1, 30),
+    ]
+    assert {row["updated_at"] for row in rows} == {NOW_UTC + timedelta(minutes=3)}
+
+
+@pytest.mark.asyncio
+async def test_purchase_credit_totals_skip_direct_energy_credits() -> None:
+    session = _Session()
+
+    await LedgerRepo.count_distinct_purchase_credits(session)  # type: ignore[arg-type]
+    await LedgerRepo.sum_distinct_purchase_stars_for_credits(session)  # type: ignore[arg-type]
+
+    # EnergyService.credit_paid_energy writes PURCHASE_CREDIT/CREDIT with asset PAID_ENERGY.
+    for statement in session.statements:
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert {"PURCHASE_CREDIT", "PURCHASE", "CREDIT"} <= set(params.values())
@@ -56,7 +56,7 @@ async def test_redeem_applies_premium_grant_and_records_attempt(
     async def _fake_get_by_id(_session, _user_id):
         return SimpleNamespace(id=7)
 
-    async def _fake_enforce_rate_limit(_session, *, user_id: int, now_utc: datetime) -> None:
+    async def _fake_enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
         return None
 
     async def _fake_get_code_by_hash_for_update(_session, _code_hash):
@@ -163,7 +163,7 @@ async def test_redeem_rejects_misconfigured_percent_discount_code(
     async def _fake_get_by_id(_session, _user_id):
         return SimpleNamespace(id=7)
 
-    async def _fake_enforce_rate_limit(_session, *, user_id: int, now_utc: datetime) -> None:
+    async def _fake_enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
         return None
 
     async def _fake_get_code_by_hash_for_update(_session, _code_hash):
@@ -137,7 +137,7 @@ async def test_redeem_records_rate_limit_failure(monkeypatch: pytest.MonkeyPatch
     async def _fake_get_by_id(_session, _user_id):
         return SimpleNamespace(id=7)
 
-    async def _fake_enforce_rate_limit(_session, *, user_id: int, now_utc: datetime) -> None:
+    async def _fake_enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
         assert user_id == 7
         assert now_utc.tzinfo is UTC
         raise PromoRateLimitedError
@@ -202,7 +202,7 @@ async def test_redeem_rejects_empty_code_and_records_invalid(
     async def _fake_get_by_id(_session, _user_id):
         return SimpleNamespace(id=7)
 
-    async def _fake_enforce_rate_limit(_session, *, user_id: int, now_utc: datetime) -> None:
+    async def _fake_enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
         return None
 
     async def _fake_record_failed_attempt(**payload):
@@ -258,7 +258,7 @@ async def test_redeem_rejects_unknown_code_and_records_invalid(
     async def _fake_get_by_id(_session, _user_id):
         return SimpleNamespace(id=7)
 
-    async def _fake_enforce_rate_limit(_session, *, user_id: int, now_utc: datetime) -> None:
+    async def _fake_enforce_rate_limit(*, user_id: int, now_utc: datetime) -> None:
         return None
 
     async def _fake_record_failed_attempt(**payload):
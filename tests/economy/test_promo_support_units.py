@@ -8,7 +8,14 @@ import pytest
 
 import app.economy.promo.idempotency as promo_idempotency
 import app.economy.promo.redeem_validation as promo_validation
-from app.economy.promo.errors import PromoExpiredError, PromoInvalidError, PromoNotApplicableError
+from app.economy.promo.errors import (
+    PromoExpiredError,
+    PromoInvalidError,
+    PromoNotApplicableError,
+    PromoRateLimitedError,
+)
+from app.economy.promo.rate_limit import enforce_rate_limit, note_failed_attempt
+from app.services import rate_limiter
 
 UTC = timezone.utc
 
@@ -216,3 +223,43 @@ async def test_ensure_purchase_eligibility_rejects_first_purchase_only_after_pur
         )
 
     assert failed_attempts[0]["metadata"] == {"reason": "FIRST_PURCHASE_ONLY"}
+
+
+@pytest.fixture
+def memory_rate_limiter(monkeypatch: pytest.MonkeyPatch):
+    async def _no_redis() -> None:
+        return None
+
+    monkeypatch.setattr(rate_limiter, "_get_redis_client", _no_redis)
+    rate_limiter._MEMORY_HITS.clear()
+    yield
+    rate_limiter._MEMORY_HITS.clear()
+
+
+@pytest.mark.asyncio
+async def test_enforce_rate_limit_blocks_for_an_hour_after_max_failures(
+    memory_rate_limiter,
+) -> None:
+    started_at = datetime(2026, 2, 20, 12, 0, tzinfo=UTC)
+    for minute in range(5):
+        await note_failed_attempt(
+            user_id=7, result="INVALID", now_utc=started_at + timedelta(minutes=minute)
+        )
+    await note_failed_attempt(user_id=8, result="INVALID", now_utc=started_at)
+
+    with pytest.raises(PromoRateLimitedError):
+        await enforce_rate_limit(user_id=7, now_utc=started_at + timedelta(minutes=30))
+    await enforce_rate_limit(user_id=8, now_utc=started_at + timedelta(minutes=30))
+    await enforce_rate_limit(user_id=7, now_utc=started_at + timedelta(hours=2))
+
+
+@pytest.mark.asyncio
+async def test_enforce_rate_limit_extends_block_on_rate_limited_attempt(
+    memory_rate_limiter,
+) -> None:
+    now_utc = datetime(2026, 2, 20, 12, 0, tzinfo=UTC)
+    await note_failed_attempt(user_id=7, result="RATE_LIMITED", now_utc=now_utc)
+
+    with pytest.raises(PromoRateLimitedError):
+        await enforce_rate_limit(user_id=7, now_utc=now_utc + timedelta(minutes=59))
+    await enforce_rate_limit(user_id=7, now_utc=now_utc + timedelta(minutes=61))
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+import app.economy.purchases.service.credit_assets_batch as credit_assets_batch
+from app.economy.purchases.errors import PurchasePrecheckoutValidationError
+from app.economy.purchases.recovery import MAX_CREDIT_RECOVERY_ATTEMPTS, RECOVERY_FAILURES_KEY
+from app.economy.purchases.service.recover import recover_claimed_purchases
+
+UTC = timezone.utc
+NOW_UTC = datetime(2026, 2, 26, 12, 0, tzinfo=UTC)
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.added: list[object] = []
+        self.flushes = 0
+        self.refreshed: list[object] = []
+        self.savepoints = 0
+        self.statements: list[object] = []
+
+    def add_all(self, rows) -> None:
+        self.added.extend(rows)
+
+    async def flush(self) -> None:
+        self.flushes += 1
+
+    async def execute(self, statement) -> None:
+        self.statements.append(statement)
+
+    async def refresh(self, obj) -> None:
+        self.refreshed.append(obj)
+
+    @asynccontextmanager
+    async def _nested(self):
+        self.savepoints += 1
+        yield
+
+    def begin_nested(self):
+        return self._nested()
+
+
+def _purchase(
+    *,
+    user_id: int,
+    product_code: str = "ENERGY_10",
+    charge_id: str | None = "charge",
+    raw: object = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=user_id,
+        product_code=product_code,
+        product_type="MICRO",
+        status="PAID_UNCREDITED",
+        stars_amount=5,
+        discount_stars_amount=0,
+        applied_promo_code_id=None,
+        telegram_payment_charge_id=charge_id,
+        raw_successful_payment={"invoice_payload": "inv"} if raw is None else raw,
+        credited_at=None,
+    )
+
+
+@pytest.fixture
+def credit_calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    calls: dict[str, list] = {"energy": [], "items": [], "events": []}
+
+    async def _credit_paid_energy(_session, **kwargs):
+        calls["energy"].append((kwargs["user_id"], kwargs["amount"]))
+
+    async def _credit_item_assets(_session, *, purchase, **_kwargs):
+        calls["items"].append(purchase.product_code)
+        if purchase.applied_promo_code_id is not None:
+            raise PurchasePrecheckoutValidationError
+        if purchase.product_code == "STREAK_SAVER_20":
+            raise RuntimeError("streak state row vanished")
+
+    async def _emit_analytics_events(_session, **kwargs):
+        calls["events"].append(kwargs)
+        return len(kwargs["payloads"])
+
+    monkeypatch.setattr(
+        credit_assets_batch.EnergyService, "credit_paid_energy", _credit_paid_energy
+    )
+    monkeypatch.setattr(credit_assets_batch, "_credit_item_assets", _credit_item_assets)
+    monkeypatch.setattr(credit_assets_batch, "emit_analytics_events", _emit_analytics_events)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batch_credits_energy_once_per_user_and_writes_bulk_ledger(credit_calls) -> None:
+    session = _Session()
+    purchases = [_purchase(user_id=user_id) for user_id in (9, 3, 9, 3, 9)]
+
+    outcomes = await recover_claimed_purchases(
+        session, purchases=purchases, now_utc=NOW_UTC  # type: ignore[arg-type]
+    )
+
+    assert [item.outcome for item in outcomes] == ["credited"] * 5
+    assert [item.purchase_id for item in outcomes] == [purchase.id for purchase in purchases]
+    assert credit_calls["energy"] == [(3, 20), (9, 30)]
+    assert credit_calls["items"] == []
+    assert session.savepoints == 0
+    assert {entry.purchase_id for entry in session.added} == {p.id for p in purchases}
+    [snapshot_upsert] = session.statements
+    assert snapshot_upsert.table.name == "ledger_balance_snapshots"
+    assert all(purchase.status == "CREDITED" for purchase in purchases)
+    [event_call] = credit_calls["events"]
+    assert event_call["event_type"] == "purchase_credited"
+    assert event_call["user_ids"] == [9, 3, 9, 3, 9]
+    assert [payload["status"] for payload in event_call["payloads"]] == ["CREDITED"] * 5
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_review_and_retryable_outcomes_per_item(credit_calls) -> None:
+    session = _Session()
+    no_charge = _purchase(user_id=1, charge_id=None)
+    bad_payload = _purchase(user_id=1, raw="not-a-dict")
+    unknown = _purchase(user_id=2, product_code="UNKNOWN")
+    exhausted = _purchase(
+        user_id=2,
+        product_code="UNKNOWN",
+        raw={RECOVERY_FAILURES_KEY: MAX_CREDIT_RECOVERY_ATTEMPTS - 1},
+    )
+    broken_promo = _purchase(user_id=3)
+    broken_promo.applied_promo_code_id = 11
+    premium = _purchase(user_id=4, product_code="PREMIUM_MONTH")
+    energy = _purchase(user_id=3)
+
+    outcomes = await recover_claimed_purchases(
+        session,  # type: ignore[arg-type]
+        purchases=[no_charge, bad_payload, unknown, exhausted, broken_promo, premium, energy],
+        now_utc=NOW_UTC,
+    )
+
+    assert [item.outcome for item in outcomes] == [
+        "review",
+        "review",
+        "retryable_failure",
+        "review",
+        "retryable_failure",
+        "credited",
+        "credited",
+    ]
+    assert no_charge.status == bad_payload.status == exhausted.status
+    assert exhausted.status == "FAILED_CREDIT_PENDING_REVIEW"
+    assert unknown.raw_successful_payment[RECOVERY_FAILURES_KEY] == 1
+    assert broken_promo.status == "PAID_UNCREDITED"
+    assert broken_promo.raw_successful_payment[RECOVERY_FAILURES_KEY] == 1
+    assert session.refreshed == [broken_promo]
+    assert session.savepoints == 2
+    assert credit_calls["items"] == ["ENERGY_10", "PREMIUM_MONTH"]
+    assert credit_calls["energy"] == [(3, 10)]
+    assert {entry.purchase_id for entry in session.added} == {premium.id, energy.id}
+
+
+@pytest.mark.asyncio
+async def test_unexpected_item_failure_only_fails_that_purchase(credit_calls) -> None:
+    session = _Session()
+    broken = _purchase(user_id=5, product_code="STREAK_SAVER_20")
+    energy = _purchase(user_id=6)
+
+    outcomes = await recover_claimed_purchases(
+        session, purchases=[broken, energy], now_utc=NOW_UTC  # type: ignore[arg-type]
+    )
+
+    assert [item.outcome for item in outcomes] == ["retryable_failure", "credited"]
+    assert broken.status == "PAID_UNCREDITED"
+    assert broken.raw_successful_payment[RECOVERY_FAILURES_KEY] == 1
+    assert session.refreshed == [broken]
+    assert energy.status == "CREDITED"
+    assert {entry.purchase_id for entry in session.added} == {energy.id}
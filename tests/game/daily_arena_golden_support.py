@@ -14,7 +14,7 @@ from app.db.models.tournaments import Tournament
 from app.db.repo.tournament_participants_repo import TournamentParticipantsRepo
 from app.db.repo.tournaments_repo import TournamentsRepo
 from app.db.session import SessionLocal, engine
-from app.game.tournaments import daily_cup_user_status
+from app.game.tournaments import daily_cup_status_cache, daily_cup_user_status
 from app.game.tournaments.constants import (
     TOURNAMENT_FORMAT_QUICK_5,
     TOURNAMENT_STATUS_COMPLETED,
@@ -202,7 +202,13 @@ def close_coroutine_and_raise(coroutine: Coroutine[Any, Any, Any], exc: Exceptio
     raise exc
 
 
+async def _no_redis_client() -> None:
+    return None
+
+
 def patch_status_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+    monkeypatch.setattr(daily_cup_status_cache, "get_redis_client", _no_redis_client)
     monkeypatch.setattr(
         daily_cup_user_status,
         "_invite_open_at_utc",
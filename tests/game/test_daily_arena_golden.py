@@ -5,7 +5,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from app.game.tournaments import daily_cup_user_status
+from app.game.tournaments import daily_cup_status_build, daily_cup_user_status
 from app.game.tournaments.constants import DAILY_CUP_TOURNAMENT_TYPES, TOURNAMENT_TYPE_DAILY_ARENA
 from app.game.tournaments.daily_cup_user_status import DailyCupUserStatus
 from app.workers.celery_app import celery_app
@@ -94,17 +94,17 @@ async def test_daily_arena_status_returns_round_active_for_pending_match(
     tournament = status_tournament(status="ROUND_1", current_round=1)
 
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(tournament),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentParticipantsRepo,
+        daily_cup_status_build.TournamentParticipantsRepo,
         "list_for_tournament",
         async_return([SimpleNamespace(user_id=101)]),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentMatchesRepo,
+        daily_cup_status_build.TournamentMatchesRepo,
         "list_by_tournament_round",
         async_return([SimpleNamespace(user_a=101, user_b=202, status="PENDING")]),
     )
@@ -126,7 +126,7 @@ async def test_daily_arena_status_returns_no_tournament_when_row_not_found(
     # GOLDEN: фіксує поточну поведінку, не змінювати без рев'ю
     patch_status_window(monkeypatch)
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(None),
     )
@@ -159,12 +159,12 @@ async def test_daily_arena_status_registration_variants(
     patch_status_window(monkeypatch)
 
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(status_tournament(status="REGISTRATION")),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentParticipantsRepo,
+        daily_cup_status_build.TournamentParticipantsRepo,
         "list_for_tournament",
         async_return([SimpleNamespace(user_id=user_id) for user_id in participant_ids]),
     )
@@ -5,7 +5,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from app.game.tournaments import daily_cup_user_status
+from app.game.tournaments import daily_cup_status_build, daily_cup_user_status
 from app.game.tournaments.constants import (
     TOURNAMENT_STATUS_COMPLETED,
     TOURNAMENT_STATUS_REGISTRATION,
@@ -54,7 +54,7 @@ def test_daily_arena_status_time_helpers_keep_current_parsing_rules(
     # GOLDEN: фіксує поточну поведінку, не змінювати без рев'ю
     monkeypatch.setattr(daily_cup_user_status.settings, "daily_cup_timezone", "Europe/Berlin")
     monkeypatch.setattr(
-        daily_cup_user_status,
+        daily_cup_status_build,
         "DAILY_CUP_TOURNAMENT_TYPE",
         TOURNAMENT_TYPE_DAILY_ARENA,
     )
@@ -98,7 +98,7 @@ async def test_daily_arena_status_returns_no_tournament_before_invite_window(
         pytest.fail("unexpected tournament lookup before invite window")
 
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         _unexpected_lookup,
     )
@@ -120,15 +120,18 @@ async def test_daily_arena_status_returns_not_participant_for_active_round(
     # GOLDEN: фіксує поточну поведінку, не змінювати без рев'ю
     patch_status_window(monkeypatch)
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(_arena_tournament(status="ROUND_2", current_round=2)),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentParticipantsRepo,
+        daily_cup_status_build.TournamentParticipantsRepo,
         "list_for_tournament",
         async_return([SimpleNamespace(user_id=202)]),
     )
+    monkeypatch.setattr(
+        daily_cup_status_build.TournamentMatchesRepo, "list_by_tournament_round", async_return([])
+    )
 
     snapshot = await daily_cup_user_status.get_daily_cup_status_for_user(
         SimpleNamespace(),
@@ -146,17 +149,17 @@ async def test_daily_arena_status_returns_round_waiting_without_pending_match(
     # GOLDEN: фіксує поточну поведінку, не змінювати без рев'ю
     patch_status_window(monkeypatch)
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(_arena_tournament(status="ROUND_2", current_round=2)),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentParticipantsRepo,
+        daily_cup_status_build.TournamentParticipantsRepo,
         "list_for_tournament",
         async_return([SimpleNamespace(user_id=101)]),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentMatchesRepo,
+        daily_cup_status_build.TournamentMatchesRepo,
         "list_by_tournament_round",
         async_return([SimpleNamespace(user_a=101, user_b=202, status="COMPLETED")]),
     )
@@ -191,12 +194,12 @@ async def test_daily_arena_status_completed_and_fallback_snapshots(
     patch_status_window(monkeypatch)
     tournament = _arena_tournament(status=tournament_status, current_round=3)
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentsRepo,
+        daily_cup_status_build.TournamentsRepo,
         "get_by_type_and_registration_deadline",
         async_return(tournament),
     )
     monkeypatch.setattr(
-        daily_cup_user_status.TournamentParticipantsRepo,
+        daily_cup_status_build.TournamentParticipantsRepo,
         "list_for_tournament",
         async_return([SimpleNamespace(user_id=user_id) for user_id in participant_ids]),
     )
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
+
+from app.core import redis_loop_client
+from app.db.models.tournament_participants import TournamentParticipant
+from app.game.tournaments import daily_cup_status_cache, daily_cup_status_redis
+from app.game.tournaments.daily_cup_status_snapshot import (
+    DailyCupStatusSnapshot,
+    DailyCupTournamentRef,
+)
+from app.workers.asyncio_runner import run_async_job
+
+CLOSE_AT_UTC = datetime(2026, 3, 1, 17, 0, tzinfo=UTC)
+TOURNAMENT_ID = UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa")
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    async def mget(self, *keys: str) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, *, ex: int) -> None:
+        self.values[key] = value
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = str(int(self.values.get(key, "0")) + 1)
+        return int(self.values[key])
+
+
+def _snapshot(*participants: int) -> DailyCupStatusSnapshot:
+    return DailyCupStatusSnapshot(
+        tournament=DailyCupTournamentRef(
+            id=TOURNAMENT_ID,
+            type="DAILY_ARENA",
+            status="ROUND_1",
+            current_round=1,
+            registration_deadline=CLOSE_AT_UTC,
+        ),
+        participant_user_ids=frozenset(participants),
+        pending_match_user_ids=frozenset(participants[:1]),
+    )
+
+
+class _CountingBuild:
+    def __init__(self, snapshot: DailyCupStatusSnapshot) -> None:
+        self.calls = 0
+        self.snapshot = snapshot
+
+    async def __call__(self) -> DailyCupStatusSnapshot:
+        self.calls += 1
+        return self.snapshot
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> Iterator[_FakeRedis]:
+    client = _FakeRedis()
+
+    async def _client() -> _FakeRedis:
+        return client
+
+    monkeypatch.setattr(daily_cup_status_cache, "get_redis_client", _client)
+    monkeypatch.setattr(daily_cup_status_redis, "get_redis_client", _client)
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+    yield client
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+
+
+def test_snapshot_payload_round_trip() -> None:
+    snapshot = _snapshot(101, 202)
+
+    restored = DailyCupStatusSnapshot.from_payload(snapshot.to_payload())
+
+    assert restored == snapshot
+    assert DailyCupStatusSnapshot.from_payload(
+        DailyCupStatusSnapshot(tournament=None).to_payload()
+    ) == DailyCupStatusSnapshot(tournament=None)
+
+
+@pytest.mark.asyncio
+async def test_repeated_lookups_are_served_from_process_cache(fake_redis: _FakeRedis) -> None:
+    build = _CountingBuild(_snapshot(101))
+
+    for _ in range(50):
+        snapshot = await daily_cup_status_cache.load_daily_cup_status_snapshot(
+            close_at_utc=CLOSE_AT_UTC, build=build
+        )
+
+    assert build.calls == 1
+    assert 101 in snapshot.participant_user_ids
+
+
+@pytest.mark.asyncio
+async def test_other_process_reuses_redis_snapshot_until_generation_bumps(
+    fake_redis: _FakeRedis,
+) -> None:
+    first_build = _CountingBuild(_snapshot(101))
+    await daily_cup_status_cache.load_daily_cup_status_snapshot(
+        close_at_utc=CLOSE_AT_UTC, build=first_build
+    )
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+
+    second_build = _CountingBuild(_snapshot(101, 202))
+    shared = await daily_cup_status_cache.load_daily_cup_status_snapshot(
+        close_at_utc=CLOSE_AT_UTC, build=second_build
+    )
+    assert second_build.calls == 0
+    assert shared.participant_user_ids == frozenset({101})
+
+    await fake_redis.incr(daily_cup_status_redis.GENERATION_KEY)
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+    rebuilt = await daily_cup_status_cache.load_daily_cup_status_snapshot(
+        close_at_utc=CLOSE_AT_UTC, build=second_build
+    )
+    assert second_build.calls == 1
+    assert rebuilt.participant_user_ids == frozenset({101, 202})
+    assert rebuilt.generation == 1
+
+
+@pytest.mark.asyncio
+async def test_async_commit_awaits_generation_bump_before_returning(
+    fake_redis: _FakeRedis,
+) -> None:
+    session = Session()
+    session.add(TournamentParticipant(tournament_id=TOURNAMENT_ID, user_id=202))
+    session.dispatch.before_flush(session, None, None)
+
+    # AsyncSession runs commit hooks through greenlet_spawn; no task is left behind.
+    await greenlet_spawn(session.dispatch.after_commit, session)
+
+    assert fake_redis.values[daily_cup_status_redis.GENERATION_KEY] == "1"
+
+
+def test_celery_job_closes_its_client_when_the_loop_ends(monkeypatch: pytest.MonkeyPatch) -> None:
+    clients: list[_FakeRedis] = []
+
+    def _from_url(url: str, **kwargs: object) -> _FakeRedis:
+        clients.append(_FakeRedis())
+        return clients[-1]
+
+    async def _job() -> DailyCupStatusSnapshot:
+        return await daily_cup_status_cache.load_daily_cup_status_snapshot(
+            close_at_utc=CLOSE_AT_UTC, build=_CountingBuild(_snapshot(101))
+        )
+
+    monkeypatch.setattr(redis_loop_client.redis, "from_url", _from_url)
+    monkeypatch.setattr(redis_loop_client, "_redis_retry_at", 0.0)
+    daily_cup_status_cache.clear_daily_cup_status_cache()
+
+    for _ in range(2):
+        run_async_job(_job())
+        daily_cup_status_cache.clear_daily_cup_status_cache()
+
+    assert len(clients) == 2
+    assert all(client.closed for client in clients)
+    assert not redis_loop_client._CLIENTS
+
+
+def test_commit_with_tournament_writes_drops_process_cache() -> None:
+    daily_cup_status_cache._LOCAL_CACHE["k"] = daily_cup_status_cache._LocalEntry(
+        checked_at_mono=0.0, snapshot=_snapshot(101)
+    )
+    session = Session()
+    session.add(TournamentParticipant(tournament_id=TOURNAMENT_ID, user_id=202))
+
+    session.dispatch.before_flush(session, None, None)
+    session.dispatch.after_commit(session)
+
+    assert daily_cup_status_cache._LOCAL_CACHE == {}
+    assert daily_cup_status_cache.STALE_INFO_KEY not in session.info
+
+
+def test_commit_without_tournament_writes_keeps_process_cache() -> None:
+    daily_cup_status_cache._LOCAL_CACHE["k"] = daily_cup_status_cache._LocalEntry(
+        checked_at_mono=0.0, snapshot=_snapshot(101)
+    )
+    session = Session()
+
+    session.dispatch.after_commit(session)
+
+    assert "k" in daily_cup_status_cache._LOCAL_CACHE
+    daily_cup_status_cache.clear_daily_cup_status_cache()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from app.game.questions.runtime_bank_filters import pick_from_pool
+from app.game.questions.runtime_bank_seed import stable_index
+from app.game.questions.runtime_bank_selection import SelectionPool
+
+POOL_IDS = tuple(f"q_{index:03d}" for index in range(40))
+
+
+def _legacy_pick(pool_ids: tuple[str, ...], *, excluded: list[str], seed: str) -> str | None:
+    if not excluded:
+        return pool_ids[stable_index(seed, len(pool_ids))]
+    start = stable_index(seed, len(pool_ids))
+    for offset in range(len(pool_ids)):
+        candidate = pool_ids[(start + offset) % len(pool_ids)]
+        if candidate not in excluded:
+            return candidate
+    return None
+
+
+def _use_legacy_seed_mode(monkeypatch: pytest.MonkeyPatch, enabled: bool) -> None:
+    monkeypatch.setattr(
+        "app.game.questions.runtime_bank_seed.get_settings",
+        lambda: SimpleNamespace(quiz_selection_legacy_seed_mode=enabled),
+    )
+
+
+def test_pick_never_returns_excluded_and_covers_remaining_ids_evenly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _use_legacy_seed_mode(monkeypatch, False)
+    pool = SelectionPool(POOL_IDS)
+    # A contiguous excluded run is where linear probing piles picks onto one neighbour.
+    excluded = list(POOL_IDS[10:30])
+
+    picks = Counter(
+        pool.pick(exclude_question_ids=excluded, selection_seed=f"seed-{index}")
+        for index in range(4_000)
+    )
+
+    assert set(picks) == set(POOL_IDS) - set(excluded)
+    assert max(picks.values()) < 2.5 * min(picks.values())
+
+
+@pytest.mark.parametrize(
+    ("pool_ids", "excluded"),
+    [
+        (("a", "b", "c", "d"), ["a", "c"]),
+        # Heavy exclusion sends most picks through the rank fallback.
+        (tuple("abcdefghij"), list("abcdefg")),
+    ],
+)
+def test_pick_is_uniform_on_small_pools_with_heavy_exclusion(
+    monkeypatch: pytest.MonkeyPatch, pool_ids: tuple[str, ...], excluded: list[str]
+) -> None:
+    _use_legacy_seed_mode(monkeypatch, False)
+    pool = SelectionPool(pool_ids)
+    draws = 30_000
+
+    picks = Counter(
+        pool.pick(exclude_question_ids=excluded, selection_seed=f"seed-{index}")
+        for index in range(draws)
+    )
+
+    remaining = set(pool_ids) - set(excluded)
+    assert set(picks) == remaining
+    expected_share = 1 / len(remaining)
+    for count in picks.values():
+        assert abs(count / draws - expected_share) < 0.02
+
+
+def test_pick_ignores_exclusions_outside_pool_and_exhausts_to_none(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _use_legacy_seed_mode(monkeypatch, False)
+    pool = SelectionPool(POOL_IDS[:3])
+
+    assert pool.pick(exclude_question_ids=["x", "y", "z", "q_000"], selection_seed="s") in {
+        "q_001",
+        "q_002",
+    }
+    assert pool.pick(exclude_question_ids=POOL_IDS[:3], selection_seed="s") is None
+    assert SelectionPool(()).pick(exclude_question_ids=(), selection_seed="s") is None
+
+
+def test_pick_is_seed_deterministic_for_sequences_and_pools(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _use_legacy_seed_mode(monkeypatch, False)
+    excluded = ["q_005", "q_006"]
+
+    from_sequence = pick_from_pool(
+        list(POOL_IDS), exclude_question_ids=excluded, selection_seed="d"
+    )
+    from_pool = pick_from_pool(
+        SelectionPool(POOL_IDS), exclude_question_ids=excluded, selection_seed="d"
+    )
+
+    assert from_sequence == from_pool
+
+
+def test_legacy_seed_mode_reproduces_previous_picks(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_legacy_seed_mode(monkeypatch, True)
+    pool = SelectionPool(POOL_IDS)
+
+    for index in range(200):
+        excluded = list(POOL_IDS[index % 7 : index % 7 + index % 5])
+        seed = f"duel:legacy:{index}"
+        assert pool.pick(exclude_question_ids=excluded, selection_seed=seed) == _legacy_pick(
+            POOL_IDS, excluded=excluded, seed=seed
+        )
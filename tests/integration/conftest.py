@@ -5,9 +5,11 @@ from sqlalchemy import text
 
 from app.core.integration_db_safety import assert_safe_integration_db
 from app.db.session import engine
+from app.services.rate_limiter import reset_rate_limits
 
 TRUNCATE_TABLES = (
     "daily_metrics",
+    "dashboard_snapshots",
     "promo_audit_log",
     "admins",
     "promo_attempts",
@@ -17,10 +19,13 @@ TRUNCATE_TABLES = (
     "offers_impressions",
     "quiz_attempts",
     "daily_push_logs",
+    "daily_push_shards",
+    "daily_push_targets",
     "daily_question_sets",
     "daily_runs",
     "quiz_questions",
     "quiz_sessions",
+    "friend_challenge_questions",
     "friend_challenges",
     "tournament_round_scores",
     "tournament_matches",
@@ -28,6 +33,7 @@ TRUNCATE_TABLES = (
     "tournaments",
     "mode_progress",
     "entitlements",
+    "ledger_balance_snapshots",
     "ledger_entries",
     "purchases",
     "processed_updates",
@@ -81,6 +87,8 @@ async def cleanup_db() -> None:
     if truncate_sql is not None:
         async with engine.begin() as conn:
             await conn.execute(text(truncate_sql))
+    # Ids restart after TRUNCATE, so limiter buckets keyed by user id must not leak across tests.
+    await reset_rate_limits()
 
     yield
 
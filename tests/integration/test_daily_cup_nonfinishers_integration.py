@@ -83,7 +83,6 @@ async def _create_completed_daily_cup_with_nonfinisher(
                     challenge_type="DIRECT",
                     mode_code="QUICK_MIX_A1A2",
                     access_type="FREE",
-                    question_ids=[],
                     tournament_match_id=None,
                     status="ACCEPTED",
                     current_round=1,
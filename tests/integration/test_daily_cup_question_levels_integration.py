@@ -7,7 +7,7 @@ import pytest
 
 from app.db.models.quiz_questions import QuizQuestion
 from app.db.models.tournaments import Tournament
-from app.db.repo.friend_challenges_repo import FriendChallengesRepo
+from app.db.repo.friend_challenge_questions_repo import FriendChallengeQuestionsRepo
 from app.db.repo.quiz_questions_repo import QuizQuestionsRepo
 from app.db.repo.tournament_matches_repo import TournamentMatchesRepo
 from app.db.repo.tournament_participants_repo import TournamentParticipantsRepo
@@ -106,10 +106,12 @@ async def _assert_round_question_levels(
         assert len(matches) == 3
         for match in matches:
             assert match.friend_challenge_id is not None
-            challenge = await FriendChallengesRepo.get_by_id(session, match.friend_challenge_id)
-            assert challenge is not None
-            assert challenge.question_ids is not None
-            ordered_question_ids = [str(question_id) for question_id in challenge.question_ids]
+            ordered_question_ids = list(
+                await FriendChallengeQuestionsRepo.list_question_ids(
+                    session, challenge_id=match.friend_challenge_id
+                )
+            )
+            assert ordered_question_ids
             question_rows = await QuizQuestionsRepo.list_by_ids(
                 session,
                 question_ids=ordered_question_ids,
@@ -7,10 +7,11 @@ import pytest
 from sqlalchemy import func, select
 
 from app.db.models.daily_push_logs import DailyPushLog
+from app.db.models.daily_push_shards import DailyPushShard
 from app.db.models.daily_runs import DailyRun
 from app.db.repo.users_repo import UsersRepo
 from app.db.session import SessionLocal
-from app.workers.tasks import daily_challenge_async
+from app.workers.tasks import daily_challenge_async, daily_push_async
 from tests.integration.stable_ids import stable_telegram_user_id
 
 
@@ -76,7 +77,7 @@ async def test_daily_push_worker_is_idempotent_for_same_day(monkeypatch) -> None
     await _create_user("daily-push-idempotent")
 
     bot = _DummyBot()
-    monkeypatch.setattr(daily_challenge_async, "build_bot", lambda: bot)
+    monkeypatch.setattr(daily_push_async, "build_bot", lambda: bot)
     monkeypatch.setattr(daily_challenge_async, "datetime", _FrozenDateTime)
 
     first = await daily_challenge_async.run_daily_push_notifications_async(batch_size=100)
@@ -96,7 +97,7 @@ async def test_daily_push_worker_sends_evening_reminder_after_morning_push(monke
     await _create_user("daily-push-evening-reminder")
 
     bot = _DummyBot()
-    monkeypatch.setattr(daily_challenge_async, "build_bot", lambda: bot)
+    monkeypatch.setattr(daily_push_async, "build_bot", lambda: bot)
     monkeypatch.setattr(daily_challenge_async, "datetime", _FrozenDateTime)
 
     first = await daily_challenge_async.run_daily_push_notifications_async(batch_size=100)
@@ -130,7 +131,7 @@ async def test_evening_reminder_targets_incomplete_daily_runs(monkeypatch) -> No
     await _create_daily_run(user_id=completed_user_id, berlin_date=berlin_date, status="COMPLETED")
 
     bot = _DummyBot()
-    monkeypatch.setattr(daily_challenge_async, "build_bot", lambda: bot)
+    monkeypatch.setattr(daily_push_async, "build_bot", lambda: bot)
     monkeypatch.setattr(daily_challenge_async, "datetime", _FrozenDateTime)
 
     result = await daily_challenge_async.run_daily_push_notifications_async(
@@ -141,3 +142,61 @@ async def test_evening_reminder_targets_incomplete_daily_runs(monkeypatch) -> No
     assert result["push_kind"] == "EVENING_REMINDER"
     assert int(result["sent_total"]) == 2
     assert len(bot.sent_messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_daily_push_dispatches_user_id_range_shards(monkeypatch) -> None:
+    for index in range(5):
+        await _create_user(f"daily-push-shard-{index}")
+
+    bot = _DummyBot()
+    dispatched: list[dict[str, object]] = []
+    monkeypatch.setattr(daily_push_async, "build_bot", lambda: bot)
+    monkeypatch.setattr(daily_challenge_async, "datetime", _FrozenDateTime)
+
+    result = await daily_challenge_async.run_daily_push_notifications_async(
+        batch_size=2,
+        shard_count=2,
+        dispatch_shard=lambda **kwargs: dispatched.append(kwargs),
+    )
+
+    assert result["targets_total"] == 5
+    assert [item["shard_index"] for item in dispatched] == [0, 1]
+    assert bot.sent_messages == []
+
+    shard_results = [
+        await daily_push_async.run_daily_push_shard_async(**kwargs)  # type: ignore[arg-type]
+        for kwargs in dispatched
+    ]
+    assert sum(int(item["sent_total"]) for item in shard_results) == 5  # type: ignore[call-overload]
+    assert len({chat_id for chat_id, _ in bot.sent_messages}) == 5
+
+    async with SessionLocal.begin() as session:
+        shards = (await session.execute(select(DailyPushShard))).scalars().all()
+        logged = await session.scalar(select(func.count(DailyPushLog.user_id)))
+    assert all(shard.completed_at is not None for shard in shards)
+    assert int(logged or 0) == 5
+
+
+@pytest.mark.asyncio
+async def test_daily_push_shard_resumes_from_persisted_cursor(monkeypatch) -> None:
+    user_ids = [await _create_user(f"daily-push-resume-{index}") for index in range(3)]
+
+    bot = _DummyBot()
+    dispatched: list[dict[str, object]] = []
+    monkeypatch.setattr(daily_push_async, "build_bot", lambda: bot)
+    monkeypatch.setattr(daily_challenge_async, "datetime", _FrozenDateTime)
+    await daily_challenge_async.run_daily_push_notifications_async(
+        shard_count=1,
+        dispatch_shard=lambda **kwargs: dispatched.append(kwargs),
+    )
+
+    async with SessionLocal.begin() as session:
+        shard = (await session.execute(select(DailyPushShard))).scalar_one()
+        shard.last_user_id = sorted(user_ids)[0]
+
+    result = await daily_push_async.run_daily_push_shard_async(**dispatched[0])  # type: ignore[arg-type]
+
+    assert result["users_scanned_total"] == 2
+    assert result["sent_total"] == 2
+    assert len(bot.sent_messages) == 2
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from app.db.repo.friend_challenge_questions_repo import FriendChallengeQuestionsRepo
+from app.db.session import SessionLocal, engine
+from app.game.sessions.service import GameSessionService
+from tests.integration.friend_challenge_fixtures import (
+    UTC,
+    _create_user,
+    _seed_friend_challenge_questions,
+)
+
+SEEDED_CHALLENGES = 2_000
+SEEDED_ROUNDS = 12
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "c9d0e1f2a3b4_m48_friend_challenge_questions.py"
+)
+
+
+def _migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("m48_friend_challenge_questions", _MIGRATION_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_migration_step(connection: Connection, step: str) -> None:
+    with Operations.context(MigrationContext.configure(connection)):
+        getattr(_migration(), step)()
+
+
+async def _seed_challenges(*, creator_user_id: int, now_utc: datetime) -> None:
+    async with SessionLocal.begin() as session:
+        await session.execute(
+            text(
+                """
+                INSERT INTO friend_challenges (
+                    id, invite_token, creator_user_id, opponent_user_id, challenge_type,
+                    mode_code, access_type, tournament_match_id, status, current_round,
+                    total_rounds, series_id, series_game_number, series_best_of, creator_score,
+                    opponent_score, creator_answered_round, opponent_answered_round,
+                    winner_user_id, creator_finished_at, opponent_finished_at,
+                    creator_push_count, opponent_push_count, creator_proof_card_file_id,
+                    opponent_proof_card_file_id, expires_at, expires_last_chance_notified_at,
+                    created_at, updated_at, completed_at
+                )
+                SELECT
+                    gen_random_uuid(), md5(n::text), :creator_user_id, NULL, 'DIRECT',
+                    'QUICK_MIX_A1A2', 'FREE', NULL, 'PENDING', 1,
+                    :rounds, NULL, 1, 1, 0,
+                    0, 0, 0,
+                    NULL, NULL, NULL,
+                    0, 0, NULL,
+                    NULL, :now_utc, NULL,
+                    :now_utc, :now_utc, NULL
+                FROM generate_series(1, :challenges) AS n
+                """
+            ),
+            {
+                "creator_user_id": creator_user_id,
+                "rounds": SEEDED_ROUNDS,
+                "challenges": SEEDED_CHALLENGES,
+                "now_utc": now_utc,
+            },
+        )
+        await session.execute(
+            text(
+                """
+                INSERT INTO friend_challenge_questions (challenge_id, round_no, question_id)
+                SELECT fc.id, round_no, 'fcq_' || lpad((abs(hashtext(fc.id::text || round_no))
+                    % 100000)::text, 6, '0')
+                FROM friend_challenges AS fc
+                CROSS JOIN generate_series(1, :rounds) AS round_no
+                """
+            ),
+            {"rounds": SEEDED_ROUNDS},
+        )
+
+
+@pytest.mark.asyncio
+async def test_round_lookup_reads_planned_question_with_its_bank_row() -> None:
+    now_utc = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    await _seed_friend_challenge_questions(now_utc)
+    creator_user_id = await _create_user("fc_questions_creator")
+    opponent_user_id = await _create_user("fc_questions_opponent")
+
+    async with SessionLocal.begin() as session:
+        challenge = await GameSessionService.create_friend_challenge(
+            session,
+            creator_user_id=creator_user_id,
+            mode_code="QUICK_MIX_A1A2",
+            now_utc=now_utc,
+        )
+        await GameSessionService.join_friend_challenge_by_token(
+            session,
+            user_id=opponent_user_id,
+            invite_token=challenge.invite_token,
+            now_utc=now_utc,
+        )
+
+    async with SessionLocal.begin() as session:
+        plan = await FriendChallengeQuestionsRepo.list_question_ids(
+            session, challenge_id=challenge.challenge_id
+        )
+        planned = await FriendChallengeQuestionsRepo.get_round_question(
+            session, challenge_id=challenge.challenge_id, round_no=3
+        )
+        missing = await FriendChallengeQuestionsRepo.get_round_question(
+            session, challenge_id=challenge.challenge_id, round_no=len(plan) + 1
+        )
+        first_round = await GameSessionService.start_friend_challenge_round(
+            session,
+            user_id=creator_user_id,
+            challenge_id=challenge.challenge_id,
+            idempotency_key="fc:questions:round:1:creator:start",
+            now_utc=now_utc,
+        )
+
+    assert plan == challenge.question_ids
+    assert len(plan) == challenge.total_rounds
+    assert planned is not None
+    question_id, record = planned
+    assert question_id == plan[2]
+    assert record is not None and record.question_id == question_id
+    assert missing is None
+    assert first_round.start_result is not None
+    assert first_round.start_result.session.question_id == plan[0]
+
+
+@pytest.mark.asyncio
+async def test_migration_round_trip_keeps_plans_and_reads_fewer_bytes_per_round() -> None:
+    now_utc = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+    creator_user_id = await _create_user("fc_questions_bulk_creator")
+    await _seed_challenges(creator_user_id=creator_user_id, now_utc=now_utc)
+    plans_sql = text(
+        "SELECT challenge_id::text, array_agg(question_id ORDER BY round_no) "
+        "FROM friend_challenge_questions GROUP BY challenge_id"
+    )
+    # One round today: the narrowed challenge row plus a single plan row.
+    table_round_bytes_sql = text(
+        "SELECT avg(pg_column_size(fc.*) + pg_column_size(q.*)) "
+        "FROM friend_challenges AS fc "
+        "JOIN friend_challenge_questions AS q ON q.challenge_id = fc.id"
+    )
+    # One round before m48: the challenge row carrying the whole JSONB plan.
+    array_round_bytes_sql = text("SELECT avg(pg_column_size(fc.*)) FROM friend_challenges AS fc")
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            plans_before = dict((await conn.execute(plans_sql)).all())
+            table_round_bytes = float((await conn.execute(table_round_bytes_sql)).scalar_one())
+            await conn.execute(text("ANALYZE friend_challenge_questions"))
+            lookup_plan = (
+                await conn.execute(
+                    text(
+                        "EXPLAIN (FORMAT JSON) SELECT question_id "
+                        "FROM friend_challenge_questions "
+                        "WHERE challenge_id = CAST(:challenge_id AS uuid) AND round_no = 5"
+                    ),
+                    {"challenge_id": next(iter(plans_before))},
+                )
+            ).scalar_one()
+
+            await conn.run_sync(_run_migration_step, "downgrade")
+            arrays = {
+                challenge_id: json.loads(question_ids)
+                for challenge_id, question_ids in (
+                    await conn.execute(
+                        text("SELECT id::text, question_ids::text FROM friend_challenges")
+                    )
+                ).all()
+            }
+            array_round_bytes = float((await conn.execute(array_round_bytes_sql)).scalar_one())
+
+            await conn.run_sync(_run_migration_step, "upgrade")
+            plans_after = dict((await conn.execute(plans_sql)).all())
+        finally:
+            await transaction.rollback()
+
+    assert len(plans_before) == SEEDED_CHALLENGES
+    assert arrays == {key: list(value) for key, value in plans_before.items()}
+    assert plans_after == plans_before
+    assert "pk_friend_challenge_questions" in json.dumps(lookup_plan)
+    assert table_round_bytes < array_round_bytes
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from aiogram.types import Update
+
+from app.api.routes.admin.users_bonus import apply_bonus
+from app.bot.query_profile_middleware import QueryProfileMiddleware
+from app.db.repo.energy_repo import EnergyRepo
+from app.db.repo.streak_repo import StreakRepo
+from app.db.repo.users_repo import UsersRepo
+from app.db.session import SessionLocal
+from app.economy.energy import energy_read
+from app.economy.energy.service import EnergyService
+from app.economy.streak.service import StreakService
+from app.services.user_onboarding import UserOnboardingService
+from tests.integration.stable_ids import stable_telegram_user_id
+
+UTC = timezone.utc
+
+
+async def _create_user_with_state(seed: str, *, now_utc: datetime) -> int:
+    async with SessionLocal.begin() as session:
+        user = await UsersRepo.create(
+            session,
+            telegram_user_id=stable_telegram_user_id(prefix=82_000_000_000, seed=seed),
+            referral_code=f"H{uuid4().hex[:10].upper()}",
+            username=None,
+            first_name="HomeRead",
+            referred_by_user_id=None,
+        )
+        await EnergyService.initialize_user_state(session, user_id=user.id, now_utc=now_utc)
+        await StreakService.sync_rollover(session, user_id=user.id, now_utc=now_utc)
+        return int(user.id)
+
+
+async def _versions(user_id: int) -> tuple[int, int]:
+    async with SessionLocal.begin() as session:
+        energy = await EnergyRepo.get_by_user_id(session, user_id)
+        streak = await StreakRepo.get_by_user_id(session, user_id)
+        assert energy is not None and streak is not None
+        return energy.version, streak.version
+
+
+@pytest.mark.asyncio
+async def test_home_reads_do_not_write_when_no_transition_is_due() -> None:
+    now_utc = datetime.now(UTC)
+    user_id = await _create_user_with_state("home-read-noop", now_utc=now_utc)
+    before = await _versions(user_id)
+
+    for _ in range(3):
+        async with SessionLocal.begin() as session:
+            await EnergyService.read_energy_clock(session, user_id=user_id, now_utc=now_utc)
+            await StreakService.read_rollover(session, user_id=user_id, now_utc=now_utc)
+
+    assert await _versions(user_id) == before
+
+
+@pytest.mark.asyncio
+async def test_home_read_persists_due_regen_once_with_version_check() -> None:
+    created_at = datetime.now(UTC) - timedelta(hours=2)
+    user_id = await _create_user_with_state("home-read-regen", now_utc=created_at)
+    async with SessionLocal.begin() as session:
+        await EnergyService.consume_quiz(
+            session, user_id=user_id, idempotency_key=f"home-read:{user_id}", now_utc=created_at
+        )
+    energy_version_before, _ = await _versions(user_id)
+    now_utc = created_at + timedelta(hours=1)
+
+    async with SessionLocal.begin() as session:
+        first = await EnergyService.read_energy_clock(session, user_id=user_id, now_utc=now_utc)
+    async with SessionLocal.begin() as session:
+        second = await EnergyService.read_energy_clock(session, user_id=user_id, now_utc=now_utc)
+
+    assert first == second
+    assert first.last_regen_at == created_at + timedelta(hours=1)
+    energy_version_after, _ = await _versions(user_id)
+    assert energy_version_after == energy_version_before + 1
+
+
+@pytest.mark.asyncio
+async def test_admin_credit_between_home_read_and_write_is_not_lost(monkeypatch) -> None:
+    created_at = datetime.now(UTC) - timedelta(hours=2)
+    user_id = await _create_user_with_state("home-read-admin-credit", now_utc=created_at)
+    async with SessionLocal.begin() as session:
+        await EnergyService.consume_quiz(
+            session, user_id=user_id, idempotency_key=f"home-read:{user_id}", now_utc=created_at
+        )
+    now_utc = created_at + timedelta(hours=1)
+    original_get_by_user_id = EnergyRepo.get_by_user_id
+
+    async def _get_then_admin_credit(session, user_id):  # noqa: ANN001
+        state = await original_get_by_user_id(session, user_id)
+        async with SessionLocal.begin() as admin_session:
+            await apply_bonus(admin_session, user_id=user_id, bonus_type="energy", amount=5)
+        return state
+
+    monkeypatch.setattr(energy_read.EnergyRepo, "get_by_user_id", _get_then_admin_credit)
+    async with SessionLocal.begin() as session:
+        snapshot = await EnergyService.read_energy_clock(session, user_id=user_id, now_utc=now_utc)
+
+    assert snapshot.paid_energy == 5
+    assert snapshot.last_regen_at == created_at + timedelta(hours=1)
+    async with SessionLocal.begin() as session:
+        stored = await original_get_by_user_id(session, user_id)
+        assert stored is not None and stored.paid_energy == 5
+
+
+def _start_update(telegram_user_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": 1,
+            "message": {
+                "message_id": 1,
+                "date": 0,
+                "chat": {"id": telegram_user_id, "type": "private"},
+                "from": {"id": telegram_user_id, "is_bot": False, "first_name": "HomeRead"},
+                "text": "/start",
+            },
+        }
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.query_budget(max_statements=10)
+async def test_start_home_render_stays_within_query_budget() -> None:
+    update = _start_update(stable_telegram_user_id(prefix=82_000_000_000, seed="home-budget"))
+    assert update.message is not None and update.message.from_user is not None
+    telegram_user = update.message.from_user
+    async with SessionLocal.begin() as session:
+        await UserOnboardingService.ensure_home_snapshot(session, telegram_user=telegram_user)
+
+    async def _render_home(event, data):  # noqa: ANN001
+        async with SessionLocal.begin() as session:
+            return await UserOnboardingService.ensure_home_snapshot(
+                session, telegram_user=telegram_user
+            )
+
+    snapshot = await QueryProfileMiddleware()(_render_home, update, {})
+
+    assert snapshot.free_energy > 0
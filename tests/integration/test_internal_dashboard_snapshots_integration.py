@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import statistics
+from datetime import date, datetime, timedelta
+from time import perf_counter
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+
+from app.core.config import get_settings
+from app.db.models.offers_impressions import OfferImpression
+from app.db.session import SessionLocal
+from app.main import app
+from app.workers.tasks.internal_dashboards import run_internal_dashboard_snapshots_async
+from tests.integration.promo_dashboard_fixtures import UTC, _create_user, _seed_dashboard_dataset
+
+DASHBOARD_PATHS = (
+    "/internal/promo/dashboard",
+    "/internal/referrals/dashboard",
+    "/internal/offers/dashboard",
+)
+
+
+async def _seed_offer_impressions(*, user_id: int, now_utc: datetime, count: int) -> None:
+    rows = [
+        {
+            "user_id": user_id,
+            "offer_code": f"OFFER_{index % 7}",
+            "trigger_code": "TRG_ENERGY_ZERO",
+            "priority": 100,
+            "shown_at": now_utc - timedelta(minutes=1 + index % 600),
+            "local_date_berlin": date(2026, 2, 19),
+            "clicked_at": None,
+            "converted_purchase_id": None,
+            "dismiss_reason": None,
+            "idempotency_key": f"dashboard-snapshot:{uuid4().hex}",
+        }
+        for index in range(count)
+    ]
+    async with SessionLocal.begin() as session:
+        await session.execute(insert(OfferImpression), rows)
+
+
+async def _get(client: AsyncClient, path: str, *, fresh: bool = False):
+    return await client.get(
+        path,
+        params={"window_hours": 24, **({"fresh": 1} if fresh else {})},
+        headers={"X-Internal-Token": get_settings().internal_api_token},
+    )
+
+
+def _client() -> AsyncClient:
+    return AsyncClient(
+        transport=ASGITransport(app=app, client=("127.0.0.1", 8080)),
+        base_url="http://testserver",
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reads_match_live_computation_for_every_dashboard() -> None:
+    now_utc = datetime.now(UTC)
+    await _seed_dashboard_dataset(now_utc)
+    user_id = await _create_user("dashboard-snapshot-parity")
+    await _seed_offer_impressions(user_id=user_id, now_utc=now_utc, count=12)
+
+    result = await run_internal_dashboard_snapshots_async()
+    assert result["snapshots_total"] == 3 * len(result["windows"])
+
+    async with _client() as client:
+        for path in DASHBOARD_PATHS:
+            stored = await _get(client, path)
+            live = await _get(client, path, fresh=True)
+
+            assert stored.status_code == live.status_code == 200
+            assert stored.headers["X-Dashboard-Source"] == "snapshot"
+            assert live.headers["X-Dashboard-Source"] == "live"
+            stored_payload = {k: v for k, v in stored.json().items() if k != "generated_at"}
+            live_payload = {k: v for k, v in live.json().items() if k != "generated_at"}
+            assert stored_payload == live_payload
+
+
+async def _median_snapshot_read_ms(client: AsyncClient, *, rounds: int = 15) -> float:
+    samples = []
+    for _ in range(rounds):
+        started_at = perf_counter()
+        response = await _get(client, "/internal/offers/dashboard")
+        samples.append((perf_counter() - started_at) * 1000)
+        assert response.headers["X-Dashboard-Source"] == "snapshot"
+    return statistics.median(samples)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_read_latency_does_not_grow_with_event_volume() -> None:
+    now_utc = datetime.now(UTC)
+    user_id = await _create_user("dashboard-snapshot-volume")
+    await _seed_offer_impressions(user_id=user_id, now_utc=now_utc, count=10)
+    await run_internal_dashboard_snapshots_async()
+    async with _client() as client:
+        small_ms = await _median_snapshot_read_ms(client)
+
+    await _seed_offer_impressions(user_id=user_id, now_utc=now_utc, count=20_000)
+    await run_internal_dashboard_snapshots_async()
+    async with _client() as client:
+        large_ms = await _median_snapshot_read_ms(client)
+
+    # A primary-key lookup stays flat; the slack only absorbs scheduler noise.
+    assert large_ms <= max(small_ms * 3, small_ms + 25)
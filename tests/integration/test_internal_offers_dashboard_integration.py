@@ -180,6 +180,7 @@ async def test_internal_offers_dashboard_returns_funnel_metrics_and_alert_flags(
             offers_alert_min_conversion_rate=0.40,
             offers_alert_max_dismiss_rate=0.30,
             offers_alert_max_impressions_per_user=1.5,
+            internal_dashboard_snapshot_max_age_seconds=900,
         ),
     )
 
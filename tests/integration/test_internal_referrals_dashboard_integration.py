@@ -132,6 +132,7 @@ async def test_internal_referrals_dashboard_returns_funnel_and_fraud_triage_metr
             referrals_alert_max_fraud_rejected_rate=0.20,
             referrals_alert_max_rejected_fraud_total=1,
             referrals_alert_max_referrer_rejected_fraud=1,
+            internal_dashboard_snapshot_max_age_seconds=900,
         ),
     )
 
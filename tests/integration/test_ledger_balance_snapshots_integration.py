@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.db.models.ledger_balance_snapshots import LedgerBalanceSnapshot
+from app.db.models.ledger_entries import LedgerEntry
+from app.db.models.purchases import Purchase
+from app.db.repo.ledger_repo import LedgerRepo
+from app.db.session import SessionLocal
+from app.economy.energy.service import EnergyService
+from app.economy.purchases.service import PurchaseService
+from app.workers.tasks.payments_reliability import (
+    check_ledger_snapshots_async,
+    run_payments_reconciliation_async,
+)
+from tests.integration.payments_idempotency_fixtures import UTC, _create_user
+
+PURCHASES_TOTAL = 120
+USERS_TOTAL = 6
+
+
+async def _seed_paid_uncredited(user_ids: list[int]) -> list[tuple[UUID, int, str]]:
+    now_utc = datetime.now(UTC)
+    seeded: list[tuple[UUID, int, str]] = []
+    async with SessionLocal.begin() as session:
+        for index in range(PURCHASES_TOTAL):
+            purchase_id = uuid4()
+            user_id = user_ids[index % len(user_ids)]
+            session.add(
+                Purchase(
+                    id=purchase_id,
+                    user_id=user_id,
+                    product_code="ENERGY_10",
+                    product_type="MICRO",
+                    base_stars_amount=5,
+                    discount_stars_amount=0,
+                    stars_amount=5,
+                    currency="XTR",
+                    status="PAID_UNCREDITED",
+                    idempotency_key=f"snapshot:{index}",
+                    invoice_payload=f"inv_snapshot_{index}",
+                    telegram_payment_charge_id=f"tg_charge_snapshot_{index}",
+                    raw_successful_payment={"invoice_payload": f"inv_snapshot_{index}"},
+                    created_at=now_utc - timedelta(minutes=5),
+                    paid_at=now_utc - timedelta(minutes=4),
+                )
+            )
+            seeded.append((purchase_id, user_id, f"inv_snapshot_{index}"))
+    return seeded
+
+
+async def _credit(purchase_id: UUID, user_id: int, invoice_payload: str) -> None:
+    async with SessionLocal.begin() as session:
+        purchase = await session.get(Purchase, purchase_id, with_for_update=True)
+        assert purchase is not None
+        await PurchaseService.apply_successful_payment(
+            session,
+            user_id=user_id,
+            invoice_payload=invoice_payload,
+            telegram_payment_charge_id=str(purchase.telegram_payment_charge_id),
+            raw_successful_payment=dict(purchase.raw_successful_payment or {}),
+            now_utc=datetime.now(UTC),
+        )
+
+
+@pytest.mark.asyncio
+async def test_snapshots_stay_exact_under_concurrent_credits_and_repair_drift() -> None:
+    user_ids = [await _create_user(f"ledger-snapshot-{index}") for index in range(USERS_TOTAL)]
+    seeded = await _seed_paid_uncredited(user_ids)
+
+    slots = asyncio.Semaphore(20)
+
+    async def _credit_limited(item: tuple[UUID, int, str]) -> None:
+        async with slots:
+            await _credit(*item)
+
+    # Every purchase is credited twice concurrently; the replay must not touch the snapshots.
+    await asyncio.gather(*(_credit_limited(item) for item in seeded + seeded))
+    # A direct energy credit is PURCHASE_CREDIT/CREDIT too, but it is not a purchase.
+    async with SessionLocal.begin() as session:
+        await EnergyService.credit_paid_energy(
+            session,
+            user_id=user_ids[0],
+            amount=7,
+            idempotency_key=f"ledger-snapshot:energy:{user_ids[0]}",
+            now_utc=datetime.now(UTC),
+        )
+
+    async with SessionLocal.begin() as session:
+        assert await LedgerRepo.count_distinct_purchase_credits(session) == PURCHASES_TOTAL
+        assert await LedgerRepo.sum_distinct_purchase_stars_for_credits(session) == (
+            5 * PURCHASES_TOTAL
+        )
+        assert await LedgerRepo.sum_distinct_purchase_stars_for_credits_by_product(session) == {
+            "ENERGY_10": 5 * PURCHASES_TOTAL
+        }
+        assert await LedgerRepo.diff_balance_snapshots(session) == []
+        ledger_rows = await session.scalar(select(func.count(LedgerEntry.id)))
+        snapshot_rows = await session.scalar(select(func.sum(LedgerBalanceSnapshot.entries_count)))
+        assert ledger_rows == snapshot_rows
+
+    reconciliation = await run_payments_reconciliation_async(stale_minutes=30)
+    assert reconciliation["status"] == "OK"
+    assert reconciliation["recent_credit_mismatch_count"] == 0
+
+    async with SessionLocal.begin() as session:
+        await session.execute(
+            update(LedgerBalanceSnapshot)
+            .where(LedgerBalanceSnapshot.entry_type == "PURCHASE_CREDIT")
+            .values(amount_total=LedgerBalanceSnapshot.amount_total + 1)
+        )
+
+    assert (await check_ledger_snapshots_async())["drift_rows"] > 0
+    repaired = await check_ledger_snapshots_async(repair=True)
+    assert repaired["repaired_rows"] > 0
+    assert await check_ledger_snapshots_async() == {"drift_rows": 0, "repaired_rows": 0}
@@ -9,6 +9,7 @@ from sqlalchemy import select
 from app.db.models.ledger_entries import LedgerEntry
 from app.db.models.purchases import Purchase
 from app.db.models.reconciliation_runs import ReconciliationRun
+from app.db.repo.ledger_repo import LedgerRepo
 from app.db.session import SessionLocal
 from app.workers.tasks.payments_reliability import run_payments_reconciliation_async
 from tests.integration.payments_idempotency_fixtures import UTC, _create_user
@@ -64,22 +65,22 @@ async def test_reconciliation_detects_diff_and_persists_run() -> None:
         )
         await session.flush()
 
-        session.add(
-            LedgerEntry(
+        await LedgerRepo.create(
+            session,
+            entry=LedgerEntry(
                 user_id=user_id,
                 purchase_id=credited_purchase_id,
                 entry_type="PURCHASE_CREDIT",
                 asset="PAID_ENERGY",
                 direction="CREDIT",
-                amount=10,
+                amount=5,
                 balance_after=10,
                 source="PURCHASE",
                 idempotency_key="ledger-recon-credited-1",
-                metadata_={},
+                metadata_={"product_code": "ENERGY_10"},
                 created_at=now_utc - timedelta(minutes=44),
-            )
+            ),
         )
-        await session.flush()
 
     result = await run_payments_reconciliation_async(stale_minutes=30)
     assert result["paid_purchases_count"] == 2
@@ -88,6 +89,7 @@ async def test_reconciliation_detects_diff_and_persists_run() -> None:
     assert result["paid_stars_total"] == 10
     assert result["credited_stars_total"] == 5
     assert result["product_stars_mismatch_count"] == 1
+    assert result["recent_credit_mismatch_count"] == 0
     assert result["diff_count"] == 4
     assert result["status"] == "DIFF"
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from time import perf_counter
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.models.energy_state import EnergyState
+from app.db.models.ledger_entries import LedgerEntry
+from app.db.models.purchases import Purchase
+from app.db.session import SessionLocal
+from app.economy.purchases.service import PurchaseService
+from app.workers.tasks.payments_reliability import recover_paid_uncredited_async
+from tests.integration.payments_idempotency_fixtures import UTC, _create_user
+
+PURCHASES_TOTAL = 10_000
+USERS_TOTAL = 200
+LEGACY_SAMPLE = 300
+
+
+async def _seed_paid_uncredited(*, prefix: str, total: int, users: int) -> dict[int, int]:
+    now_utc = datetime.now(UTC)
+    user_ids = [await _create_user(f"{prefix}-{index}") for index in range(users)]
+    per_user: dict[int, int] = {user_id: 0 for user_id in user_ids}
+    async with SessionLocal.begin() as session:
+        for index in range(total):
+            user_id = user_ids[index % users]
+            per_user[user_id] += 1
+            session.add(
+                Purchase(
+                    id=uuid4(),
+                    user_id=user_id,
+                    product_code="ENERGY_10",
+                    product_type="MICRO",
+                    base_stars_amount=5,
+                    discount_stars_amount=0,
+                    stars_amount=5,
+                    currency="XTR",
+                    status="PAID_UNCREDITED",
+                    idempotency_key=f"{prefix}:{index}",
+                    invoice_payload=f"inv_{prefix}_{index}",
+                    telegram_payment_charge_id=f"tg_charge_{prefix}_{index}",
+                    raw_successful_payment={"invoice_payload": f"inv_{prefix}_{index}"},
+                    created_at=now_utc - timedelta(minutes=20),
+                    paid_at=now_utc - timedelta(minutes=10, microseconds=index),
+                )
+            )
+        await session.flush()
+    return per_user
+
+
+async def _legacy_seconds_per_purchase() -> float:
+    await _seed_paid_uncredited(prefix="recovery-legacy", total=LEGACY_SAMPLE, users=10)
+    async with SessionLocal.begin() as session:
+        purchases = list(
+            (
+                await session.execute(
+                    select(Purchase.id, Purchase.user_id, Purchase.invoice_payload)
+                    .where(Purchase.status == "PAID_UNCREDITED")
+                    .order_by(Purchase.paid_at.asc())
+                )
+            ).all()
+        )
+
+    started_at = perf_counter()
+    for purchase_id, user_id, invoice_payload in purchases:
+        async with SessionLocal.begin() as session:
+            purchase = await session.get(Purchase, purchase_id, with_for_update=True)
+            assert purchase is not None
+            await PurchaseService.apply_successful_payment(
+                session,
+                user_id=user_id,
+                invoice_payload=invoice_payload,
+                telegram_payment_charge_id=str(purchase.telegram_payment_charge_id),
+                raw_successful_payment=dict(purchase.raw_successful_payment or {}),
+                now_utc=datetime.now(UTC),
+            )
+    return (perf_counter() - started_at) / len(purchases)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batched_recoverers_credit_each_purchase_once_and_faster() -> None:
+    legacy_per_purchase = await _legacy_seconds_per_purchase()
+    per_user = await _seed_paid_uncredited(
+        prefix="recovery-batch", total=PURCHASES_TOTAL, users=USERS_TOTAL
+    )
+
+    started_at = perf_counter()
+    first, second = await asyncio.gather(
+        recover_paid_uncredited_async(batch_size=500, stale_minutes=2),
+        recover_paid_uncredited_async(batch_size=500, stale_minutes=2),
+    )
+    batched_per_purchase = (perf_counter() - started_at) / PURCHASES_TOTAL
+
+    assert first["errors"] == second["errors"] == 0
+    assert first["credited"] + second["credited"] == PURCHASES_TOTAL
+    assert first["batches"] > 0 and second["batches"] > 0
+
+    async with SessionLocal.begin() as session:
+        uncredited = await session.scalar(
+            select(func.count(Purchase.id)).where(Purchase.status != "CREDITED")
+        )
+        assert uncredited == 0
+
+        credits_per_purchase = (
+            await session.execute(
+                select(LedgerEntry.purchase_id, func.count(LedgerEntry.id))
+                .where(LedgerEntry.entry_type == "PURCHASE_CREDIT")
+                .group_by(LedgerEntry.purchase_id)
+            )
+        ).all()
+        counts: dict[UUID | None, int] = {row[0]: int(row[1]) for row in credits_per_purchase}
+        assert len(counts) == PURCHASES_TOTAL + LEGACY_SAMPLE
+        assert set(counts.values()) == {1}
+
+        energy_rows = (
+            await session.execute(
+                select(EnergyState.user_id, EnergyState.paid_energy).where(
+                    EnergyState.user_id.in_(list(per_user))
+                )
+            )
+        ).all()
+        assert {int(user_id): int(paid) for user_id, paid in energy_rows} == {
+            user_id: 10 * count for user_id, count in per_user.items()
+        }
+
+    # One transaction per purchase pays a commit round-trip per row; pages amortize it.
+    assert batched_per_purchase * 3 < legacy_per_purchase
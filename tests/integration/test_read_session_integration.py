@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.db.models.dashboard_snapshots import DashboardSnapshot
+from app.db.read_session import ReadSessionRouter
+from app.db.session import SessionLocal, create_read_only_engine
+from app.workers.tasks import internal_dashboards
+
+# The test database stands in for the replica: the read-only engine is a separate pool whose
+# connections open every transaction READ ONLY, like a hot standby would.
+
+
+@pytest.fixture
+async def replica_maker():
+    replica_engine = create_read_only_engine(get_settings().database_url)
+    yield async_sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+    await replica_engine.dispose()
+
+
+def _router(replica: async_sessionmaker[AsyncSession], *, max_lag_seconds: float):
+    return ReadSessionRouter(
+        primary=lambda: SessionLocal,
+        replica=lambda: replica,
+        max_lag_seconds=max_lag_seconds,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_lag_seconds", [30.0, -1.0], ids=["replica", "primary_fallback"])
+async def test_read_sessions_read_but_never_write(replica_maker, max_lag_seconds: float) -> None:
+    router = _router(replica_maker, max_lag_seconds=max_lag_seconds)
+
+    async with router.begin() as session:
+        assert await session.scalar(text("SHOW transaction_read_only")) == "on"
+        assert await session.scalar(text("SELECT count(*) FROM users")) is not None
+
+    with pytest.raises(DBAPIError, match="read-only transaction"):
+        async with router.begin() as session:
+            await session.execute(text("DELETE FROM users WHERE id = -1"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_lag_seconds", [30.0, -1.0], ids=["replica", "primary_fallback"])
+async def test_repeatable_read_sessions_keep_one_read_only_snapshot(
+    replica_maker, max_lag_seconds: float
+) -> None:
+    router = _router(replica_maker, max_lag_seconds=max_lag_seconds)
+
+    async with router.begin(repeatable_read=True) as session:
+        assert await session.scalar(text("SHOW transaction_isolation")) == "repeatable read"
+        assert await session.scalar(text("SHOW transaction_read_only")) == "on"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_refresh_builds_on_replica_and_writes_on_primary(
+    monkeypatch, replica_maker
+) -> None:
+    monkeypatch.setattr(
+        internal_dashboards, "ReadSessionLocal", _router(replica_maker, max_lag_seconds=30.0)
+    )
+
+    result = await internal_dashboards.run_internal_dashboard_snapshots_async()
+
+    async with SessionLocal.begin() as session:
+        stored = await session.scalar(select(func.count()).select_from(DashboardSnapshot))
+    assert result["snapshots_total"] == stored
+    assert stored
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db.models.entitlements import Entitlement
+from app.db.query_profiler import install_query_profiler, profile_queries
+from app.db.repo.entitlements_repo import EntitlementsRepo
+from app.db.session import SessionLocal, engine
+from app.db.session_memo import MEMO_INFO_KEY
+from app.economy.energy.service import EnergyService
+from app.services.user_onboarding import UserOnboardingService
+from tests.integration.referrals_fixtures import _telegram_user
+
+UTC = timezone.utc
+
+
+async def _consume_statements(telegram_user_id: int, *, memo: bool) -> int:
+    telegram_user = _telegram_user(telegram_user_id)
+    async with SessionLocal.begin() as session:
+        await UserOnboardingService.ensure_home_snapshot(session, telegram_user=telegram_user)
+
+    async with SessionLocal.begin() as session:
+        snapshot = await UserOnboardingService.ensure_home_snapshot(
+            session, telegram_user=telegram_user
+        )
+        if not memo:
+            session.info.pop(MEMO_INFO_KEY, None)
+        with profile_queries("memo:consume_quiz", emit_log=False) as consume_profile:
+            await EnergyService.consume_quiz(
+                session,
+                user_id=snapshot.user_id,
+                idempotency_key=f"memo:{snapshot.user_id}",
+                now_utc=datetime.now(UTC),
+            )
+        if memo:
+            with profile_queries("memo:repeat_reads", emit_log=False) as repeat_profile:
+                await UserOnboardingService.get_by_telegram_user_id(session, telegram_user.id)
+                await EntitlementsRepo.has_active_premium(
+                    session, snapshot.user_id, datetime.now(UTC)
+                )
+            assert repeat_profile.statement_count == 0
+    return consume_profile.statement_count
+
+
+@pytest.mark.asyncio
+async def test_answer_transaction_reads_user_and_premium_once() -> None:
+    install_query_profiler(engine)
+
+    memoized = await _consume_statements(61_000_000_001, memo=True)
+    unmemoized = await _consume_statements(61_000_000_003, memo=False)
+
+    # The premium check inside consume_quiz is served from the home render's lookup.
+    assert memoized == unmemoized - 1
+
+
+@pytest.mark.asyncio
+async def test_entitlement_write_in_same_session_invalidates_memo() -> None:
+    telegram_user = _telegram_user(61_000_000_002)
+    now_utc = datetime.now(UTC)
+    async with SessionLocal.begin() as session:
+        snapshot = await UserOnboardingService.ensure_home_snapshot(
+            session, telegram_user=telegram_user
+        )
+        assert snapshot.premium_active is False
+
+        await EntitlementsRepo.create(
+            session,
+            entitlement=Entitlement(
+                user_id=snapshot.user_id,
+                entitlement_type="PREMIUM",
+                scope="premium_month",
+                status="ACTIVE",
+                starts_at=now_utc - timedelta(minutes=1),
+                ends_at=now_utc + timedelta(days=30),
+                idempotency_key=f"memo:premium:{snapshot.user_id}",
+                metadata_={},
+                created_at=now_utc,
+                updated_at=now_utc,
+            ),
+        )
+
+        assert await EntitlementsRepo.has_active_premium(session, snapshot.user_id, now_utc)
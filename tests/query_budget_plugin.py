@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import pytest
+
+from app.db.query_profiler import (
+    QueryProfile,
+    add_profile_sink,
+    install_query_profiler,
+    profile_queries,
+    remove_profile_sink,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudget:
+    max_statements: int
+    max_db_ms: float | None = None
+
+
+def find_budget_violations(
+    profiles: list[QueryProfile],
+    budget: QueryBudget,
+) -> list[QueryProfile]:
+    return [
+        profile
+        for profile in profiles
+        if profile.statement_count > budget.max_statements
+        or (budget.max_db_ms is not None and profile.total_db_ms > budget.max_db_ms)
+    ]
+
+
+def format_budget_violations(violations: list[QueryProfile], budget: QueryBudget) -> str:
+    lines = [
+        f"SQL query budget exceeded (max_statements={budget.max_statements}, "
+        f"max_db_ms={budget.max_db_ms}):"
+    ]
+    for profile in violations:
+        lines.append(
+            f"  {profile.label}: {profile.statement_count} statements, "
+            f"{profile.total_db_ms:.2f} ms"
+        )
+        for slow in profile.slowest:
+            lines.append(f"    {slow.duration_ms:.2f} ms  {slow.statement}")
+    return "\n".join(lines)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_statements, max_db_ms=None): fail when any profiled handler "
+        "(profile_queries scope) or, if none ran, the whole test exceeds the SQL budget.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _enforce_query_budget(request: pytest.FixtureRequest) -> Iterator[None]:
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+
+    from app.db import session as db_session
+
+    budget = QueryBudget(*marker.args, **marker.kwargs)
+    install_query_profiler(db_session.engine)
+    handler_profiles: list[QueryProfile] = []
+    add_profile_sink(handler_profiles.append)
+    try:
+        with profile_queries(f"test:{request.node.name}", emit_log=False) as test_profile:
+            yield
+    finally:
+        remove_profile_sink(handler_profiles.append)
+
+    handler_profiles = [profile for profile in handler_profiles if profile is not test_profile]
+    violations = find_budget_violations(handler_profiles or [test_profile], budget)
+    if violations:
+        pytest.fail(format_budget_violations(violations, budget), pytrace=False)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.evaluate_slo_gate import evaluate_flow_slos
+
+SLO_FILE = Path(__file__).resolve().parents[2] / "load" / "k6" / "gameplay_slos.json"
+
+
+def _metrics() -> dict[str, object]:
+    return {
+        "gameplay_e2e_ms": {"p(95)": 700.0},
+        "gameplay_e2e_ms{flow:mode_play}": {"p(95)": 420.0},
+        "gameplay_e2e_ms{flow:friend_duel}": {"values": {"p(95)": 950.0}},
+        "gameplay_step_fail_rate{flow:mode_play}": {"rate": 0.0},
+        "gameplay_step_fail_rate{flow:friend_duel}": {"rate": 0.02},
+    }
+
+
+def test_evaluate_flow_slos_reads_tagged_submetrics_per_flow() -> None:
+    slo = {"duration_metric": "gameplay_e2e_ms", "error_metric": "gameplay_step_fail_rate"}
+    results, failures = evaluate_flow_slos(
+        _metrics(),
+        {
+            "mode_play": {**slo, "max_p95_ms": 600, "max_error_rate": 0.01},
+            "friend_duel": {**slo, "max_p95_ms": 800, "max_error_rate": 0.01},
+        },
+    )
+
+    assert results["mode_play"]["p95_ms"] == 420.0
+    assert results["friend_duel"]["error_rate"] == 0.02
+    assert failures == [
+        "friend_duel: p95=950.00ms > 800.00ms",
+        "friend_duel: error_rate=0.020000 > 0.010000",
+    ]
+
+
+def test_gameplay_slo_file_covers_every_k6_flow() -> None:
+    slos = json.loads(SLO_FILE.read_text(encoding="utf-8"))
+
+    assert set(slos) == {"mode_play", "friend_duel", "daily_cup"}
+    assert all(slo["duration_metric"] == "gameplay_e2e_ms" for slo in slos.values())
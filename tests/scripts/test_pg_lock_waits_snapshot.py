@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from scripts.pg_lock_waits_snapshot import summarize_lock_waits
+
+
+def test_summarize_lock_waits_reports_peak_and_mean() -> None:
+    assert summarize_lock_waits([0, 3, 1, 0]) == {
+        "lock_waits_max": 3,
+        "lock_waits_mean": 1.0,
+        "samples": 4,
+    }
+
+
+def test_summarize_lock_waits_handles_empty_samples() -> None:
+    assert summarize_lock_waits([]) == {"lock_waits_max": 0, "lock_waits_mean": 0.0, "samples": 0}
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+
+from app.api.router_registry import include_profile_routers, router_modules_for_profile
+from app.workers.task_registry import WORKER_TASK_MODULES, task_modules_for_profile
+from scripts.profile_startup import (
+    StartupMeasurement,
+    _slowest_imports,
+    budget_failures,
+    load_budgets,
+    measure_profile,
+)
+
+_BUDGETS = load_budgets()
+
+
+@pytest.mark.parametrize(
+    ("role", "profile"),
+    [(role, profile) for role, profiles in _BUDGETS.items() for profile in profiles],
+)
+def test_process_profile_cold_start_stays_within_recorded_budget(role: str, profile: str) -> None:
+    measurement = measure_profile(role, profile)
+
+    assert budget_failures(measurement, _BUDGETS[role][profile]) == []
+
+
+def test_role_profiles_load_strictly_less_than_the_full_process() -> None:
+    assert _BUDGETS["api"]["webhook"]["max_modules"] < _BUDGETS["api"]["full"]["max_modules"]
+    assert _BUDGETS["worker"]["q_high"]["max_modules"] < _BUDGETS["worker"]["all"]["max_modules"]
+    assert task_modules_for_profile("ALL") == WORKER_TASK_MODULES
+    assert task_modules_for_profile("q_high") == ("app.workers.tasks.payments_reliability",)
+    with pytest.raises(ValueError):
+        task_modules_for_profile("q_turbo")
+    with pytest.raises(ValueError):
+        router_modules_for_profile("admin-only")
+
+
+def test_webhook_profile_mounts_only_webhook_health_and_metrics_routes() -> None:
+    app = FastAPI()
+    include_profile_routers(app, profile=" webhook ")
+
+    paths = {getattr(route, "path", "") for route in app.routes}
+    assert "/webhook/telegram" in paths
+    assert "/health" in paths
+    assert not any(path.startswith(("/admin", "/internal", "/ops")) for path in paths)
+
+
+def test_slowest_imports_and_budget_failures_report_offenders() -> None:
+    log = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        150 | json",
+            "import time:      4000 |    2500000 | aiogram",
+            "import time:       900 |     900000 | PIL.Image",
+        ]
+    )
+    assert _slowest_imports(log, top=2) == (("aiogram", 2.5), ("PIL.Image", 0.9))
+
+    measurement = StartupMeasurement(role="api", profile="webhook", seconds=4.2, modules=1200)
+    assert budget_failures(measurement, {"max_import_seconds": 3.5, "max_modules": 1060}) == [
+        "api:webhook: import=4.20s > 3.5s",
+        "api:webhook: modules=1200 > 1060",
+    ]
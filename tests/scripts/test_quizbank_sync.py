@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from scripts.quizbank_sync import QuizbankDiff, apply_diff, compute_diff, content_hash
+
+NOW_UTC = datetime(2026, 2, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def _record(question_id: str, **overrides: Any) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "question_id": question_id,
+        "mode_code": "ARTIKEL_SPRINT",
+        "source_file": "Artikel_Sprint_Bank_A1_B2_1000.csv",
+        "level": "A1",
+        "category": "Grammar",
+        "question_text": f"Frage {question_id}?",
+        "option_1": "der",
+        "option_2": "die",
+        "option_3": "das",
+        "option_4": "den",
+        "correct_option_id": 1,
+        "correct_answer": "die",
+        "explanation": "Erklaerung",
+        "key": question_id,
+        "status": "ACTIVE",
+        "quick_mix_eligible": False,
+    }
+    record.update(overrides)
+    return record
+
+
+def test_content_hash_ignores_timestamps() -> None:
+    stored = {**_record("q1"), "created_at": NOW_UTC, "updated_at": NOW_UTC}
+    assert content_hash(stored) == content_hash(_record("q1"))
+    assert content_hash(_record("q1", explanation="Neu")) != content_hash(_record("q1"))
+
+
+def test_compute_diff_classifies_rows() -> None:
+    existing = [
+        _record("same"),
+        _record("changed"),
+        _record("removed"),
+        _record("already_disabled", status="DISABLED"),
+        _record("reactivated", status="DISABLED"),
+    ]
+    records = [
+        _record("same"),
+        _record("changed", correct_option_id=2, correct_answer="das"),
+        _record("reactivated"),
+        _record("new"),
+    ]
+
+    diff = compute_diff(records, existing)
+
+    assert diff.inserted == ["new"]
+    assert sorted(diff.updated) == ["changed", "reactivated"]
+    assert diff.disabled == ["removed"]
+    assert diff.unchanged == 1
+
+
+def test_compute_diff_for_unchanged_bank_reports_no_changes() -> None:
+    rows = [_record(f"q{index}") for index in range(6000)]
+
+    diff = compute_diff(rows, [dict(row) for row in rows])
+
+    assert diff.has_changes is False
+    assert diff.unchanged == 6000
+
+
+def test_diff_report_samples_ids_unless_unbounded() -> None:
+    diff = QuizbankDiff(inserted=[f"q{index:02d}" for index in range(15)])
+
+    assert diff.as_report()["inserted_ids"] == [f"q{index:02d}" for index in range(10)]
+    assert len(diff.as_report(sample_size=None)["inserted_ids"]) == 15
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, Any]] = []
+
+    async def execute(self, statement: Any, params: Any = None) -> None:
+        self.calls.append((statement, params))
+
+
+@pytest.mark.asyncio
+async def test_apply_diff_writes_only_changed_rows() -> None:
+    session = _RecordingSession()
+    records = [_record("new"), _record("changed", level="B1"), _record("same")]
+    diff = QuizbankDiff(inserted=["new"], updated=["changed"], disabled=["gone"], unchanged=1)
+
+    await apply_diff(cast(AsyncSession, session), records=records, diff=diff, now_utc=NOW_UTC)
+
+    insert_stmt, _ = session.calls[0]
+    assert "INSERT INTO quiz_questions" in str(insert_stmt.compile(dialect=postgresql.dialect()))
+    _, update_params = session.calls[1]
+    assert [row["question_id"] for row in update_params] == ["changed"]
+    assert update_params[0]["level"] == "B1"
+    assert "created_at" not in update_params[0]
+    disable_stmt, _ = session.calls[2]
+    disable_sql = str(disable_stmt.compile(dialect=postgresql.dialect()))
+    assert "UPDATE quiz_questions SET status=" in disable_sql
+    assert len(session.calls) == 3
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiohttp import ClientSession, web
+
+from scripts.telegram_bot_api_stub import StubFaults, TelegramBotApiStub, create_app
+
+
+@pytest.fixture
+async def stub_server() -> AsyncIterator[tuple[TelegramBotApiStub, str, Bot]]:
+    stub = TelegramBotApiStub(StubFaults())
+    runner = web.AppRunner(create_app(stub))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    base_url = f"http://127.0.0.1:{port}"
+    bot = Bot(
+        token="123456:stub",
+        session=AiohttpSession(api=TelegramAPIServer.from_base(base_url)),
+    )
+    try:
+        yield stub, base_url, bot
+    finally:
+        await bot.session.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stub_answers_bot_calls_and_exposes_sent_messages(
+    stub_server: tuple[TelegramBotApiStub, str, Bot],
+) -> None:
+    _, base_url, bot = stub_server
+    markup = InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text="Go", callback_data="play")]]
+    )
+    sent = await bot.send_message(chat_id=42, text="hello", reply_markup=markup)
+    await bot.edit_message_text(chat_id=42, message_id=sent.message_id, text="edited")
+    assert await bot.answer_callback_query("cb-1") is True
+
+    async with ClientSession() as client:
+        async with client.get(
+            f"{base_url}/__stub__/messages", params={"chat_id": "42", "timeout_ms": "100"}
+        ) as response:
+            payload = await response.json()
+        async with client.get(
+            f"{base_url}/__stub__/messages",
+            params={"chat_id": "42", "after": "2", "timeout_ms": "50"},
+        ) as response:
+            empty = await response.json()
+
+    assert [message["method"] for message in payload["messages"]] == [
+        "sendmessage",
+        "editmessagetext",
+    ]
+    assert payload["messages"][0]["reply_markup"]["inline_keyboard"][0][0]["callback_data"] == (
+        "play"
+    )
+    assert payload["messages"][1]["message_id"] == sent.message_id
+    assert empty["messages"] == []
+
+
+@pytest.mark.asyncio
+async def test_stub_simulates_blocked_users_and_flood_limits(
+    stub_server: tuple[TelegramBotApiStub, str, Bot],
+) -> None:
+    stub, _, bot = stub_server
+    stub.faults.blocked_chat_ids = {7}
+    stub.faults.per_chat_per_second = 1
+    stub.faults.retry_after_seconds = 3
+
+    with pytest.raises(TelegramForbiddenError):
+        await bot.send_message(chat_id=7, text="blocked")
+    await bot.send_message(chat_id=8, text="first")
+    with pytest.raises(TelegramRetryAfter) as flood:
+        await bot.send_message(chat_id=8, text="second")
+    await bot.send_message(chat_id=9, text="other chat")
+
+    assert flood.value.retry_after == 3
+    assert [(call.chat_id, call.status) for call in stub.calls] == [
+        (7, 403),
+        (8, 200),
+        (8, 429),
+        (9, 200),
+    ]
+    assert stub.stats()["status_counts"] == {"200": 2, "403": 1, "429": 1}
+    assert [message.chat_id for message in stub.messages] == [8, 9]
+
+
+@pytest.mark.asyncio
+async def test_stub_reset_and_call_filter_endpoints(
+    stub_server: tuple[TelegramBotApiStub, str, Bot],
+) -> None:
+    stub, base_url, bot = stub_server
+    await bot.send_message(chat_id=5, text="hi")
+    await bot.get_me()
+
+    async with ClientSession() as client:
+        async with client.get(
+            f"{base_url}/__stub__/calls", params={"method": "sendMessage"}
+        ) as response:
+            calls = (await response.json())["calls"]
+        async with client.post(f"{base_url}/__stub__/blocked", json={"chat_ids": [5]}):
+            pass
+        async with client.post(f"{base_url}/__stub__/reset"):
+            pass
+
+    assert [call["method"] for call in calls] == ["sendmessage"]
+    assert stub.faults.blocked_chat_ids == {5}
+    assert stub.calls == [] and stub.messages == []
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
 from types import SimpleNamespace
 from typing import Any
 
+import httpx
 import pytest
 
-from app.services import alerts
+from app.services import alerts, alerts_dedupe, alerts_delivery, alerts_http
+from app.services.alerts_dedupe import ALERT_DEDUPLICATOR
 
 
 class _Response:
@@ -14,23 +18,43 @@ class _Response:
 
 
 class _Client:
-    def __init__(self, calls: list[dict[str, Any]], *, fail_urls: set[str] | None = None) -> None:
+    def __init__(
+        self,
+        calls: list[dict[str, Any]],
+        *,
+        fail_urls: set[str] | None = None,
+        transient_failures: dict[str, int] | None = None,
+        delays: dict[str, float] | None = None,
+    ) -> None:
         self._calls = calls
         self._fail_urls = fail_urls or set()
+        self._transient_failures = transient_failures if transient_failures is not None else {}
+        self._delays = delays or {}
+        self.is_closed = False
 
-    async def __aenter__(self) -> "_Client":
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        return None
+    async def aclose(self) -> None:
+        self.is_closed = True
 
     async def post(self, url: str, json: dict[str, object]) -> _Response:
         self._calls.append({"url": url, "json": json})
+        await asyncio.sleep(self._delays.get(url, 0))
         if url in self._fail_urls:
             raise RuntimeError("delivery failed")
+        if self._transient_failures.get(url, 0) > 0:
+            self._transient_failures[url] -= 1
+            raise httpx.ConnectError("connection reset")
         return _Response()
 
 
+@pytest.fixture(autouse=True)
+def _reset_alert_state() -> Iterator[None]:
+    alerts_http.reset_alert_http_clients()
+    ALERT_DEDUPLICATOR.reset()
+    yield
+    alerts_http.reset_alert_http_clients()
+    ALERT_DEDUPLICATOR.reset()
+
+
 def _settings(**overrides: object) -> SimpleNamespace:
     base = {
         "app_env": "test",
@@ -47,13 +71,17 @@ def _settings(**overrides: object) -> SimpleNamespace:
 def _patch_http_client(
     monkeypatch: pytest.MonkeyPatch,
     calls: list[dict[str, Any]],
-    *,
-    fail_urls: set[str] | None = None,
-) -> None:
-    def factory(timeout: float) -> _Client:  # noqa: ARG001
-        return _Client(calls, fail_urls=fail_urls)
+    **client_kwargs: Any,
+) -> list[_Client]:
+    created: list[_Client] = []
+
+    def factory(**kwargs: object) -> _Client:  # noqa: ARG001
+        client = _Client(calls, **client_kwargs)
+        created.append(client)
+        return client
 
-    monkeypatch.setattr(alerts.httpx, "AsyncClient", factory)
+    monkeypatch.setattr(alerts_http.httpx, "AsyncClient", factory)
+    return created
 
 
 @pytest.mark.asyncio
@@ -193,3 +221,109 @@ async def test_send_ops_alert_routes_referral_reward_milestone_as_info(
     assert "[INFO][ops_l3]" in calls[0]["json"]["text"]
     assert calls[1]["url"] == "https://ops.example.local/hook"
     assert calls[1]["json"]["severity"] == "info"
+
+
+def _two_target_settings(**overrides: object) -> SimpleNamespace:
+    return _settings(
+        ops_alert_webhook_url="https://ops.example.local/hook",
+        ops_alert_slack_webhook_url="https://slack.example.local/hook",
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_ops_alert_delivers_targets_concurrently_with_per_target_timeout(
+    monkeypatch,
+) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        alerts,
+        "get_settings",
+        lambda: _two_target_settings(ops_alert_timeout_seconds=0.05, ops_alert_max_attempts=1),
+    )
+    _patch_http_client(
+        monkeypatch,
+        calls,
+        delays={"https://slack.example.local/hook": 1.0},
+    )
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    sent = await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 1})
+
+    assert sent is True
+    assert loop.time() - started_at < 0.5
+    assert {call["url"] for call in calls} == {
+        "https://ops.example.local/hook",
+        "https://slack.example.local/hook",
+    }
+
+
+@pytest.mark.asyncio
+async def test_send_ops_alert_retries_transient_errors_on_pooled_client(monkeypatch) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(alerts, "get_settings", lambda: _two_target_settings())
+    monkeypatch.setattr(alerts_delivery, "RETRY_BACKOFF_BASE_SECONDS", 0)
+    created = _patch_http_client(
+        monkeypatch,
+        calls,
+        transient_failures={"https://slack.example.local/hook": 2},
+        fail_urls={"https://ops.example.local/hook"},
+    )
+
+    sent = await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 1})
+    await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 2})
+
+    assert sent is True
+    assert len(created) == 1
+    slack_calls = [call for call in calls if call["url"] == "https://slack.example.local/hook"]
+    ops_calls = [call for call in calls if call["url"] == "https://ops.example.local/hook"]
+    assert len(slack_calls) == 4
+    assert len(ops_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_ops_alert_collapses_duplicates_inside_window(monkeypatch) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        alerts, "get_settings", lambda: _settings(ops_alert_webhook_url="https://ops.local/hook")
+    )
+    _patch_http_client(monkeypatch, calls)
+
+    first = await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 1})
+    duplicate = await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 1})
+    different = await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={"n": 2})
+
+    assert (first, duplicate, different) == (True, True, True)
+    assert [call["json"]["payload"] for call in calls] == [{"n": 1}, {"n": 2}]
+
+
+@pytest.mark.asyncio
+async def test_send_ops_alert_does_not_suppress_after_failed_delivery(monkeypatch) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(
+        alerts, "get_settings", lambda: _settings(ops_alert_webhook_url="https://ops.local/hook")
+    )
+    _patch_http_client(monkeypatch, calls, fail_urls={"https://ops.local/hook"})
+
+    assert await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={}) is False
+    assert await alerts.send_ops_alert(event="promo_campaign_auto_paused", payload={}) is False
+    assert len(calls) == 2
+
+
+def test_deduplicator_flushes_and_evicts_expired_keys_with_suppressed_duplicates(
+    monkeypatch,
+) -> None:
+    flushed: list[dict[str, object]] = []
+    monkeypatch.setattr(
+        alerts_dedupe.logger, "info", lambda event, **kwargs: flushed.append(kwargs)
+    )
+    deduplicator = alerts_dedupe.AlertDeduplicator()
+
+    assert deduplicator.claim(key="quiet", window_seconds=60, now_mono=0.0) == 0
+    assert deduplicator.claim(key="quiet", window_seconds=60, now_mono=10.0) is None
+    assert deduplicator.claim(key="other", window_seconds=60, now_mono=61.0) == 0
+
+    assert flushed == [{"dedupe_key": "quiet", "suppressed_duplicates": 1}]
+    assert deduplicator.claim(key="quiet", window_seconds=60, now_mono=62.0) == 0
+    assert set(deduplicator._entries) == {"other", "quiet"}
@@ -5,10 +5,19 @@ from types import SimpleNamespace
 
 import pytest
 
-from app.services import channel_bonus
+from app.services import channel_bonus, channel_membership
 from app.services.channel_bonus import ChannelBonusService
 
 
+@pytest.fixture(autouse=True)
+def _clear_membership_state():
+    channel_membership.clear_membership_cache()
+    channel_membership._CHECKER_BOTS.clear()
+    yield
+    channel_membership.clear_membership_cache()
+    channel_membership._CHECKER_BOTS.clear()
+
+
 class _FakeBot:
     def __init__(self, *, status: str = "member", error: Exception | None = None) -> None:
         self._status = status
@@ -167,7 +176,8 @@ async def test_claim_bonus_uses_dedicated_checker_bot_token(monkeypatch) -> None
     created_tokens: list[str] = []
 
     class _FakeCheckerBot:
-        def __init__(self, *, token: str) -> None:
+        def __init__(self, *, token: str, session=None) -> None:
+            del session
             created_tokens.append(token)
 
             async def _close() -> None:
@@ -195,7 +205,7 @@ async def test_claim_bonus_uses_dedicated_checker_bot_token(monkeypatch) -> None
             bonus_check_bot_token="checker-token",
         ),
     )
-    monkeypatch.setattr(channel_bonus, "Bot", _FakeCheckerBot)
+    monkeypatch.setattr(channel_membership, "Bot", _FakeCheckerBot)
     monkeypatch.setattr(channel_bonus.UsersRepo, "get_by_id_for_update", _fake_get_user_for_update)
     monkeypatch.setattr(channel_bonus.EnergyService, "fill_to_free_cap", _fake_fill_to_free_cap)
 
@@ -221,8 +231,8 @@ async def test_claim_bonus_uses_dedicated_checker_bot_token(monkeypatch) -> None
 @pytest.mark.asyncio
 async def test_claim_bonus_returns_error_when_checker_token_invalid(monkeypatch) -> None:
     class _InvalidCheckerBot:
-        def __init__(self, *, token: str) -> None:
-            del token
+        def __init__(self, *, token: str, session=None) -> None:
+            del token, session
             raise ValueError("invalid token")
 
     monkeypatch.setattr(
@@ -233,7 +243,7 @@ async def test_claim_bonus_returns_error_when_checker_token_invalid(monkeypatch)
             bonus_check_bot_token="invalid",
         ),
     )
-    monkeypatch.setattr(channel_bonus, "Bot", _InvalidCheckerBot)
+    monkeypatch.setattr(channel_membership, "Bot", _InvalidCheckerBot)
 
     session = SimpleNamespace(flush=lambda: None)
 
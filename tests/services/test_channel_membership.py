@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from time import perf_counter
+from types import SimpleNamespace
+
+import pytest
+from aiogram.exceptions import TelegramNetworkError
+
+from app.services import channel_bonus, channel_membership
+from app.services.channel_bonus import ChannelBonusService
+
+CHANNEL = "@quiz_arena_test"
+
+
+@pytest.fixture(autouse=True)
+def _clear_membership_state():
+    channel_membership.clear_membership_cache()
+    channel_membership._CHECKER_BOTS.clear()
+    yield
+    channel_membership.clear_membership_cache()
+    channel_membership._CHECKER_BOTS.clear()
+
+
+class _CountingBot:
+    def __init__(
+        self, *, status: str = "member", latency: float = 0.02, error: Exception | None = None
+    ) -> None:
+        self.status = status
+        self.latency = latency
+        self.error = error
+        self.calls: list[int] = []
+
+    async def get_chat_member(self, *, chat_id, user_id):
+        assert chat_id == CHANNEL
+        self.calls.append(user_id)
+        await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(status=self.status)
+
+
+async def _check(bot: _CountingBot, telegram_user_id: int = 42, token: str = "") -> bool | None:
+    return await channel_membership.is_channel_member(
+        bot=bot,  # type: ignore[arg-type]
+        channel_target=CHANNEL,
+        telegram_user_id=telegram_user_id,
+        checker_bot_token=token,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_for_one_user_share_a_single_request() -> None:
+    bot = _CountingBot()
+
+    results = await asyncio.gather(*(_check(bot) for _ in range(30)), _check(bot, 43))
+
+    assert results == [True] * 31
+    assert sorted(bot.calls) == [42, 43]
+    assert await _check(bot) is True
+    assert len(bot.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_results_expire_quickly_and_errors_are_not_cached(monkeypatch) -> None:
+    clock = [1_000.0]
+    monkeypatch.setattr(channel_membership, "monotonic", lambda: clock[0])
+    bot = _CountingBot(status="left", latency=0)
+
+    assert await _check(bot) is False
+    clock[0] += channel_membership.NEGATIVE_TTL_SECONDS - 1
+    assert await _check(bot) is False
+    assert len(bot.calls) == 1
+
+    clock[0] += 2
+    bot.status = "member"
+    assert await _check(bot) is True
+    clock[0] += channel_membership.POSITIVE_TTL_SECONDS - 1
+    assert await _check(bot) is True
+    assert len(bot.calls) == 2
+
+    failing = _CountingBot(error=TelegramNetworkError(method=None, message="down"))
+    assert await asyncio.gather(_check(failing, 7), _check(failing, 7)) == [None, None]
+    assert await _check(failing, 7) is None
+    assert failing.calls == [7, 7]
+
+
+@pytest.mark.asyncio
+async def test_checker_bot_is_created_once_per_loop_and_closed_on_shutdown(monkeypatch) -> None:
+    created: list[_CountingBot] = []
+    closed: list[bool] = []
+
+    def _bot_factory(*, token: str, session=None) -> _CountingBot:
+        del session
+        assert token == "checker-token"
+        bot = _CountingBot()
+
+        async def _close() -> None:
+            closed.append(True)
+
+        bot.session = SimpleNamespace(close=_close)  # type: ignore[attr-defined]
+        created.append(bot)
+        return bot
+
+    monkeypatch.setattr(channel_membership, "Bot", _bot_factory)
+    update_bot = _CountingBot(status="left")
+
+    for telegram_user_id in (1, 2, 3):
+        assert await _check(update_bot, telegram_user_id, token=" checker-token ") is True
+    await channel_membership.close_checker_bot()
+
+    assert len(created) == 1
+    assert created[0].calls == [1, 2, 3]
+    assert update_bot.calls == []
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_claim_handler_throughput_under_repeated_taps(monkeypatch) -> None:
+    user = SimpleNamespace(channel_bonus_claimed_at=None)
+
+    async def _get_user_for_update(session, user_id: int):
+        del session, user_id
+        return user
+
+    async def _fill_to_free_cap(session, *, user_id: int, now_utc):
+        del session, user_id, now_utc
+        return SimpleNamespace(free_energy=20, paid_energy=0)
+
+    async def _flush() -> None:
+        return None
+
+    monkeypatch.setattr(
+        channel_bonus, "get_settings", lambda: SimpleNamespace(bonus_channel_id=CHANNEL)
+    )
+    monkeypatch.setattr(channel_bonus.UsersRepo, "get_by_id_for_update", _get_user_for_update)
+    monkeypatch.setattr(channel_bonus.EnergyService, "fill_to_free_cap", _fill_to_free_cap)
+    bot = _CountingBot(latency=0.02)
+    session = SimpleNamespace(flush=_flush)
+    now_utc = datetime(2026, 2, 26, 18, 0, tzinfo=timezone.utc)
+
+    async def _tap():
+        return await ChannelBonusService.claim_bonus_if_subscribed(
+            session,  # type: ignore[arg-type]
+            user_id=1,
+            telegram_user_id=42,
+            bot=bot,  # type: ignore[arg-type]
+            now_utc=now_utc,
+        )
+
+    taps = 200
+    started_at = perf_counter()
+    results = []
+    for _ in range(taps // 20):
+        results.extend(await asyncio.gather(*(_tap() for _ in range(20))))
+    elapsed = perf_counter() - started_at
+
+    assert len(bot.calls) == 1
+    assert [result.status for result in results].count(ChannelBonusService.STATUS_CLAIMED) == 1
+    # Uncached, 200 taps at 20 ms per Telegram round-trip would need at least 4 seconds.
+    assert taps / elapsed > 200
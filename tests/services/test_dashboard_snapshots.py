@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import dashboard_snapshots
+from app.services.offers_observability import OfferFunnelSnapshot
+from app.services.referrals_observability import ReferralsDashboardSnapshot
+
+NOW_UTC = datetime(2026, 3, 7, 12, 0, tzinfo=timezone.utc)
+
+
+def _offer_snapshot(generated_at: datetime) -> OfferFunnelSnapshot:
+    return OfferFunnelSnapshot(
+        generated_at=generated_at,
+        window_hours=24,
+        impressions_total=40,
+        unique_users=10,
+        clicks_total=5,
+        dismissals_total=2,
+        conversions_total=2,
+        click_through_rate=0.125,
+        conversion_rate=0.05,
+        dismiss_rate=0.05,
+        impressions_per_user=4.0,
+        top_offer_codes={"OFFER_B": 30, "OFFER_A": 10},
+    )
+
+
+def test_parse_snapshot_windows_drops_invalid_and_duplicate_entries() -> None:
+    assert dashboard_snapshots.parse_snapshot_windows("168, 24,x,0,24,500") == (24, 168)
+    assert dashboard_snapshots.parse_snapshot_windows("") == ()
+
+
+def test_snapshot_encoding_round_trips_dataclasses() -> None:
+    offers = _offer_snapshot(NOW_UTC)
+    referrals = ReferralsDashboardSnapshot(
+        generated_at=NOW_UTC,
+        window_hours=24,
+        referrals_started_total=3,
+        status_counts={"STARTED": 3},
+        qualified_like_total=0,
+        rewarded_total=0,
+        rejected_fraud_total=0,
+        canceled_total=0,
+        qualification_rate=0.0,
+        reward_rate=0.0,
+        fraud_rejected_rate=0.0,
+        top_referrers=[{"referrer_user_id": 1, "started_total": 3}],
+        recent_fraud_cases=[],
+    )
+
+    for snapshot in (offers, referrals):
+        payload = dashboard_snapshots.encode_snapshot(snapshot)
+        assert payload["generated_at"] == NOW_UTC.isoformat()
+        assert dashboard_snapshots.decode_snapshot(type(snapshot), payload) == snapshot
+    assert list(dashboard_snapshots.encode_snapshot(offers)["top_offer_codes"]) == [
+        "OFFER_B",
+        "OFFER_A",
+    ]
+
+
+def _spec_and_repo(monkeypatch, *, stored: object | None):
+    built: list[datetime] = []
+
+    async def _build(session, *, now_utc, window_hours):
+        del session, window_hours
+        built.append(now_utc)
+        return _offer_snapshot(now_utc)
+
+    async def _get(session, *, dashboard, window_hours):
+        del session, dashboard, window_hours
+        return stored
+
+    monkeypatch.setattr(dashboard_snapshots.DashboardSnapshotsRepo, "get", _get)
+    spec = dashboard_snapshots.DashboardSpec("offers", OfferFunnelSnapshot, _build)
+    return spec, built
+
+
+def _stored_row(
+    *, age: timedelta, schema_version: int = dashboard_snapshots.SNAPSHOT_SCHEMA_VERSION
+):
+    generated_at = NOW_UTC - age
+    return SimpleNamespace(
+        schema_version=schema_version,
+        generated_at=generated_at,
+        payload=dashboard_snapshots.encode_snapshot(_offer_snapshot(generated_at)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_dashboard_serves_current_snapshot_without_computing(monkeypatch) -> None:
+    spec, built = _spec_and_repo(monkeypatch, stored=_stored_row(age=timedelta(minutes=4)))
+
+    read = await dashboard_snapshots.read_dashboard(
+        object(), spec, now_utc=NOW_UTC, window_hours=24, fresh=False, max_age_seconds=900
+    )
+
+    assert read.source == "snapshot"
+    assert read.snapshot.generated_at == NOW_UTC - timedelta(minutes=4)
+    assert built == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("row", "fresh"),
+    [
+        (None, False),
+        (_stored_row(age=timedelta(minutes=20)), False),
+        (_stored_row(age=timedelta(minutes=1), schema_version=0), False),
+        (_stored_row(age=timedelta(minutes=1)), True),
+    ],
+    ids=["missing", "stale", "old-schema", "fresh-bypass"],
+)
+async def test_read_dashboard_falls_back_to_live_computation(monkeypatch, row, fresh) -> None:
+    spec, built = _spec_and_repo(monkeypatch, stored=row)
+
+    read = await dashboard_snapshots.read_dashboard(
+        object(), spec, now_utc=NOW_UTC, window_hours=24, fresh=fresh, max_age_seconds=900
+    )
+
+    assert read.source == "live"
+    assert read.snapshot.generated_at == NOW_UTC
+    assert built == [NOW_UTC]
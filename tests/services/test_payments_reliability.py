@@ -52,3 +52,16 @@ def test_compute_product_stars_mismatch_count() -> None:
 def test_reconciliation_status() -> None:
     assert reconciliation_status(0) == "OK"
     assert reconciliation_status(1) == "DIFF"
+
+
+def test_compute_reconciliation_diff_includes_recent_credit_mismatches() -> None:
+    diff = compute_reconciliation_diff(
+        paid_purchases_count=10,
+        credited_purchases_count=10,
+        stale_paid_uncredited_count=0,
+        paid_stars_total=100,
+        credited_stars_total=100,
+        product_stars_mismatch_count=0,
+        recent_credit_mismatch_count=2,
+    )
+    assert diff == 2
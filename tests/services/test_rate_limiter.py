@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from app.core import redis_loop_client
+from app.services import rate_limiter
+from app.workers.asyncio_runner import run_async_job
+
+
+class _ScriptRedis:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    def register_script(self, script: str) -> Any:
+        async def _run(*, keys: list[str], args: list[object]) -> list[object]:
+            if self.fail:
+                raise ConnectionError("redis went away")
+            return [0, "0"]
+
+        return _run
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiter_state() -> Iterator[None]:
+    rate_limiter._MEMORY_HITS.clear()
+    redis_loop_client._CLIENTS.clear()
+    redis_loop_client._redis_retry_at = 0.0
+    yield
+    rate_limiter._MEMORY_HITS.clear()
+    redis_loop_client._CLIENTS.clear()
+    redis_loop_client._redis_retry_at = 0.0
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_memory_and_backs_off_when_redis_is_unreachable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connects: list[str] = []
+
+    def _from_url(url: str, **kwargs: object) -> object:
+        connects.append(url)
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(redis_loop_client.redis, "from_url", _from_url)
+
+    first = await rate_limiter.record_hit(key="k", window_seconds=60, now=100.0)
+    second = await rate_limiter.record_hit(key="k", window_seconds=60, now=101.0)
+
+    assert (first.count, second.count, second.newest_at) == (1, 2, 101.0)
+    assert len(connects) == 1
+
+
+@pytest.mark.asyncio
+async def test_script_error_drops_client_and_uses_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _ScriptRedis(fail=True)
+    monkeypatch.setattr(redis_loop_client.redis, "from_url", lambda url, **kwargs: client)
+
+    usage = await rate_limiter.record_hit(key="k", window_seconds=60, now=100.0)
+
+    assert usage.count == 1
+    assert redis_loop_client._CLIENTS.get(asyncio.get_running_loop()) is None
+    assert redis_loop_client._redis_retry_at > 0
+    assert client.closed
+
+
+def test_celery_job_closes_its_client_when_the_loop_ends(monkeypatch: pytest.MonkeyPatch) -> None:
+    clients: list[_ScriptRedis] = []
+
+    def _from_url(url: str, **kwargs: object) -> _ScriptRedis:
+        clients.append(_ScriptRedis())
+        return clients[-1]
+
+    async def _job() -> rate_limiter.WindowUsage:
+        await rate_limiter.get_window_usage(key="k", window_seconds=60, now=100.0)
+        return await rate_limiter.get_window_usage(key="k", window_seconds=60, now=101.0)
+
+    monkeypatch.setattr(redis_loop_client.redis, "from_url", _from_url)
+
+    usage = run_async_job(_job())
+
+    assert usage.count == 0
+    assert len(clients) == 1
+    assert clients[0].closed
+    assert not redis_loop_client._CLIENTS
+
+
+@pytest.mark.asyncio
+async def test_window_usage_reports_newest_hit_inside_window() -> None:
+    redis_loop_client._redis_retry_at = float("inf")
+
+    await rate_limiter.record_hit(key="k", window_seconds=10, now=100.0)
+    await rate_limiter.record_hit(key="k", window_seconds=10, now=105.0)
+
+    usage = await rate_limiter.get_window_usage(key="k", window_seconds=10, now=112.0)
+    assert (usage.count, usage.newest_at) == (1, 105.0)
@@ -45,6 +45,7 @@ def test_all_m2_tables_registered() -> None:
         "quiz_attempts",
         "quiz_questions",
         "friend_challenges",
+        "friend_challenge_questions",
         "offers_impressions",
         "promo_codes",
         "promo_redemptions",
@@ -56,7 +57,11 @@ def test_all_m2_tables_registered() -> None:
         "analytics_daily",
         "daily_runs",
         "daily_push_logs",
+        "daily_push_shards",
+        "daily_push_targets",
         "daily_question_sets",
+        "dashboard_snapshots",
+        "ledger_balance_snapshots",
         "reconciliation_runs",
         "promo_code_batches",
     }
@@ -125,3 +125,56 @@ async def test_list_recent_for_user_ignores_tournament_duels() -> None:
 
     assert "friend_challenges.creator_user_id = 13" in sql
     assert "friend_challenges.tournament_match_id IS NULL" in sql
+
+
+class _MappingsResult:
+    def __init__(self, rows: list[dict[str, object]]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> list[dict[str, object]]:
+        return self._rows
+
+
+class _RecordingMappingsSession:
+    def __init__(self) -> None:
+        self.statement: object | None = None
+
+    async def execute(self, statement: object) -> _MappingsResult:
+        self.statement = statement
+        return _MappingsResult([{"id": "x", "status": "WALKOVER"}])
+
+
+async def test_walkover_sweep_is_one_partitioned_update_returning() -> None:
+    session = _RecordingMappingsSession()
+    now_utc = datetime(2026, 3, 7, tzinfo=timezone.utc)
+
+    rows = await FriendChallengesRepo.walkover_joined_due(
+        session, now_utc=now_utc, limit=50, partition_index=1, partition_count=4
+    )
+
+    assert rows == [{"id": "x", "status": "WALKOVER"}]
+    sql = _compile_sql(session.statement)
+    assert sql.startswith("WITH due AS")
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "friend_challenges.creator_user_id %% 4 = 1" in sql
+    assert "UPDATE friend_challenges SET status='WALKOVER'" in sql
+    assert "RETURNING friend_challenges.id" in sql and "due.previous_status" in sql
+
+
+async def test_last_chance_sweep_only_claims_duels_waiting_on_one_player() -> None:
+    session = _RecordingMappingsSession()
+    now_utc = datetime(2026, 3, 7, tzinfo=timezone.utc)
+
+    await FriendChallengesRepo.mark_last_chance_due(
+        session,
+        now_utc=now_utc,
+        expires_before_utc=now_utc,
+        max_push_per_user=2,
+        limit=10,
+    )
+
+    sql = _compile_sql(session.statement)
+    assert "friend_challenges.opponent_push_count < 2" in sql
+    assert "friend_challenges.status = 'CREATOR_DONE'" in sql
+    assert "friend_challenges.creator_user_id %%" not in sql
+    assert "AS target_user_id" in sql
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.methods import SendMessage
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.routes import metrics as metrics_routes
+from app.core.metrics import GAMEPLAY_OPERATION_SECONDS, observe_latency, timed_operation
+from app.main import app
+from app.services.telegram_api_metrics import TelegramApiMetricsMiddleware
+from app.workers.celery_metrics import compute_queue_lag_seconds
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_latency_labels_error_outcome() -> None:
+    labels = {"operation": "unit_test_error", "outcome": "error"}
+    before = _sample("quiz_arena_gameplay_operation_seconds_count", labels)
+
+    with pytest.raises(RuntimeError):
+        with observe_latency(GAMEPLAY_OPERATION_SECONDS, operation="unit_test_error"):
+            raise RuntimeError("boom")
+
+    assert _sample("quiz_arena_gameplay_operation_seconds_count", labels) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_timed_operation_records_ok_outcome_and_keeps_result() -> None:
+    labels = {"operation": "unit_test_ok", "outcome": "ok"}
+    before = _sample("quiz_arena_gameplay_operation_seconds_count", labels)
+
+    @timed_operation("unit_test_ok")
+    async def _operation(value: int) -> int:
+        return value * 2
+
+    assert await _operation(21) == 42
+    assert _sample("quiz_arena_gameplay_operation_seconds_count", labels) == before + 1
+
+
+def test_queue_lag_uses_enqueue_timestamp() -> None:
+    request = SimpleNamespace(enqueued_at=100.0, eta=None)
+    assert compute_queue_lag_seconds(request, now_ts=102.5) == pytest.approx(2.5)
+
+
+def test_queue_lag_starts_counting_at_eta_for_countdown_tasks() -> None:
+    eta = datetime(2026, 2, 19, 12, 0, 10, tzinfo=timezone.utc)
+    request = SimpleNamespace(enqueued_at=eta.timestamp() - 60, eta=eta.isoformat())
+    assert compute_queue_lag_seconds(request, now_ts=eta.timestamp() + 1) == pytest.approx(1.0)
+
+
+def test_queue_lag_is_none_without_header() -> None:
+    assert compute_queue_lag_seconds(SimpleNamespace(), now_ts=1.0) is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_api_middleware_records_forbidden_outcome() -> None:
+    labels = {"method": "sendMessage", "outcome": "forbidden"}
+    before = _sample("quiz_arena_telegram_api_request_seconds_count", labels)
+    method = SendMessage(chat_id=1, text="hi")
+
+    async def _blocked(bot, method):  # noqa: ANN001
+        raise TelegramForbiddenError(method=method, message="Forbidden: bot was blocked")
+
+    with pytest.raises(TelegramForbiddenError):
+        await TelegramApiMetricsMiddleware()(_blocked, object(), method)  # type: ignore[arg-type]
+
+    assert _sample("quiz_arena_telegram_api_request_seconds_count", labels) == before + 1
+
+
+def _settings(allowlist: str) -> SimpleNamespace:
+    return SimpleNamespace(internal_api_allowlist=allowlist, internal_api_trusted_proxies="")
+
+
+def test_metrics_endpoint_exposes_registry_to_allowlisted_ip(monkeypatch) -> None:
+    monkeypatch.setattr(metrics_routes, "get_settings", lambda: _settings("127.0.0.1/32"))
+
+    client = TestClient(app, client=("127.0.0.1", 50000))
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "quiz_arena_webhook_enqueue_seconds" in response.text
+    assert "quiz_arena_celery_task_queue_lag_seconds" in response.text
+
+
+def test_metrics_endpoint_rejects_disallowed_ip(monkeypatch) -> None:
+    monkeypatch.setattr(metrics_routes, "get_settings", lambda: _settings("10.0.0.0/8"))
+
+    client = TestClient(app, client=("127.0.0.1", 50000))
+    response = client.get("/metrics")
+
+    assert response.status_code == 403
+    assert response.json() == {"detail": {"code": "E_FORBIDDEN"}}
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from aiogram.types import Update
+from sqlalchemy import Engine, create_engine, text
+
+from app.bot.query_profile_middleware import QueryProfileMiddleware, resolve_update_profile_label
+from app.db.query_profiler import (
+    SLOWEST_STATEMENTS_LIMIT,
+    QueryProfile,
+    add_profile_sink,
+    install_query_profiler,
+    profile_queries,
+    remove_profile_sink,
+)
+from tests.query_budget_plugin import QueryBudget, find_budget_violations
+
+
+@pytest.fixture
+def sqlite_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    install_query_profiler(engine)
+    yield engine
+    engine.dispose()
+
+
+def _run_statements(engine: Engine, count: int) -> None:
+    with engine.connect() as conn:
+        for index in range(count):
+            conn.execute(text(f"SELECT {index}"))
+
+
+def _update(payload: dict[str, object]) -> Update:
+    return Update.model_validate({"update_id": 1, **payload})
+
+
+def _callback_update(data: str) -> Update:
+    return _update(
+        {
+            "callback_query": {
+                "id": "cb-1",
+                "from": {"id": 7, "is_bot": False, "first_name": "Test"},
+                "chat_instance": "ci",
+                "data": data,
+            }
+        }
+    )
+
+
+def test_profile_counts_statements_and_keeps_slowest(sqlite_engine: Engine) -> None:
+    with profile_queries("unit", emit_log=False) as profile:
+        _run_statements(sqlite_engine, 5)
+
+    assert profile.statement_count == 5
+    assert profile.total_db_ms > 0
+    assert len(profile.slowest) == SLOWEST_STATEMENTS_LIMIT
+    durations = [item.duration_ms for item in profile.slowest]
+    assert durations == sorted(durations, reverse=True)
+
+
+def test_nested_profiles_both_receive_statements(sqlite_engine: Engine) -> None:
+    with profile_queries("outer", emit_log=False) as outer:
+        _run_statements(sqlite_engine, 1)
+        with profile_queries("inner", emit_log=False) as inner:
+            _run_statements(sqlite_engine, 2)
+
+    assert inner.statement_count == 2
+    assert outer.statement_count == 3
+
+
+def test_statements_outside_profile_are_ignored(sqlite_engine: Engine) -> None:
+    _run_statements(sqlite_engine, 2)
+    with profile_queries("empty", emit_log=False) as profile:
+        pass
+    assert profile.statement_count == 0
+
+
+def test_update_label_uses_callback_prefix_without_ids() -> None:
+    assert resolve_update_profile_label(_callback_update("answer:3f2a:1")) == (
+        "callback_query:answer"
+    )
+    assert resolve_update_profile_label(_callback_update("friend:next:abc-1")) == (
+        "callback_query:friend:next"
+    )
+
+
+def test_update_label_uses_message_command() -> None:
+    update = _update(
+        {
+            "message": {
+                "message_id": 1,
+                "date": 0,
+                "chat": {"id": 7, "type": "private"},
+                "text": "/start ref_abc",
+            }
+        }
+    )
+    assert resolve_update_profile_label(update) == "message:/start"
+
+
+@pytest.mark.asyncio
+async def test_middleware_reports_profile_to_sinks(sqlite_engine: Engine) -> None:
+    captured: list[QueryProfile] = []
+    add_profile_sink(captured.append)
+
+    async def _handler(event, data):  # noqa: ANN001
+        _run_statements(sqlite_engine, 3)
+        return "handled"
+
+    try:
+        result = await QueryProfileMiddleware()(_handler, _callback_update("home:play"), {})
+    finally:
+        remove_profile_sink(captured.append)
+
+    assert result == "handled"
+    assert [(item.label, item.statement_count) for item in captured] == [
+        ("callback_query:home:play", 3)
+    ]
+
+
+def test_budget_violations_report_only_profiles_over_budget() -> None:
+    within = QueryProfile(label="ok", statement_count=4, total_db_ms=1.0)
+    over_count = QueryProfile(label="count", statement_count=9, total_db_ms=1.0)
+    over_time = QueryProfile(label="time", statement_count=1, total_db_ms=50.0)
+
+    violations = find_budget_violations(
+        [within, over_count, over_time],
+        QueryBudget(max_statements=5, max_db_ms=20.0),
+    )
+
+    assert [item.label for item in violations] == ["count", "time"]
+
+
+@pytest.mark.query_budget(max_statements=2)
+def test_query_budget_marker_applies_to_handler_scopes(sqlite_engine: Engine) -> None:
+    _run_statements(sqlite_engine, 5)
+    with profile_queries("handler", emit_log=False):
+        _run_statements(sqlite_engine, 2)
+
+
+def test_query_budget_marker_fails_handler_over_budget(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+        import pytest
+        from sqlalchemy import create_engine, text
+
+        from app.db.query_profiler import install_query_profiler, profile_queries
+
+
+        @pytest.mark.query_budget(max_statements=2)
+        def test_handler_over_budget():
+            engine = create_engine("sqlite://")
+            install_query_profiler(engine)
+            with profile_queries("callback_query:home:play", emit_log=False):
+                with engine.connect() as conn:
+                    for index in range(3):
+                        conn.execute(text(f"SELECT {index}"))
+        """
+    )
+
+    result = pytester.runpytest_inprocess("-p", "tests.query_budget_plugin", "-p", "no:asyncio")
+
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*SQL query budget exceeded (max_statements=2*",
+            "*callback_query:home:play: 3 statements*",
+        ]
+    )
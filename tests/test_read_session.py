@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.db.read_session import ReadSessionRouter
+
+
+class _FakeSession:
+    def __init__(self, name: str, *, lag_seconds: float | Exception = 0.0) -> None:
+        self.name = name
+        self.lag_seconds = lag_seconds
+        self.statements: list[str] = []
+
+    async def execute(self, statement) -> None:
+        self.statements.append(str(statement))
+
+    async def scalar(self, statement) -> float:
+        self.statements.append(str(statement))
+        if isinstance(self.lag_seconds, Exception):
+            raise self.lag_seconds
+        return self.lag_seconds
+
+
+class _FakeMaker:
+    def __init__(self, session: _FakeSession) -> None:
+        self.session = session
+        self.begins = 0
+        self.lag_checks = 0
+
+    @asynccontextmanager
+    async def begin(self):
+        self.begins += 1
+        yield self.session
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.lag_checks += 1
+        yield self.session
+
+
+def _router(
+    primary: _FakeMaker, replica: _FakeMaker | None, *, check_interval_seconds: float = 60.0
+) -> ReadSessionRouter:
+    return ReadSessionRouter(
+        primary=lambda: primary,  # type: ignore[arg-type,return-value]
+        replica=lambda: replica,  # type: ignore[arg-type,return-value]
+        max_lag_seconds=30.0,
+        check_interval_seconds=check_interval_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_and_lag_check_is_cached() -> None:
+    primary = _FakeMaker(_FakeSession("primary"))
+    replica = _FakeMaker(_FakeSession("replica", lag_seconds=1.5))
+    router = _router(primary, replica)
+
+    for _ in range(3):
+        async with router.begin() as session:
+            assert session.name == "replica"
+
+    assert replica.begins == 3
+    assert replica.lag_checks == 1
+    assert primary.begins == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lag_seconds", [120.0, ConnectionRefusedError("replica down")])
+async def test_lagging_or_unreachable_replica_falls_back_to_read_only_primary(
+    lag_seconds: float | Exception,
+) -> None:
+    primary = _FakeMaker(_FakeSession("primary"))
+    replica = _FakeMaker(_FakeSession("replica", lag_seconds=lag_seconds))
+    router = _router(primary, replica)
+
+    async with router.begin() as session:
+        assert session.name == "primary"
+
+    assert replica.begins == 0
+    assert primary.session.statements == ["SET TRANSACTION READ ONLY"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lag_seconds", [1.0, 120.0], ids=["replica", "primary_fallback"])
+async def test_repeatable_read_is_set_before_the_first_query(lag_seconds: float) -> None:
+    primary = _FakeMaker(_FakeSession("primary"))
+    replica = _FakeMaker(_FakeSession("replica", lag_seconds=lag_seconds))
+    router = _router(primary, replica)
+
+    async with router.begin(repeatable_read=True) as session:
+        statements = list(session.statements)
+
+    assert statements[-1] == "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+
+
+@pytest.mark.asyncio
+async def test_replica_is_used_again_once_it_catches_up() -> None:
+    primary = _FakeMaker(_FakeSession("primary"))
+    replica = _FakeMaker(_FakeSession("replica", lag_seconds=120.0))
+    router = _router(primary, replica, check_interval_seconds=0.0)
+
+    async with router.begin() as session:
+        assert session.name == "primary"
+    replica.session.lag_seconds = 2.0
+    async with router.begin() as session:
+        assert session.name == "replica"
+
+    assert replica.lag_checks == 2
+
+
+@pytest.mark.asyncio
+async def test_without_replica_every_read_is_read_only_on_primary() -> None:
+    primary = _FakeMaker(_FakeSession("primary"))
+    router = _router(primary, None)
+
+    async with router.begin() as session:
+        assert session.name == "primary"
+
+    assert primary.session.statements == ["SET TRANSACTION READ ONLY"]
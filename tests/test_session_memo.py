@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import UnboundExecutionError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.models.entitlements import Entitlement
+from app.db.repo.entitlements_repo import EntitlementsRepo
+from app.db.repo.users_repo import UsersRepo
+from app.db.session_memo import MEMO_INFO_KEY, get_session_memo
+
+UTC = timezone.utc
+NOW_UTC = datetime(2026, 2, 19, 12, 0, tzinfo=UTC)
+
+
+class _Result:
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def one_or_none(self) -> object:
+        return self._value
+
+    def scalar_one_or_none(self) -> object:
+        return self._value
+
+
+class _CountingSession:
+    def __init__(self, result: object) -> None:
+        self.info: dict[str, object] = {}
+        self.statements: list[object] = []
+        self.identity_map: dict[int, object] = {}
+        self._result = result
+
+    async def execute(self, statement: object) -> _Result:
+        self.statements.append(statement)
+        return _Result(self._result)
+
+    async def get(self, model: object, ident: int) -> object:
+        return self.identity_map.get(ident)
+
+
+def _db(session: _CountingSession) -> AsyncSession:
+    return cast(AsyncSession, session)
+
+
+def _premium_row(*, ends_at: datetime | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        scope="premium_month", starts_at=NOW_UTC - timedelta(days=1), ends_at=ends_at
+    )
+
+
+@pytest.mark.asyncio
+async def test_premium_lookups_hit_database_once_per_transaction() -> None:
+    session = _CountingSession(_premium_row(ends_at=NOW_UTC + timedelta(days=5)))
+
+    assert await EntitlementsRepo.has_active_premium(_db(session), 7, NOW_UTC) is True
+    scope = await EntitlementsRepo.get_active_premium_scope(
+        _db(session), 7, NOW_UTC + timedelta(seconds=1)
+    )
+    assert scope == "premium_month"
+    assert await EntitlementsRepo.has_active_premium(
+        _db(session), 7, NOW_UTC + timedelta(seconds=2)
+    )
+
+    assert len(session.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_memoized_premium_window_expires_within_transaction() -> None:
+    session = _CountingSession(_premium_row(ends_at=NOW_UTC + timedelta(seconds=1)))
+
+    assert await EntitlementsRepo.has_active_premium(_db(session), 7, NOW_UTC) is True
+    assert (
+        await EntitlementsRepo.has_active_premium(_db(session), 7, NOW_UTC + timedelta(seconds=5))
+        is False
+    )
+    assert len(session.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_premium_lookup_before_memoized_instant_queries_again() -> None:
+    session = _CountingSession(None)
+
+    assert await EntitlementsRepo.has_active_premium(_db(session), 7, NOW_UTC) is False
+    await EntitlementsRepo.has_active_premium(_db(session), 7, NOW_UTC - timedelta(minutes=1))
+
+    assert len(session.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_user_lookup_by_telegram_id_reuses_identity_map() -> None:
+    user = SimpleNamespace(id=42, telegram_user_id=1001)
+    session = _CountingSession(user)
+    session.identity_map[42] = user
+
+    first = await UsersRepo.get_by_telegram_user_id(_db(session), 1001)
+    second = await UsersRepo.get_by_telegram_user_id(_db(session), 1001)
+
+    assert first is second is user
+    assert len(session.statements) == 1
+
+
+def _session_with_premium_memo() -> Session:
+    session = Session()
+    memo = get_session_memo(session)
+    assert memo is not None
+    memo.premium_by_user_id[7] = object()  # type: ignore[assignment]
+    memo.user_id_by_telegram_id[1001] = 7
+    return session
+
+
+def test_pending_entitlement_flush_invalidates_premium_memo() -> None:
+    session = _session_with_premium_memo()
+    session.add(
+        Entitlement(user_id=7, entitlement_type="PREMIUM", status="ACTIVE", starts_at=NOW_UTC)
+    )
+
+    session.dispatch.before_flush(session, None, None)
+
+    memo = get_session_memo(session)
+    assert memo is not None
+    assert memo.premium_by_user_id == {}
+    assert memo.user_id_by_telegram_id == {1001: 7}
+
+
+def test_entitlement_bulk_update_invalidates_premium_memo() -> None:
+    session = _session_with_premium_memo()
+
+    with pytest.raises(UnboundExecutionError):
+        # No bind: the ORM hook runs before the connection is resolved.
+        session.execute(update(Entitlement).values(status="REVOKED"))
+
+    memo = get_session_memo(session)
+    assert memo is not None
+    assert memo.premium_by_user_id == {}
+
+
+def test_transaction_end_drops_memo() -> None:
+    session = _session_with_premium_memo()
+
+    session.dispatch.after_commit(session)
+
+    assert MEMO_INFO_KEY not in session.info
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Tools run as standalone scripts with sibling imports; mirror that for their tests.
+TOOLS_DIR = Path(__file__).resolve().parents[2] / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
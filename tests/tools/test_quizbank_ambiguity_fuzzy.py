@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+
+from quizbank_ambiguity_fuzzy import (
+    FUZZY_SCORE_CUTOFF,
+    FuzzyItem,
+    candidate_pairs,
+    find_fuzzy_conflicts,
+    max_indel_distance,
+)
+from rapidfuzz import fuzz
+
+BASE_QUESTIONS = [
+    "Ich gehe morgen ___ die Schule.",
+    "Er wohnt seit zwei Jahren ___ Berlin.",
+    "Wir treffen uns um acht Uhr ___ Bahnhof.",
+    "Kannst du mir bitte ___ Salz geben?",
+]
+
+
+def _mutate(rng: random.Random, question: str) -> str:
+    chars = list(question)
+    for _ in range(rng.randint(0, 3)):
+        position = rng.randrange(len(chars))
+        roll = rng.random()
+        if roll < 0.4:
+            chars.insert(position, rng.choice("abcde "))
+        elif roll < 0.8 and len(chars) > 1:
+            del chars[position]
+        else:
+            chars[position] = rng.choice("xyz")
+    return "".join(chars)
+
+
+def _random_bank(size: int, *, seed: int) -> list[FuzzyItem]:
+    rng = random.Random(seed)
+    return [
+        FuzzyItem(
+            file=f"Bank_{index % 3}.csv",
+            row=index + 2,
+            question=_mutate(rng, rng.choice(BASE_QUESTIONS)),
+            answer=rng.choice(["am", "in", "zur", "das"]),
+        )
+        for index in range(size)
+    ]
+
+
+def _brute_force(items: list[FuzzyItem], *, cross_file_only: bool) -> list[tuple[int, int]]:
+    return [
+        (left, right)
+        for left in range(len(items))
+        for right in range(left + 1, len(items))
+        if items[left].answer != items[right].answer
+        and not (cross_file_only and items[left].file == items[right].file)
+        and fuzz.ratio(items[left].question, items[right].question) >= FUZZY_SCORE_CUTOFF
+    ]
+
+
+def test_blocked_search_matches_full_pairwise_scan() -> None:
+    items = _random_bank(400, seed=7)
+
+    conflicts = find_fuzzy_conflicts(items)
+
+    assert [(left, right) for left, right, _ in conflicts] == _brute_force(
+        items, cross_file_only=False
+    )
+    assert all(score >= FUZZY_SCORE_CUTOFF for _, _, score in conflicts)
+
+
+def test_cross_file_only_skips_pairs_within_one_file() -> None:
+    items = _random_bank(300, seed=11)
+
+    conflicts = find_fuzzy_conflicts(items, cross_file_only=True)
+
+    expected = _brute_force(items, cross_file_only=True)
+    assert expected
+    assert [(left, right) for left, right, _ in conflicts] == expected
+
+
+def test_blocking_prunes_unrelated_questions() -> None:
+    items = [
+        FuzzyItem(file="A.csv", row=2, question="Ich gehe morgen ___ die Schule.", answer="in"),
+        FuzzyItem(file="B.csv", row=2, question="Ich gehe morgen ___ die Schule!", answer="zur"),
+        FuzzyItem(file="B.csv", row=3, question="Wo ist der Bahnhof hier ___?", answer="bitte"),
+    ]
+
+    assert candidate_pairs(items) == [(0, 1)]
+    assert max_indel_distance(len(items[0].question)) == 2
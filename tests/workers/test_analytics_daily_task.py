@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
 from app.workers.tasks import analytics_daily
 
 
@@ -9,3 +12,38 @@ def test_run_analytics_daily_aggregation_task_wrapper(monkeypatch) -> None:
 
     result = analytics_daily.run_analytics_daily_aggregation(days_back=3)
     assert result == {"days_processed": 3, "local_days_berlin": ["2026-02-20"]}
+
+
+async def test_daily_aggregation_builds_on_read_session_and_upserts_on_primary(monkeypatch) -> None:
+    calls: list[tuple[str, str]] = []
+
+    def _maker(name: str) -> SimpleNamespace:
+        @asynccontextmanager
+        async def _begin():
+            yield name
+
+        return SimpleNamespace(begin=_begin)
+
+    async def fake_build(session, *, local_date_berlin, now_utc):
+        del now_utc
+        calls.append(("build", session))
+        return SimpleNamespace(row={"local_date_berlin": local_date_berlin})
+
+    async def fake_upsert(session, *, row) -> None:
+        del row
+        calls.append(("upsert", session))
+
+    monkeypatch.setattr(analytics_daily, "ReadSessionLocal", _maker("read"))
+    monkeypatch.setattr(analytics_daily, "SessionLocal", _maker("primary"))
+    monkeypatch.setattr(analytics_daily, "build_daily_snapshot", fake_build)
+    monkeypatch.setattr(analytics_daily.AnalyticsRepo, "upsert_daily", fake_upsert)
+
+    result = await analytics_daily.run_analytics_daily_aggregation_async(days_back=2)
+
+    assert result["days_processed"] == 2
+    assert calls == [
+        ("build", "read"),
+        ("build", "read"),
+        ("upsert", "primary"),
+        ("upsert", "primary"),
+    ]
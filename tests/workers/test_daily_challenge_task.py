@@ -12,7 +12,8 @@ def test_run_daily_question_set_precompute_task_wrapper(monkeypatch) -> None:
 
 
 def test_run_daily_push_notifications_task_wrapper(monkeypatch) -> None:
-    async def fake_async(*, batch_size: int, push_kind: str) -> dict[str, object]:
+    async def fake_async(*, batch_size: int, push_kind: str, dispatch_shard) -> dict[str, object]:
+        dispatch_shard(berlin_date="2026-02-26", push_kind=push_kind, shard_index=0, batch_size=50)
         return {
             "batch_size": batch_size,
             "push_kind": push_kind,
@@ -20,7 +21,13 @@ def test_run_daily_push_notifications_task_wrapper(monkeypatch) -> None:
             "skipped_total": 1,
         }
 
+    enqueued: list[dict[str, object]] = []
     monkeypatch.setattr(daily_challenge, "run_daily_push_notifications_async", fake_async)
+    monkeypatch.setattr(
+        daily_challenge.run_daily_push_shard,
+        "apply_async",
+        lambda *, kwargs, queue: enqueued.append({"queue": queue, **kwargs}),
+    )
 
     result = daily_challenge.run_daily_push_notifications(batch_size=50)
     assert result == {
@@ -29,3 +36,26 @@ def test_run_daily_push_notifications_task_wrapper(monkeypatch) -> None:
         "sent_total": 5,
         "skipped_total": 1,
     }
+    assert enqueued == [
+        {
+            "queue": "q_low",
+            "berlin_date": "2026-02-26",
+            "push_kind": "MORNING",
+            "shard_index": 0,
+            "batch_size": 50,
+        }
+    ]
+
+
+def test_run_daily_push_shard_task_wrapper(monkeypatch) -> None:
+    async def fake_async(
+        *, berlin_date: str, push_kind: str, shard_index: int, batch_size: int
+    ) -> dict[str, object]:
+        return {"berlin_date": berlin_date, "shard_index": shard_index, "sent_total": 3}
+
+    monkeypatch.setattr(daily_challenge, "run_daily_push_shard_async", fake_async)
+
+    result = daily_challenge.run_daily_push_shard(
+        berlin_date="2026-02-26", push_kind="MORNING", shard_index=2
+    )
+    assert result == {"berlin_date": "2026-02-26", "shard_index": 2, "sent_total": 3}
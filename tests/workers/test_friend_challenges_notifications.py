@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
-from aiogram.exceptions import TelegramForbiddenError
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
 from aiogram.methods import SendMessage
 
 from app.workers.tasks import friend_challenges_notifications
@@ -62,3 +63,73 @@ async def test_send_deadline_notifications_walkover_with_blocked_user_does_not_c
     assert expired_sent == 0
     assert expired_failed == 2
     assert events[0]["status"] == "WALKOVER"
+
+
+class _SlowBot:
+    def __init__(self) -> None:
+        self.session = _DummyBotSession()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.flooded_once: set[int] = set()
+        self.sent: list[int] = []
+
+    async def send_message(self, *, chat_id: int, **kwargs):
+        del kwargs
+        if chat_id == 30 and chat_id not in self.flooded_once:
+            self.flooded_once.add(chat_id)
+            raise TelegramRetryAfter(
+                method=SendMessage(chat_id=chat_id, text="x"),
+                message="flood",
+                retry_after=0,
+            )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.sent.append(chat_id)
+
+
+@pytest.mark.asyncio
+async def test_send_deadline_notifications_sends_concurrently_and_retries_flood_once(
+    monkeypatch,
+) -> None:
+    bot = _SlowBot()
+
+    async def _fake_resolve_targets(user_ids):
+        return {user_id: user_id for user_id in user_ids}
+
+    monkeypatch.setattr(friend_challenges_notifications, "build_bot", lambda: bot)
+    monkeypatch.setattr(
+        friend_challenges_notifications,
+        "resolve_telegram_targets",
+        _fake_resolve_targets,
+    )
+    now_utc = datetime.now(timezone.utc)
+    expired_items: list[dict[str, object]] = [
+        {
+            "challenge_id": f"challenge-{creator}",
+            "creator_user_id": creator,
+            "opponent_user_id": creator + 1,
+            "creator_score": 1,
+            "opponent_score": 0,
+            "status": "WALKOVER",
+            "previous_status": "CREATOR_DONE",
+        }
+        for creator in (10, 20, 30)
+    ]
+
+    result = await friend_challenges_notifications.send_deadline_notifications(
+        now_utc=now_utc,
+        reminder_items=[
+            {"challenge_id": "c-r", "target_user_id": 40, "expires_at": now_utc},
+        ],
+        expired_items=expired_items,
+        concurrency=3,
+    )
+
+    reminders_sent, reminders_failed, expired_sent, expired_failed, reminders, events = result
+    assert (reminders_sent, reminders_failed, expired_sent, expired_failed) == (1, 0, 6, 0)
+    assert bot.max_in_flight == 3
+    assert sorted(bot.sent) == [10, 11, 20, 21, 30, 31, 40]
+    assert reminders[0]["sent_to"] == 1
+    assert [event["sent_to"] for event in events] == [2, 2, 2]
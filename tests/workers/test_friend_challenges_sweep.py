@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.workers.tasks import friend_challenges_async
+
+
+class _AsyncBeginContext:
+    async def __aenter__(self) -> object:
+        return object()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        del exc_type, exc, tb
+        return None
+
+
+def _walkover_row(index: int) -> dict[str, object]:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "status": "WALKOVER",
+        "previous_status": "CREATOR_DONE",
+        "creator_user_id": index,
+        "opponent_user_id": index + 1000,
+        "creator_score": 3,
+        "opponent_score": 0,
+        "total_rounds": 5,
+        "winner_user_id": index,
+        "expires_at": datetime(2026, 3, 7, tzinfo=timezone.utc) - timedelta(minutes=1),
+    }
+
+
+@pytest.mark.asyncio
+async def test_deadline_sweep_drains_full_batches_with_bulk_events(monkeypatch) -> None:
+    walkover_batches = [[_walkover_row(1), _walkover_row(2)], [_walkover_row(3)]]
+    partitions: list[tuple[int, int]] = []
+    emitted: list[tuple[str, int]] = []
+    notified_batches: list[int] = []
+
+    async def _no_rows(session, **kwargs):
+        del session, kwargs
+        return []
+
+    async def _walkover(session, **kwargs):
+        del session
+        partitions.append((kwargs["partition_index"], kwargs["partition_count"]))
+        return walkover_batches.pop(0) if walkover_batches else []
+
+    async def _emit(session, *, event_type, payloads, **kwargs):
+        del session, kwargs
+        emitted.append((event_type, len(payloads)))
+        return len(payloads)
+
+    async def _notify(*, now_utc, reminder_items, expired_items):
+        del now_utc, reminder_items
+        notified_batches.append(len(expired_items))
+        events = [{"challenge_id": item["challenge_id"]} for item in expired_items]
+        return 0, 0, 2 * len(expired_items), 0, [], events
+
+    monkeypatch.setattr(
+        friend_challenges_async, "SessionLocal", SimpleNamespace(begin=_AsyncBeginContext)
+    )
+    monkeypatch.setattr(
+        friend_challenges_async,
+        "FriendChallengesRepo",
+        SimpleNamespace(
+            mark_last_chance_due=_no_rows,
+            expire_pending_due=_no_rows,
+            walkover_joined_due=_walkover,
+        ),
+    )
+    monkeypatch.setattr(friend_challenges_async, "emit_analytics_events", _emit)
+    monkeypatch.setattr(friend_challenges_async, "send_deadline_notifications", _notify)
+
+    result = await friend_challenges_async.run_friend_challenge_deadlines_async(
+        batch_size=2, partition_index=5, partition_count=4
+    )
+
+    assert result["batches"] == 2
+    assert result["expired_total"] == 3
+    assert result["expired_notice_sent_total"] == 6
+    assert result["partition_index"] == 1
+    assert partitions == [(1, 4), (1, 4)]
+    assert notified_batches == [2, 1]
+    assert ("duel_expired", 2) in emitted and ("duel_expired", 1) in emitted
+    assert ("friend_challenge_expired_notice_sent", 2) in emitted
+
+
+@pytest.mark.asyncio
+async def test_deadline_sweep_stops_at_max_batches(monkeypatch) -> None:
+    calls: list[int] = []
+
+    async def _always_full(session, **kwargs):
+        del session
+        calls.append(kwargs["limit"])
+        return [_walkover_row(len(calls))]
+
+    async def _no_rows(session, **kwargs):
+        del session, kwargs
+        return []
+
+    async def _emit(session, **kwargs):
+        del session, kwargs
+        return 0
+
+    async def _notify(*, now_utc, reminder_items, expired_items):
+        del now_utc, reminder_items, expired_items
+        return 0, 0, 0, 0, [], []
+
+    monkeypatch.setattr(
+        friend_challenges_async, "SessionLocal", SimpleNamespace(begin=_AsyncBeginContext)
+    )
+    monkeypatch.setattr(
+        friend_challenges_async,
+        "FriendChallengesRepo",
+        SimpleNamespace(
+            mark_last_chance_due=_no_rows,
+            expire_pending_due=_no_rows,
+            walkover_joined_due=_always_full,
+        ),
+    )
+    monkeypatch.setattr(friend_challenges_async, "emit_analytics_events", _emit)
+    monkeypatch.setattr(friend_challenges_async, "send_deadline_notifications", _notify)
+
+    result = await friend_challenges_async.run_friend_challenge_deadlines_async(
+        batch_size=1, max_batches=3
+    )
+
+    assert result["batches"] == 3
+    assert calls == [1, 1, 1]
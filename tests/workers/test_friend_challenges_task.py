@@ -2,9 +2,13 @@ from app.workers.tasks import friend_challenges
 
 
 def test_run_friend_challenge_deadlines_task_wrapper(monkeypatch) -> None:
-    async def fake_async(*, batch_size: int) -> dict[str, int]:
+    async def fake_async(
+        *, batch_size: int, partition_index: int, partition_count: int
+    ) -> dict[str, int]:
         return {
             "batch_size": batch_size,
+            "partition_index": partition_index,
+            "partition_count": partition_count,
             "last_chance_queued_total": 2,
             "expired_total": 1,
             "last_chance_sent_total": 2,
@@ -18,6 +22,28 @@ def test_run_friend_challenge_deadlines_task_wrapper(monkeypatch) -> None:
     result = friend_challenges.run_friend_challenge_deadlines(batch_size=7)
     assert result["batch_size"] == 7
     assert result["last_chance_queued_total"] == 2
+    assert (result["partition_index"], result["partition_count"]) == (0, 1)
+
+
+def test_run_friend_challenge_deadlines_fans_out_extra_partitions(monkeypatch) -> None:
+    async def fake_async(
+        *, batch_size: int, partition_index: int, partition_count: int
+    ) -> dict[str, int]:
+        return {"partition_index": partition_index, "partition_count": partition_count}
+
+    dispatched: list[dict[str, int]] = []
+    monkeypatch.setattr(friend_challenges, "run_friend_challenge_deadlines_async", fake_async)
+    monkeypatch.setattr(
+        friend_challenges,
+        "_dispatch_deadline_partition",
+        lambda **kwargs: dispatched.append(kwargs),
+    )
+
+    result = friend_challenges.run_friend_challenge_deadlines(batch_size=5, partition_count=3)
+
+    assert result == {"partition_index": 0, "partition_count": 3}
+    assert [item["partition_index"] for item in dispatched] == [1, 2]
+    assert all(item["partition_count"] == 3 for item in dispatched)
 
 
 def test_format_remaining_hhmm_clamps_negative_values() -> None:
@@ -62,3 +62,13 @@ def test_run_payments_reconciliation_task_wrapper(monkeypatch) -> None:
     result = payments_reliability.run_payments_reconciliation(stale_minutes=30)
     assert result["paid_purchases_count"] == 30
     assert result["status"] == "OK"
+
+
+def test_check_ledger_snapshots_task_wrapper(monkeypatch) -> None:
+    async def fake_async(*, repair: bool) -> dict[str, int]:
+        return {"drift_rows": 2, "repaired_rows": 5 if repair else 0}
+
+    monkeypatch.setattr(payments_reliability, "check_ledger_snapshots_async", fake_async)
+
+    result = payments_reliability.check_ledger_snapshots(repair=True)
+    assert result == {"drift_rows": 2, "repaired_rows": 5}
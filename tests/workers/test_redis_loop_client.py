@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from app.core import redis_loop_client
+from app.game.tournaments import daily_cup_status_redis
+from app.services import rate_limiter
+from app.workers.asyncio_runner import run_async_job
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    async def incr(self, key: str) -> int:
+        del key
+        return 1
+
+    async def delete(self, key: str) -> None:
+        del key
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients() -> Iterator[None]:
+    redis_loop_client._CLIENTS.clear()
+    redis_loop_client._redis_retry_at = 0.0
+    yield
+    redis_loop_client._CLIENTS.clear()
+    redis_loop_client._redis_retry_at = 0.0
+
+
+def test_job_shares_one_client_across_redis_helpers_and_closes_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clients: list[_Redis] = []
+
+    def _from_url(url: str, **kwargs: object) -> _Redis:
+        clients.append(_Redis())
+        return clients[-1]
+
+    async def _job() -> None:
+        await rate_limiter.clear_hits(key="k")
+        await daily_cup_status_redis.bump_generation()
+
+    monkeypatch.setattr(redis_loop_client.redis, "from_url", _from_url)
+
+    run_async_job(_job())
+
+    assert len(clients) == 1
+    assert clients[0].closed
+    assert not redis_loop_client._CLIENTS
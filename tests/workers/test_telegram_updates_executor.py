@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.workers.tasks import telegram_updates, telegram_updates_executor
+from app.workers.tasks import telegram_updates_processing as processing
+from app.workers.tasks.telegram_updates_executor import (
+    ChatOrderedExecutor,
+    callback_tap_key,
+    submit_ordered_update,
+    update_chat_id,
+)
+
+_DATE = 1_772_100_000
+
+
+def _sender(user_id: int) -> dict[str, object]:
+    return {"id": user_id, "is_bot": False, "first_name": "Player"}
+
+
+def _message(update_id: int, chat_id: int, text: str = "/start") -> dict[str, object]:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": _DATE,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": _sender(chat_id),
+            "text": text,
+        },
+    }
+
+
+def _tap(update_id: int, chat_id: int, data: str, *, message_id: int = 500) -> dict[str, object]:
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": f"cb-{update_id}",
+            "from": _sender(chat_id),
+            "chat_instance": "ci",
+            "data": data,
+            "message": {
+                "message_id": message_id,
+                "date": _DATE,
+                "chat": {"id": chat_id, "type": "private"},
+            },
+        },
+    }
+
+
+class _FakeDispatcher:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, int]] = []
+
+    async def feed_update(self, bot, update) -> None:
+        del bot
+        self.events.append(("start", update.update_id))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", update.update_id))
+
+
+@pytest.fixture
+def fake_dispatcher(monkeypatch) -> tuple[_FakeDispatcher, list[int]]:
+    dispatcher = _FakeDispatcher()
+    processed: list[int] = []
+
+    async def _acquire(update_id: int, **kwargs) -> str:
+        del update_id, kwargs
+        return "created"
+
+    @asynccontextmanager
+    async def _begin():
+        yield object()
+
+    async def _set_status(session, *, update_id: int, status: str, processing_task_id) -> None:
+        del session, processing_task_id
+        assert status == "PROCESSED"
+        processed.append(update_id)
+
+    async def _close() -> None:
+        return None
+
+    monkeypatch.setattr(processing, "_acquire_processing_slot", _acquire)
+    monkeypatch.setattr(processing, "SessionLocal", SimpleNamespace(begin=_begin))
+    monkeypatch.setattr(processing.ProcessedUpdatesRepo, "set_status", _set_status)
+    monkeypatch.setattr(
+        telegram_updates,
+        "build_bot",
+        lambda: SimpleNamespace(session=SimpleNamespace(close=_close)),
+    )
+    monkeypatch.setattr(telegram_updates, "build_dispatcher", lambda: dispatcher)
+    return dispatcher, processed
+
+
+def test_update_keys_follow_chat_and_button() -> None:
+    assert update_chat_id(_message(1, 10)) == 10
+    assert update_chat_id(_tap(2, 11, "play")) == 11
+    assert update_chat_id({"inline_query": {"from": {"id": 12}}}) == 12
+    assert update_chat_id({"update_id": 3}) is None
+    assert callback_tap_key(_tap(2, 11, "play")) == (11, "500", "play")
+    assert callback_tap_key(_message(1, 10)) is None
+
+
+@pytest.mark.asyncio
+async def test_same_chat_runs_in_order_other_chats_overlap_and_double_taps_coalesce(
+    fake_dispatcher,
+) -> None:
+    dispatcher, processed = fake_dispatcher
+    payloads = [
+        _message(1, 10),
+        _tap(2, 10, "play"),
+        _tap(3, 10, "play"),
+        _tap(4, 10, "answer:1"),
+        _message(5, 20),
+    ]
+
+    outcomes = await asyncio.gather(
+        *(
+            submit_ordered_update(
+                payload,
+                lambda payload=payload: processing.process_update_async(
+                    payload, update_id=int(payload["update_id"])
+                ),
+            )
+            for payload in payloads
+        )
+    )
+
+    assert outcomes == ["processed", "processed", "coalesced", "processed", "processed"]
+    assert sorted(processed) == [1, 2, 4, 5]
+    chat_10 = [event for event in dispatcher.events if event[1] != 5]
+    assert chat_10 == [
+        ("start", 1),
+        ("end", 1),
+        ("start", 2),
+        ("end", 2),
+        ("start", 4),
+        ("end", 4),
+    ]
+    assert dispatcher.events.index(("start", 5)) < dispatcher.events.index(("end", 1))
+
+
+@pytest.mark.asyncio
+async def test_repeated_tap_after_completion_runs_again_and_cancelled_wait_keeps_order() -> None:
+    executor = ChatOrderedExecutor()
+    events: list[str] = []
+    release = asyncio.Event()
+
+    async def _job(name: str, *, wait: bool = False) -> str:
+        events.append(f"start:{name}")
+        if wait:
+            await release.wait()
+        events.append(f"end:{name}")
+        return name
+
+    assert await executor.submit(_tap(1, 7, "play"), lambda: _job("a")) == "a"
+    assert await executor.submit(_tap(2, 7, "play"), lambda: _job("b")) == "b"
+
+    running = asyncio.create_task(executor.submit(_message(3, 7), lambda: _job("c", wait=True)))
+    queued = asyncio.create_task(executor.submit(_message(4, 7), lambda: _job("d")))
+    await asyncio.sleep(0)
+    queued.cancel()
+    after = asyncio.create_task(executor.submit(_message(5, 7), lambda: _job("e")))
+    await asyncio.sleep(0.01)
+    assert "start:e" not in events
+
+    release.set()
+    assert await running == "c"
+    assert await after == "e"
+    assert queued.cancelled()
+    assert events == [
+        "start:a",
+        "end:a",
+        "start:b",
+        "end:b",
+        "start:c",
+        "end:c",
+        "start:e",
+        "end:e",
+    ]
+
+
+def test_executor_mode_runs_every_task_on_one_shared_loop(monkeypatch) -> None:
+    async def _dispose() -> None:
+        return None
+
+    monkeypatch.setattr(
+        telegram_updates_executor,
+        "get_settings",
+        lambda: SimpleNamespace(telegram_updates_executor_enabled=True),
+    )
+    monkeypatch.setattr(telegram_updates_executor, "dispose_engine", _dispose)
+    monkeypatch.setattr(
+        telegram_updates_executor, "_LOOP_THREAD", telegram_updates_executor._ExecutorLoopThread()
+    )
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def _record() -> str:
+        loops.append(asyncio.get_running_loop())
+        return threading.current_thread().name
+
+    threads = [
+        threading.Thread(target=lambda: telegram_updates_executor.run_update_job(_record()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loops) == 4
+    assert len(set(loops)) == 1
+    assert telegram_updates_executor.run_update_job(_record()) == "telegram-updates-executor"
+    loops[0].call_soon_threadsafe(loops[0].stop)
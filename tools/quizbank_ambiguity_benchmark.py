@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Runtime benchmark for the blocked fuzzy conflict search on a synthetic bank."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+from time import perf_counter
+
+from quizbank_ambiguity_fuzzy import FuzzyItem, candidate_pairs, find_fuzzy_conflicts
+from rapidfuzz import fuzz
+
+SYLLABLES = [
+    "ba",
+    "be",
+    "chen",
+    "da",
+    "der",
+    "ein",
+    "fa",
+    "ge",
+    "hal",
+    "ke",
+    "lo",
+    "men",
+    "na",
+    "or",
+    "pa",
+    "ri",
+    "sch",
+    "ta",
+    "un",
+    "ver",
+    "wa",
+    "zu",
+    "ung",
+    "keit",
+    "lich",
+]
+TEMPLATES_PER_FILE = 40
+TEMPLATE_WORDS = (4, 7)
+
+
+def _lexicon(rng: random.Random, size: int) -> list[str]:
+    words: set[str] = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def build_synthetic_bank(*, rows: int, files: int, seed: int) -> list[FuzzyItem]:
+    """Per-file template families with one varying slot, like the real gap-fill banks."""
+    rng = random.Random(seed)
+    lexicon = _lexicon(rng, 5_000)
+    templates = [
+        [
+            " ".join(rng.choice(lexicon) for _ in range(rng.randint(*TEMPLATE_WORDS)))
+            for _ in range(TEMPLATES_PER_FILE)
+        ]
+        for _ in range(files)
+    ]
+    items: list[FuzzyItem] = []
+    for index in range(rows):
+        file_index = index % files
+        template = rng.choice(templates[file_index])
+        items.append(
+            FuzzyItem(
+                file=f"Synthetic_Bank_{file_index}.csv",
+                row=index // files + 2,
+                question=f"{template} ___ {rng.choice(lexicon)}?",
+                answer=rng.choice(lexicon),
+            )
+        )
+    return items
+
+
+def _naive_pairs_per_second(items: list[FuzzyItem]) -> float:
+    started = perf_counter()
+    compared = 0
+    for left, first in enumerate(items):
+        for second in items[left + 1 :]:
+            if first.answer != second.answer:
+                fuzz.ratio(first.question, second.question)
+                compared += 1
+    return compared / max(perf_counter() - started, 1e-9)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark blocked fuzzy conflict detection.")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--files", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=20260219)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--naive-sample", type=int, default=1_500)
+    args = parser.parse_args()
+
+    items = build_synthetic_bank(rows=args.rows, files=args.files, seed=args.seed)
+
+    started = perf_counter()
+    candidates = candidate_pairs(items)
+    blocking_seconds = perf_counter() - started
+    started = perf_counter()
+    conflicts = find_fuzzy_conflicts(items, workers=args.workers)
+    total_seconds = perf_counter() - started
+
+    naive_rate = _naive_pairs_per_second(items[: args.naive_sample])
+    all_pairs = args.rows * (args.rows - 1) // 2
+    print(
+        json.dumps(
+            {
+                "rows": args.rows,
+                "files": args.files,
+                "workers": args.workers,
+                "candidate_pairs": len(candidates),
+                "conflicts": len(conflicts),
+                "blocking_seconds": round(blocking_seconds, 3),
+                "blocked_total_seconds": round(total_seconds, 3),
+                "naive_pairs": all_pairs,
+                "naive_estimated_seconds": round(all_pairs / naive_rate, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
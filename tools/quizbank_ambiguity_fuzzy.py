@@ -0,0 +1,156 @@
+"""Blocked near-duplicate search for the quiz bank ambiguity scan.
+
+A pair with ``fuzz.ratio >= FUZZY_SCORE_CUTOFF`` is at most ``d`` insertions
+and deletions apart. Splitting a question into ``d_max + 1`` segments means at
+least one segment survives verbatim in the other string, shifted by at most
+``d`` characters (pigeonhole, as in PassJoin). Blocking on those segment
+signatures therefore never drops a pair the full O(n^2) scan would report.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from rapidfuzz import fuzz, process
+
+FUZZY_SCORE_CUTOFF = 96
+SCORE_SLACK = 1 - FUZZY_SCORE_CUTOFF / 100
+PARALLEL_MIN_ITEMS = 5_000
+SCORE_CHUNK_SIZE = 500
+
+ScoredPair = tuple[int, int, float]
+ScoreTask = tuple[int, str, list[int], list[str]]
+
+
+@dataclass(frozen=True, slots=True)
+class FuzzyItem:
+    file: str
+    row: int
+    question: str
+    answer: str
+
+
+def _pair_distance_budget(first_length: int, second_length: int) -> int:
+    return math.floor(SCORE_SLACK * (first_length + second_length) + 1e-9)
+
+
+def max_indel_distance(length: int) -> int:
+    # d <= s * (len1 + len2) and len2 <= len1 + d  =>  d <= 2 * s * len1 / (1 - s).
+    return math.floor(2 * SCORE_SLACK * length / (1 - SCORE_SLACK) + 1e-9)
+
+
+@lru_cache(maxsize=None)
+def _segments(length: int) -> tuple[tuple[int, int], ...]:
+    count = max_indel_distance(length) + 1
+    base, extra = divmod(length, count)
+    segments: list[tuple[int, int]] = []
+    start = 0
+    for segment_index in range(count):
+        size = base + (1 if segment_index >= count - extra else 0)
+        segments.append((start, size))
+        start += size
+    return tuple(segments)
+
+
+def _candidate_groups(
+    items: list[FuzzyItem], *, cross_file_only: bool
+) -> Iterator[tuple[int, list[int]]]:
+    index: defaultdict[tuple[int, int, str], list[int]] = defaultdict(list)
+    indexed_lengths: set[int] = set()
+    lookup = index.get
+    for right, item in enumerate(items):
+        question = item.question
+        if not question:
+            continue
+        length = len(question)
+        reach = max_indel_distance(length)
+        lefts: set[int] = set()
+        for other_length in range(max(1, length - reach), length + reach + 1):
+            if other_length not in indexed_lengths:
+                continue
+            budget = _pair_distance_budget(length, other_length)
+            if abs(length - other_length) > budget:
+                continue
+            # Edits before a segment shift it by k and those after cover the rest of
+            # the length delta, so |k| + |delta - k| <= budget bounds the shift.
+            delta = length - other_length
+            lowest_shift = -((budget - delta) // 2)
+            highest_shift = (budget + delta) // 2
+            for segment_index, (start, size) in enumerate(_segments(other_length)):
+                first = max(0, start + lowest_shift)
+                last = min(length - size, start + highest_shift)
+                for position in range(first, last + 1):
+                    hits = lookup(
+                        (other_length, segment_index, question[position : position + size])
+                    )
+                    if hits is not None:
+                        lefts.update(hits)
+        for segment_index, (start, size) in enumerate(_segments(length)):
+            index[(length, segment_index, question[start : start + size])].append(right)
+        indexed_lengths.add(length)
+        candidates = [
+            left
+            for left in lefts
+            if items[left].answer != item.answer
+            and not (cross_file_only and items[left].file == item.file)
+        ]
+        if candidates:
+            yield right, sorted(candidates)
+
+
+def candidate_pairs(
+    items: list[FuzzyItem], *, cross_file_only: bool = False
+) -> list[tuple[int, int]]:
+    return sorted(
+        (left, right)
+        for right, lefts in _candidate_groups(items, cross_file_only=cross_file_only)
+        for left in lefts
+    )
+
+
+def _score_chunk(chunk: list[ScoreTask]) -> list[ScoredPair]:
+    scored: list[ScoredPair] = []
+    for right, query, left_ids, choices in chunk:
+        for _, score, position in process.extract(
+            query,
+            choices,
+            scorer=fuzz.ratio,
+            score_cutoff=FUZZY_SCORE_CUTOFF,
+            limit=None,
+        ):
+            scored.append((left_ids[position], right, float(score)))
+    return scored
+
+
+def _score_chunks(items: list[FuzzyItem], *, cross_file_only: bool) -> Iterator[list[ScoreTask]]:
+    chunk: list[ScoreTask] = []
+    for right, lefts in _candidate_groups(items, cross_file_only=cross_file_only):
+        chunk.append(
+            (right, items[right].question, lefts, [items[left].question for left in lefts])
+        )
+        if len(chunk) >= SCORE_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def find_fuzzy_conflicts(
+    items: list[FuzzyItem],
+    *,
+    cross_file_only: bool = False,
+    workers: int = 1,
+) -> list[ScoredPair]:
+    """Returns (left, right, score) index pairs with differing answers, ordered like the full scan."""
+    chunks = _score_chunks(items, cross_file_only=cross_file_only)
+    if workers > 1 and len(items) >= PARALLEL_MIN_ITEMS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_score_chunk, chunks))
+    else:
+        results = [_score_chunk(chunk) for chunk in chunks]
+    return sorted((pair for chunk_result in results for pair in chunk_result), key=lambda p: p[:2])
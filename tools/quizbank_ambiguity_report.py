@@ -64,4 +64,15 @@ def build_md(report: dict[str, Any]) -> str:
                 f"| rows `{group['rows']}` | answer_count `{group['answer_count']}`"
             )
         lines.append("")
+    cross_file_conflicts = report.get("cross_file_fuzzy_conflicts", [])
+    if cross_file_conflicts:
+        lines.append("## Cross-File Fuzzy Conflicts")
+        lines.append("")
+        for pair in cross_file_conflicts[:20]:
+            lines.append(
+                f"- `{Path(pair['file_1']).name}:{pair['row_1']}` / "
+                f"`{Path(pair['file_2']).name}:{pair['row_2']}` score `{pair['score']}` "
+                f"| answers `{pair['answer_1']}/{pair['answer_2']}`"
+            )
+        lines.append("")
     return "\n".join(lines)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -12,7 +13,7 @@ from quizbank_ambiguity_constants import CUE_PREFIXES, OPTION_COLUMNS
 from quizbank_ambiguity_io import read_csv, read_table, read_xlsx
 from quizbank_ambiguity_report import build_md
 from quizbank_report_paths import csv_sort_key
-from quizbank_ambiguity_scan_core import scan_file
+from quizbank_ambiguity_scan_core import scan_file, scan_files
 from quizbank_ambiguity_text import key_family, norm, question_signature
 
 __all__ = [
@@ -25,6 +26,7 @@ __all__ = [
     "read_xlsx",
     "read_table",
     "scan_file",
+    "scan_files",
     "build_md",
 ]
 
@@ -34,6 +36,12 @@ def main() -> None:
     parser.add_argument("--input-dir", default="QuizBank")
     parser.add_argument("--output-json", default="reports/quizbank_ambiguity_scan.json")
     parser.add_argument("--output-md", default="reports/quizbank_ambiguity_scan.md")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to score fuzzy candidates on large banks.",
+    )
     args = parser.parse_args()
 
     files = sorted(
@@ -44,7 +52,7 @@ def main() -> None:
         ],
         key=csv_sort_key,
     )
-    results = [scan_file(p) for p in files]
+    results, cross_file_conflicts = scan_files(files, workers=args.workers)
     summary = {
         "file_count": len(results),
         "exact_duplicate_groups_total": sum(len(r["exact_duplicate_groups"]) for r in results),
@@ -53,6 +61,7 @@ def main() -> None:
             len(r["signature_conflict_groups"]) for r in results
         ),
         "fuzzy_conflicts_total": sum(len(r["fuzzy_conflicts"]) for r in results),
+        "cross_file_fuzzy_conflicts_total": len(cross_file_conflicts),
         "same_row_candidates_total": sum(
             len(r["same_row_multi_logical_candidates"]) for r in results
         ),
@@ -65,6 +74,7 @@ def main() -> None:
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "summary": summary,
         "files": results,
+        "cross_file_fuzzy_conflicts": cross_file_conflicts,
     }
 
     out_json = Path(args.output_json)
@@ -7,14 +7,72 @@ from pathlib import Path
 from typing import Any
 
 from quizbank_ambiguity_constants import OPTION_COLUMNS
+from quizbank_ambiguity_fuzzy import FuzzyItem, find_fuzzy_conflicts
 from quizbank_ambiguity_io import read_table
 from quizbank_report_paths import report_path
 from quizbank_ambiguity_text import key_family, norm, question_signature
-from rapidfuzz import fuzz
 
+FUZZY_CONFLICTS_LIMIT = 100
 
-def scan_file(path: Path) -> dict[str, Any]:
+
+def _fuzzy_items(file_label: str, rows: list[dict[str, Any]]) -> list[FuzzyItem]:
+    return [
+        FuzzyItem(
+            file=file_label,
+            row=int(row["_row"]),
+            question=norm(row.get("question")),
+            answer=norm(row.get("correct_answer")),
+        )
+        for row in rows
+    ]
+
+
+def _conflict_entry(first: FuzzyItem, second: FuzzyItem, score: float) -> dict[str, Any]:
+    return {
+        "row_1": first.row,
+        "row_2": second.row,
+        "score": score,
+        "question_1": first.question,
+        "question_2": second.question,
+        "answer_1": first.answer,
+        "answer_2": second.answer,
+    }
+
+
+def scan_file(path: Path, *, workers: int = 1) -> dict[str, Any]:
     columns, rows = read_table(path)
+    return _scan_rows(path, columns, rows, workers=workers)
+
+
+def scan_files(
+    paths: list[Path], *, workers: int = 1
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Scans each file and then looks for fuzzy answer conflicts across files."""
+    results: list[dict[str, Any]] = []
+    all_items: list[FuzzyItem] = []
+    for path in paths:
+        columns, rows = read_table(path)
+        results.append(_scan_rows(path, columns, rows, workers=workers))
+        if "question" in columns:
+            all_items.extend(_fuzzy_items(report_path(path), rows))
+
+    cross_file_conflicts = [
+        {
+            "file_1": all_items[left].file,
+            "file_2": all_items[right].file,
+            **_conflict_entry(all_items[left], all_items[right], score),
+        }
+        for left, right, score in find_fuzzy_conflicts(
+            all_items, cross_file_only=True, workers=workers
+        )
+    ]
+    cross_file_conflicts.sort(key=lambda x: x["score"], reverse=True)
+    return results, cross_file_conflicts[:FUZZY_CONFLICTS_LIMIT]
+
+
+def _scan_rows(
+    path: Path, columns: list[str], rows: list[dict[str, Any]], *, workers: int
+) -> dict[str, Any]:
     if "question" not in columns:
         return {
             "file": report_path(path),
@@ -101,30 +159,14 @@ def scan_file(path: Path) -> dict[str, Any]:
         )
     template_repeat_groups = sorted(template_repeat_groups, key=lambda x: x["size"], reverse=True)
 
-    q_items = [
-        (int(row["_row"]), norm(row.get("question")), norm(row.get("correct_answer")))
-        for row in rows
+    items = _fuzzy_items(report_path(path), rows)
+    fuzzy_conflicts = [
+        _conflict_entry(items[left], items[right], score)
+        for left, right, score in find_fuzzy_conflicts(items, workers=workers)
+    ]
+    fuzzy_conflicts = sorted(fuzzy_conflicts, key=lambda x: x["score"], reverse=True)[
+        :FUZZY_CONFLICTS_LIMIT
     ]
-    for i, (r1, q1, a1) in enumerate(q_items):
-        if not q1:
-            continue
-        for r2, q2, a2 in q_items[i + 1 :]:
-            if not q2 or a1 == a2:
-                continue
-            score = fuzz.ratio(q1, q2)
-            if score >= 96:
-                fuzzy_conflicts.append(
-                    {
-                        "row_1": r1,
-                        "row_2": r2,
-                        "score": score,
-                        "question_1": q1,
-                        "question_2": q2,
-                        "answer_1": a1,
-                        "answer_2": a2,
-                    }
-                )
-    fuzzy_conflicts = sorted(fuzzy_conflicts, key=lambda x: x["score"], reverse=True)[:100]
 
     return {
         "file": report_path(path),